@@ -0,0 +1,123 @@
+"""Machine-readable benchmark results and baseline comparison."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import json
+from pathlib import Path
+import platform
+import sys
+from typing import Any, Sequence
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """One measured value; ``params`` identify the configuration it came from."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        if not self.params:
+            return self.name
+        rendered = ",".join(f"{name}={value}" for name, value in sorted(self.params.items()))
+        return f"{self.name}[{rendered}]"
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A current result set against its baseline counterpart.
+
+    ``change`` is the relative change of the value, signed so that a
+    positive number always means slower or lower throughput.
+    """
+
+    key: str
+    unit: str
+    baseline: float | None
+    current: float | None
+    change: float | None
+    status: str
+
+
+def dump_results(results: Sequence[BenchmarkResult], path: str | Path, environment: dict[str, Any]) -> None:
+    document = {
+        "schema": SCHEMA_VERSION,
+        "environment": environment,
+        "results": [asdict(result) for result in results],
+    }
+    Path(path).write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_results(path: str | Path) -> list[BenchmarkResult]:
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported benchmark results schema in '{path}'.")
+    return [BenchmarkResult(**item) for item in document["results"]]
+
+
+def environment_info() -> dict[str, Any]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def compare_results(
+    current: Sequence[BenchmarkResult],
+    baseline: Sequence[BenchmarkResult],
+    tolerance: float,
+    noise_floor_ms: float = 0.0,
+) -> list[Comparison]:
+    """Match results by key and flag changes worse than ``tolerance``.
+
+    A lower-is-better value regresses when it exceeds the baseline by more
+    than ``tolerance`` (0.25 = 25%); a higher-is-better value when it drops
+    below ``baseline / (1 + tolerance)``. Millisecond results must also move
+    by more than ``noise_floor_ms``, so timer jitter on sub-millisecond
+    operations is not reported. Keys present on one side only are reported
+    as ``new`` or ``missing`` and never fail the comparison.
+    """
+    if tolerance < 0 or noise_floor_ms < 0:
+        raise ValueError("tolerance and noise_floor_ms cannot be negative.")
+    baseline_by_key = {result.key: result for result in baseline}
+    comparisons: list[Comparison] = []
+    for result in current:
+        reference = baseline_by_key.pop(result.key, None)
+        if reference is None:
+            comparisons.append(Comparison(result.key, result.unit, None, result.value, None, "new"))
+            continue
+        comparisons.append(_compare(result, reference, tolerance, noise_floor_ms))
+    for reference in baseline_by_key.values():
+        comparisons.append(Comparison(reference.key, reference.unit, reference.value, None, None, "missing"))
+    return comparisons
+
+
+def _compare(
+    result: BenchmarkResult,
+    reference: BenchmarkResult,
+    tolerance: float,
+    noise_floor_ms: float,
+) -> Comparison:
+    if reference.value <= 0 or result.value <= 0:
+        return Comparison(result.key, result.unit, reference.value, result.value, None, "ok")
+    # Ratio > 1 means worse in either direction, so one threshold covers both.
+    ratio = reference.value / result.value if result.higher_is_better else result.value / reference.value
+    change = ratio - 1.0
+    if result.unit == "ms" and abs(result.value - reference.value) <= noise_floor_ms:
+        status = "ok"
+    elif change > tolerance:
+        status = "regression"
+    elif ratio < 1.0 / (1.0 + tolerance):
+        status = "improvement"
+    else:
+        status = "ok"
+    return Comparison(result.key, result.unit, reference.value, result.value, change, status)
@@ -0,0 +1,96 @@
+"""Run the offline benchmark suite and compare it with the stored baseline.
+
+Usage::
+
+    python -m benchmarks.run                      # full suite, compare with baseline
+    python -m benchmarks.run --quick --no-compare # smoke run
+    python -m benchmarks.run --update-baseline    # record a new baseline
+
+Exits with status 1 when any result regresses beyond ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+from pathlib import Path
+import sys
+from typing import Sequence
+
+from .results import (
+    Comparison,
+    compare_results,
+    dump_results,
+    environment_info,
+    load_results,
+)
+from .scenarios import BenchmarkConfig, run_suite
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    config = BenchmarkConfig.quick() if args.quick else BenchmarkConfig()
+    config = replace(
+        config,
+        embedding_latency_seconds=args.embedding_latency_ms / 1000,
+        generation_latency_seconds=args.generation_latency_ms / 1000,
+        search_latency_seconds=args.search_latency_ms / 1000,
+    )
+
+    results = run_suite(config)
+    environment = {**environment_info(), "quick": args.quick}
+    if args.output is not None:
+        dump_results(results, args.output, environment)
+    if args.update_baseline:
+        dump_results(results, args.baseline, environment)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if args.no_compare or not args.baseline.exists():
+        for result in results:
+            print(f"{result.key:<70} {result.value:>12.3f} {result.unit}")
+        return 0
+
+    comparisons = compare_results(results, load_results(args.baseline), args.tolerance, args.noise_floor_ms)
+    _print_comparisons(comparisons)
+    regressions = [comparison for comparison in comparisons if comparison.status == "regression"]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}.")
+        return 1
+    return 0
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller workload for smoke runs")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline results file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown (0.25 = 25%%)")
+    parser.add_argument(
+        "--noise-floor-ms",
+        type=float,
+        default=0.1,
+        help="ignore latency changes smaller than this many milliseconds",
+    )
+    parser.add_argument("--no-compare", action="store_true", help="print results without comparing")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--embedding-latency-ms", type=float, default=0.0, help="simulated embedding latency")
+    parser.add_argument("--generation-latency-ms", type=float, default=0.0, help="simulated generation latency")
+    parser.add_argument("--search-latency-ms", type=float, default=0.0, help="simulated vector-search latency")
+    return parser.parse_args(argv)
+
+
+def _print_comparisons(comparisons: Sequence[Comparison]) -> None:
+    for comparison in comparisons:
+        baseline = "-" if comparison.baseline is None else f"{comparison.baseline:.3f}"
+        current = "-" if comparison.current is None else f"{comparison.current:.3f}"
+        change = "" if comparison.change is None else f"{comparison.change:+.1%}"
+        print(
+            f"{comparison.key:<70} {baseline:>12} {current:>12} {comparison.unit:<9} {change:>8}  {comparison.status}"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""Benchmark scenarios built on the simulated adapters.
+
+Every scenario is deterministic in its inputs (seeded corpus, hashed
+embeddings, exact search), so run-to-run differences come from the code
+under test and the machine, not from the workload. The one exception is
+the HNSW build, whose random layer assignment moves its recall slightly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import random
+import statistics
+import tempfile
+import time
+from typing import Sequence
+
+import numpy as np
+
+from src.application import (
+    EmbeddingRecord,
+    IngestionService,
+    MetricsPort,
+    RAGPipelineService,
+    RAGRequest,
+)
+from src.infrastructure.simulated import (
+    SimulatedEmbeddingAdapter,
+    SimulatedGenerationAdapter,
+    SimulatedVectorStore,
+)
+from src.infrastructure.vector_store import NumpyStoreSettings, NumpyVectorStore
+
+from .results import BenchmarkResult
+
+# Stages spent inside a port; everything else in a request is pipeline overhead.
+_PORT_STAGES = ("embedding", "vector_search", "keyword_search", "generation")
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    """Workload sizes and simulated provider latencies for one suite run."""
+
+    seed: int = 7
+    corpus_files: int = 40
+    file_bytes: int = 20_000
+    dimension: int = 256
+    queries: int = 200
+    repeats: int = 3
+    search_sizes: tuple[int, ...] = (1_000, 10_000, 100_000)
+    hnsw_build_sizes: tuple[int, ...] = (5_000,)
+    top_k_values: tuple[int, ...] = (1, 5, 10, 20, 50)
+    embedding_latency_seconds: float = 0.0
+    generation_latency_seconds: float = 0.0
+    search_latency_seconds: float = 0.0
+
+    @classmethod
+    def quick(cls) -> BenchmarkConfig:
+        """A smaller workload for smoke runs; not comparable with the full one."""
+        return cls(
+            corpus_files=10,
+            queries=50,
+            repeats=2,
+            search_sizes=(1_000, 10_000),
+            hnsw_build_sizes=(1_000,),
+            top_k_values=(1, 5, 20),
+        )
+
+    @property
+    def latency_params(self) -> dict[str, float]:
+        return {
+            "embedding_latency_ms": self.embedding_latency_seconds * 1000,
+            "generation_latency_ms": self.generation_latency_seconds * 1000,
+            "search_latency_ms": self.search_latency_seconds * 1000,
+        }
+
+
+class StageRecorder(MetricsPort):
+    """Groups the pipeline's latency observations into one dict per request."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, float]] = []
+        self._current: dict[str, float] = {}
+
+    def observe_latency(self, stage: str, seconds: float) -> None:
+        self._current[stage] = self._current.get(stage, 0.0) + seconds
+        if stage == "total":
+            self.requests.append(self._current)
+            self._current = {}
+
+    def clear(self) -> None:
+        self.requests.clear()
+        self._current = {}
+
+
+def run_suite(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    with tempfile.TemporaryDirectory(prefix="atlas-bench-") as workdir:
+        corpus_dir = Path(workdir)
+        words = write_corpus(corpus_dir, config)
+        results = bench_ingestion(corpus_dir, config)
+        pipeline, recorder = build_pipeline(corpus_dir, config)
+        queries = make_queries(words, config)
+        results += bench_pipeline_overhead(pipeline, recorder, queries, config)
+        results += bench_prompt_build(pipeline, recorder, queries, config)
+    results += bench_search_latency(config)
+    results += bench_hnsw_build(config)
+    return results
+
+
+def write_corpus(directory: Path, config: BenchmarkConfig) -> list[str]:
+    """Write ``corpus_files`` text files of seeded pseudo-words; return the vocabulary."""
+    rng = random.Random(config.seed)
+    vocabulary = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 10))) for _ in range(5_000)]
+    for index in range(config.corpus_files):
+        parts: list[str] = []
+        size = 0
+        while size < config.file_bytes:
+            sentence = " ".join(rng.choices(vocabulary, k=rng.randint(6, 18))) + ".\n"
+            parts.append(sentence)
+            size += len(sentence)
+        (directory / f"doc-{index:04d}.txt").write_text("".join(parts), encoding="utf-8")
+    return vocabulary
+
+
+def make_queries(vocabulary: Sequence[str], config: BenchmarkConfig) -> list[str]:
+    rng = random.Random(config.seed + 1)
+    return [" ".join(rng.choices(vocabulary, k=6)) for _ in range(config.queries)]
+
+
+def bench_ingestion(corpus_dir: Path, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Chunks per second through the full ingestion pipeline, median of repeats."""
+    rates: list[float] = []
+    for _ in range(config.repeats):
+        service = IngestionService(
+            vector_store=_simulated_store(config),
+            embedding_service=_simulated_embeddings(config),
+        )
+        rates.append(service.run(corpus_dir).chunks_per_second)
+    params = {"files": config.corpus_files, "file_bytes": config.file_bytes, **config.latency_params}
+    return [BenchmarkResult("ingestion.chunks_per_second", statistics.median(rates), "chunks/s", True, params)]
+
+
+def build_pipeline(corpus_dir: Path, config: BenchmarkConfig) -> tuple[RAGPipelineService, StageRecorder]:
+    store = _simulated_store(config)
+    IngestionService(vector_store=store, embedding_service=_simulated_embeddings(config)).run(corpus_dir)
+    recorder = StageRecorder()
+    pipeline = RAGPipelineService(
+        vector_store=store,
+        embedding_service=_simulated_embeddings(config),
+        generation_service=SimulatedGenerationAdapter(latency_seconds=config.generation_latency_seconds),
+        metrics=recorder,
+    )
+    return pipeline, recorder
+
+
+def bench_pipeline_overhead(
+    pipeline: RAGPipelineService,
+    recorder: StageRecorder,
+    queries: Sequence[str],
+    config: BenchmarkConfig,
+) -> list[BenchmarkResult]:
+    """Per-query time spent outside the ports, and the end-to-end total."""
+    rounds = _run_queries(pipeline, recorder, queries, top_k=5, repeats=config.repeats)
+    overheads = [
+        [request["total"] - sum(request.get(stage, 0.0) for stage in _PORT_STAGES) for request in requests]
+        for requests in rounds
+    ]
+    totals = [[request["total"] for request in requests] for requests in rounds]
+    params = {"top_k": 5, "queries": len(queries), **config.latency_params}
+    return [
+        BenchmarkResult("pipeline.overhead_p50", _best_percentile(overheads, 50) * 1000, "ms", False, params),
+        BenchmarkResult("pipeline.overhead_p95", _best_percentile(overheads, 95) * 1000, "ms", False, params),
+        BenchmarkResult("pipeline.total_p50", _best_percentile(totals, 50) * 1000, "ms", False, params),
+    ]
+
+
+def bench_prompt_build(
+    pipeline: RAGPipelineService,
+    recorder: StageRecorder,
+    queries: Sequence[str],
+    config: BenchmarkConfig,
+) -> list[BenchmarkResult]:
+    """Median cost of the context stage (hydrate, pack, build prompt) per ``top_k``."""
+    results: list[BenchmarkResult] = []
+    for top_k in config.top_k_values:
+        rounds = _run_queries(pipeline, recorder, queries, top_k=top_k, repeats=config.repeats)
+        context = [[request["context"] for request in requests] for requests in rounds]
+        params = {"top_k": top_k, "queries": len(queries)}
+        results.append(BenchmarkResult("prompt_build.p50", _best_percentile(context, 50) * 1000, "ms", False, params))
+    return results
+
+
+def bench_search_latency(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Exact in-process search latency as the collection grows."""
+    rng = np.random.default_rng(config.seed + 2)
+    results: list[BenchmarkResult] = []
+    for size in config.search_sizes:
+        store = NumpyVectorStore(NumpyStoreSettings(embedding_size=config.dimension, initial_capacity=size))
+        _fill_store(store, size, config.dimension, rng)
+        probes = rng.standard_normal((config.queries, config.dimension), dtype=np.float32).tolist()
+        for probe in probes[:5]:
+            store.search_similar(probe, limit=10)
+        rounds: list[list[float]] = []
+        for _ in range(config.repeats):
+            durations: list[float] = []
+            for probe in probes:
+                started = time.perf_counter()
+                store.search_similar(probe, limit=10)
+                durations.append(time.perf_counter() - started)
+            rounds.append(durations)
+        store.close()
+        params = {"size": size, "dimension": config.dimension, "limit": 10}
+        results.append(BenchmarkResult("search.p50", _best_percentile(rounds, 50) * 1000, "ms", False, params))
+        results.append(BenchmarkResult("search.p95", _best_percentile(rounds, 95) * 1000, "ms", False, params))
+    return results
+
+
+def bench_hnsw_build(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Rows per second linked into an HNSW store, and the recall@10 of the built graph."""
+    rng = np.random.default_rng(config.seed + 3)
+    results: list[BenchmarkResult] = []
+    for size in config.hnsw_build_sizes:
+        store = NumpyVectorStore(
+            NumpyStoreSettings(embedding_size=config.dimension, initial_capacity=size, index="hnsw")
+        )
+        exact = NumpyVectorStore(NumpyStoreSettings(embedding_size=config.dimension, initial_capacity=size))
+        started = time.perf_counter()
+        _fill_store(store, size, config.dimension, np.random.default_rng(config.seed + 4))
+        elapsed = time.perf_counter() - started
+        _fill_store(exact, size, config.dimension, np.random.default_rng(config.seed + 4))
+
+        found = 0
+        probes = rng.standard_normal((config.queries, config.dimension), dtype=np.float32).tolist()
+        for probe in probes:
+            expected = {result.chunk_id for result in exact.search_similar(probe, limit=10)}
+            found += len(expected & {result.chunk_id for result in store.search_similar(probe, limit=10)})
+        store.close()
+        exact.close()
+        params = {"size": size, "dimension": config.dimension}
+        results.append(BenchmarkResult("hnsw_build.rows_per_second", size / elapsed, "rows/s", True, params))
+        results.append(BenchmarkResult("hnsw_build.recall_at_10", found / (10 * len(probes)), "ratio", True, params))
+    return results
+
+
+def _run_queries(
+    pipeline: RAGPipelineService,
+    recorder: StageRecorder,
+    queries: Sequence[str],
+    top_k: int,
+    repeats: int,
+) -> list[list[dict[str, float]]]:
+    """Answer every query ``repeats`` times; return the stage timings of each round."""
+    # A short warm-up keeps first-call costs (imports, caches) out of the sample.
+    for query in queries[:5]:
+        pipeline.run(RAGRequest(query_text=query, top_k=top_k))
+    rounds: list[list[dict[str, float]]] = []
+    for _ in range(repeats):
+        recorder.clear()
+        for query in queries:
+            pipeline.run(RAGRequest(query_text=query, top_k=top_k))
+        rounds.append(list(recorder.requests))
+    return rounds
+
+
+def _simulated_store(config: BenchmarkConfig) -> SimulatedVectorStore:
+    return SimulatedVectorStore(config.dimension, search_latency_seconds=config.search_latency_seconds)
+
+
+def _simulated_embeddings(config: BenchmarkConfig) -> SimulatedEmbeddingAdapter:
+    return SimulatedEmbeddingAdapter(dimension=config.dimension, latency_seconds=config.embedding_latency_seconds)
+
+
+def _fill_store(store: NumpyVectorStore, size: int, dimension: int, rng: np.random.Generator) -> None:
+    batch_size = 5_000
+    for start in range(0, size, batch_size):
+        vectors = rng.standard_normal((min(batch_size, size - start), dimension), dtype=np.float32)
+        store.upsert_embeddings(
+            [
+                EmbeddingRecord(f"chunk-{row}", vector, {"document_id": f"doc-{row // 50}"})
+                for row, vector in enumerate(vectors.tolist(), start)
+            ]
+        )
+
+
+def _best_percentile(rounds: Sequence[Sequence[float]], percentile: float) -> float:
+    """Lowest per-round percentile: the round least disturbed by other load."""
+    return min(_percentile(durations, percentile) for durations in rounds)
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    """Nearest-rank percentile; stable for the small samples used here."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percentile // 100))
+    return ordered[int(rank) - 1]
@@ -1,17 +1,109 @@
 """Application layer (use-case orchestration)."""
 
-from .ports import EmbeddingPort, GenerationPort, VectorSearchResult, VectorStorePort
-from .use_cases import RAGPipelineError, RAGPipelineService, RAGRequest
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from .context_packing import ContextPacker, PackedContext
+from .ports import (
+    AsyncEmbeddingPort,
+    AsyncGenerationPort,
+    AsyncVectorStorePort,
+    ChunkTextStorePort,
+    EmbeddingPort,
+    EmbeddingRecord,
+    EmbeddingResult,
+    GenerationPort,
+    KeywordIndexPort,
+    ManifestEntry,
+    ManifestStorePort,
+    MetricsPort,
+    TextRecord,
+    UpsertReport,
+    VectorSearchOptions,
+    VectorSearchQuery,
+    VectorSearchResult,
+    VectorStorePort,
+)
+from .priority import RequestPriority, current_priority, priority_scope
+from .telemetry import StageSpan, StageTrace
+
+if TYPE_CHECKING:
+    from .answer_cache import SemanticAnswerCache
+    from .use_cases import (
+        IngestionError,
+        IngestionReport,
+        IngestionService,
+        RAGBatchResult,
+        RAGPipelineError,
+        RAGPipelineService,
+        RAGRequest,
+        RAGRetrievalEvent,
+        RAGStreamEvent,
+        RAGTextDelta,
+    )
+
+# Use cases pull in threading, asyncio and the domain, the answer cache numpy,
+# and adapters only need the ports; they are imported on first access instead.
+_LAZY_EXPORTS = {
+    "SemanticAnswerCache": ".answer_cache",
+    "RAGPipelineService": ".use_cases.rag_pipeline",
+    "RAGRequest": ".use_cases.rag_pipeline",
+    "RAGPipelineError": ".use_cases.rag_pipeline",
+    "RAGBatchResult": ".use_cases.rag_pipeline",
+    "RAGRetrievalEvent": ".use_cases.rag_pipeline",
+    "RAGTextDelta": ".use_cases.rag_pipeline",
+    "RAGStreamEvent": ".use_cases.rag_pipeline",
+    "IngestionService": ".use_cases.ingestion",
+    "IngestionReport": ".use_cases.ingestion",
+    "IngestionError": ".use_cases.ingestion",
+}
 
 __all__ = [
     "VectorStorePort",
     "VectorSearchResult",
+    "VectorSearchQuery",
+    "VectorSearchOptions",
+    "EmbeddingRecord",
+    "UpsertReport",
+    "ManifestEntry",
+    "ManifestStorePort",
+    "KeywordIndexPort",
+    "ChunkTextStorePort",
+    "MetricsPort",
+    "TextRecord",
     "EmbeddingPort",
+    "EmbeddingResult",
     "GenerationPort",
+    "AsyncVectorStorePort",
+    "AsyncEmbeddingPort",
+    "AsyncGenerationPort",
     "RAGPipelineService",
     "RAGRequest",
     "RAGPipelineError",
+    "RAGBatchResult",
+    "RAGRetrievalEvent",
+    "RAGTextDelta",
+    "RAGStreamEvent",
+    "IngestionService",
+    "IngestionReport",
+    "IngestionError",
+    "SemanticAnswerCache",
+    "ContextPacker",
+    "PackedContext",
+    "RequestPriority",
+    "current_priority",
+    "priority_scope",
+    "StageSpan",
+    "StageTrace",
 ]
-from .ports import VectorSearchResult, VectorStorePort
 
-__all__ = ["VectorStorePort", "VectorSearchResult"]
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,176 @@
+"""Semantic answer cache keyed on query-embedding similarity."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+
+from src.domain import Answer
+
+
+@dataclass(frozen=True)
+class _Entries:
+    """Immutable snapshot of the cache; a store publishes a new one.
+
+    Row ``i`` of every array describes one slot. ``expires_at`` is ``-inf``
+    for empty slots and ``score_threshold`` is NaN where it was ``None``.
+    """
+
+    embeddings: np.ndarray
+    top_k: np.ndarray
+    score_threshold: np.ndarray
+    expires_at: np.ndarray
+    answers: tuple[Answer | None, ...]
+
+    @classmethod
+    def empty(cls, capacity: int, dimension: int) -> "_Entries":
+        return cls(
+            embeddings=np.zeros((capacity, dimension), dtype=np.float32),
+            top_k=np.zeros(capacity, dtype=np.int64),
+            score_threshold=np.full(capacity, np.nan),
+            expires_at=np.full(capacity, -np.inf),
+            answers=(None,) * capacity,
+        )
+
+
+class SemanticAnswerCache:
+    """In-process cache returning a previous answer for a near-identical query.
+
+    A cached answer is reused when its query embedding has cosine similarity
+    of at least ``similarity_threshold`` with the new query and the retrieval
+    parameters (``top_k``, ``score_threshold``) are identical. Entries expire
+    after ``ttl_seconds`` and the least recently used entry is evicted once
+    ``max_entries`` is reached. Call :meth:`invalidate` whenever the indexed
+    collection changes; pass :attr:`epoch`, read before retrieval, to
+    :meth:`store` so answers built from the old collection are dropped.
+
+    Normalized embeddings live in one float32 matrix, so a lookup is a
+    single matrix-vector product. It runs outside the lock on an immutable
+    snapshot; stores copy the snapshot, which is cheap next to the
+    generation call a miss costs. Storing an embedding of another
+    dimension (a new embedding model) drops the previous entries.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.95,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0.0 < similarity_threshold <= 1.0:
+            raise ValueError("similarity_threshold must be in (0, 1].")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than zero.")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero.")
+        self._similarity_threshold = similarity_threshold
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: _Entries | None = None
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._uses = 0
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            entries = self._entries
+        if entries is None:
+            return 0
+        return int(np.count_nonzero(entries.expires_at > self._clock()))
+
+    @property
+    def epoch(self) -> int:
+        """Counter bumped by every :meth:`invalidate` call."""
+        return self._epoch
+
+    def lookup(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        score_threshold: float | None,
+    ) -> tuple[Answer, float] | None:
+        """Return the most similar live answer and its similarity, if any."""
+        normalized = _normalize(query_embedding)
+        with self._lock:
+            entries = self._entries
+        if normalized is None or entries is None or entries.embeddings.shape[1] != normalized.shape[0]:
+            return None
+
+        eligible = (entries.expires_at > self._clock()) & (entries.top_k == top_k)
+        if score_threshold is None:
+            eligible &= np.isnan(entries.score_threshold)
+        else:
+            eligible &= entries.score_threshold == score_threshold
+        scores = np.where(eligible, entries.embeddings @ normalized, -np.inf)
+        row = int(np.argmax(scores))
+        similarity = float(scores[row])
+        if similarity < self._similarity_threshold:
+            return None
+
+        answer = entries.answers[row]
+        with self._lock:
+            # The slot may have been reused or the cache invalidated meanwhile.
+            if self._entries is None or self._entries.answers[row] is not answer:
+                return None
+            self._uses += 1
+            self._last_used[row] = self._uses
+        return answer, similarity
+
+    def store(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        score_threshold: float | None,
+        answer: Answer,
+        epoch: int | None = None,
+    ) -> None:
+        """Cache ``answer``, unless the cache was invalidated since ``epoch``."""
+        normalized = _normalize(query_embedding)
+        if normalized is None:
+            return
+        now = self._clock()
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+            entries = self._entries
+            if entries is None or entries.embeddings.shape[1] != normalized.shape[0]:
+                entries = _Entries.empty(self._max_entries, normalized.shape[0])
+                self._last_used[:] = 0
+            free = np.flatnonzero(entries.expires_at <= now)
+            # Prefer empty or expired slots, then the least recently used one.
+            row = int(free[np.argmin(self._last_used[free])]) if free.size else int(np.argmin(self._last_used))
+            embeddings = entries.embeddings.copy()
+            embeddings[row] = normalized
+            top_ks = entries.top_k.copy()
+            top_ks[row] = top_k
+            thresholds = entries.score_threshold.copy()
+            thresholds[row] = np.nan if score_threshold is None else score_threshold
+            expires_at = entries.expires_at.copy()
+            expires_at[row] = now + self._ttl_seconds
+            answers = list(entries.answers)
+            answers[row] = answer
+            self._entries = _Entries(embeddings, top_ks, thresholds, expires_at, tuple(answers))
+            self._uses += 1
+            self._last_used[row] = self._uses
+
+    def invalidate(self) -> None:
+        """Drop every entry, e.g. after the collection was re-ingested."""
+        with self._lock:
+            self._entries = None
+            self._last_used[:] = 0
+            self._epoch += 1
+
+
+def _normalize(vector: list[float]) -> np.ndarray | None:
+    values = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(values))
+    if values.ndim != 1 or norm == 0.0:
+        return None
+    return values / norm
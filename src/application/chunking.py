@@ -0,0 +1,120 @@
+"""Streaming fixed-size chunking over UTF-8 byte streams."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+from typing import BinaryIO, Iterator
+
+
+@dataclass(frozen=True)
+class ChunkingConfig:
+    """Chunk size and overlap, both expressed in bytes of UTF-8 text."""
+
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+
+    def __post_init__(self) -> None:
+        if self.chunk_size <= 0:
+            raise ValueError("ChunkingConfig.chunk_size must be greater than zero.")
+
+        if not 0 <= self.chunk_overlap < self.chunk_size:
+            raise ValueError("ChunkingConfig.chunk_overlap must be in [0, chunk_size).")
+
+    @property
+    def stride(self) -> int:
+        return self.chunk_size - self.chunk_overlap
+
+    @property
+    def fingerprint(self) -> str:
+        """Compact identifier; chunk boundaries only match for equal fingerprints."""
+        return f"bytes:{self.chunk_size}:{self.chunk_overlap}"
+
+
+@dataclass(frozen=True)
+class TextSpan:
+    """Normalized chunk text with its byte range in the source file."""
+
+    sequence_number: int
+    start: int
+    end: int
+    text: str
+
+
+def normalize_text(raw: str) -> str:
+    """Collapse whitespace runs so equivalent chunks compare and embed alike."""
+    return " ".join(raw.split())
+
+
+def text_hash(text: str) -> str:
+    """Short content hash of normalized chunk text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def align_to_char_boundary(data: bytes | memoryview, position: int) -> int:
+    """Move ``position`` forward past UTF-8 continuation bytes."""
+    limit = len(data)
+    while position < limit and 0x80 <= data[position] < 0xC0:
+        position += 1
+    return position
+
+
+def iter_text_spans(
+    stream: BinaryIO,
+    config: ChunkingConfig,
+    block_size: int = 1 << 20,
+) -> Iterator[TextSpan]:
+    """Yield overlapping chunks from a binary stream without loading it whole.
+
+    Chunk ``k`` nominally covers ``[k * stride, k * stride + chunk_size)``; both
+    ends are moved forward to the next UTF-8 character boundary. Boundaries
+    therefore depend only on absolute byte positions, never on how the input
+    is read. Chunks that are blank after normalization are skipped, leaving a
+    gap in ``sequence_number``.
+    """
+    buffer = bytearray()
+    buffer_start = 0
+    eof = False
+    sequence_number = 0
+    # A UTF-8 character is at most 4 bytes, so alignment never looks further.
+    lookahead = 4
+
+    while True:
+        nominal_start = sequence_number * config.stride
+        nominal_end = nominal_start + config.chunk_size
+
+        while not eof and buffer_start + len(buffer) < nominal_end + lookahead:
+            block = stream.read(block_size)
+            if not block:
+                eof = True
+                break
+            buffer.extend(block)
+
+        buffer_end = buffer_start + len(buffer)
+        if nominal_start >= buffer_end:
+            return
+
+        view = memoryview(buffer)
+        try:
+            start = align_to_char_boundary(view, nominal_start - buffer_start)
+            end = align_to_char_boundary(view, min(nominal_end, buffer_end) - buffer_start)
+            text = normalize_text(bytes(view[start:end]).decode("utf-8", errors="replace"))
+        finally:
+            view.release()
+
+        if text:
+            yield TextSpan(
+                sequence_number=sequence_number,
+                start=buffer_start + start,
+                end=buffer_start + end,
+                text=text,
+            )
+
+        # The buffer is filled past ``nominal_end`` unless the stream ended.
+        if nominal_end >= buffer_end:
+            return
+
+        sequence_number += 1
+        discard = min(sequence_number * config.stride - buffer_start, len(buffer))
+        del buffer[:discard]
+        buffer_start += discard
@@ -0,0 +1,199 @@
+"""Token-budget-aware packing of retrieved chunks into prompt context."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Callable, Sequence
+
+from src.application.chunking import ChunkingConfig, normalize_text, text_hash
+from src.application.ports import VectorSearchResult
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap provider-agnostic estimate: about four characters per token."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+@dataclass(frozen=True)
+class PackedContext:
+    """Context blocks ready for the prompt plus what was kept and dropped."""
+
+    blocks: list[str]
+    chunk_ids: list[str]
+    dropped_chunk_ids: list[str]
+    estimated_tokens: int
+
+
+@dataclass
+class _Candidate:
+    chunk_id: str
+    text: str
+    score: float
+    document_id: str | None
+    sequence_number: int | None
+
+
+class ContextPacker:
+    """Builds prompt context from retrieved chunks within a token budget.
+
+    Chunks with no text, exact duplicates and near duplicates (word-shingle
+    Jaccard similarity of at least ``near_duplicate_threshold``) are
+    dropped. The rest are admitted in score order while the packed context
+    fits ``max_tokens``. Admitted chunks of the same document with
+    consecutive ``sequence_number`` are merged into one block, with their
+    shared overlap text kept once. The overlap is searched for only within
+    the last ``max_overlap_chars`` characters, which should be at least the
+    ingestion ``ChunkingConfig.chunk_overlap`` (in bytes, so never fewer
+    characters).
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 3000,
+        near_duplicate_threshold: float = 0.9,
+        min_overlap_chars: int = 16,
+        max_overlap_chars: int = ChunkingConfig.chunk_overlap,
+        token_estimator: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be greater than zero.")
+        if not 0.0 < near_duplicate_threshold <= 1.0:
+            raise ValueError("near_duplicate_threshold must be in (0, 1].")
+        if min_overlap_chars <= 0:
+            raise ValueError("min_overlap_chars must be greater than zero.")
+        if max_overlap_chars < min_overlap_chars:
+            raise ValueError("max_overlap_chars must be at least min_overlap_chars.")
+        self._max_tokens = max_tokens
+        self._near_duplicate_threshold = near_duplicate_threshold
+        self._min_overlap_chars = min_overlap_chars
+        self._max_overlap_chars = max_overlap_chars
+        self._token_estimator = token_estimator
+
+    def pack(self, retrieved_chunks: Sequence[VectorSearchResult]) -> PackedContext:
+        candidates, dropped = self._deduplicate(retrieved_chunks)
+
+        # Groups, their rendered blocks and token counts change only where a candidate lands.
+        groups: list[list[_Candidate]] = []
+        blocks: list[str] = []
+        tokens: list[int] = []
+        used_tokens = 0
+        for candidate in candidates:
+            touching = [index for index, group in enumerate(groups) if _extends(group, candidate)]
+            members = [candidate, *(member for index in touching for member in groups[index])]
+            group = sorted(members, key=lambda member: member.sequence_number) if touching else members
+            block = self._block(group)
+            block_tokens = self._token_estimator(block)
+            trial_tokens = used_tokens - sum(tokens[index] for index in touching) + block_tokens
+            if trial_tokens > self._max_tokens:
+                dropped.append(candidate.chunk_id)
+                continue
+            used_tokens = trial_tokens
+            if not touching:
+                groups.append(group)
+                blocks.append(block)
+                tokens.append(block_tokens)
+                continue
+            # The merged group takes the place of the first group it touches.
+            first = touching[0]
+            groups[first], blocks[first], tokens[first] = group, block, block_tokens
+            for index in reversed(touching[1:]):
+                del groups[index], blocks[index], tokens[index]
+
+        if not groups and candidates:
+            # Never send an empty context: keep the best chunk, cut to the budget.
+            best = candidates[0]
+            dropped.remove(best.chunk_id)
+            text = best.text[: self._max_tokens * 4]
+            best = _Candidate(best.chunk_id, text, best.score, best.document_id, best.sequence_number)
+            groups, blocks = [[best]], [self._block([best])]
+            used_tokens = self._token_estimator(blocks[0])
+
+        return PackedContext(
+            blocks=blocks,
+            chunk_ids=[candidate.chunk_id for group in groups for candidate in group],
+            dropped_chunk_ids=dropped,
+            estimated_tokens=used_tokens,
+        )
+
+    def _deduplicate(
+        self,
+        retrieved_chunks: Sequence[VectorSearchResult],
+    ) -> tuple[list[_Candidate], list[str]]:
+        kept: list[_Candidate] = []
+        kept_shingles: list[set[tuple[str, ...]]] = []
+        seen_hashes: set[str] = set()
+        seen_ids: set[str] = set()
+        dropped: list[str] = []
+        for item in sorted(retrieved_chunks, key=lambda result: result.score, reverse=True):
+            text = str(item.payload.get("text", "")).strip()
+            if not text or item.chunk_id in seen_ids:
+                dropped.append(item.chunk_id)
+                continue
+            seen_ids.add(item.chunk_id)
+            digest = text_hash(normalize_text(text).lower())
+            shingles = _shingles(text)
+            if digest in seen_hashes or any(
+                _jaccard(shingles, other) >= self._near_duplicate_threshold for other in kept_shingles
+            ):
+                dropped.append(item.chunk_id)
+                continue
+            seen_hashes.add(digest)
+            kept_shingles.append(shingles)
+            sequence_number = item.payload.get("sequence_number")
+            kept.append(
+                _Candidate(
+                    chunk_id=item.chunk_id,
+                    text=text,
+                    score=item.score,
+                    document_id=item.payload.get("document_id"),
+                    sequence_number=int(sequence_number) if sequence_number is not None else None,
+                )
+            )
+        return kept, dropped
+
+    def _block(self, group: list[_Candidate]) -> str:
+        text = group[0].text
+        for candidate in group[1:]:
+            text = self._join(text, candidate.text)
+        chunk_ids = ", ".join(candidate.chunk_id for candidate in group)
+        return f"[chunk_id={chunk_ids}] {text}"
+
+    def _join(self, left: str, right: str) -> str:
+        """Concatenate, writing a suffix of ``left`` that prefixes ``right`` only once."""
+        # Candidate overlaps start where ``right``'s first characters occur in
+        # the tail of ``left``; the leftmost that matches is the longest.
+        window = min(len(left), len(right), self._max_overlap_chars)
+        probe = right[: self._min_overlap_chars]
+        position = left.find(probe, len(left) - window)
+        while position != -1:
+            if right.startswith(left[position:]):
+                return left[:position] + right
+            position = left.find(probe, position + 1)
+        return f"{left} {right}"
+
+
+def _extends(group: list[_Candidate], candidate: _Candidate) -> bool:
+    if candidate.document_id is None or candidate.sequence_number is None:
+        return False
+    first, last = group[0], group[-1]
+    return (
+        first.document_id == candidate.document_id
+        and first.sequence_number is not None
+        and last.sequence_number is not None
+        and first.sequence_number - 1 <= candidate.sequence_number <= last.sequence_number + 1
+    )
+
+
+def _shingles(text: str, size: int = 3) -> set[tuple[str, ...]]:
+    words = normalize_text(text).lower().split()
+    if len(words) < size:
+        return {tuple(words)}
+    return {tuple(words[index : index + size]) for index in range(len(words) - size + 1)}
+
+
+def _jaccard(left: set[tuple[str, ...]], right: set[tuple[str, ...]]) -> float:
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
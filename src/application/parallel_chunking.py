@@ -0,0 +1,321 @@
+"""Chunk boundaries of large files computed in a process pool."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+import hashlib
+from itertools import accumulate
+import multiprocessing
+import os
+from typing import Iterable, Iterator
+
+from src.application.chunking import ChunkingConfig, TextSpan, align_to_char_boundary, normalize_text
+
+# Matches ``text_hash``: blake2b with a 16-byte digest.
+_DIGEST_SIZE = 16
+# A UTF-8 character is at most 4 bytes, so alignment never looks further.
+_LOOKAHEAD = 4
+
+PathLike = str | os.PathLike[str]
+
+
+class ParallelChunkingError(Exception):
+    """Raised when the chunking engine is misconfigured or used after close."""
+
+
+@dataclass(frozen=True)
+class ChunkBoundaries:
+    """Non-blank chunks of a file, column-wise, in ``sequence_number`` order.
+
+    ``starts``/``ends`` are byte offsets in the file. The normalized text
+    of chunk ``i`` is ``text[text_offsets[i]:text_offsets[i + 1]]`` and its
+    ``text_hash`` is ``digests[16 * i:16 * (i + 1)]`` in hex.
+    """
+
+    sequence_numbers: array
+    starts: array
+    ends: array
+    text: str
+    text_offsets: array
+    digests: bytes
+
+    def __len__(self) -> int:
+        return len(self.sequence_numbers)
+
+    def text_of(self, index: int) -> str:
+        return self.text[self.text_offsets[index] : self.text_offsets[index + 1]]
+
+    def digest(self, index: int) -> str:
+        return self.digests[index * _DIGEST_SIZE : (index + 1) * _DIGEST_SIZE].hex()
+
+    def spans(self) -> Iterator[TextSpan]:
+        """The same spans ``iter_text_spans`` yields for the file."""
+        for index, sequence_number in enumerate(self.sequence_numbers):
+            yield TextSpan(
+                sequence_number=sequence_number,
+                start=self.starts[index],
+                end=self.ends[index],
+                text=self.text_of(index),
+            )
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """Worker output: flat arrays and one joined string rather than a string per chunk."""
+
+    sequence_numbers: array
+    starts: array
+    ends: array
+    text: str
+    text_lengths: array
+    digests: bytes
+
+
+# ``chunk_files`` queue entry: a file's start marker (``None``) or ``OSError``,
+# then the arguments of each of its segments, replaced by the future once submitted.
+_Job = OSError | tuple[int, int, int, int] | Future[_Segment] | None
+
+
+def chunk_count(size: int, config: ChunkingConfig) -> int:
+    """Number of chunk positions ``iter_text_spans`` visits for a ``size``-byte file."""
+    if size <= 0:
+        return 0
+    # Chunk ``k`` is the last one once ``k * stride + chunk_size`` reaches the end.
+    return max(0, -(-(size - config.chunk_size) // config.stride)) + 1
+
+
+def _chunk_segment(path: str, chunk_size: int, chunk_overlap: int, first: int, stop: int) -> _Segment:
+    """Chunks ``first`` to ``stop - 1`` of ``path``; runs in a worker process."""
+    stride = chunk_size - chunk_overlap
+    region_start = first * stride
+    with open(path, "rb") as stream:
+        stream.seek(region_start)
+        data = stream.read((stop - 1) * stride + chunk_size + _LOOKAHEAD - region_start)
+
+    sequence_numbers = array("q")
+    starts = array("q")
+    ends = array("q")
+    text_lengths = array("q")
+    texts: list[str] = []
+    digests = bytearray()
+    view = memoryview(data)
+    try:
+        for sequence_number in range(first, stop):
+            nominal_start = sequence_number * stride - region_start
+            start = align_to_char_boundary(view, nominal_start)
+            end = align_to_char_boundary(view, min(nominal_start + chunk_size, len(data)))
+            text = normalize_text(bytes(view[start:end]).decode("utf-8", errors="replace"))
+            if not text:
+                continue
+            sequence_numbers.append(sequence_number)
+            starts.append(region_start + start)
+            ends.append(region_start + end)
+            text_lengths.append(len(text))
+            texts.append(text)
+            digests += hashlib.blake2b(text.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+    finally:
+        view.release()
+    return _Segment(sequence_numbers, starts, ends, "".join(texts), text_lengths, bytes(digests))
+
+
+def _merge(segments: list[_Segment]) -> ChunkBoundaries:
+    sequence_numbers = array("q")
+    starts = array("q")
+    ends = array("q")
+    text_lengths = array("q")
+    for segment in segments:
+        sequence_numbers.extend(segment.sequence_numbers)
+        starts.extend(segment.starts)
+        ends.extend(segment.ends)
+        text_lengths.extend(segment.text_lengths)
+    return ChunkBoundaries(
+        sequence_numbers=sequence_numbers,
+        starts=starts,
+        ends=ends,
+        text="".join(segment.text for segment in segments),
+        text_offsets=array("q", accumulate(text_lengths, initial=0)),
+        digests=b"".join(segment.digests for segment in segments),
+    )
+
+
+class ParallelChunker:
+    """Splits files into the chunks of ``iter_text_spans`` using several processes.
+
+    Each file is cut into segments of consecutive chunk positions. Workers
+    read only their segment's bytes, then normalize and hash each chunk.
+    Boundaries depend only on absolute byte positions, so the merged
+    result is identical to the streaming chunker and does not depend on
+    ``workers`` or ``segment_bytes``. With ``workers`` 1, segments run in
+    the calling process.
+
+    The pool starts on first use and uses the ``spawn`` start method,
+    because ingestion calls it from pipeline threads and forking a
+    threaded process is unsafe. Call :meth:`close`, or use the chunker as
+    a context manager, to stop it.
+    """
+
+    def __init__(
+        self,
+        config: ChunkingConfig | None = None,
+        workers: int | None = None,
+        segment_bytes: int = 4 << 20,
+        executor: Executor | None = None,
+    ) -> None:
+        if workers is not None and workers <= 0:
+            raise ParallelChunkingError("workers must be greater than zero.")
+        if segment_bytes <= 0:
+            raise ParallelChunkingError("segment_bytes must be greater than zero.")
+        self._config = config or ChunkingConfig()
+        self._workers = workers or os.cpu_count() or 1
+        self._segment_chunks = max(1, segment_bytes // self._config.stride)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._closed = False
+
+    @property
+    def config(self) -> ChunkingConfig:
+        return self._config
+
+    def __enter__(self) -> "ParallelChunker":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._closed = True
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def chunk_file(self, path: PathLike, start: int = 0, end: int | None = None) -> ChunkBoundaries:
+        """Chunks of ``path`` whose nominal start lies in ``[start, end)``.
+
+        Ranges that tile a file yield disjoint chunk sets whose union is the
+        whole file, so separate hosts or jobs can split one large file. The
+        range's normalized text is held in memory at once; use
+        :meth:`chunk_files` to stream large files.
+        """
+        return _merge([future.result() for future in self._submit(path, start, end)])
+
+    def chunk_files(
+        self,
+        paths: Iterable[PathLike],
+    ) -> Iterator[tuple[PathLike, Iterator[ChunkBoundaries]]]:
+        """Chunk many files, in order, one segment's :class:`ChunkBoundaries` at a time.
+
+        Each file comes with an iterator over its segments, which must be
+        consumed before advancing to the next file (parts left unconsumed
+        are discarded). At most two segments per worker are submitted or
+        waiting, across file boundaries, so memory stays bounded by the
+        segment size however large a file is, and small files share the
+        pool. A file that cannot be read raises its ``OSError`` from its
+        iterator.
+        """
+        window = 2 * self._workers
+        queue: deque[tuple[int, PathLike, _Job]] = deque()
+        jobs = self._jobs(paths)
+
+        def fill() -> None:
+            while len(queue) < window:
+                job = next(jobs, None)
+                if job is None:
+                    return
+                number, path, work = job
+                if isinstance(work, tuple):
+                    work = self._executor_for().submit(_chunk_segment, os.fspath(path), *work)
+                queue.append((number, path, work))
+
+        def next_part(number: int) -> Future[_Segment] | None:
+            # Refilled here rather than after the pop: the part being consumed counts too.
+            fill()
+            # Jobs arrive in file order: a segment of another file means this one is done.
+            if not queue or queue[0][0] != number:
+                return None
+            return queue.popleft()[2]
+
+        def parts(number: int, error: OSError | None) -> Iterator[ChunkBoundaries]:
+            if error is not None:
+                raise error
+            while (future := next_part(number)) is not None:
+                yield _merge([future.result()])
+
+        fill()
+        while queue:
+            number, path, head = queue.popleft()
+            fill()
+            file_parts = parts(number, head if isinstance(head, OSError) else None)
+            yield path, file_parts
+            file_parts.close()
+            while (future := next_part(number)) is not None:
+                future.cancel()
+
+    def _jobs(self, paths: Iterable[PathLike]) -> Iterator[tuple[int, PathLike, _Job]]:
+        """A start marker (``None``) or the ``OSError`` per file, then its segments' arguments."""
+        for number, path in enumerate(paths):
+            if self._closed:
+                raise ParallelChunkingError("ParallelChunker is closed.")
+            try:
+                segments = self._segments(path, 0, None)
+            except OSError as error:
+                yield number, path, error
+                continue
+            yield number, path, None
+            for segment in segments:
+                yield number, path, segment
+
+    def _submit(self, path: PathLike, start: int, end: int | None) -> list[Future[_Segment]]:
+        executor = self._executor_for()
+        return [
+            executor.submit(_chunk_segment, os.fspath(path), *segment)
+            for segment in self._segments(path, start, end)
+        ]
+
+    def _segments(self, path: PathLike, start: int, end: int | None) -> Iterator[tuple[int, int, int, int]]:
+        """Arguments of ``_chunk_segment`` after the path; sizes the file now, yields lazily."""
+        if self._closed:
+            raise ParallelChunkingError("ParallelChunker is closed.")
+        if start < 0 or (end is not None and end < start):
+            raise ParallelChunkingError(f"Invalid byte range [{start}, {end}).")
+        config = self._config
+        total = chunk_count(os.path.getsize(path), config)
+        first = min(total, -(-start // config.stride))
+        stop = total if end is None else min(total, -(-end // config.stride))
+        return (
+            (
+                config.chunk_size,
+                config.chunk_overlap,
+                segment_first,
+                min(segment_first + self._segment_chunks, stop),
+            )
+            for segment_first in range(first, stop, self._segment_chunks)
+        )
+
+    def _executor_for(self) -> Executor:
+        if self._executor is not None:
+            return self._executor
+        if self._workers == 1:
+            return _INLINE
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        return self._executor
+
+
+class _InlineExecutor(Executor):
+    """Runs submitted calls immediately in the calling thread."""
+
+    def submit(self, fn, /, *args, **kwargs):  # type: ignore[no-untyped-def]
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as error:  # noqa: BLE001
+            future.set_exception(error)
+        return future
+
+
+_INLINE = _InlineExecutor()
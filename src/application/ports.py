@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Sequence
 
 
 @dataclass(frozen=True)
@@ -16,6 +17,50 @@ class VectorSearchResult:
     payload: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class VectorSearchOptions:
+    """Search-time tuning for stores that keep quantized vectors.
+
+    ``oversampling`` multiplies the number of candidates fetched from the
+    compressed vectors; ``rescore`` re-ranks those candidates with the
+    original full-precision vectors. ``None`` keeps the store's default.
+    """
+
+    oversampling: float | None = None
+    rescore: bool | None = None
+
+
+@dataclass(frozen=True)
+class VectorSearchQuery:
+    """One nearest-neighbour lookup within a batched search."""
+
+    query_embedding: list[float]
+    limit: int
+    score_threshold: float | None = None
+    options: VectorSearchOptions | None = None
+
+
+@dataclass(frozen=True)
+class EmbeddingRecord:
+    """One embedding record to be written to the vector store."""
+
+    chunk_id: str
+    embedding: list[float]
+    payload: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UpsertReport:
+    """Outcome of a bulk upsert: number written plus per-chunk failures."""
+
+    upserted: int
+    failures: dict[str, str]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
 class VectorStorePort(ABC):
     """Port for vector-store operations used by the application layer."""
 
@@ -32,15 +77,123 @@ class VectorStorePort(ABC):
     ) -> None:
         """Insert or update one embedding record."""
 
+    def upsert_embeddings(self, records: Sequence[EmbeddingRecord]) -> UpsertReport:
+        """Insert or update many embedding records.
+
+        Failures are reported per chunk ID. Adapters with a bulk write API
+        should override this record-at-a-time default.
+        """
+        upserted = 0
+        failures: dict[str, str] = {}
+        for record in records:
+            try:
+                self.upsert_embedding(record.chunk_id, record.embedding, record.payload)
+            except Exception as error:  # noqa: BLE001
+                failures[record.chunk_id] = str(error) or type(error).__name__
+            else:
+                upserted += 1
+        return UpsertReport(upserted=upserted, failures=failures)
+
+    @abstractmethod
+    def delete_embeddings(self, chunk_ids: Sequence[str]) -> None:
+        """Delete embedding records by chunk ID; unknown IDs are ignored."""
+
     @abstractmethod
     def search_similar(
         self,
         query_embedding: list[float],
         limit: int,
         score_threshold: float | None = None,
+        options: VectorSearchOptions | None = None,
     ) -> list[VectorSearchResult]:
         """Search for nearest neighbors by vector similarity."""
 
+    def search_similar_batch(self, queries: Sequence[VectorSearchQuery]) -> list[list[VectorSearchResult]]:
+        """Run several similarity searches, returning result lists in query order.
+
+        Adapters able to answer many lookups in one round trip should override
+        this one-search-per-query default.
+        """
+        results: list[list[VectorSearchResult]] = []
+        for query in queries:
+            # Only forward options when set, so stores predating them keep working.
+            extra = {"options": query.options} if query.options is not None else {}
+            results.append(
+                self.search_similar(
+                    query_embedding=query.query_embedding,
+                    limit=query.limit,
+                    score_threshold=query.score_threshold,
+                    **extra,
+                )
+            )
+        return results
+
+
+@dataclass(frozen=True)
+class TextRecord:
+    """One chunk text to be written to a keyword index."""
+
+    chunk_id: str
+    text: str
+    payload: dict[str, Any]
+
+
+class KeywordIndexPort(ABC):
+    """Port for lexical (keyword) retrieval over chunk text."""
+
+    @abstractmethod
+    def index_texts(self, records: Sequence[TextRecord]) -> None:
+        """Insert or replace the indexed text of each chunk."""
+
+    @abstractmethod
+    def delete_texts(self, chunk_ids: Sequence[str]) -> None:
+        """Remove chunks from the index; unknown IDs are ignored."""
+
+    @abstractmethod
+    def search_text(self, query_text: str, limit: int) -> list[VectorSearchResult]:
+        """Return the best keyword matches, highest score first."""
+
+
+class ChunkTextStorePort(ABC):
+    """Port for chunk text kept outside the vector store."""
+
+    @abstractmethod
+    def put_texts(self, records: Sequence[TextRecord]) -> None:
+        """Store (or replace) the text of each chunk."""
+
+    @abstractmethod
+    def get_texts(self, chunk_ids: Sequence[str]) -> dict[str, str]:
+        """Return texts keyed by chunk ID; unknown IDs are omitted."""
+
+    @abstractmethod
+    def delete_texts(self, chunk_ids: Sequence[str]) -> None:
+        """Forget chunks; unknown IDs are ignored."""
+
+
+class MetricsPort(ABC):
+    """Port for recording operational measurements."""
+
+    @abstractmethod
+    def observe_latency(self, stage: str, seconds: float) -> None:
+        """Record how long one execution of ``stage`` took."""
+
+
+@dataclass(frozen=True)
+class EmbeddingResult:
+    """Per-item outcome of a batched embedding request.
+
+    ``exception`` is the error behind ``error`` when there was one, so
+    callers can tell transient provider failures from bad input.
+    """
+
+    embedding: list[float] | None = None
+    error: str | None = None
+    exception: BaseException | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.embedding is not None
+
 
 class EmbeddingPort(ABC):
     """Port for text embeddings."""
@@ -49,6 +202,20 @@ class EmbeddingPort(ABC):
     def embed_text(self, text: str) -> list[float]:
         """Generate an embedding vector for one text input."""
 
+    def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        """Generate embeddings for many texts, preserving input order.
+
+        Failures are reported per item instead of aborting the whole batch.
+        Adapters backed by a provider batch API should override this default.
+        """
+        results: list[EmbeddingResult] = []
+        for text in texts:
+            try:
+                results.append(EmbeddingResult(embedding=self.embed_text(text)))
+            except Exception as error:  # noqa: BLE001
+                results.append(EmbeddingResult(error=str(error) or type(error).__name__, exception=error))
+        return results
+
 
 class GenerationPort(ABC):
     """Port for text generation over an LLM."""
@@ -56,3 +223,114 @@ class GenerationPort(ABC):
     @abstractmethod
     def generate_text(self, prompt: str) -> str:
         """Generate text from a prompt."""
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        """Yield the generated text as incremental deltas.
+
+        Adapters backed by a streaming provider API should override this
+        default, which yields the complete text as a single delta.
+        """
+        yield self.generate_text(prompt)
+
+
+class AsyncVectorStorePort(ABC):
+    """Asynchronous counterpart of :class:`VectorStorePort`."""
+
+    @abstractmethod
+    async def ensure_collection(self) -> None:
+        """Create or validate the target collection in the vector database."""
+
+    @abstractmethod
+    async def upsert_embedding(
+        self,
+        chunk_id: str,
+        embedding: list[float],
+        payload: dict[str, Any],
+    ) -> None:
+        """Insert or update one embedding record."""
+
+    async def upsert_embeddings(self, records: Sequence[EmbeddingRecord]) -> UpsertReport:
+        """Insert or update many embedding records, reporting failures per chunk ID."""
+        upserted = 0
+        failures: dict[str, str] = {}
+        for record in records:
+            try:
+                await self.upsert_embedding(record.chunk_id, record.embedding, record.payload)
+            except Exception as error:  # noqa: BLE001
+                failures[record.chunk_id] = str(error) or type(error).__name__
+            else:
+                upserted += 1
+        return UpsertReport(upserted=upserted, failures=failures)
+
+    @abstractmethod
+    async def delete_embeddings(self, chunk_ids: Sequence[str]) -> None:
+        """Delete embedding records by chunk ID; unknown IDs are ignored."""
+
+    @abstractmethod
+    async def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+        options: VectorSearchOptions | None = None,
+    ) -> list[VectorSearchResult]:
+        """Search for nearest neighbors by vector similarity."""
+
+
+class AsyncEmbeddingPort(ABC):
+    """Asynchronous counterpart of :class:`EmbeddingPort`."""
+
+    @abstractmethod
+    async def embed_text(self, text: str) -> list[float]:
+        """Generate an embedding vector for one text input."""
+
+    async def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        """Generate embeddings for many texts concurrently, preserving input order.
+
+        Cancellation of any item cancels the whole batch.
+        """
+        outcomes = await asyncio.gather(
+            *(self.embed_text(text) for text in texts),
+            return_exceptions=True,
+        )
+        results: list[EmbeddingResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                results.append(EmbeddingResult(error=str(outcome) or type(outcome).__name__, exception=outcome))
+            else:
+                results.append(EmbeddingResult(embedding=outcome))
+        return results
+
+
+class AsyncGenerationPort(ABC):
+    """Asynchronous counterpart of :class:`GenerationPort`."""
+
+    @abstractmethod
+    async def generate_text(self, prompt: str) -> str:
+        """Generate text from a prompt."""
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Last indexed state of one source file."""
+
+    source_path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    chunking: str
+    chunk_hashes: dict[int, str]
+
+
+class ManifestStorePort(ABC):
+    """Port for persisting the ingestion manifest between runs."""
+
+    @abstractmethod
+    def load(self) -> dict[str, ManifestEntry]:
+        """Return manifest entries keyed by source path; empty when absent."""
+
+    @abstractmethod
+    def save(self, entries: dict[str, ManifestEntry]) -> None:
+        """Replace the stored manifest with ``entries``."""
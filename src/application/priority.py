@@ -0,0 +1,37 @@
+"""Request priority carried implicitly to provider adapters."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Iterator
+
+
+class RequestPriority(IntEnum):
+    """Lower values are served first when provider quota is contended."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+# Unmarked work (user queries, fresh threads) counts as interactive; bulk
+# jobs such as ingestion opt out explicitly.
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "request_priority",
+    default=RequestPriority.INTERACTIVE,
+)
+
+
+def current_priority() -> RequestPriority:
+    return _current_priority.get()
+
+
+@contextmanager
+def priority_scope(priority: RequestPriority) -> Iterator[None]:
+    """Run the enclosed provider calls with ``priority``."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
@@ -0,0 +1,37 @@
+"""Rank fusion for combining retrieval result lists."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from src.application.ports import VectorSearchResult
+
+
+def reciprocal_rank_fusion(
+    result_lists: Sequence[Sequence[VectorSearchResult]],
+    limit: int,
+    k: int = 60,
+) -> list[VectorSearchResult]:
+    """Merge ranked lists by summing ``1 / (k + rank)`` per chunk.
+
+    Only ranks matter, so lists with incomparable scores (cosine similarity,
+    BM25) fuse directly. The payload comes from the first list holding the
+    chunk; the returned ``score`` is the fused score.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be greater than zero.")
+    if k <= 0:
+        raise ValueError("k must be greater than zero.")
+
+    scores: dict[str, float] = {}
+    payloads: dict[str, dict] = {}
+    for results in result_lists:
+        for rank, item in enumerate(results, start=1):
+            scores[item.chunk_id] = scores.get(item.chunk_id, 0.0) + 1.0 / (k + rank)
+            payloads.setdefault(item.chunk_id, item.payload)
+
+    ranked = sorted(scores.items(), key=lambda pair: pair[1], reverse=True)[:limit]
+    return [
+        VectorSearchResult(chunk_id=chunk_id, score=score, payload=payloads[chunk_id])
+        for chunk_id, score in ranked
+    ]
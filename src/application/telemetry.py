@@ -0,0 +1,56 @@
+"""Per-request stage timing for use cases."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import time
+from typing import Any, Callable, Iterator
+
+
+@dataclass(frozen=True)
+class StageSpan:
+    """Duration and size attributes of one pipeline stage."""
+
+    stage: str
+    duration_seconds: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"stage": self.stage, "duration_ms": round(self.duration_seconds * 1000, 3), **self.attributes}
+
+
+class StageTrace:
+    """Collects the spans of one request under its correlation ID."""
+
+    def __init__(self, correlation_id: str, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.correlation_id = correlation_id
+        self.spans: list[StageSpan] = []
+        self._clock = clock
+        self._started = clock()
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; the yielded dict receives size attributes.
+
+        The span is recorded even when the block raises, so failed requests
+        still show how far they got.
+        """
+        attributes: dict[str, Any] = {}
+        started = self._clock()
+        try:
+            yield attributes
+        finally:
+            self.spans.append(StageSpan(stage, self._clock() - started, attributes))
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self._clock() - self._started
+
+    def as_metadata(self) -> dict[str, Any]:
+        return {
+            "correlation_id": self.correlation_id,
+            "timings_ms": {span.stage: round(span.duration_seconds * 1000, 3) for span in self.spans},
+            "total_ms": round(self.elapsed_seconds * 1000, 3),
+            "spans": [span.as_dict() for span in self.spans],
+        }
@@ -1,5 +1,44 @@
 """Application use cases."""
 
-from .rag_pipeline import RAGPipelineError, RAGPipelineService, RAGRequest
+from __future__ import annotations
 
-__all__ = ["RAGPipelineService", "RAGRequest", "RAGPipelineError"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ingestion import IngestionError, IngestionReport, IngestionService, StageStats
+    from .rag_pipeline import (
+        RAGBatchResult,
+        RAGPipelineError,
+        RAGPipelineService,
+        RAGRequest,
+        RAGRetrievalEvent,
+        RAGStreamEvent,
+        RAGTextDelta,
+    )
+
+# Each use case module is imported on first access to one of its names.
+_EXPORTS = {
+    "RAGPipelineService": ".rag_pipeline",
+    "RAGRequest": ".rag_pipeline",
+    "RAGPipelineError": ".rag_pipeline",
+    "RAGBatchResult": ".rag_pipeline",
+    "RAGRetrievalEvent": ".rag_pipeline",
+    "RAGTextDelta": ".rag_pipeline",
+    "RAGStreamEvent": ".rag_pipeline",
+    "IngestionService": ".ingestion",
+    "IngestionReport": ".ingestion",
+    "IngestionError": ".ingestion",
+    "StageStats": ".ingestion",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,596 @@
+"""Streaming TXT ingestion use case."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+import uuid
+
+from src.application.chunking import ChunkingConfig, TextSpan, iter_text_spans, text_hash
+from src.application.parallel_chunking import ChunkBoundaries, ParallelChunker
+from src.application.ports import (
+    ChunkTextStorePort,
+    EmbeddingPort,
+    EmbeddingRecord,
+    KeywordIndexPort,
+    ManifestEntry,
+    ManifestStorePort,
+    TextRecord,
+    UpsertReport,
+    VectorStorePort,
+)
+from src.application.priority import RequestPriority, priority_scope
+from src.domain import Chunk, ChunkBatch, ChunkBatchBuilder
+
+
+class IngestionError(Exception):
+    """Raised when the ingestion pipeline cannot complete."""
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Throughput counters for one pipeline stage."""
+
+    name: str
+    items: int
+    busy_seconds: float
+
+
+@dataclass(frozen=True)
+class IngestionReport:
+    """Summary of one ingestion run."""
+
+    files_processed: int
+    chunks_indexed: int
+    elapsed_seconds: float
+    stages: tuple[StageStats, ...]
+    failed_files: dict[str, str]
+    failed_chunks: dict[str, str]
+    files_unchanged: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks_indexed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def bottleneck_stage(self) -> str | None:
+        """Stage that spent the most time doing work rather than waiting."""
+        if not self.stages:
+            return None
+        return max(self.stages, key=lambda stage: stage.busy_seconds).name
+
+
+_END = object()
+
+
+class _StageClock:
+    """Accumulates time a stage spends blocked on its neighbours."""
+
+    def __init__(self) -> None:
+        self.waiting_seconds = 0.0
+
+
+class _Pipeline:
+    """Runs generator stages in threads connected by bounded queues.
+
+    Each stage is a generator function consuming an iterator of inputs and
+    yielding outputs. Full queues block the producer, so at most
+    ``queue_size`` items sit between any two stages.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self._queue_size = queue_size
+        self._stop = threading.Event()
+        self._errors: list[BaseException] = []
+        self._threads: list[threading.Thread] = []
+        self._stats: list[StageStats] = []
+        self._stats_lock = threading.Lock()
+
+    def run(
+        self,
+        source: tuple[str, Callable[[], Iterable[Any]]],
+        stages: list[tuple[str, Callable[[Iterator[Any]], Iterable[Any]]]],
+    ) -> tuple[StageStats, ...]:
+        name, produce = source
+        outbox: queue.Queue[Any] = queue.Queue(maxsize=self._queue_size)
+        self._start(name, lambda clock: produce(), None, outbox)
+        for index, (name, transform) in enumerate(stages):
+            inbox = outbox
+            is_last = index == len(stages) - 1
+            outbox = None if is_last else queue.Queue(maxsize=self._queue_size)
+            self._start(name, self._bind(transform, inbox), inbox, outbox)
+
+        for thread in self._threads:
+            thread.join()
+        if self._errors:
+            raise IngestionError(f"Ingestion stage failed: {self._errors[0]}") from self._errors[0]
+
+        order = [source[0]] + [name for name, _ in stages]
+        return tuple(sorted(self._stats, key=lambda stats: order.index(stats.name)))
+
+    def _bind(
+        self,
+        transform: Callable[[Iterator[Any]], Iterable[Any]],
+        inbox: queue.Queue[Any],
+    ) -> Callable[[_StageClock], Iterable[Any]]:
+        return lambda clock: transform(self._drain(inbox, clock))
+
+    def _start(
+        self,
+        name: str,
+        body: Callable[[_StageClock], Iterable[Any]],
+        inbox: queue.Queue[Any] | None,
+        outbox: queue.Queue[Any] | None,
+    ) -> None:
+        thread = threading.Thread(
+            target=self._run_stage,
+            args=(name, body, inbox, outbox),
+            name=f"ingestion-{name}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _run_stage(
+        self,
+        name: str,
+        body: Callable[[_StageClock], Iterable[Any]],
+        inbox: queue.Queue[Any] | None,
+        outbox: queue.Queue[Any] | None,
+    ) -> None:
+        clock = _StageClock()
+        items = 0
+        started = time.perf_counter()
+        try:
+            for item in body(clock):
+                items += 1
+                if outbox is not None:
+                    self._put(outbox, item, clock)
+                if self._stop.is_set():
+                    break
+        except BaseException as error:  # noqa: BLE001
+            self._errors.append(error)
+            self._stop.set()
+        finally:
+            if outbox is not None:
+                self._put(outbox, _END, clock, force=True)
+            if inbox is not None and self._stop.is_set():
+                self._discard(inbox)
+            busy = time.perf_counter() - started - clock.waiting_seconds
+            with self._stats_lock:
+                self._stats.append(StageStats(name=name, items=items, busy_seconds=max(busy, 0.0)))
+
+    def _drain(self, inbox: queue.Queue[Any], clock: _StageClock) -> Iterator[Any]:
+        while True:
+            waited = time.perf_counter()
+            item = inbox.get()
+            clock.waiting_seconds += time.perf_counter() - waited
+            if item is _END:
+                return
+            yield item
+
+    def _put(
+        self,
+        outbox: queue.Queue[Any],
+        item: Any,
+        clock: _StageClock,
+        force: bool = False,
+    ) -> None:
+        waited = time.perf_counter()
+        while force or not self._stop.is_set():
+            try:
+                outbox.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                if force and self._stop.is_set():
+                    # Downstream is unwinding too; make room for the sentinel.
+                    self._discard(outbox)
+        clock.waiting_seconds += time.perf_counter() - waited
+
+    @staticmethod
+    def _discard(box: queue.Queue[Any]) -> None:
+        try:
+            while True:
+                box.get_nowait()
+        except queue.Empty:
+            return
+
+
+@dataclass(frozen=True)
+class _SourceFile:
+    path: Path
+    source_path: str
+    size: int
+    mtime_ns: int
+
+
+class _HashingReader:
+    """Binary stream wrapper hashing the bytes as they are read."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._hasher = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._hasher.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+class _StreamedSource:
+    """Chunks a file while reading it once, hashing its bytes along the way."""
+
+    def __init__(self, path: Path, chunking: ChunkingConfig) -> None:
+        self._path = path
+        self._chunking = chunking
+        self._reader: _HashingReader | None = None
+
+    def spans(self) -> Iterator[tuple[TextSpan, str]]:
+        with self._path.open("rb") as stream:
+            self._reader = _HashingReader(stream)
+            for span in iter_text_spans(self._reader, self._chunking):
+                yield span, text_hash(span.text)
+
+    def content_hash(self) -> str:
+        if self._reader is None:
+            raise IngestionError("spans() must be consumed before content_hash().")
+        return self._reader.hexdigest()
+
+
+class _ChunkedSource:
+    """Chunks computed by a ``ParallelChunker``, one segment at a time."""
+
+    def __init__(self, path: Path, parts: Iterator[ChunkBoundaries]) -> None:
+        self._path = path
+        self._parts = parts
+
+    def spans(self) -> Iterator[tuple[TextSpan, str]]:
+        for part in self._parts:
+            for index, span in enumerate(part.spans()):
+                yield span, part.digest(index)
+
+    def content_hash(self) -> str:
+        # Workers see byte ranges only; the whole-file hash is one sequential pass here.
+        with self._path.open("rb") as stream:
+            return hashlib.file_digest(stream, "sha256").hexdigest()
+
+
+class IngestionService:
+    """Use case that indexes TXT files from a knowledge-base directory.
+
+    The run is a chain of concurrent stages — discover, chunk, embed,
+    upsert — joined by bounded queues, so memory stays flat regardless of
+    corpus size and the slowest stage applies backpressure upstream.
+
+    With a manifest store, runs are incremental: files whose size and mtime
+    are unchanged are not read, only chunks whose content hash changed are
+    embedded, and points of vanished chunks or files are deleted.
+
+    With a ``ParallelChunker``, files are split into chunks by a process
+    pool instead of in the chunk stage's thread; the chunks are the same.
+
+    With a keyword index, every chunk written to the vector store is also
+    indexed for lexical search, and deletions are mirrored. A chunk text
+    store receives the text of written chunks the same way, so the vector
+    store can be configured to keep IDs and vectors only.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStorePort,
+        embedding_service: EmbeddingPort,
+        chunking: ChunkingConfig | None = None,
+        embed_batch_size: int = 64,
+        queue_size: int = 8,
+        file_suffix: str = ".txt",
+        manifest_store: ManifestStorePort | None = None,
+        delete_batch_size: int = 1000,
+        on_index_changed: Callable[[], None] | None = None,
+        keyword_index: KeywordIndexPort | None = None,
+        chunk_text_store: ChunkTextStorePort | None = None,
+        chunker: ParallelChunker | None = None,
+    ) -> None:
+        if embed_batch_size <= 0:
+            raise IngestionError("embed_batch_size must be greater than zero.")
+        if queue_size <= 0:
+            raise IngestionError("queue_size must be greater than zero.")
+        if delete_batch_size <= 0:
+            raise IngestionError("delete_batch_size must be greater than zero.")
+        self._vector_store = vector_store
+        self._embedding_service = embedding_service
+        if chunker is not None and chunking is not None and chunker.config != chunking:
+            raise IngestionError("chunker and chunking must use the same ChunkingConfig.")
+        self._chunking = chunking or (chunker.config if chunker is not None else ChunkingConfig())
+        self._embed_batch_size = embed_batch_size
+        self._queue_size = queue_size
+        self._file_suffix = file_suffix.lower()
+        self._manifest_store = manifest_store
+        self._delete_batch_size = delete_batch_size
+        self._on_index_changed = on_index_changed
+        self._keyword_index = keyword_index
+        self._chunk_text_store = chunk_text_store
+        self._chunker = chunker
+
+    def run(self, source_dir: str | Path) -> IngestionReport:
+        """Ingest every matching file under ``source_dir``."""
+        root = Path(source_dir)
+        if not root.is_dir():
+            raise IngestionError(f"Knowledge base directory '{root}' does not exist.")
+
+        previous = self._manifest_store.load() if self._manifest_store is not None else {}
+        fingerprint = self._chunking.fingerprint
+        seen: set[str] = set()
+        updated_entries: dict[str, ManifestEntry] = {}
+        stale_chunk_ids: dict[str, list[str]] = {}
+        failed_files: dict[str, str] = {}
+        failed_chunks: dict[str, str] = {}
+        failed_sources: set[str] = set()
+        # One dict per stage: each is only written by that stage's thread.
+        discovered = {"files_unchanged": 0}
+        chunked = dict.fromkeys(("files", "files_unchanged", "chunks_unchanged"), 0)
+        upserted = {"chunks": 0}
+
+        def discover_stage() -> Iterator[_SourceFile]:
+            for path in self._discover(root):
+                source_path = self._relative(root, path)
+                seen.add(source_path)
+                try:
+                    stat = path.stat()
+                except OSError as error:
+                    failed_files[source_path] = str(error)
+                    continue
+                entry = previous.get(source_path)
+                if (
+                    entry is not None
+                    and entry.chunking == fingerprint
+                    and entry.size == stat.st_size
+                    and entry.mtime_ns == stat.st_mtime_ns
+                ):
+                    discovered["files_unchanged"] += 1
+                    continue
+                yield _SourceFile(path, source_path, stat.st_size, stat.st_mtime_ns)
+
+        def chunk_stage(sources: Iterator[_SourceFile]) -> Iterator[ChunkBatch]:
+            # Batches hold chunk text and IDs in shared buffers, not one Chunk object per item.
+            pending = ChunkBatchBuilder()
+            for source, contents in self._read_sources(sources):
+                entry = previous.get(source.source_path)
+                known_hashes = entry.chunk_hashes if entry is not None and entry.chunking == fingerprint else {}
+                chunk_hashes: dict[int, str] = {}
+                document_id = document_id_for(source.source_path)
+                document_metadata = {"source_path": source.source_path}
+                try:
+                    for span, digest in contents.spans():
+                        chunk_hashes[span.sequence_number] = digest
+                        if known_hashes.get(span.sequence_number) == digest:
+                            chunked["chunks_unchanged"] += 1
+                            continue
+                        pending.append(
+                            chunk_id=chunk_id_for(document_id, span.sequence_number),
+                            document_index=pending.add_document(document_id, document_metadata),
+                            content=span.text,
+                            sequence_number=span.sequence_number,
+                            source_start=span.start,
+                            source_end=span.end,
+                        )
+                        if len(pending) >= self._embed_batch_size:
+                            yield pending.build()
+                    content_hash = contents.content_hash()
+                except OSError as error:
+                    failed_files[source.source_path] = str(error)
+                    failed_sources.add(source.source_path)
+                    continue
+
+                # Touched but identical files were read, yet count as unchanged only.
+                if entry is not None and entry.content_hash == content_hash:
+                    chunked["files_unchanged"] += 1
+                else:
+                    chunked["files"] += 1
+                if entry is not None:
+                    document_id = document_id_for(source.source_path)
+                    stale_chunk_ids[source.source_path] = [
+                        chunk_id_for(document_id, sequence_number)
+                        for sequence_number in entry.chunk_hashes
+                        if sequence_number not in chunk_hashes
+                    ]
+                updated_entries[source.source_path] = ManifestEntry(
+                    source_path=source.source_path,
+                    size=source.size,
+                    mtime_ns=source.mtime_ns,
+                    content_hash=content_hash,
+                    chunking=fingerprint,
+                    chunk_hashes=chunk_hashes,
+                )
+            if pending:
+                yield pending.build()
+
+        def embed_stage(batches: Iterator[ChunkBatch]) -> Iterator[list[EmbeddingRecord]]:
+            for chunks in batches:
+                # Yield provider quota to interactive queries sharing the same key.
+                with priority_scope(RequestPriority.BULK):
+                    results = self._embedding_service.embed_batch(chunks.contents())
+                records: list[EmbeddingRecord] = []
+                for chunk, result in zip(chunks, results):
+                    if not result.ok:
+                        failed_chunks[chunk.id] = result.error or "embedding failed"
+                        failed_sources.add(str(chunk.metadata["source_path"]))
+                        continue
+                    records.append(
+                        EmbeddingRecord(
+                            chunk_id=chunk.id,
+                            embedding=result.embedding or [],
+                            payload=self._payload(chunk),
+                        )
+                    )
+                if records:
+                    yield records
+
+        def upsert_stage(batches: Iterator[list[EmbeddingRecord]]) -> Iterator[UpsertReport]:
+            for records in batches:
+                report = self._vector_store.upsert_embeddings(records)
+                if report.failures:
+                    failed_chunks.update(report.failures)
+                    failed_sources.update(
+                        str(record.payload["source_path"])
+                        for record in records
+                        if record.chunk_id in report.failures
+                    )
+                if report.upserted and (self._keyword_index is not None or self._chunk_text_store is not None):
+                    texts = [
+                        TextRecord(
+                            chunk_id=record.chunk_id,
+                            text=str(record.payload["text"]),
+                            payload=record.payload,
+                        )
+                        for record in records
+                        if record.chunk_id not in report.failures
+                    ]
+                    if self._chunk_text_store is not None:
+                        self._chunk_text_store.put_texts(texts)
+                    if self._keyword_index is not None:
+                        self._keyword_index.index_texts(texts)
+                upserted["chunks"] += report.upserted
+                yield report
+
+        started = time.perf_counter()
+        stages = _Pipeline(self._queue_size).run(
+            source=("discover", discover_stage),
+            stages=[("chunk", chunk_stage), ("embed", embed_stage), ("upsert", upsert_stage)],
+        )
+
+        chunks_deleted = 0
+        if self._manifest_store is not None:
+            for source_path, entry in previous.items():
+                if source_path not in seen:
+                    document_id = document_id_for(source_path)
+                    stale_chunk_ids[source_path] = [
+                        chunk_id_for(document_id, sequence_number) for sequence_number in entry.chunk_hashes
+                    ]
+            chunks_deleted = self._delete_stale(stale_chunk_ids, failed_sources, failed_files)
+            self._manifest_store.save(
+                self._merge_manifest(previous, updated_entries, seen, failed_sources)
+            )
+        elapsed = time.perf_counter() - started
+
+        if self._on_index_changed is not None and (upserted["chunks"] or chunks_deleted):
+            # Lets query-side caches (e.g. SemanticAnswerCache.invalidate) drop stale answers.
+            self._on_index_changed()
+
+        return IngestionReport(
+            files_processed=chunked["files"],
+            chunks_indexed=upserted["chunks"],
+            elapsed_seconds=elapsed,
+            stages=stages,
+            failed_files=failed_files,
+            failed_chunks=failed_chunks,
+            files_unchanged=discovered["files_unchanged"] + chunked["files_unchanged"],
+            chunks_unchanged=chunked["chunks_unchanged"],
+            chunks_deleted=chunks_deleted,
+        )
+
+    def _delete_stale(
+        self,
+        stale_chunk_ids: dict[str, list[str]],
+        failed_sources: set[str],
+        failed_files: dict[str, str],
+    ) -> int:
+        deleted = 0
+        for source_path, chunk_ids in stale_chunk_ids.items():
+            if source_path in failed_sources:
+                continue
+            try:
+                for start in range(0, len(chunk_ids), self._delete_batch_size):
+                    batch = chunk_ids[start : start + self._delete_batch_size]
+                    self._vector_store.delete_embeddings(batch)
+                    if self._keyword_index is not None:
+                        self._keyword_index.delete_texts(batch)
+                    if self._chunk_text_store is not None:
+                        self._chunk_text_store.delete_texts(batch)
+                    deleted += len(batch)
+            except Exception as error:  # noqa: BLE001
+                failed_files[source_path] = f"Failed to delete stale chunks: {error}"
+                failed_sources.add(source_path)
+        return deleted
+
+    @staticmethod
+    def _merge_manifest(
+        previous: dict[str, ManifestEntry],
+        updated: dict[str, ManifestEntry],
+        seen: set[str],
+        failed_sources: set[str],
+    ) -> dict[str, ManifestEntry]:
+        """Keep the old entry for anything that did not fully succeed so it is retried."""
+        merged: dict[str, ManifestEntry] = {}
+        for source_path, entry in previous.items():
+            if source_path in seen or source_path in failed_sources:
+                merged[source_path] = entry
+        for source_path, entry in updated.items():
+            if source_path not in failed_sources:
+                merged[source_path] = entry
+        return merged
+
+    def _read_sources(
+        self,
+        sources: Iterator[_SourceFile],
+    ) -> Iterator[tuple[_SourceFile, _StreamedSource | _ChunkedSource]]:
+        if self._chunker is None:
+            for source in sources:
+                yield source, _StreamedSource(source.path, self._chunking)
+            return
+        # The chunker reads ahead to keep its workers busy; sources come back in order.
+        submitted: deque[_SourceFile] = deque()
+
+        def paths() -> Iterator[Path]:
+            for source in sources:
+                submitted.append(source)
+                yield source.path
+
+        for path, parts in self._chunker.chunk_files(paths()):
+            yield submitted.popleft(), _ChunkedSource(path, parts)
+
+    def _discover(self, root: Path) -> Iterator[Path]:
+        """Walk the tree lazily in a stable order."""
+        for directory, subdirectories, filenames in os.walk(root):
+            subdirectories.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith(self._file_suffix):
+                    yield Path(directory) / filename
+
+    @staticmethod
+    def _relative(root: Path, path: Path) -> str:
+        return path.relative_to(root).as_posix()
+
+    @staticmethod
+    def _payload(chunk: Chunk) -> dict[str, object]:
+        return {
+            "text": chunk.content,
+            "document_id": chunk.document_id,
+            "sequence_number": chunk.sequence_number,
+            **chunk.metadata,
+        }
+
+
+def document_id_for(source_path: str) -> str:
+    """Stable document ID derived from the path relative to the knowledge base."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"atlas-document:{source_path}"))
+
+
+def chunk_id_for(document_id: str, sequence_number: int) -> str:
+    """Stable chunk ID; UUID-shaped so every vector store accepts it as point ID."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"atlas-chunk:{document_id}:{sequence_number}"))
@@ -2,11 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Iterator, Union
+import uuid
 
-from src.application.ports import EmbeddingPort, GenerationPort, VectorStorePort
+from src.application.context_packing import ContextPacker, estimate_tokens
+from src.application.ports import (
+    AsyncEmbeddingPort,
+    AsyncGenerationPort,
+    AsyncVectorStorePort,
+    ChunkTextStorePort,
+    EmbeddingPort,
+    GenerationPort,
+    KeywordIndexPort,
+    MetricsPort,
+    VectorSearchQuery,
+    VectorSearchResult,
+    VectorStorePort,
+)
+from src.application.retrieval import reciprocal_rank_fusion
+from src.application.telemetry import StageTrace
 from src.domain import Answer, Query
 
+if TYPE_CHECKING:
+    from src.application.answer_cache import SemanticAnswerCache
+
+logger = logging.getLogger("atlas.rag")
+
 
 class RAGPipelineError(Exception):
     """Raised when RAG pipeline execution fails."""
@@ -19,61 +44,516 @@ class RAGRequest:
     query_text: str
     top_k: int = 3
     score_threshold: float | None = None
+    correlation_id: str | None = None
+
+
+@dataclass(frozen=True)
+class RAGBatchResult:
+    """Per-request outcome of :meth:`RAGPipelineService.run_many`."""
+
+    answer: Answer | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.answer is not None
+
+
+@dataclass(frozen=True)
+class RAGRetrievalEvent:
+    """First event of :meth:`RAGPipelineService.run_stream`: the grounding context."""
+
+    source_chunk_ids: list[str]
+    scores: dict[str, float]
+    cache_hit: bool = False
+
+
+@dataclass(frozen=True)
+class RAGTextDelta:
+    """Incremental piece of generated answer text."""
+
+    text: str
+
+
+RAGStreamEvent = Union[RAGRetrievalEvent, RAGTextDelta, Answer]
 
 
 class RAGPipelineService:
-    """Use case for retrieval, prompt construction and answer generation."""
+    """Use case for retrieval, prompt construction and answer generation.
+
+    ``run`` drives the synchronous ports. ``arun`` has the same semantics on
+    an event loop: it awaits the optional async ports and falls back to
+    running the synchronous ones in worker threads. ``run_stream`` yields
+    the answer text as the generation port produces it.
+
+    With a keyword index, retrieval is hybrid: dense and keyword searches
+    each return ``hybrid_candidates`` chunks, merged by reciprocal-rank
+    fusion down to ``top_k``. ``score_threshold`` filters the dense side only.
+
+    Retrieved chunks reach the prompt through a :class:`ContextPacker`, which
+    removes duplicates, merges adjacent chunks and enforces a token budget;
+    ``source_chunk_ids`` lists exactly the chunks that made it in.
+
+    ``run``, ``run_stream`` and ``arun`` time each stage (query, embedding,
+    vector/keyword search, context, generation). The spans and their sizes
+    are added to ``Answer.metadata``, logged under the request's
+    ``correlation_id`` and, with a metrics port, recorded as latencies.
+    """
 
     def __init__(
         self,
         vector_store: VectorStorePort,
         embedding_service: EmbeddingPort,
         generation_service: GenerationPort,
+        answer_cache: SemanticAnswerCache | None = None,
+        async_vector_store: AsyncVectorStorePort | None = None,
+        async_embedding_service: AsyncEmbeddingPort | None = None,
+        async_generation_service: AsyncGenerationPort | None = None,
+        keyword_index: KeywordIndexPort | None = None,
+        hybrid_candidates: int = 20,
+        rrf_k: int = 60,
+        context_packer: ContextPacker | None = None,
+        chunk_text_store: ChunkTextStorePort | None = None,
+        metrics: MetricsPort | None = None,
     ) -> None:
+        if hybrid_candidates <= 0:
+            raise RAGPipelineError("hybrid_candidates must be greater than zero.")
+        if rrf_k <= 0:
+            raise RAGPipelineError("rrf_k must be greater than zero.")
         self._vector_store = vector_store
         self._embedding_service = embedding_service
         self._generation_service = generation_service
+        self._answer_cache = answer_cache
+        self._async_vector_store = async_vector_store
+        self._async_embedding_service = async_embedding_service
+        self._async_generation_service = async_generation_service
+        self._keyword_index = keyword_index
+        self._hybrid_candidates = hybrid_candidates
+        self._rrf_k = rrf_k
+        self._context_packer = context_packer or ContextPacker()
+        self._chunk_text_store = chunk_text_store
+        self._metrics = metrics
 
     def run(self, request: RAGRequest) -> Answer:
         """Execute minimal RAG flow and return answer with source chunk IDs."""
-        query = Query.create(text=request.query_text)
-        query_embedding = self._embedding_service.embed_text(query.text)
-        retrieved_chunks = self._vector_store.search_similar(
-            query_embedding=query_embedding,
-            limit=request.top_k,
-            score_threshold=request.score_threshold,
+        trace = self._start_trace(request)
+        try:
+            query = self._create_query(request, trace)
+            with trace.span("embedding") as span:
+                query_embedding = self._embedding_service.embed_text(query.text)
+                span["vector_dimension"] = len(query_embedding)
+
+            cache_epoch = self._cache_epoch()
+            cached_answer = self._lookup_cache(query, query_embedding, request, trace)
+            if cached_answer is not None:
+                return cached_answer
+
+            retrieved_chunks = self._retrieve(query, query_embedding, request, trace)
+            prompt, source_chunk_ids = self._build_context(query, retrieved_chunks, trace)
+            with trace.span("generation") as span:
+                generated_text = self._generation_service.generate_text(prompt)
+                span["output_chars"] = len(generated_text)
+            return self._finish(query, request, query_embedding, generated_text, source_chunk_ids, trace, cache_epoch)
+        except Exception as error:
+            self._report_failure(trace, error)
+            raise
+
+    def run_stream(self, request: RAGRequest) -> Iterator[RAGStreamEvent]:
+        """Execute the RAG flow, yielding events as soon as they are available.
+
+        Yields one :class:`RAGRetrievalEvent`, then :class:`RAGTextDelta`
+        items while the answer is generated, and finally the :class:`Answer`.
+        The generation span includes time the consumer spends between
+        events; its ``first_delta_ms`` attribute is the time to first text.
+        """
+        trace = self._start_trace(request)
+        try:
+            query = self._create_query(request, trace)
+            with trace.span("embedding") as span:
+                query_embedding = self._embedding_service.embed_text(query.text)
+                span["vector_dimension"] = len(query_embedding)
+
+            cache_epoch = self._cache_epoch()
+            cached_answer = self._lookup_cache(query, query_embedding, request, trace)
+            if cached_answer is not None:
+                yield RAGRetrievalEvent(
+                    source_chunk_ids=list(cached_answer.source_chunk_ids),
+                    scores={},
+                    cache_hit=True,
+                )
+                yield RAGTextDelta(text=cached_answer.text)
+                yield cached_answer
+                return
+
+            retrieved_chunks = self._retrieve(query, query_embedding, request, trace)
+            prompt, source_chunk_ids = self._build_context(query, retrieved_chunks, trace)
+            scores = {item.chunk_id: item.score for item in retrieved_chunks if item.chunk_id in source_chunk_ids}
+            yield RAGRetrievalEvent(source_chunk_ids=list(source_chunk_ids), scores=scores)
+
+            deltas: list[str] = []
+            with trace.span("generation") as span:
+                generation_started = trace.elapsed_seconds
+                for delta in self._generation_service.stream_text(prompt):
+                    if delta:
+                        if not deltas:
+                            span["first_delta_ms"] = round((trace.elapsed_seconds - generation_started) * 1000, 3)
+                        deltas.append(delta)
+                        yield RAGTextDelta(text=delta)
+                generated_text = "".join(deltas).strip()
+                span["output_chars"] = len(generated_text)
+
+            if not generated_text:
+                raise RAGPipelineError("Generation returned no text.")
+            yield self._finish(query, request, query_embedding, generated_text, source_chunk_ids, trace, cache_epoch)
+        except Exception as error:
+            self._report_failure(trace, error)
+            raise
+
+    def run_many(
+        self,
+        requests: list[RAGRequest],
+        max_generation_concurrency: int = 8,
+    ) -> list[RAGBatchResult]:
+        """Answer many requests with one batched embed and one batched search.
+
+        Generation runs with bounded concurrency. Results come back in input
+        order; a failing request yields a result with ``error`` set instead of
+        aborting the batch.
+        """
+        if max_generation_concurrency <= 0:
+            raise RAGPipelineError("max_generation_concurrency must be greater than zero.")
+
+        results: list[RAGBatchResult | None] = [None] * len(requests)
+        queries: dict[int, Query] = {}
+        for index, request in enumerate(requests):
+            try:
+                queries[index] = Query.create(text=request.query_text)
+            except ValueError as error:
+                results[index] = RAGBatchResult(error=str(error))
+
+        embeddings: dict[int, list[float]] = {}
+        embedding_results = self._embedding_service.embed_batch([query.text for query in queries.values()])
+        for index, outcome in zip(queries, embedding_results):
+            if outcome.ok and outcome.embedding is not None:
+                embeddings[index] = outcome.embedding
+            else:
+                results[index] = RAGBatchResult(error=outcome.error or "Query embedding failed.")
+
+        cache_epoch = self._cache_epoch()
+        to_search: list[int] = []
+        for index, query_embedding in embeddings.items():
+            cached_answer = self._lookup_cache(queries[index], query_embedding, requests[index])
+            if cached_answer is not None:
+                results[index] = RAGBatchResult(answer=cached_answer)
+            else:
+                to_search.append(index)
+
+        prompts: dict[int, tuple[str, list[str]]] = {}
+        if to_search:
+            try:
+                retrieved_batches = self._vector_store.search_similar_batch(
+                    [
+                        VectorSearchQuery(
+                            query_embedding=embeddings[index],
+                            limit=self._candidate_limit(requests[index]),
+                            score_threshold=requests[index].score_threshold,
+                        )
+                        for index in to_search
+                    ]
+                )
+            except Exception as error:  # noqa: BLE001
+                for index in to_search:
+                    results[index] = RAGBatchResult(error=f"Vector search failed: {error}")
+                retrieved_batches = []
+            for index, retrieved_chunks in zip(to_search, retrieved_batches):
+                try:
+                    retrieved_chunks = self._fuse_keyword_matches(queries[index], retrieved_chunks, requests[index])
+                    prompts[index] = self._prepare_prompt(queries[index], retrieved_chunks)
+                except Exception as error:  # noqa: BLE001
+                    results[index] = RAGBatchResult(error=str(error) or type(error).__name__)
+
+        def generate(index: int) -> RAGBatchResult:
+            prompt, source_chunk_ids = prompts[index]
+            try:
+                generated_text = self._generation_service.generate_text(prompt)
+                answer = self._finish(
+                    queries[index],
+                    requests[index],
+                    embeddings[index],
+                    generated_text,
+                    source_chunk_ids,
+                    cache_epoch=cache_epoch,
+                )
+            except Exception as error:  # noqa: BLE001
+                return RAGBatchResult(error=str(error) or type(error).__name__)
+            return RAGBatchResult(answer=answer)
+
+        if prompts:
+            workers = min(max_generation_concurrency, len(prompts))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for index, outcome in zip(prompts, executor.map(generate, prompts)):
+                    results[index] = outcome
+
+        return [result or RAGBatchResult(error="Request was not processed.") for result in results]
+
+    async def arun(self, request: RAGRequest) -> Answer:
+        """Asynchronous equivalent of :meth:`run`."""
+        trace = self._start_trace(request)
+        try:
+            return await self._arun(request, trace)
+        except Exception as error:
+            self._report_failure(trace, error)
+            raise
+
+    async def _arun(self, request: RAGRequest, trace: StageTrace) -> Answer:
+        query = self._create_query(request, trace)
+        with trace.span("embedding") as span:
+            if self._async_embedding_service is not None:
+                query_embedding = await self._async_embedding_service.embed_text(query.text)
+            else:
+                query_embedding = await asyncio.to_thread(self._embedding_service.embed_text, query.text)
+            span["vector_dimension"] = len(query_embedding)
+
+        cache_epoch = self._cache_epoch()
+        cached_answer = self._lookup_cache(query, query_embedding, request, trace)
+        if cached_answer is not None:
+            return cached_answer
+
+        if self._async_vector_store is not None:
+            dense_search = self._async_vector_store.search_similar(
+                query_embedding=query_embedding,
+                limit=self._candidate_limit(request),
+                score_threshold=request.score_threshold,
+            )
+        else:
+            dense_search = asyncio.to_thread(
+                self._vector_store.search_similar,
+                query_embedding=query_embedding,
+                limit=self._candidate_limit(request),
+                score_threshold=request.score_threshold,
+            )
+        # Dense and keyword searches overlap here, so one span covers both.
+        with trace.span("vector_search") as span:
+            if self._keyword_index is None:
+                retrieved_chunks = await dense_search
+            else:
+                dense, lexical = await asyncio.gather(
+                    dense_search,
+                    asyncio.to_thread(self._keyword_index.search_text, query.text, self._candidate_limit(request)),
+                )
+                span["keyword_hits"] = len(lexical)
+                retrieved_chunks = self._fuse([dense, lexical], request)
+            span["hits"] = len(retrieved_chunks)
+        # Hydration reads the sync chunk text store and packing is CPU-bound: keep both off the loop.
+        prompt, source_chunk_ids = await asyncio.to_thread(self._build_context, query, retrieved_chunks, trace)
+        with trace.span("generation") as span:
+            if self._async_generation_service is not None:
+                generated_text = await self._async_generation_service.generate_text(prompt)
+            else:
+                generated_text = await asyncio.to_thread(self._generation_service.generate_text, prompt)
+            span["output_chars"] = len(generated_text)
+        return self._finish(query, request, query_embedding, generated_text, source_chunk_ids, trace, cache_epoch)
+
+    def _retrieve(
+        self,
+        query: Query,
+        query_embedding: list[float],
+        request: RAGRequest,
+        trace: StageTrace,
+    ) -> list[VectorSearchResult]:
+        with trace.span("vector_search") as span:
+            dense = self._vector_store.search_similar(
+                query_embedding=query_embedding,
+                limit=self._candidate_limit(request),
+                score_threshold=request.score_threshold,
+            )
+            span["hits"] = len(dense)
+        if self._keyword_index is None:
+            return dense
+        with trace.span("keyword_search") as span:
+            lexical = self._keyword_index.search_text(query.text, self._candidate_limit(request))
+            span["hits"] = len(lexical)
+        return self._fuse([dense, lexical], request)
+
+    def _fuse_keyword_matches(
+        self,
+        query: Query,
+        dense: list[VectorSearchResult],
+        request: RAGRequest,
+    ) -> list[VectorSearchResult]:
+        if self._keyword_index is None:
+            return dense
+        lexical = self._keyword_index.search_text(query.text, self._candidate_limit(request))
+        return self._fuse([dense, lexical], request)
+
+    def _fuse(
+        self,
+        result_lists: list[list[VectorSearchResult]],
+        request: RAGRequest,
+    ) -> list[VectorSearchResult]:
+        return reciprocal_rank_fusion(result_lists, limit=request.top_k, k=self._rrf_k)
+
+    def _candidate_limit(self, request: RAGRequest) -> int:
+        if self._keyword_index is None:
+            return request.top_k
+        return max(request.top_k, self._hybrid_candidates)
+
+    def _start_trace(self, request: RAGRequest) -> StageTrace:
+        return StageTrace(request.correlation_id or uuid.uuid4().hex)
+
+    @staticmethod
+    def _create_query(request: RAGRequest, trace: StageTrace) -> Query:
+        with trace.span("query") as span:
+            query = Query.create(text=request.query_text)
+            span["query_chars"] = len(query.text)
+        return query
+
+    def _build_context(
+        self,
+        query: Query,
+        retrieved_chunks: list[VectorSearchResult],
+        trace: StageTrace,
+    ) -> tuple[str, list[str]]:
+        with trace.span("context") as span:
+            prompt, source_chunk_ids = self._prepare_prompt(query, retrieved_chunks)
+            span["context_chunks"] = len(source_chunk_ids)
+            span["prompt_chars"] = len(prompt)
+            span["prompt_tokens"] = estimate_tokens(prompt)
+        return prompt, source_chunk_ids
+
+    def _report(self, trace: StageTrace, cache_hit: bool) -> None:
+        if self._metrics is not None:
+            for span in trace.spans:
+                self._metrics.observe_latency(span.stage, span.duration_seconds)
+            self._metrics.observe_latency("total", trace.elapsed_seconds)
+        logger.info(
+            "RAG request completed",
+            extra={
+                "correlation_id": trace.correlation_id,
+                "fields": {
+                    "total_ms": round(trace.elapsed_seconds * 1000, 3),
+                    "cache_hit": cache_hit,
+                    "spans": [span.as_dict() for span in trace.spans],
+                },
+            },
+        )
+
+    def _report_failure(self, trace: StageTrace, error: Exception) -> None:
+        logger.warning(
+            "RAG request failed: %s",
+            error,
+            extra={
+                "correlation_id": trace.correlation_id,
+                "fields": {
+                    "total_ms": round(trace.elapsed_seconds * 1000, 3),
+                    "failed_stage": trace.spans[-1].stage if trace.spans else None,
+                    "spans": [span.as_dict() for span in trace.spans],
+                },
+            },
         )
 
+    def _prepare_prompt(
+        self,
+        query: Query,
+        retrieved_chunks: list[VectorSearchResult],
+    ) -> tuple[str, list[str]]:
         if not retrieved_chunks:
             raise RAGPipelineError(
                 "No relevant context found for query. Ingest TXT files before querying."
             )
 
-        context_blocks = []
-        source_chunk_ids: list[str] = []
-        for item in retrieved_chunks:
-            source_text = str(item.payload.get("text", "")).strip()
-            if not source_text:
-                continue
-            source_chunk_ids.append(item.chunk_id)
-            context_blocks.append(f"[chunk_id={item.chunk_id}] {source_text}")
-
-        if not context_blocks:
+        packed = self._context_packer.pack(self._hydrate(retrieved_chunks))
+        if not packed.blocks:
             raise RAGPipelineError(
                 "Retrieved chunks did not contain 'text' payload required for prompt context."
             )
 
-        prompt = self._build_prompt(query.text, context_blocks)
-        generated_text = self._generation_service.generate_text(prompt)
+        return self._build_prompt(query.text, packed.blocks), packed.chunk_ids
 
-        return Answer.create(
+    def _hydrate(self, retrieved_chunks: list[VectorSearchResult]) -> list[VectorSearchResult]:
+        """Fill in chunk text from the text store with one batched lookup."""
+        if self._chunk_text_store is None:
+            return retrieved_chunks
+        missing = [item.chunk_id for item in retrieved_chunks if "text" not in item.payload]
+        if not missing:
+            return retrieved_chunks
+        texts = self._chunk_text_store.get_texts(missing)
+        return [
+            VectorSearchResult(
+                chunk_id=item.chunk_id,
+                score=item.score,
+                payload={**item.payload, "text": texts[item.chunk_id]},
+            )
+            if item.chunk_id in texts and "text" not in item.payload
+            else item
+            for item in retrieved_chunks
+        ]
+
+    def _finish(
+        self,
+        query: Query,
+        request: RAGRequest,
+        query_embedding: list[float],
+        generated_text: str,
+        source_chunk_ids: list[str],
+        trace: StageTrace | None = None,
+        cache_epoch: int | None = None,
+    ) -> Answer:
+        metadata = self._answer_metadata(query, request)
+        if trace is not None:
+            metadata.update(trace.as_metadata())
+        answer = Answer.create(
             text=generated_text,
             source_chunk_ids=source_chunk_ids,
-            metadata={
-                "query_text": query.text,
-                "top_k": request.top_k,
-            },
+            metadata=metadata,
         )
+        if self._answer_cache is not None:
+            self._answer_cache.store(query_embedding, request.top_k, request.score_threshold, answer, cache_epoch)
+        if trace is not None:
+            self._report(trace, cache_hit=False)
+        return answer
+
+    def _cache_epoch(self) -> int | None:
+        """Read before retrieval so answers built on an invalidated index are not cached."""
+        return None if self._answer_cache is None else self._answer_cache.epoch
+
+    def _lookup_cache(
+        self,
+        query: Query,
+        query_embedding: list[float],
+        request: RAGRequest,
+        trace: StageTrace | None = None,
+    ) -> Answer | None:
+        if self._answer_cache is None:
+            return None
+        hit = self._answer_cache.lookup(query_embedding, request.top_k, request.score_threshold)
+        if hit is None:
+            return None
+        cached, similarity = hit
+        metadata = {
+            **self._answer_metadata(query, request),
+            "cache_hit": True,
+            "cache_similarity": round(similarity, 6),
+        }
+        if trace is not None:
+            metadata.update(trace.as_metadata())
+            self._report(trace, cache_hit=True)
+        return Answer.create(
+            text=cached.text,
+            source_chunk_ids=cached.source_chunk_ids,
+            metadata=metadata,
+        )
+
+    def _answer_metadata(self, query: Query, request: RAGRequest) -> dict[str, object]:
+        metadata: dict[str, object] = {
+            "query_text": query.text,
+            "top_k": request.top_k,
+        }
+        if self._answer_cache is not None:
+            metadata["cache_hit"] = False
+        if self._keyword_index is not None:
+            metadata["retrieval"] = "hybrid"
+        return metadata
 
     @staticmethod
     def _build_prompt(query_text: str, context_blocks: list[str]) -> str:
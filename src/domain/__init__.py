@@ -2,7 +2,8 @@
 
 from .answer import Answer
 from .chunk import Chunk
+from .chunk_batch import ChunkBatch, ChunkBatchBuilder
 from .document import Document
 from .query import Query
 
-__all__ = ["Document", "Chunk", "Query", "Answer"]
+__all__ = ["Document", "Chunk", "ChunkBatch", "ChunkBatchBuilder", "Query", "Answer"]
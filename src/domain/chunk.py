@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chunk:
     """Represents a chunk generated from a source document."""
 
@@ -17,13 +17,13 @@ class Chunk:
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        if not self.id.strip():
+        if not self.id or self.id.isspace():
             raise ValueError("Chunk.id cannot be empty.")
 
-        if not self.document_id.strip():
+        if not self.document_id or self.document_id.isspace():
             raise ValueError("Chunk.document_id cannot be empty.")
 
-        if not self.content.strip():
+        if not self.content or self.content.isspace():
             raise ValueError("Chunk.content cannot be empty.")
 
         if self.sequence_number < 0:
@@ -0,0 +1,191 @@
+"""Columnar batch of chunks over shared text buffers."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+import operator
+from typing import Any, Iterator
+
+from .chunk import Chunk
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkBatch:
+    """Many chunks stored column-wise instead of as one object each.
+
+    Chunk ``i`` has content ``text[text_offsets[i]:text_offsets[i + 1]]`` and
+    ID ``ids[id_offsets[i]:id_offsets[i + 1]]``. Document IDs and metadata are
+    stored once per document and referenced by ``document_indices``.
+    ``source_starts``/``source_ends`` hold each chunk's range in its source
+    document and become the ``start_offset``/``end_offset`` metadata of the
+    materialized :class:`Chunk`.
+
+    Content and IDs must be stripped and non-empty, as ``normalize_text``
+    produces them; this lets validation inspect only the first and last
+    character of each entry. The arrays are treated as read-only.
+    """
+
+    text: str
+    text_offsets: array
+    ids: str
+    id_offsets: array
+    sequence_numbers: array
+    document_indices: array
+    source_starts: array
+    source_ends: array
+    document_ids: tuple[str, ...]
+    document_metadata: tuple[dict[str, Any], ...]
+
+    def __post_init__(self) -> None:
+        size = len(self.sequence_numbers)
+        if len(self.text_offsets) != size + 1 or len(self.id_offsets) != size + 1:
+            raise ValueError("ChunkBatch offsets must have one entry more than the batch size.")
+
+        if not len(self.document_indices) == len(self.source_starts) == len(self.source_ends) == size:
+            raise ValueError("ChunkBatch columns must all have the batch size.")
+
+        if len(self.document_ids) != len(self.document_metadata):
+            raise ValueError("ChunkBatch.document_metadata must match ChunkBatch.document_ids.")
+
+        if any(not document_id or document_id.isspace() for document_id in self.document_ids):
+            raise ValueError("ChunkBatch.document_ids cannot contain empty IDs.")
+
+        _check_slices("content", self.text, self.text_offsets)
+        _check_slices("id", self.ids, self.id_offsets)
+
+        if size == 0:
+            return
+
+        if min(self.sequence_numbers) < 0:
+            raise ValueError("ChunkBatch.sequence_numbers must be non-negative.")
+
+        if min(self.document_indices) < 0 or max(self.document_indices) >= len(self.document_ids):
+            raise ValueError("ChunkBatch.document_indices must reference ChunkBatch.document_ids.")
+
+        if not all(map(operator.le, self.source_starts, self.source_ends)):
+            raise ValueError("ChunkBatch.source_starts cannot exceed ChunkBatch.source_ends.")
+
+    def __len__(self) -> int:
+        return len(self.sequence_numbers)
+
+    def __iter__(self) -> Iterator[Chunk]:
+        return map(self.chunk, range(len(self)))
+
+    def content(self, index: int) -> str:
+        return self.text[self.text_offsets[index] : self.text_offsets[index + 1]]
+
+    def chunk_id(self, index: int) -> str:
+        return self.ids[self.id_offsets[index] : self.id_offsets[index + 1]]
+
+    def contents(self) -> list[str]:
+        offsets = self.text_offsets
+        return [self.text[start:end] for start, end in zip(offsets, islice(offsets, 1, None))]
+
+    def chunk_ids(self) -> list[str]:
+        offsets = self.id_offsets
+        return [self.ids[start:end] for start, end in zip(offsets, islice(offsets, 1, None))]
+
+    def chunk(self, index: int) -> Chunk:
+        """Materialize chunk ``index`` without re-running per-chunk validation."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"ChunkBatch index {index} out of range.")
+        document_index = self.document_indices[index]
+        metadata = dict(self.document_metadata[document_index])
+        metadata["start_offset"] = self.source_starts[index]
+        metadata["end_offset"] = self.source_ends[index]
+        # The batch was validated as a whole in __post_init__.
+        chunk = object.__new__(Chunk)
+        object.__setattr__(chunk, "id", self.chunk_id(index))
+        object.__setattr__(chunk, "document_id", self.document_ids[document_index])
+        object.__setattr__(chunk, "content", self.content(index))
+        object.__setattr__(chunk, "sequence_number", self.sequence_numbers[index])
+        object.__setattr__(chunk, "metadata", metadata)
+        return chunk
+
+
+class ChunkBatchBuilder:
+    """Accumulates chunks and emits them as a :class:`ChunkBatch`."""
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._sequence_numbers)
+
+    def add_document(self, document_id: str, metadata: dict[str, Any] | None = None) -> int:
+        """Index of ``document_id`` in the batch being built, registering it if new."""
+        index = self._document_index.get(document_id)
+        if index is None:
+            index = len(self._document_ids)
+            self._document_index[document_id] = index
+            self._document_ids.append(document_id)
+            self._document_metadata.append(dict(metadata or {}))
+        return index
+
+    def append(
+        self,
+        chunk_id: str,
+        document_index: int,
+        content: str,
+        sequence_number: int,
+        source_start: int,
+        source_end: int,
+    ) -> None:
+        self._texts.append(content)
+        self._text_length += len(content)
+        self._text_offsets.append(self._text_length)
+        self._ids.append(chunk_id)
+        self._ids_length += len(chunk_id)
+        self._id_offsets.append(self._ids_length)
+        self._sequence_numbers.append(sequence_number)
+        self._document_indices.append(document_index)
+        self._source_starts.append(source_start)
+        self._source_ends.append(source_end)
+
+    def build(self) -> ChunkBatch:
+        """Validated batch of everything appended so far; the builder starts over."""
+        batch = ChunkBatch(
+            text="".join(self._texts),
+            text_offsets=self._text_offsets,
+            ids="".join(self._ids),
+            id_offsets=self._id_offsets,
+            sequence_numbers=self._sequence_numbers,
+            document_indices=self._document_indices,
+            source_starts=self._source_starts,
+            source_ends=self._source_ends,
+            document_ids=tuple(self._document_ids),
+            document_metadata=tuple(self._document_metadata),
+        )
+        self._reset()
+        return batch
+
+    def _reset(self) -> None:
+        self._texts: list[str] = []
+        self._text_length = 0
+        self._text_offsets = array("q", [0])
+        self._ids: list[str] = []
+        self._ids_length = 0
+        self._id_offsets = array("q", [0])
+        self._sequence_numbers = array("q")
+        self._document_indices = array("l")
+        self._source_starts = array("q")
+        self._source_ends = array("q")
+        self._document_ids: list[str] = []
+        self._document_metadata: list[dict[str, Any]] = []
+        self._document_index: dict[str, int] = {}
+
+
+def _check_slices(label: str, buffer: str, offsets: array) -> None:
+    """Every slice non-empty, in order, covering ``buffer``, with no edge whitespace."""
+    if offsets[0] != 0 or offsets[-1] != len(buffer):
+        raise ValueError(f"ChunkBatch {label} offsets must span the whole buffer.")
+    ends = islice(offsets, 1, None)
+    if not all(map(operator.lt, offsets, ends)):
+        raise ValueError(f"ChunkBatch {label} entries cannot be empty.")
+    count = len(offsets) - 1
+    firsts = map(buffer.__getitem__, islice(offsets, count))
+    lasts = map(buffer.__getitem__, map((-1).__add__, islice(offsets, 1, None)))
+    if any(map(str.isspace, firsts)) or any(map(str.isspace, lasts)):
+        raise ValueError(f"ChunkBatch {label} entries must be stripped and non-blank.")
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Document:
     """Represents a source document in the knowledge base."""
 
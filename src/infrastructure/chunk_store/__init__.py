@@ -0,0 +1,5 @@
+"""Chunk text store adapters."""
+
+from .mmap_store import ChunkStoreError, MmapChunkTextStore
+
+__all__ = ["MmapChunkTextStore", "ChunkStoreError"]
@@ -0,0 +1,208 @@
+"""Append-only, memory-mapped chunk text store."""
+
+from __future__ import annotations
+
+import mmap
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import BinaryIO, Sequence
+
+from src.application import ChunkTextStorePort, TextRecord
+
+
+class ChunkStoreError(Exception):
+    """Raised when the chunk text store cannot be read or written."""
+
+
+_BLOB_FILE = "texts.blob"
+_INDEX_FILE = "texts.idx"
+# chunk_id byte length, blob offset, text byte length (-1 marks a deletion).
+_ENTRY = struct.Struct("<HQi")
+
+
+class MmapChunkTextStore(ChunkTextStorePort):
+    """Chunk texts in one append-only blob file, read through ``mmap``.
+
+    Every write appends UTF-8 text to ``texts.blob`` and an entry to the
+    ``texts.idx`` log; the log is replayed into an in-memory
+    ``chunk_id -> (offset, length)`` map on open. Replaced and deleted texts
+    stay in the blob until :meth:`compact` rewrites it. A torn trailing log
+    entry from an interrupted write is discarded on open.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._directory = Path(directory)
+        self._lock = threading.Lock()
+        self._locations: dict[str, tuple[int, int]] = {}
+        self._live_bytes = 0
+        self._map: mmap.mmap | None = None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._replay_index()
+            self._blob = (self._directory / _BLOB_FILE).open("ab")
+            self._index = (self._directory / _INDEX_FILE).open("ab")
+        except OSError as error:
+            raise ChunkStoreError(f"Failed to open chunk text store '{self._directory}'.") from error
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._locations)
+
+    @property
+    def dead_bytes(self) -> int:
+        """Blob bytes held by replaced or deleted texts, reclaimable by :meth:`compact`."""
+        with self._lock:
+            return self._blob.tell() - self._live_bytes
+
+    def put_texts(self, records: Sequence[TextRecord]) -> None:
+        if not records:
+            return
+        latest = {record.chunk_id: record.text.encode("utf-8") for record in records}
+        with self._lock:
+            locations: dict[str, tuple[int, int]] = {}
+            offset = self._blob.tell()
+            for chunk_id, data in latest.items():
+                locations[chunk_id] = (offset, len(data))
+                offset += len(data)
+            try:
+                # Text first, so a crash never leaves an index entry past the blob end.
+                self._blob.write(b"".join(latest.values()))
+                self._blob.flush()
+                self._index.write(
+                    b"".join(_encode_entry(chunk_id, *location) for chunk_id, location in locations.items())
+                )
+                self._index.flush()
+            except OSError as error:
+                raise ChunkStoreError(f"Failed to write {len(latest)} chunk texts.") from error
+
+            for chunk_id, location in locations.items():
+                self._forget(chunk_id)
+                self._locations[chunk_id] = location
+                self._live_bytes += location[1]
+
+    def get_texts(self, chunk_ids: Sequence[str]) -> dict[str, str]:
+        """Read many texts in blob order, so lookups sweep the file forwards."""
+        with self._lock:
+            wanted = sorted(
+                ((self._locations[chunk_id], chunk_id) for chunk_id in set(chunk_ids) if chunk_id in self._locations),
+            )
+            if not wanted:
+                return {}
+            view = self._view(max(offset + length for (offset, length), _ in wanted))
+            return {
+                chunk_id: view[offset : offset + length].decode("utf-8")
+                for (offset, length), chunk_id in wanted
+            }
+
+    def delete_texts(self, chunk_ids: Sequence[str]) -> None:
+        with self._lock:
+            known = [chunk_id for chunk_id in dict.fromkeys(chunk_ids) if chunk_id in self._locations]
+            if not known:
+                return
+            try:
+                self._index.write(b"".join(_encode_entry(chunk_id, 0, -1) for chunk_id in known))
+                self._index.flush()
+            except OSError as error:
+                raise ChunkStoreError(f"Failed to delete {len(known)} chunk texts.") from error
+            for chunk_id in known:
+                self._forget(chunk_id)
+
+    def flush(self) -> None:
+        """Force written texts and index entries to stable storage."""
+        with self._lock:
+            try:
+                for handle in (self._blob, self._index):
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            except OSError as error:
+                raise ChunkStoreError("Failed to flush chunk text store.") from error
+
+    def compact(self) -> None:
+        """Rewrite the blob and index with live texts only."""
+        with self._lock:
+            try:
+                self._blob.flush()
+                view = self._view(self._blob.tell())
+                blob_tmp = self._directory / (_BLOB_FILE + ".tmp")
+                index_tmp = self._directory / (_INDEX_FILE + ".tmp")
+                locations: dict[str, tuple[int, int]] = {}
+                with blob_tmp.open("wb") as blob, index_tmp.open("wb") as index:
+                    for chunk_id, (offset, length) in sorted(self._locations.items(), key=lambda item: item[1]):
+                        locations[chunk_id] = (blob.tell(), length)
+                        index.write(_encode_entry(chunk_id, blob.tell(), length))
+                        blob.write(view[offset : offset + length])
+                    for handle in (blob, index):
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                self._close_handles()
+                os.replace(blob_tmp, self._directory / _BLOB_FILE)
+                os.replace(index_tmp, self._directory / _INDEX_FILE)
+                self._blob = (self._directory / _BLOB_FILE).open("ab")
+                self._index = (self._directory / _INDEX_FILE).open("ab")
+            except OSError as error:
+                raise ChunkStoreError(f"Failed to compact chunk text store '{self._directory}'.") from error
+            self._locations = locations
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handles()
+
+    def _view(self, needed: int) -> mmap.mmap | bytes:
+        """Return a mapping covering ``needed`` bytes, remapping after appends."""
+        if needed == 0:
+            # Only empty texts are wanted, and an empty blob cannot be mapped.
+            return b""
+        if self._map is None or len(self._map) < needed:
+            if self._map is not None:
+                self._map.close()
+            self._blob.flush()
+            with (self._directory / _BLOB_FILE).open("rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _forget(self, chunk_id: str) -> None:
+        previous = self._locations.pop(chunk_id, None)
+        if previous is not None:
+            self._live_bytes -= previous[1]
+
+    def _close_handles(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        for handle in (getattr(self, "_blob", None), getattr(self, "_index", None)):
+            if handle is not None and not handle.closed:
+                handle.close()
+
+    def _replay_index(self) -> None:
+        index_path = self._directory / _INDEX_FILE
+        blob_path = self._directory / _BLOB_FILE
+        if not index_path.exists():
+            return
+        blob_size = blob_path.stat().st_size if blob_path.exists() else 0
+        with index_path.open("r+b") as handle:
+            valid_end = self._replay_entries(handle, blob_size)
+            if valid_end != handle.seek(0, os.SEEK_END):
+                handle.truncate(valid_end)
+
+    def _replay_entries(self, handle: BinaryIO, blob_size: int) -> int:
+        data = handle.read()
+        position = 0
+        while position + _ENTRY.size <= len(data):
+            id_length, offset, length = _ENTRY.unpack_from(data, position)
+            end = position + _ENTRY.size + id_length
+            if end > len(data) or (length >= 0 and offset + length > blob_size):
+                break
+            chunk_id = data[position + _ENTRY.size : end].decode("utf-8")
+            self._forget(chunk_id)
+            if length >= 0:
+                self._locations[chunk_id] = (offset, length)
+                self._live_bytes += length
+            position = end
+        return position
+
+
+def _encode_entry(chunk_id: str, offset: int, length: int) -> bytes:
+    encoded = chunk_id.encode("utf-8")
+    return _ENTRY.pack(len(encoded), offset, length) + encoded
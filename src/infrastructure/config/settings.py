@@ -24,10 +24,22 @@ class AppSettings:
     gemini_api_key: str
     gemini_generation_model: str
     gemini_embedding_model: str
+    qdrant_quantization: str = "none"
+    qdrant_search_oversampling: float = 2.0
+    qdrant_search_rescore: bool = True
+    qdrant_prefer_grpc: bool = False
+    qdrant_grpc_port: int = 6334
+    qdrant_timeout_seconds: int = 10
+    qdrant_pool_size: int = 4
+    qdrant_keepalive_seconds: float = 30.0
+    log_debug_sampling: tuple[tuple[str, float], ...] = ()
 
 
 _ALLOWED_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 _ALLOWED_LOG_FORMATS = {"json", "text"}
+_ALLOWED_QUANTIZATION = {"none", "int8", "binary"}
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off"}
 
 
 def _read_env(name: str, default: str | None = None) -> str:
@@ -44,9 +56,32 @@ def _read_required_env(name: str, stage: str, remediation: str) -> str:
     raise SettingsError(
         f"Missing required environment variable '{name}' in stage '{stage}'. {remediation}"
     )
-def _read_env(name: str, default: str) -> str:
-    value = os.getenv(name, default).strip()
-    return value or default
+
+
+def _parse_number(name: str, raw_value: str, cast: type, minimum: float) -> int | float:
+    try:
+        value = cast(raw_value)
+    except ValueError as error:
+        raise SettingsError(f"Invalid {name}='{raw_value}'. Expected number >= {minimum}.") from error
+    if value < minimum:
+        raise SettingsError(f"Invalid {name}. Expected number >= {minimum}.")
+    return value
+
+
+def _parse_sampling(raw_value: str) -> tuple[tuple[str, float], ...]:
+    rates: list[tuple[str, float]] = []
+    for entry in filter(None, (part.strip() for part in raw_value.split(","))):
+        logger_name, separator, rate_raw = entry.partition("=")
+        try:
+            rate = float(rate_raw)
+        except ValueError:
+            rate = -1.0
+        if not separator or not logger_name.strip() or not 0.0 <= rate <= 1.0:
+            raise SettingsError(
+                f"Invalid LOG_DEBUG_SAMPLING entry '{entry}'. Expected logger=rate with rate between 0 and 1."
+            )
+        rates.append((logger_name.strip(), rate))
+    return tuple(rates)
 
 
 def load_settings() -> AppSettings:
@@ -55,6 +90,7 @@ def load_settings() -> AppSettings:
     app_name = _read_env("APP_NAME", "atlas-rag-platform") or "atlas-rag-platform"
     log_level = (_read_env("LOG_LEVEL", "INFO") or "INFO").upper()
     log_format = (_read_env("LOG_FORMAT", "json") or "json").lower()
+    log_debug_sampling = _parse_sampling(_read_env("LOG_DEBUG_SAMPLING", ""))
 
     qdrant_url = _read_required_env(
         name="QDRANT_URL",
@@ -63,6 +99,14 @@ def load_settings() -> AppSettings:
     )
     qdrant_collection_name = _read_env("QDRANT_COLLECTION_NAME", "atlas_chunks") or "atlas_chunks"
     embedding_size_raw = _read_env("EMBEDDING_SIZE", "768") or "768"
+    qdrant_quantization = (_read_env("QDRANT_QUANTIZATION", "none") or "none").lower()
+    oversampling_raw = _read_env("QDRANT_SEARCH_OVERSAMPLING", "2.0") or "2.0"
+    rescore_raw = (_read_env("QDRANT_SEARCH_RESCORE", "true") or "true").lower()
+    prefer_grpc_raw = (_read_env("QDRANT_PREFER_GRPC", "false") or "false").lower()
+    grpc_port_raw = _read_env("QDRANT_GRPC_PORT", "6334") or "6334"
+    timeout_raw = _read_env("QDRANT_TIMEOUT_SECONDS", "10") or "10"
+    pool_size_raw = _read_env("QDRANT_POOL_SIZE", "4") or "4"
+    keepalive_raw = _read_env("QDRANT_KEEPALIVE_SECONDS", "30") or "30"
 
     gemini_api_key = _read_required_env(
         name="GEMINI_API_KEY",
@@ -92,6 +136,33 @@ def load_settings() -> AppSettings:
     if embedding_size <= 0:
         raise SettingsError("Invalid EMBEDDING_SIZE. Expected integer greater than zero.")
 
+    if qdrant_quantization not in _ALLOWED_QUANTIZATION:
+        raise SettingsError(
+            f"Invalid QDRANT_QUANTIZATION='{qdrant_quantization}'. "
+            f"Allowed values: {sorted(_ALLOWED_QUANTIZATION)}"
+        )
+
+    try:
+        qdrant_search_oversampling = float(oversampling_raw)
+    except ValueError as error:
+        raise SettingsError(
+            f"Invalid QDRANT_SEARCH_OVERSAMPLING='{oversampling_raw}'. Expected number >= 1.0."
+        ) from error
+
+    if qdrant_search_oversampling < 1.0:
+        raise SettingsError("Invalid QDRANT_SEARCH_OVERSAMPLING. Expected number >= 1.0.")
+
+    if rescore_raw not in _TRUE_VALUES | _FALSE_VALUES:
+        raise SettingsError(f"Invalid QDRANT_SEARCH_RESCORE='{rescore_raw}'. Expected true or false.")
+
+    if prefer_grpc_raw not in _TRUE_VALUES | _FALSE_VALUES:
+        raise SettingsError(f"Invalid QDRANT_PREFER_GRPC='{prefer_grpc_raw}'. Expected true or false.")
+
+    qdrant_grpc_port = _parse_number("QDRANT_GRPC_PORT", grpc_port_raw, int, 1)
+    qdrant_timeout_seconds = _parse_number("QDRANT_TIMEOUT_SECONDS", timeout_raw, int, 1)
+    qdrant_pool_size = _parse_number("QDRANT_POOL_SIZE", pool_size_raw, int, 1)
+    qdrant_keepalive_seconds = _parse_number("QDRANT_KEEPALIVE_SECONDS", keepalive_raw, float, 0.0)
+
     return AppSettings(
         app_env=app_env,
         app_name=app_name,
@@ -103,4 +174,13 @@ def load_settings() -> AppSettings:
         gemini_api_key=gemini_api_key,
         gemini_generation_model=gemini_generation_model,
         gemini_embedding_model=gemini_embedding_model,
+        qdrant_quantization=qdrant_quantization,
+        qdrant_search_oversampling=qdrant_search_oversampling,
+        qdrant_search_rescore=rescore_raw in _TRUE_VALUES,
+        qdrant_prefer_grpc=prefer_grpc_raw in _TRUE_VALUES,
+        qdrant_grpc_port=qdrant_grpc_port,
+        qdrant_timeout_seconds=qdrant_timeout_seconds,
+        qdrant_pool_size=qdrant_pool_size,
+        qdrant_keepalive_seconds=qdrant_keepalive_seconds,
+        log_debug_sampling=log_debug_sampling,
     )
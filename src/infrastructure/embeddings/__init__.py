@@ -1,5 +1,13 @@
 """Embedding adapters."""
 
-from .gemini_embeddings import GeminiEmbeddingAdapter, GeminiEmbeddingError
+from .caching import CachingEmbeddingAdapter, EmbeddingCacheError, EmbeddingCacheStats
+from .gemini_embeddings import AsyncGeminiEmbeddingAdapter, GeminiEmbeddingAdapter, GeminiEmbeddingError
 
-__all__ = ["GeminiEmbeddingAdapter", "GeminiEmbeddingError"]
+__all__ = [
+    "GeminiEmbeddingAdapter",
+    "AsyncGeminiEmbeddingAdapter",
+    "GeminiEmbeddingError",
+    "CachingEmbeddingAdapter",
+    "EmbeddingCacheError",
+    "EmbeddingCacheStats",
+]
@@ -0,0 +1,244 @@
+"""Content-addressed embedding cache wrapping any embedding adapter."""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Sequence
+
+from src.application import EmbeddingPort, EmbeddingResult
+from src.application.chunking import normalize_text
+
+
+class EmbeddingCacheError(Exception):
+    """Raised when the on-disk embedding cache cannot be used."""
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    """Hit/miss counters since the adapter was created."""
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (model, text_hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS embeddings_accessed_at ON embeddings (accessed_at);
+"""
+
+
+class CachingEmbeddingAdapter(EmbeddingPort):
+    """Embedding decorator keyed by (model name, normalized text hash).
+
+    Recent vectors live in an in-memory LRU; with ``path`` set they are also
+    stored as float32 blobs in SQLite, bounded by ``max_disk_entries`` with
+    least-recently-used eviction. Only cache misses reach the wrapped adapter.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingPort,
+        model_name: str,
+        path: str | Path | None = None,
+        memory_entries: int = 10_000,
+        max_disk_entries: int = 1_000_000,
+    ) -> None:
+        if not model_name.strip():
+            raise EmbeddingCacheError("model_name cannot be empty.")
+        if memory_entries < 0 or max_disk_entries <= 0:
+            raise EmbeddingCacheError("Cache sizes must be positive.")
+        self._inner = inner
+        self._model_name = model_name
+        self._memory_entries = memory_entries
+        self._max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[bytes, tuple[float, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._connection: sqlite3.Connection | None = None
+        self._disk_entries = 0
+        if path is not None:
+            self._connection = self._open(Path(path))
+            self._disk_entries = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @property
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def embed_text(self, text: str) -> list[float]:
+        key = self._key(text)
+        cached = self._lookup([key]).get(key)
+        if cached is not None:
+            return list(cached)
+        embedding = self._inner.embed_text(text)
+        self._store({key: embedding})
+        return embedding
+
+    def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        keys = [self._key(text) for text in texts]
+        cached = self._lookup(keys)
+
+        miss_texts: dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in miss_texts:
+                miss_texts[key] = text
+
+        computed: dict[bytes, EmbeddingResult] = {}
+        if miss_texts:
+            results = self._inner.embed_batch(list(miss_texts.values()))
+            computed = dict(zip(miss_texts, results))
+            self._store(
+                {key: result.embedding for key, result in computed.items() if result.ok and result.embedding}
+            )
+
+        return [
+            EmbeddingResult(embedding=list(cached[key])) if key in cached else computed[key]
+            for key in keys
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(normalize_text(text).encode("utf-8")).digest()
+
+    def _lookup(self, keys: Sequence[bytes]) -> dict[bytes, tuple[float, ...]]:
+        found: dict[bytes, tuple[float, ...]] = {}
+        with self._lock:
+            disk_candidates: list[bytes] = []
+            for key in dict.fromkeys(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                else:
+                    disk_candidates.append(key)
+
+            if disk_candidates and self._connection is not None:
+                for key, vector in self._read_disk(self._connection, disk_candidates).items():
+                    found[key] = vector
+                    self._remember(key, vector)
+
+            from_disk = set(disk_candidates)
+            for key in keys:
+                if key not in found:
+                    self._misses += 1
+                elif key in from_disk:
+                    self._disk_hits += 1
+                else:
+                    self._memory_hits += 1
+        return found
+
+    def _store(self, embeddings: dict[bytes, list[float]]) -> None:
+        if not embeddings:
+            return
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._remember(key, tuple(embedding))
+            if self._connection is None:
+                return
+            now = time.time()
+            try:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, accessed_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        [
+                            (self._model_name, key, array("f", embedding).tobytes(), now)
+                            for key, embedding in embeddings.items()
+                        ],
+                    )
+                self._disk_entries += len(embeddings)
+                if self._disk_entries > self._max_disk_entries:
+                    self._evict_disk(self._connection)
+            except sqlite3.Error as error:
+                raise EmbeddingCacheError("Failed to write embedding cache.") from error
+
+    def _remember(self, key: bytes, vector: tuple[float, ...]) -> None:
+        if self._memory_entries == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, connection: sqlite3.Connection, keys: list[bytes]) -> dict[bytes, tuple[float, ...]]:
+        found: dict[bytes, tuple[float, ...]] = {}
+        # Stay well under SQLite's bound-parameter limit.
+        for start in range(0, len(keys), 500):
+            batch = keys[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            try:
+                rows = connection.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    [self._model_name, *batch],
+                ).fetchall()
+                if rows:
+                    with connection:
+                        connection.executemany(
+                            "UPDATE embeddings SET accessed_at = ? WHERE model = ? AND text_hash = ?",
+                            [(time.time(), self._model_name, key) for key, _ in rows],
+                        )
+            except sqlite3.Error as error:
+                raise EmbeddingCacheError("Failed to read embedding cache.") from error
+            for key, blob in rows:
+                found[bytes(key)] = tuple(array("f", blob))
+        return found
+
+    def _evict_disk(self, connection: sqlite3.Connection) -> None:
+        """Trim the store to 90% of its bound so eviction runs in amortized batches."""
+        self._disk_entries = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        excess = self._disk_entries - int(self._max_disk_entries * 0.9)
+        if excess <= 0:
+            return
+        with connection:
+            connection.execute(
+                "DELETE FROM embeddings WHERE (model, text_hash) IN "
+                "(SELECT model, text_hash FROM embeddings ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+        self._disk_entries -= excess
+        self._evictions += excess
+
+    @staticmethod
+    def _open(path: Path) -> sqlite3.Connection:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as error:
+            raise EmbeddingCacheError(f"Failed to open embedding cache '{path}'.") from error
+        return connection
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from src.application import EmbeddingPort
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
 
-try:
-    import google.generativeai as genai
-except ImportError:  # pragma: no cover
-    genai = None
+from src.application import AsyncEmbeddingPort, EmbeddingPort, EmbeddingResult
+from src.infrastructure.registry import import_optional
+
+# The SDK is heavy to import, so it is loaded when the first adapter is built.
+genai: Any = None
+
+
+# Upper bound accepted by the Gemini batchEmbedContents endpoint.
+GEMINI_MAX_BATCH_SIZE = 100
 
 
 class GeminiEmbeddingError(Exception):
@@ -17,15 +24,21 @@ class GeminiEmbeddingError(Exception):
 class GeminiEmbeddingAdapter(EmbeddingPort):
     """Gemini implementation for embeddings."""
 
-    def __init__(self, api_key: str, model_name: str = "models/text-embedding-004") -> None:
-        if not api_key.strip():
-            raise GeminiEmbeddingError("GEMINI_API_KEY cannot be empty.")
-        if genai is None:
-            raise GeminiEmbeddingError(
-                "google-generativeai is not installed. Install dependencies before running Phase 5."
-            )
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "models/text-embedding-004",
+        batch_size: int = GEMINI_MAX_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+    ) -> None:
+        _configure_client(api_key, batch_size, max_concurrent_batches)
         self._model_name = model_name
-        genai.configure(api_key=api_key)
+        self._batch_size = batch_size
+        self._max_concurrent_batches = max_concurrent_batches
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
 
     def embed_text(self, text: str) -> list[float]:
         if not text.strip():
@@ -35,7 +48,150 @@ class GeminiEmbeddingAdapter(EmbeddingPort):
         except Exception as error:  # noqa: BLE001
             raise GeminiEmbeddingError("Gemini embedding request failed.") from error
 
-        embedding = response.get("embedding")
+        return _parse_single(response)
+
+    def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        """Embed texts in provider-sized batches with bounded concurrency.
+
+        Empty inputs and failed batches are reported per item; the remaining
+        items are still embedded and returned in input order.
+        """
+        results, batches = _plan_batches(texts, self._batch_size)
+        if not batches:
+            return [result for result in results if result is not None]
+
+        workers = min(self._max_concurrent_batches, len(batches))
+        if workers == 1:
+            batch_outcomes = [self._embed_indices(texts, batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_outcomes = list(
+                    executor.map(lambda batch: self._embed_indices(texts, batch), batches)
+                )
+
+        for batch, outcomes in zip(batches, batch_outcomes):
+            for index, outcome in zip(batch, outcomes):
+                results[index] = outcome
+        return [result for result in results if result is not None]
+
+    def _embed_indices(self, texts: Sequence[str], indices: list[int]) -> list[EmbeddingResult]:
+        try:
+            response = genai.embed_content(
+                model=self._model_name,
+                content=[texts[index] for index in indices],
+            )
+        except Exception as error:  # noqa: BLE001
+            message = f"Gemini embedding request failed: {error}"
+            return [EmbeddingResult(error=message, exception=error) for _ in indices]
+        return _parse_batch(response, len(indices))
+
+
+class AsyncGeminiEmbeddingAdapter(AsyncEmbeddingPort):
+    """Gemini embeddings over the SDK's asyncio API."""
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "models/text-embedding-004",
+        batch_size: int = GEMINI_MAX_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+    ) -> None:
+        _configure_client(api_key, batch_size, max_concurrent_batches)
+        self._model_name = model_name
+        self._batch_size = batch_size
+        self._max_concurrent_batches = max_concurrent_batches
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    async def embed_text(self, text: str) -> list[float]:
+        if not text.strip():
+            raise GeminiEmbeddingError("Embedding text cannot be empty.")
+        try:
+            response = await genai.embed_content_async(model=self._model_name, content=text)
+        except Exception as error:  # noqa: BLE001
+            raise GeminiEmbeddingError("Gemini embedding request failed.") from error
+        return _parse_single(response)
+
+    async def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        results, batches = _plan_batches(texts, self._batch_size)
+        semaphore = asyncio.Semaphore(self._max_concurrent_batches)
+
+        async def embed_indices(indices: list[int]) -> list[EmbeddingResult]:
+            async with semaphore:
+                try:
+                    response = await genai.embed_content_async(
+                        model=self._model_name,
+                        content=[texts[index] for index in indices],
+                    )
+                except Exception as error:  # noqa: BLE001
+                    message = f"Gemini embedding request failed: {error}"
+                    return [EmbeddingResult(error=message, exception=error) for _ in indices]
+            return _parse_batch(response, len(indices))
+
+        batch_outcomes = await asyncio.gather(*(embed_indices(batch) for batch in batches))
+        for batch, outcomes in zip(batches, batch_outcomes):
+            for index, outcome in zip(batch, outcomes):
+                results[index] = outcome
+        return [result for result in results if result is not None]
+
+
+def _configure_client(api_key: str, batch_size: int, max_concurrent_batches: int) -> None:
+    if not api_key.strip():
+        raise GeminiEmbeddingError("GEMINI_API_KEY cannot be empty.")
+    if not 0 < batch_size <= GEMINI_MAX_BATCH_SIZE:
+        raise GeminiEmbeddingError(
+            f"batch_size must be between 1 and {GEMINI_MAX_BATCH_SIZE}, got {batch_size}."
+        )
+    if max_concurrent_batches <= 0:
+        raise GeminiEmbeddingError("max_concurrent_batches must be greater than zero.")
+    _load_sdk().configure(api_key=api_key)
+
+
+def _load_sdk() -> Any:
+    global genai
+    if genai is None:
+        genai = import_optional("google.generativeai")
+    if genai is None:
+        raise GeminiEmbeddingError(
+            "google-generativeai is not installed. Install dependencies before running Phase 5."
+        )
+    return genai
+
+
+def _plan_batches(
+    texts: Sequence[str],
+    batch_size: int,
+) -> tuple[list[EmbeddingResult | None], list[list[int]]]:
+    """Pre-fill errors for blank inputs and group the rest into index batches."""
+    results: list[EmbeddingResult | None] = [None] * len(texts)
+    pending: list[int] = []
+    for index, text in enumerate(texts):
+        if not text.strip():
+            results[index] = EmbeddingResult(error="Embedding text cannot be empty.")
+        else:
+            pending.append(index)
+    batches = [pending[start : start + batch_size] for start in range(0, len(pending), batch_size)]
+    return results, batches
+
+
+def _parse_single(response: Any) -> list[float]:
+    embedding = response.get("embedding")
+    if not isinstance(embedding, list) or not embedding:
+        raise GeminiEmbeddingError("Gemini embedding response is invalid.")
+    return [float(value) for value in embedding]
+
+
+def _parse_batch(response: Any, expected: int) -> list[EmbeddingResult]:
+    embeddings = response.get("embedding")
+    if not isinstance(embeddings, list) or len(embeddings) != expected:
+        return [EmbeddingResult(error="Gemini embedding response is invalid.") for _ in range(expected)]
+
+    outcomes: list[EmbeddingResult] = []
+    for embedding in embeddings:
         if not isinstance(embedding, list) or not embedding:
-            raise GeminiEmbeddingError("Gemini embedding response is invalid.")
-        return [float(value) for value in embedding]
+            outcomes.append(EmbeddingResult(error="Gemini embedding response is invalid."))
+        else:
+            outcomes.append(EmbeddingResult(embedding=[float(value) for value in embedding]))
+    return outcomes
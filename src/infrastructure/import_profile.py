@@ -0,0 +1,80 @@
+"""Import-time profiling of a module in a fresh interpreter."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+import subprocess
+import sys
+from typing import Sequence
+
+# "import time:   self [us] | cumulative | imported package" lines from -X importtime.
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+class ImportProfileError(Exception):
+    """Raised when the profiled import fails."""
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Time spent importing one module; ``cumulative_us`` includes its own imports."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Every module loaded by one import, in the order they finished."""
+
+    target: str
+    timings: tuple[ImportTiming, ...]
+
+    @property
+    def total_ms(self) -> float:
+        return sum(timing.self_us for timing in self.timings) / 1000
+
+    def slowest(self, limit: int = 15, cumulative: bool = True) -> list[ImportTiming]:
+        key = (lambda timing: timing.cumulative_us) if cumulative else (lambda timing: timing.self_us)
+        return sorted(self.timings, key=key, reverse=True)[:limit]
+
+    def format(self, limit: int = 15) -> str:
+        lines = [
+            f"Importing {self.target} loaded {len(self.timings)} modules in {self.total_ms:.1f} ms.",
+            f"{'cumulative ms':>14}{'self ms':>10}  module",
+        ]
+        lines += [
+            f"{timing.cumulative_us / 1000:>14.1f}{timing.self_us / 1000:>10.1f}  {timing.module}"
+            for timing in self.slowest(limit)
+        ]
+        return "\n".join(lines)
+
+
+def parse_import_times(output: str) -> list[ImportTiming]:
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def profile_imports(target: str, python: str | None = None, extra_args: Sequence[str] = ()) -> ImportProfile:
+    """Import ``target`` in a new interpreter under ``-X importtime``.
+
+    A fresh process is the only way to see the real cold-start cost: in the
+    current one most modules are already cached in ``sys.modules``.
+    """
+    completed = subprocess.run(
+        [python or sys.executable, "-X", "importtime", *extra_args, "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise ImportProfileError(f"Importing '{target}' failed:\n{completed.stderr.strip()}")
+    return ImportProfile(target, tuple(parse_import_times(completed.stderr)))
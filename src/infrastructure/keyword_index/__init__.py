@@ -0,0 +1,5 @@
+"""Keyword (lexical) index adapters."""
+
+from .sqlite_bm25 import KeywordIndexError, SqliteKeywordIndex
+
+__all__ = ["SqliteKeywordIndex", "KeywordIndexError"]
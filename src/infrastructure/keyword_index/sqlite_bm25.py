@@ -0,0 +1,141 @@
+"""BM25 keyword index on SQLite FTS5."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import re
+import sqlite3
+import threading
+from typing import Sequence
+
+from src.application import KeywordIndexPort, TextRecord, VectorSearchResult
+
+
+class KeywordIndexError(Exception):
+    """Raised when the keyword index cannot be read or written."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    chunk_id TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunk_text USING fts5(
+    text,
+    tokenize = "unicode61 remove_diacritics 2 tokenchars '_'"
+);
+"""
+
+_WORD = re.compile(r"\w+")
+
+
+class SqliteKeywordIndex(KeywordIndexPort):
+    """Inverted index ranked with FTS5's built-in BM25.
+
+    Chunk text is stored once, in the FTS table; the ``text`` key is dropped
+    from the stored payload and restored on read. Queries match any of their
+    terms; a term with punctuation inside (``ERR-4012``) must match as an
+    adjacent phrase, so identifiers and error codes stay precise.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self._lock = threading.Lock()
+        try:
+            if path is None:
+                self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+            else:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._connection = sqlite3.connect(path, check_same_thread=False)
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as error:
+            raise KeywordIndexError(f"Failed to open keyword index '{path}'.") from error
+
+    def index_texts(self, records: Sequence[TextRecord]) -> None:
+        if not records:
+            return
+        with self._lock:
+            try:
+                latest = {record.chunk_id: record for record in records}
+                with self._connection:
+                    self._delete(list(latest))
+                    for record in latest.values():
+                        payload = {key: value for key, value in record.payload.items() if key != "text"}
+                        cursor = self._connection.execute(
+                            "INSERT OR REPLACE INTO chunks (chunk_id, payload) VALUES (?, ?)",
+                            (record.chunk_id, json.dumps(payload, default=str, ensure_ascii=False)),
+                        )
+                        self._connection.execute(
+                            "INSERT INTO chunk_text (rowid, text) VALUES (?, ?)",
+                            (cursor.lastrowid, record.text),
+                        )
+            except sqlite3.Error as error:
+                raise KeywordIndexError(f"Failed to index {len(records)} chunks.") from error
+
+    def delete_texts(self, chunk_ids: Sequence[str]) -> None:
+        if not chunk_ids:
+            return
+        with self._lock:
+            try:
+                with self._connection:
+                    self._delete(list(chunk_ids))
+            except sqlite3.Error as error:
+                raise KeywordIndexError(f"Failed to delete {len(chunk_ids)} chunks from keyword index.") from error
+
+    def search_text(self, query_text: str, limit: int) -> list[VectorSearchResult]:
+        if limit <= 0:
+            raise KeywordIndexError("limit must be greater than zero.")
+        expression = _match_expression(query_text)
+        if not expression:
+            return []
+        with self._lock:
+            try:
+                rows = self._connection.execute(
+                    "SELECT chunks.chunk_id, chunks.payload, chunk_text.text, bm25(chunk_text) AS rank "
+                    "FROM chunk_text JOIN chunks ON chunks.id = chunk_text.rowid "
+                    "WHERE chunk_text MATCH ? ORDER BY rank LIMIT ?",
+                    (expression, limit),
+                ).fetchall()
+            except sqlite3.Error as error:
+                raise KeywordIndexError("Failed to query keyword index.") from error
+        # FTS5 reports BM25 negated so that ascending order ranks best first.
+        return [
+            VectorSearchResult(
+                chunk_id=chunk_id,
+                score=-float(rank),
+                payload={**json.loads(payload), "text": text},
+            )
+            for chunk_id, payload, text, rank in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _delete(self, chunk_ids: list[str]) -> None:
+        # Stay well under SQLite's bound-parameter limit.
+        for start in range(0, len(chunk_ids), 500):
+            batch = chunk_ids[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rowids = [
+                (rowid,)
+                for (rowid,) in self._connection.execute(
+                    f"SELECT id FROM chunks WHERE chunk_id IN ({placeholders})",
+                    batch,
+                )
+            ]
+            self._connection.executemany("DELETE FROM chunk_text WHERE rowid = ?", rowids)
+            self._connection.executemany("DELETE FROM chunks WHERE id = ?", rowids)
+
+
+def _match_expression(query_text: str) -> str:
+    """Build an FTS5 query: each whitespace-separated term as a quoted phrase, OR-ed."""
+    phrases: list[str] = []
+    for term in query_text.split():
+        words = _WORD.findall(term)
+        if words:
+            phrases.append('"' + " ".join(words) + '"')
+    return " OR ".join(dict.fromkeys(phrases))
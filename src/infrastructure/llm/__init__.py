@@ -1,5 +1,5 @@
 """LLM adapters."""
 
-from .gemini_generator import GeminiGenerationAdapter, GeminiGenerationError
+from .gemini_generator import AsyncGeminiGenerationAdapter, GeminiGenerationAdapter, GeminiGenerationError
 
-__all__ = ["GeminiGenerationAdapter", "GeminiGenerationError"]
+__all__ = ["GeminiGenerationAdapter", "AsyncGeminiGenerationAdapter", "GeminiGenerationError"]
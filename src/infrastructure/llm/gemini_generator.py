@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from src.application import GenerationPort
+from typing import Any, Iterator
 
-try:
-    import google.generativeai as genai
-except ImportError:  # pragma: no cover
-    genai = None
+from src.application import AsyncGenerationPort, GenerationPort
+from src.infrastructure.registry import import_optional
+
+# The SDK is heavy to import, so it is loaded when the first adapter is built.
+genai: Any = None
 
 
 class GeminiGenerationError(Exception):
@@ -18,15 +19,8 @@ class GeminiGenerationAdapter(GenerationPort):
     """Gemini implementation for text generation."""
 
     def __init__(self, api_key: str, model_name: str) -> None:
-        if not api_key.strip():
-            raise GeminiGenerationError("GEMINI_API_KEY cannot be empty.")
-        if genai is None:
-            raise GeminiGenerationError(
-                "google-generativeai is not installed. Install dependencies before running Phase 5."
-            )
         self._model_name = model_name
-        genai.configure(api_key=api_key)
-        self._model = genai.GenerativeModel(model_name)
+        self._model = _configure_model(api_key, model_name)
 
     def generate_text(self, prompt: str) -> str:
         if not prompt.strip():
@@ -36,7 +30,64 @@ class GeminiGenerationAdapter(GenerationPort):
         except Exception as error:  # noqa: BLE001
             raise GeminiGenerationError("Gemini generation request failed.") from error
 
-        text = getattr(response, "text", "")
-        if not str(text).strip():
+        return _response_text(response)
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        if not prompt.strip():
+            raise GeminiGenerationError("Prompt cannot be empty.")
+        emitted = False
+        try:
+            for chunk in self._model.generate_content(prompt, stream=True):
+                text = str(getattr(chunk, "text", "") or "")
+                if text:
+                    emitted = True
+                    yield text
+        except Exception as error:  # noqa: BLE001
+            raise GeminiGenerationError("Gemini generation request failed.") from error
+
+        if not emitted:
             raise GeminiGenerationError("Gemini returned an empty response.")
-        return str(text).strip()
+
+
+class AsyncGeminiGenerationAdapter(AsyncGenerationPort):
+    """Gemini text generation over the SDK's asyncio API."""
+
+    def __init__(self, api_key: str, model_name: str) -> None:
+        self._model_name = model_name
+        self._model = _configure_model(api_key, model_name)
+
+    async def generate_text(self, prompt: str) -> str:
+        if not prompt.strip():
+            raise GeminiGenerationError("Prompt cannot be empty.")
+        try:
+            response = await self._model.generate_content_async(prompt)
+        except Exception as error:  # noqa: BLE001
+            raise GeminiGenerationError("Gemini generation request failed.") from error
+
+        return _response_text(response)
+
+
+def _configure_model(api_key: str, model_name: str) -> Any:
+    if not api_key.strip():
+        raise GeminiGenerationError("GEMINI_API_KEY cannot be empty.")
+    sdk = _load_sdk()
+    sdk.configure(api_key=api_key)
+    return sdk.GenerativeModel(model_name)
+
+
+def _load_sdk() -> Any:
+    global genai
+    if genai is None:
+        genai = import_optional("google.generativeai")
+    if genai is None:
+        raise GeminiGenerationError(
+            "google-generativeai is not installed. Install dependencies before running Phase 5."
+        )
+    return genai
+
+
+def _response_text(response: Any) -> str:
+    text = getattr(response, "text", "")
+    if not str(text).strip():
+        raise GeminiGenerationError("Gemini returned an empty response.")
+    return str(text).strip()
@@ -1,5 +1,5 @@
 """Logging module."""
 
-from .setup import configure_logging
+from .setup import JsonFormatter, SamplingFilter, configure_logging, shutdown_logging
 
-__all__ = ["configure_logging"]
+__all__ = ["JsonFormatter", "SamplingFilter", "configure_logging", "shutdown_logging"]
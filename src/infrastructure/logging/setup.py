@@ -2,17 +2,69 @@
 
 from __future__ import annotations
 
+import atexit
 from datetime import datetime, timezone
+import itertools
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import threading
+from typing import Any, Callable, Mapping, TextIO
+
+from src.infrastructure.registry import import_optional
+
+JsonEncoder = Callable[[dict[str, Any]], str]
+
+# Built once: ``json.dumps`` with non-default options constructs a new encoder on every call.
+_STDLIB_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def stdlib_json_encoder(payload: dict[str, Any]) -> str:
+    return _STDLIB_ENCODER.encode(payload)
+
+
+def default_json_encoder() -> JsonEncoder:
+    """``orjson`` when it is installed, otherwise the standard library encoder.
+
+    orjson only handles payloads whose output matches the standard library
+    encoder's: datetimes, dataclasses and anything it cannot serialize
+    natively are routed to ``default``, which rejects them, and the record
+    is encoded by the standard library with ``default=str`` instead. The
+    same happens for non-string keys and integers wider than 64 bits.
+    Plain ``Enum`` members are the exception: orjson writes their value
+    where ``default=str`` writes ``Class.MEMBER``. Output is compact,
+    without the spaces after ``,`` and ``:``.
+    """
+    orjson = import_optional("orjson")
+    if orjson is None:
+        return stdlib_json_encoder
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def encode(payload: dict[str, Any]) -> str:
+        try:
+            return orjson.dumps(payload, default=_reject, option=options).decode("utf-8")
+        except TypeError:
+            return stdlib_json_encoder(payload)
+
+    return encode
+
+
+def _reject(value: object) -> Any:
+    raise TypeError(f"{type(value).__name__} is left to the standard library encoder.")
 
 
 class JsonFormatter(logging.Formatter):
     """Minimal JSON formatter for structured logs."""
 
+    def __init__(self, encoder: JsonEncoder | None = None) -> None:
+        super().__init__()
+        self._encoder = encoder or default_json_encoder()
+
     def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # When the event happened, not when the listener thread got to it.
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -22,16 +74,113 @@ class JsonFormatter(logging.Formatter):
         if correlation_id:
             payload["correlation_id"] = correlation_id
 
-        return json.dumps(payload, ensure_ascii=False)
+        # Structured context passed as ``extra={"fields": {...}}``; never overrides the keys above.
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            for key, value in fields.items():
+                payload.setdefault(key, value)
+
+        return self._encoder(payload)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of the low-level records of selected loggers.
+
+    ``rates`` maps a logger name to the share of its records to keep; it
+    also applies to the logger's children, the most specific name winning.
+    Only records at or below ``max_level`` (DEBUG by default) are sampled.
+    Sampling is deterministic, one record in ``round(1 / rate)``: a rate
+    of 0.1 keeps the 1st, 11th, 21st... record of each logger.
+    """
+
+    def __init__(self, rates: Mapping[str, float], max_level: int = logging.DEBUG) -> None:
+        super().__init__()
+        for name, rate in rates.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Sampling rate for '{name}' must be between 0 and 1.")
+        self._rates = dict(rates)
+        self._max_level = max_level
+        self._lock = threading.Lock()
+        self._periods: dict[str, int | None] = {}
+        self._counters: dict[str, itertools.count] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self._max_level:
+            return True
+        period = self._periods.get(record.name, -1)
+        if period == -1:
+            period = self._resolve(record.name)
+        if period is None:
+            return True
+        if period == 0:
+            return False
+        # next() on itertools.count is atomic, so the hot path takes no lock.
+        return next(self._counters[record.name]) % period == 0
 
+    def _resolve(self, logger_name: str) -> int | None:
+        name = logger_name
+        rate: float | None = None
+        while name:
+            rate = self._rates.get(name)
+            if rate is not None:
+                break
+            name = name.rpartition(".")[0]
+        period = None if rate is None or rate >= 1.0 else (0 if rate == 0.0 else max(1, round(1 / rate)))
+        with self._lock:
+            self._counters.setdefault(logger_name, itertools.count())
+            self._periods[logger_name] = period
+        return period
 
-def configure_logging(level: str, log_format: str = "json") -> None:
-    """Configure root logger once for the process."""
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueues records for a background listener to format and write.
+
+    The caller's thread only renders ``%``-style arguments (they may be
+    mutated or unpicklable later) and the traceback text; JSON encoding,
+    timestamps and stream I/O happen on the listener thread.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+        prepared = logging.makeLogRecord(record.__dict__)
+        prepared.msg = message
+        prepared.args = None
+        prepared.exc_info = None
+        return prepared
+
+
+_listener_lock = threading.Lock()
+_listener: QueueListener | None = None
+_atexit_registered = False
+
+
+def configure_logging(
+    level: str,
+    log_format: str = "json",
+    *,
+    sample_rates: Mapping[str, float] | None = None,
+    stream: TextIO | None = None,
+    use_queue: bool = True,
+) -> None:
+    """Configure root logger once for the process.
+
+    By default loggers only enqueue records; a ``QueueListener`` thread
+    formats and writes them, and :func:`shutdown_logging` (also run at
+    exit) drains the queue. ``sample_rates`` keeps a fraction of the DEBUG
+    records of the named loggers, dropped before they are enqueued.
+    """
+    global _atexit_registered
+
+    shutdown_logging()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.setLevel(level)
 
-    stream_handler = logging.StreamHandler()
+    stream_handler = logging.StreamHandler(stream)
 
     if log_format == "json":
         stream_handler.setFormatter(JsonFormatter())
@@ -42,4 +191,50 @@ def configure_logging(level: str, log_format: str = "json") -> None:
             )
         )
 
-    root_logger.addHandler(stream_handler)
+    handler: logging.Handler = stream_handler
+    if use_queue:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = _DeferredQueueHandler(records)
+        _start_listener(QueueListener(records, stream_handler, respect_handler_level=True))
+        if not _atexit_registered:
+            # Registered after the logging module's own hook, so it runs first.
+            atexit.register(shutdown_logging)
+            _atexit_registered = True
+
+    if sample_rates:
+        handler.addFilter(SamplingFilter(sample_rates))
+    root_logger.addHandler(handler)
+
+
+def shutdown_logging() -> None:
+    """Write every queued record and stop the listener thread.
+
+    Safe to call more than once. Until :func:`configure_logging` runs
+    again, the root logger writes directly to the listener's handlers.
+    """
+    global _listener
+
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+    # Records logged after shutdown (e.g. by later atexit hooks) are written synchronously.
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root_logger.removeHandler(handler)
+            for target in listener.handlers:
+                for record_filter in handler.filters:
+                    target.addFilter(record_filter)
+                root_logger.addHandler(target)
+
+
+def _start_listener(listener: QueueListener) -> None:
+    global _listener
+
+    with _listener_lock:
+        _listener = listener
+    listener.start()
@@ -0,0 +1,5 @@
+"""Ingestion manifest stores."""
+
+from .json_manifest import JsonManifestStore, ManifestStoreError
+
+__all__ = ["JsonManifestStore", "ManifestStoreError"]
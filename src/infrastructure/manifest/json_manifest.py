@@ -0,0 +1,74 @@
+"""JSON file implementation of the ingestion manifest store."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from src.application import ManifestEntry, ManifestStorePort
+
+_FORMAT_VERSION = 1
+
+
+class ManifestStoreError(Exception):
+    """Raised when the manifest file cannot be read or written."""
+
+
+class JsonManifestStore(ManifestStorePort):
+    """Stores the manifest as one JSON document, replaced atomically on save."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    def load(self) -> dict[str, ManifestEntry]:
+        if not self._path.exists():
+            return {}
+        try:
+            document = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as error:
+            raise ManifestStoreError(f"Failed to read manifest '{self._path}'.") from error
+
+        if document.get("version") != _FORMAT_VERSION:
+            raise ManifestStoreError(
+                f"Unsupported manifest version {document.get('version')!r} in '{self._path}'."
+            )
+
+        entries: dict[str, ManifestEntry] = {}
+        for raw in document.get("entries", []):
+            entry = ManifestEntry(
+                source_path=raw["source_path"],
+                size=int(raw["size"]),
+                mtime_ns=int(raw["mtime_ns"]),
+                content_hash=raw["content_hash"],
+                chunking=raw["chunking"],
+                chunk_hashes={int(sequence): digest for sequence, digest in raw["chunk_hashes"].items()},
+            )
+            entries[entry.source_path] = entry
+        return entries
+
+    def save(self, entries: dict[str, ManifestEntry]) -> None:
+        document = {
+            "version": _FORMAT_VERSION,
+            "entries": [
+                {
+                    "source_path": entry.source_path,
+                    "size": entry.size,
+                    "mtime_ns": entry.mtime_ns,
+                    "content_hash": entry.content_hash,
+                    "chunking": entry.chunking,
+                    "chunk_hashes": {str(sequence): digest for sequence, digest in entry.chunk_hashes.items()},
+                }
+                for entry in sorted(entries.values(), key=lambda item: item.source_path)
+            ],
+        }
+        temporary_path = self._path.with_name(self._path.name + ".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with temporary_path.open("w", encoding="utf-8") as handle:
+                json.dump(document, handle, ensure_ascii=False, separators=(",", ":"))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary_path, self._path)
+        except OSError as error:
+            raise ManifestStoreError(f"Failed to write manifest '{self._path}'.") from error
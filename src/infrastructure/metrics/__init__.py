@@ -0,0 +1,5 @@
+"""Metrics adapters."""
+
+from .histogram import DEFAULT_LATENCY_BUCKETS, InMemoryLatencyHistogram
+
+__all__ = ["InMemoryLatencyHistogram", "DEFAULT_LATENCY_BUCKETS"]
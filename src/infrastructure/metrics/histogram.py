@@ -0,0 +1,131 @@
+"""In-process latency histograms with Prometheus text export."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+import threading
+from typing import Sequence
+
+from src.application import MetricsPort
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+REPORTED_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class _Histogram:
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.counts = [0] * (len(bounds) + 1)  # the last slot is +Inf
+        self.total = 0
+        self.sum = 0.0
+
+
+class InMemoryLatencyHistogram(MetricsPort):
+    """Cumulative per-stage latency histograms.
+
+    Quantiles are interpolated within buckets the way Prometheus'
+    ``histogram_quantile`` does, so their precision is bounded by the bucket
+    layout. :meth:`to_prometheus` emits the histograms plus the p50/p95/p99
+    estimates as a gauge family.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        metric_name: str = "atlas_rag_stage_latency_seconds",
+    ) -> None:
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds or bounds[0] <= 0 or len(set(bounds)) != len(bounds):
+            raise ValueError("buckets must be distinct positive upper bounds.")
+        self._bounds = bounds
+        self._metric_name = metric_name
+        self._histograms: dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe_latency(self, stage: str, seconds: float) -> None:
+        slot = bisect_left(self._bounds, seconds)
+        with self._lock:
+            histogram = self._histograms.setdefault(stage, _Histogram(self._bounds))
+            histogram.counts[slot] += 1
+            histogram.total += 1
+            histogram.sum += seconds
+
+    def quantile(self, stage: str, q: float) -> float | None:
+        """Estimated ``q`` quantile (0-1) of ``stage`` latency, or ``None`` if unseen."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1.")
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            counts = list(histogram.counts) if histogram else []
+        return self._interpolate(counts, q)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Count, sum and p50/p95/p99 for every stage seen so far."""
+        with self._lock:
+            histograms = {
+                stage: (list(histogram.counts), histogram.total, histogram.sum)
+                for stage, histogram in self._histograms.items()
+            }
+        return {
+            stage: {
+                "count": total,
+                "sum": total_seconds,
+                **{f"p{round(q * 100)}": self._interpolate(counts, q) for q in REPORTED_QUANTILES},
+            }
+            for stage, (counts, total, total_seconds) in sorted(histograms.items())
+        }
+
+    def to_prometheus(self) -> str:
+        """Render all stages in the Prometheus text exposition format."""
+        with self._lock:
+            histograms = {
+                stage: (list(histogram.counts), histogram.total, histogram.sum)
+                for stage, histogram in self._histograms.items()
+            }
+        name = self._metric_name
+        lines = [
+            f"# HELP {name} Latency of RAG pipeline stages.",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, (counts, total, total_seconds) in sorted(histograms.items()):
+            label = f'stage="{_escape(stage)}"'
+            cumulative = 0
+            for bound, count in zip([*self._bounds, math.inf], counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{label},le="{_format_bound(bound)}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{label}}} {total_seconds!r}")
+            lines.append(f"{name}_count{{{label}}} {total}")
+
+        quantile_name = f"{name}_quantile"
+        lines.append(f"# HELP {quantile_name} In-process latency quantile estimates of RAG pipeline stages.")
+        lines.append(f"# TYPE {quantile_name} gauge")
+        for stage, (counts, _, _) in sorted(histograms.items()):
+            for q in REPORTED_QUANTILES:
+                value = self._interpolate(counts, q)
+                lines.append(f'{quantile_name}{{stage="{_escape(stage)}",quantile="{q}"}} {value!r}')
+        return "\n".join(lines) + "\n"
+
+    def _interpolate(self, counts: list[int], q: float) -> float | None:
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0
+        for slot, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                if slot == len(self._bounds):
+                    # Beyond the last bound nothing is known; report that bound.
+                    return self._bounds[-1]
+                lower = self._bounds[slot - 1] if slot else 0.0
+                upper = self._bounds[slot]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self._bounds[-1]  # pragma: no cover - rank never exceeds total
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
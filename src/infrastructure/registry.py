@@ -0,0 +1,94 @@
+"""Adapters looked up by name and imported on first use."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class AdapterRegistryError(Exception):
+    """Raised when an adapter name is unknown or its module cannot be imported."""
+
+
+def import_optional(module_name: str) -> ModuleType | None:
+    """Import an optional dependency, or return ``None`` when it is not installed.
+
+    Adapters call this on first use rather than at module import, so
+    processes that never touch a provider SDK do not pay for loading it.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+class AdapterRegistry:
+    """Maps adapter names to ``"package.module:Attribute"`` targets.
+
+    Nothing is imported until :meth:`resolve` is called for a name, so
+    wiring code can refer to every adapter while a process only loads
+    the ones it actually builds.
+    """
+
+    def __init__(self, targets: dict[str, str] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._targets: dict[str, str] = {}
+        self._resolved: dict[str, Any] = {}
+        for name, target in (targets or {}).items():
+            self.register(name, target)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._targets
+
+    def names(self) -> list[str]:
+        return sorted(self._targets)
+
+    def loaded(self) -> list[str]:
+        """Names resolved so far, i.e. adapters whose modules were imported."""
+        with self._lock:
+            return sorted(self._resolved)
+
+    def register(self, name: str, target: str) -> None:
+        module_name, _, attribute = target.partition(":")
+        if not name or not module_name or not attribute:
+            raise AdapterRegistryError(f"Invalid adapter target '{target}' for '{name}'; use 'module:Attribute'.")
+        with self._lock:
+            self._targets[name] = target
+            self._resolved.pop(name, None)
+
+    def resolve(self, name: str) -> Any:
+        with self._lock:
+            if name in self._resolved:
+                return self._resolved[name]
+            target = self._targets.get(name)
+        if target is None:
+            raise AdapterRegistryError(f"Unknown adapter '{name}'. Registered adapters: {self.names()}")
+        module_name, _, attribute = target.partition(":")
+        try:
+            value = getattr(importlib.import_module(module_name), attribute)
+        except (ImportError, AttributeError) as error:
+            raise AdapterRegistryError(f"Failed to load adapter '{name}' from '{target}'.") from error
+        with self._lock:
+            self._resolved[name] = value
+        return value
+
+
+ADAPTERS = AdapterRegistry(
+    {
+        "vector_store.qdrant": "src.infrastructure.vector_store.qdrant_adapter:QdrantVectorStore",
+        "vector_store.qdrant_async": "src.infrastructure.vector_store.async_qdrant_adapter:AsyncQdrantVectorStore",
+        "vector_store.qdrant_client_factory": (
+            "src.infrastructure.vector_store.qdrant_client_factory:QdrantClientFactory"
+        ),
+        "vector_store.numpy": "src.infrastructure.vector_store.numpy_store:NumpyVectorStore",
+        "vector_store.simulated": "src.infrastructure.simulated.adapters:SimulatedVectorStore",
+        "embeddings.gemini": "src.infrastructure.embeddings.gemini_embeddings:GeminiEmbeddingAdapter",
+        "embeddings.gemini_async": "src.infrastructure.embeddings.gemini_embeddings:AsyncGeminiEmbeddingAdapter",
+        "embeddings.simulated": "src.infrastructure.simulated.adapters:SimulatedEmbeddingAdapter",
+        "generation.gemini": "src.infrastructure.llm.gemini_generator:GeminiGenerationAdapter",
+        "generation.gemini_async": "src.infrastructure.llm.gemini_generator:AsyncGeminiGenerationAdapter",
+        "generation.simulated": "src.infrastructure.simulated.adapters:SimulatedGenerationAdapter",
+    }
+)
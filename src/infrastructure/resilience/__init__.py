@@ -0,0 +1,45 @@
+"""Resilience decorators for provider adapters."""
+
+from .adapters import (
+    AsyncResilientEmbeddingAdapter,
+    AsyncResilientGenerationAdapter,
+    ResilientEmbeddingAdapter,
+    ResilientGenerationAdapter,
+)
+from .policies import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgingPolicy,
+    LatencyTracker,
+    ResilientCaller,
+    RetryPolicy,
+    is_rate_limited,
+    is_retryable,
+)
+from .rate_limit import (
+    AsyncRateLimitedEmbeddingAdapter,
+    AsyncRateLimitedGenerationAdapter,
+    QuotaLimiter,
+    RateLimitedEmbeddingAdapter,
+    RateLimitedGenerationAdapter,
+)
+
+__all__ = [
+    "ResilientCaller",
+    "RetryPolicy",
+    "HedgingPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "LatencyTracker",
+    "is_retryable",
+    "is_rate_limited",
+    "ResilientGenerationAdapter",
+    "ResilientEmbeddingAdapter",
+    "AsyncResilientGenerationAdapter",
+    "AsyncResilientEmbeddingAdapter",
+    "QuotaLimiter",
+    "RateLimitedGenerationAdapter",
+    "RateLimitedEmbeddingAdapter",
+    "AsyncRateLimitedGenerationAdapter",
+    "AsyncRateLimitedEmbeddingAdapter",
+]
@@ -0,0 +1,153 @@
+"""Resilient decorators for embedding and generation adapters."""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import islice
+from typing import Iterator, Sequence
+
+from src.application import (
+    AsyncEmbeddingPort,
+    AsyncGenerationPort,
+    EmbeddingPort,
+    EmbeddingResult,
+    GenerationPort,
+)
+
+from .policies import CircuitOpenError, ResilientCaller, is_retryable
+
+
+class ResilientGenerationAdapter(GenerationPort):
+    """Generation decorator adding retries, hedging and a circuit breaker.
+
+    Streams are retried only until their first chunk arrives and are never
+    hedged; a failure after text was yielded is raised to the consumer.
+    Time to first chunk is not recorded in the hedge latency window.
+    """
+
+    def __init__(self, inner: GenerationPort, caller: ResilientCaller) -> None:
+        self._inner = inner
+        self._caller = caller
+
+    def generate_text(self, prompt: str) -> str:
+        return self._caller.call(lambda: self._inner.generate_text(prompt))
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        def open_stream() -> tuple[list[str], Iterator[str]]:
+            stream = iter(self._inner.stream_text(prompt))
+            return list(islice(stream, 1)), stream
+
+        first, stream = self._caller.call(open_stream, hedge=False, record_latency=False)
+        yield from first
+        yield from stream
+
+
+class ResilientEmbeddingAdapter(EmbeddingPort):
+    """Embedding decorator adding retries, hedging and a circuit breaker.
+
+    Single-text calls (the query path) may be hedged. Batches are not: only
+    items whose error :func:`is_retryable` classifies as transient are sent
+    again, up to the retry policy's attempt count. Each provider round trip
+    counts once on the circuit breaker; once it opens, the failed items are
+    returned as they are.
+    """
+
+    def __init__(self, inner: EmbeddingPort, caller: ResilientCaller) -> None:
+        self._inner = inner
+        self._caller = caller
+
+    def embed_text(self, text: str) -> list[float]:
+        return self._caller.call(lambda: self._inner.embed_text(text))
+
+    def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        results = list(
+            self._caller.call(lambda: self._inner.embed_batch(texts), hedge=False, record_success=False)
+        )
+        pending = _settle_items(self._caller, results, range(len(texts)))
+        for attempt in range(1, self._caller.retry.max_attempts):
+            if not pending:
+                break
+            self._caller.pause(attempt)
+            try:
+                retried = self._caller.call(
+                    lambda: self._inner.embed_batch([texts[index] for index in pending]),
+                    hedge=False,
+                    record_success=False,
+                )
+            except CircuitOpenError:
+                break
+            for index, result in zip(pending, retried):
+                results[index] = result
+            pending = _settle_items(self._caller, results, pending)
+        return results
+
+
+class AsyncResilientGenerationAdapter(AsyncGenerationPort):
+    """Asynchronous counterpart of :class:`ResilientGenerationAdapter`."""
+
+    def __init__(self, inner: AsyncGenerationPort, caller: ResilientCaller) -> None:
+        self._inner = inner
+        self._caller = caller
+
+    async def generate_text(self, prompt: str) -> str:
+        return await self._caller.acall(lambda: self._inner.generate_text(prompt))
+
+
+class AsyncResilientEmbeddingAdapter(AsyncEmbeddingPort):
+    """Asynchronous counterpart of :class:`ResilientEmbeddingAdapter`."""
+
+    def __init__(self, inner: AsyncEmbeddingPort, caller: ResilientCaller) -> None:
+        self._inner = inner
+        self._caller = caller
+
+    async def embed_text(self, text: str) -> list[float]:
+        return await self._caller.acall(lambda: self._inner.embed_text(text))
+
+    async def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        results = list(
+            await self._caller.acall(lambda: self._inner.embed_batch(texts), hedge=False, record_success=False)
+        )
+        pending = _settle_items(self._caller, results, range(len(texts)))
+        for attempt in range(1, self._caller.retry.max_attempts):
+            if not pending:
+                break
+            await asyncio.sleep(self._caller.backoff(attempt))
+            try:
+                retried = await self._caller.acall(
+                    lambda: self._inner.embed_batch([texts[index] for index in pending]),
+                    hedge=False,
+                    record_success=False,
+                )
+            except CircuitOpenError:
+                break
+            for index, result in zip(pending, retried):
+                results[index] = result
+            pending = _settle_items(self._caller, results, pending)
+        return results
+
+
+def _settle_items(
+    caller: ResilientCaller,
+    results: list[EmbeddingResult],
+    indices: Sequence[int],
+) -> list[int]:
+    """Record the round trip's outcome on the breaker; return the items worth resending.
+
+    An item failed transiently only if its exception is retryable; errors
+    without one (blank text, a malformed response) are final. One provider
+    call is one breaker outcome: a failure if any item failed transiently,
+    since adapters mark every item of a rejected request as failed.
+    """
+    retriable = [
+        index
+        for index in indices
+        if not results[index].ok
+        and results[index].exception is not None
+        and is_retryable(results[index].exception)
+    ]
+    if caller.breaker is not None:
+        if retriable:
+            caller.breaker.record_failure()
+        else:
+            caller.breaker.record_success()
+    return retriable
@@ -0,0 +1,399 @@
+"""Retry, hedging and circuit-breaker policies for calls to remote providers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import math
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider while its circuit is open."""
+
+
+# HTTP statuses worth retrying: timeouts, throttling and transient server errors.
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# google.api_core exception names for the same conditions, matched by name so the
+# SDK stays an optional import.
+_RETRYABLE_ERROR_NAMES = frozenset(
+    {
+        "TooManyRequests",
+        "ResourceExhausted",
+        "InternalServerError",
+        "BadGateway",
+        "ServiceUnavailable",
+        "GatewayTimeout",
+        "DeadlineExceeded",
+    }
+)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether ``error``, or an error it was raised from, is transient."""
+    return any(
+        isinstance(current, (TimeoutError, ConnectionError))
+        or type(current).__name__ in _RETRYABLE_ERROR_NAMES
+        or _status_code(current) in RETRYABLE_STATUS_CODES
+        for current in error_chain(error)
+    )
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Whether ``error``, or an error it was raised from, is a provider 429."""
+    return any(
+        type(current).__name__ in {"TooManyRequests", "ResourceExhausted"} or _status_code(current) == 429
+        for current in error_chain(error)
+    )
+
+
+def error_chain(error: BaseException) -> Iterator[BaseException]:
+    """``error`` followed by the errors it was raised from or during."""
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__ or current.__context__
+
+
+def _status_code(error: BaseException) -> int | None:
+    code = getattr(error, "code", None)
+    return code if isinstance(code, int) else None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Capped exponential backoff with full jitter."""
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.2
+    max_delay_seconds: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts <= 0:
+            raise ValueError("max_attempts must be greater than zero.")
+        if self.base_delay_seconds < 0 or self.max_delay_seconds < self.base_delay_seconds:
+            raise ValueError("Backoff delays must satisfy 0 <= base_delay_seconds <= max_delay_seconds.")
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Delay after failed ``attempt`` (1-based): uniform in ``[0, min(cap, base * 2**(attempt - 1))]``."""
+        return rng.uniform(0.0, min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)))
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """When to send a duplicate request for a slow call.
+
+    The hedge fires once the call has been outstanding for the
+    ``percentile`` of recently observed latencies, clamped to
+    ``[min_delay_seconds, max_delay_seconds]``; until ``min_samples``
+    latencies are known, ``initial_delay_seconds`` is used.
+    """
+
+    percentile: float = 95.0
+    min_delay_seconds: float = 0.05
+    max_delay_seconds: float = 2.0
+    initial_delay_seconds: float = 1.0
+    window: int = 256
+    min_samples: int = 20
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.percentile < 100.0:
+            raise ValueError("percentile must be in (0, 100).")
+        if not 0.0 <= self.min_delay_seconds <= self.max_delay_seconds:
+            raise ValueError("Hedge delays must satisfy 0 <= min_delay_seconds <= max_delay_seconds.")
+        if self.window <= 0 or self.min_samples <= 0:
+            raise ValueError("window and min_samples must be greater than zero.")
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies."""
+
+    def __init__(self, window: int = 256) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Nearest-rank percentile, or ``None`` without samples."""
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return None
+        rank = max(1, math.ceil(percentile / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    opens and calls fail fast with :class:`CircuitOpenError`. Once
+    ``reset_timeout_seconds`` have passed a single trial call is let
+    through (half-open): success closes the circuit, failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be greater than zero.")
+        if reset_timeout_seconds <= 0:
+            raise ValueError("reset_timeout_seconds must be greater than zero.")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def before_call(self) -> None:
+        """Admit a call or raise :class:`CircuitOpenError`."""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        raise CircuitOpenError("Provider circuit is open; failing fast.")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self._failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+
+class ResilientCaller:
+    """Runs provider calls under a retry policy, optional hedging and breaker.
+
+    Only errors classified by :func:`is_retryable` are retried or count
+    against the breaker; anything else (bad input, auth) is raised at once.
+    A hedged call returns the first successful response. The asyncio path
+    cancels the losing request; threads cannot be interrupted, so on the
+    sync path the loser runs to completion in the background and its result
+    is discarded.
+    """
+
+    def __init__(
+        self,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        max_hedge_workers: int = 16,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.retry = retry or RetryPolicy()
+        self.hedging = hedging
+        self.breaker = breaker
+        self.latencies = LatencyTracker(hedging.window if hedging else 256)
+        self._max_hedge_workers = max_hedge_workers
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or ``None`` when hedging is off."""
+        if self.hedging is None:
+            return None
+        observed = self.latencies.percentile(self.hedging.percentile)
+        if observed is None or len(self.latencies) < self.hedging.min_samples:
+            observed = self.hedging.initial_delay_seconds
+        return min(self.hedging.max_delay_seconds, max(self.hedging.min_delay_seconds, observed))
+
+    def backoff(self, attempt: int) -> float:
+        return self.retry.backoff(attempt, self._rng)
+
+    def pause(self, attempt: int) -> None:
+        self._sleep(self.backoff(attempt))
+
+    def call(
+        self,
+        operation: Callable[[], T],
+        hedge: bool = True,
+        record_latency: bool = True,
+        record_success: bool = True,
+    ) -> T:
+        """Run ``operation`` under the policies.
+
+        ``record_latency=False`` keeps the call's duration out of the window
+        that sets the hedge delay; use it for operations whose latency is not
+        comparable to the hedged calls. ``record_success=False`` leaves
+        recording a returned result on the breaker to the caller, e.g. one
+        outcome per item of a batch; the caller must then record at least one.
+        """
+        for attempt in range(1, self.retry.max_attempts + 1):
+            if self.breaker is not None:
+                self.breaker.before_call()
+            try:
+                delay = self.hedge_delay() if hedge else None
+                if delay is None:
+                    result = self._timed(operation) if record_latency else operation()
+                else:
+                    result = self._hedged(operation, delay)
+            except Exception as error:  # noqa: BLE001
+                if not self._settle_failure(error, attempt):
+                    raise
+                self.pause(attempt)
+                continue
+            if self.breaker is not None and record_success:
+                self.breaker.record_success()
+            return result
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def acall(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        hedge: bool = True,
+        record_latency: bool = True,
+        record_success: bool = True,
+    ) -> T:
+        """Asynchronous :meth:`call`."""
+        for attempt in range(1, self.retry.max_attempts + 1):
+            if self.breaker is not None:
+                self.breaker.before_call()
+            try:
+                delay = self.hedge_delay() if hedge else None
+                if delay is None:
+                    result = await (self._atimed(operation) if record_latency else operation())
+                else:
+                    result = await self._ahedged(operation, delay)
+            except Exception as error:  # noqa: BLE001
+                if not self._settle_failure(error, attempt):
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+                continue
+            if self.breaker is not None and record_success:
+                self.breaker.record_success()
+            return result
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _settle_failure(self, error: Exception, attempt: int) -> bool:
+        """Update the breaker; return whether the call should be retried."""
+        retryable = is_retryable(error)
+        if self.breaker is not None:
+            if retryable:
+                self.breaker.record_failure()
+            else:
+                # The provider answered; the request itself was at fault.
+                self.breaker.record_success()
+        return retryable and attempt < self.retry.max_attempts
+
+    def _timed(self, operation: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        result = operation()
+        self.latencies.record(time.perf_counter() - started)
+        return result
+
+    async def _atimed(self, operation: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        result = await operation()
+        self.latencies.record(time.perf_counter() - started)
+        return result
+
+    def _hedged(self, operation: Callable[[], T], delay: float) -> T:
+        executor = self._hedge_executor()
+        # Copy the caller's context so request priority follows the call into worker threads.
+        primary = executor.submit(contextvars.copy_context().run, self._timed, operation)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        hedge = executor.submit(contextvars.copy_context().run, self._timed, operation)
+        return _first_success([primary, hedge])
+
+    async def _ahedged(self, operation: Callable[[], Awaitable[T]], delay: float) -> T:
+        primary = asyncio.ensure_future(self._atimed(operation))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+            tasks.add(asyncio.ensure_future(self._atimed(operation)))
+            pending = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_hedge_workers,
+                    thread_name_prefix="hedge",
+                )
+            return self._executor
+
+
+def _first_success(futures: list[Future]) -> T:
+    pending = set(futures)
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            error = future.exception()
+    raise error
@@ -0,0 +1,361 @@
+"""Client-side provider quota: token buckets with priority admission."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+import time
+from typing import Callable, Iterator, Sequence
+
+from src.application import (
+    AsyncEmbeddingPort,
+    AsyncGenerationPort,
+    EmbeddingPort,
+    EmbeddingResult,
+    GenerationPort,
+    RequestPriority,
+    current_priority,
+)
+from src.application.context_packing import estimate_tokens
+
+from .policies import is_rate_limited
+
+
+class QuotaLimiter:
+    """Requests-per-minute and tokens-per-minute budget shared by adapters.
+
+    Each bucket holds up to one minute of quota and refills continuously.
+    Callers wait in a priority queue (then FIFO): only the head may take
+    quota, so a bulk job never gets ahead of a waiting interactive request.
+    Threads and asyncio tasks wait in the same queue.
+    Limits adapt to the provider: every 429 halves the effective rate (down
+    to ``min_rate_fraction``) and drains the request bucket; every success
+    restores ``recovery_step`` of it.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int | None = None,
+        min_rate_fraction: float = 0.1,
+        recovery_step: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than zero.")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be greater than zero.")
+        if not 0.0 < min_rate_fraction <= 1.0:
+            raise ValueError("min_rate_fraction must be in (0, 1].")
+        if not 0.0 < recovery_step <= 1.0:
+            raise ValueError("recovery_step must be in (0, 1].")
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._min_rate_fraction = min_rate_fraction
+        self._recovery_step = recovery_step
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._rate_fraction = 1.0
+        self._request_level = float(requests_per_minute)
+        self._token_level = float(tokens_per_minute or 0)
+        self._updated_at = clock()
+        self._waiters: list[tuple[int, int]] = []
+        # Async waiters cannot block on the condition; they are woken through these.
+        self._async_wakeups: dict[tuple[int, int], Callable[[], object]] = {}
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        """Callers currently waiting for quota."""
+        with self._condition:
+            return len(self._waiters)
+
+    @property
+    def rate_fraction(self) -> float:
+        """Share of the configured limits currently in effect."""
+        with self._condition:
+            return self._rate_fraction
+
+    def acquire(self, tokens: int = 0, requests: int = 1, priority: RequestPriority | None = None) -> None:
+        """Block until the quota for one call is available, then take it.
+
+        ``priority`` defaults to the caller's :func:`current_priority`.
+        Costs above a bucket's capacity are capped so they cannot wait forever.
+        """
+        ticket = (int(current_priority() if priority is None else priority), next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    self._refill()
+                    wait_seconds: float | None = None
+                    if self._waiters[0] == ticket:
+                        wait_seconds = self._shortfall_seconds(requests, tokens)
+                        if wait_seconds <= 0:
+                            self._take(requests, tokens)
+                            return
+                    self._condition.wait(wait_seconds)
+            finally:
+                self._leave(ticket)
+
+    async def acquire_async(
+        self,
+        tokens: int = 0,
+        requests: int = 1,
+        priority: RequestPriority | None = None,
+    ) -> None:
+        """Asynchronous :meth:`acquire`: waits in the same queue without holding a thread."""
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        ticket = (int(current_priority() if priority is None else priority), next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            self._async_wakeups[ticket] = lambda: loop.call_soon_threadsafe(wakeup.set)
+        try:
+            while True:
+                with self._condition:
+                    self._refill()
+                    wait_seconds: float | None = None
+                    if self._waiters[0] == ticket:
+                        wait_seconds = self._shortfall_seconds(requests, tokens)
+                        if wait_seconds <= 0:
+                            self._take(requests, tokens)
+                            return
+                    wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), wait_seconds)
+                except TimeoutError:
+                    pass
+        finally:
+            with self._condition:
+                self._leave(ticket)
+
+    def record_success(self) -> None:
+        with self._condition:
+            self._rate_fraction = min(1.0, self._rate_fraction + self._recovery_step)
+            self._notify_waiters()
+
+    def record_rate_limited(self) -> None:
+        with self._condition:
+            self._refill()
+            self._rate_fraction = max(self._min_rate_fraction, self._rate_fraction / 2)
+            self._request_level = 0.0
+            self._token_level = min(self._token_level, self._capacity(self._tokens_per_minute))
+
+    def record_failure(self, error: BaseException) -> None:
+        if is_rate_limited(error):
+            self.record_rate_limited()
+
+    def _leave(self, ticket: tuple[int, int]) -> None:
+        self._waiters.remove(ticket)
+        heapq.heapify(self._waiters)
+        self._async_wakeups.pop(ticket, None)
+        self._notify_waiters()
+
+    def _notify_waiters(self) -> None:
+        self._condition.notify_all()
+        for wakeup in self._async_wakeups.values():
+            wakeup()
+
+    def _capacity(self, per_minute: int | None) -> float:
+        return (per_minute or 0) * self._rate_fraction
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed_minutes = max(0.0, now - self._updated_at) / 60.0
+        self._updated_at = now
+        self._request_level = min(
+            self._capacity(self._requests_per_minute),
+            self._request_level + elapsed_minutes * self._capacity(self._requests_per_minute),
+        )
+        if self._tokens_per_minute is not None:
+            self._token_level = min(
+                self._capacity(self._tokens_per_minute),
+                self._token_level + elapsed_minutes * self._capacity(self._tokens_per_minute),
+            )
+
+    def _costs(self, requests: int, tokens: int) -> tuple[float, float]:
+        request_cost = min(float(requests), self._capacity(self._requests_per_minute))
+        token_cost = 0.0
+        if self._tokens_per_minute is not None:
+            token_cost = min(float(tokens), self._capacity(self._tokens_per_minute))
+        return request_cost, token_cost
+
+    def _shortfall_seconds(self, requests: int, tokens: int) -> float:
+        request_cost, token_cost = self._costs(requests, tokens)
+        waits = [(request_cost - self._request_level) * 60.0 / self._capacity(self._requests_per_minute)]
+        if self._tokens_per_minute is not None:
+            waits.append((token_cost - self._token_level) * 60.0 / self._capacity(self._tokens_per_minute))
+        return max(waits)
+
+    def _take(self, requests: int, tokens: int) -> None:
+        request_cost, token_cost = self._costs(requests, tokens)
+        self._request_level -= request_cost
+        self._token_level -= token_cost
+
+
+class RateLimitedGenerationAdapter(GenerationPort):
+    """Generation decorator that draws from a shared :class:`QuotaLimiter`.
+
+    A call costs the prompt's estimated tokens plus ``expected_output_tokens``.
+    """
+
+    def __init__(
+        self,
+        inner: GenerationPort,
+        limiter: QuotaLimiter,
+        expected_output_tokens: int = 512,
+        token_estimator: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        self._inner = inner
+        self._limiter = limiter
+        self._expected_output_tokens = expected_output_tokens
+        self._token_estimator = token_estimator
+
+    def generate_text(self, prompt: str) -> str:
+        self._limiter.acquire(tokens=self._cost(prompt))
+        try:
+            text = self._inner.generate_text(prompt)
+        except Exception as error:  # noqa: BLE001
+            self._limiter.record_failure(error)
+            raise
+        self._limiter.record_success()
+        return text
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        self._limiter.acquire(tokens=self._cost(prompt))
+        try:
+            yield from self._inner.stream_text(prompt)
+        except Exception as error:  # noqa: BLE001
+            self._limiter.record_failure(error)
+            raise
+        self._limiter.record_success()
+
+    def _cost(self, prompt: str) -> int:
+        return self._token_estimator(prompt) + self._expected_output_tokens
+
+
+class RateLimitedEmbeddingAdapter(EmbeddingPort):
+    """Embedding decorator that draws from a shared :class:`QuotaLimiter`.
+
+    A batch costs one request per ``provider_batch_size`` texts, since the
+    wrapped adapter splits it into that many provider calls.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingPort,
+        limiter: QuotaLimiter,
+        provider_batch_size: int = 100,
+        token_estimator: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        if provider_batch_size <= 0:
+            raise ValueError("provider_batch_size must be greater than zero.")
+        self._inner = inner
+        self._limiter = limiter
+        self._provider_batch_size = provider_batch_size
+        self._token_estimator = token_estimator
+
+    def embed_text(self, text: str) -> list[float]:
+        self._limiter.acquire(tokens=self._token_estimator(text))
+        try:
+            embedding = self._inner.embed_text(text)
+        except Exception as error:  # noqa: BLE001
+            self._limiter.record_failure(error)
+            raise
+        self._limiter.record_success()
+        return embedding
+
+    def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        if not texts:
+            return []
+        self._limiter.acquire(
+            tokens=sum(self._token_estimator(text) for text in texts),
+            requests=math.ceil(len(texts) / self._provider_batch_size),
+        )
+        try:
+            results = self._inner.embed_batch(texts)
+        except Exception as error:  # noqa: BLE001
+            self._limiter.record_failure(error)
+            raise
+        _record_batch_outcome(self._limiter, results)
+        return results
+
+
+class AsyncRateLimitedGenerationAdapter(AsyncGenerationPort):
+    """Asynchronous counterpart of :class:`RateLimitedGenerationAdapter`."""
+
+    def __init__(
+        self,
+        inner: AsyncGenerationPort,
+        limiter: QuotaLimiter,
+        expected_output_tokens: int = 512,
+        token_estimator: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        self._inner = inner
+        self._limiter = limiter
+        self._expected_output_tokens = expected_output_tokens
+        self._token_estimator = token_estimator
+
+    async def generate_text(self, prompt: str) -> str:
+        await self._limiter.acquire_async(tokens=self._token_estimator(prompt) + self._expected_output_tokens)
+        try:
+            text = await self._inner.generate_text(prompt)
+        except Exception as error:  # noqa: BLE001
+            self._limiter.record_failure(error)
+            raise
+        self._limiter.record_success()
+        return text
+
+
+class AsyncRateLimitedEmbeddingAdapter(AsyncEmbeddingPort):
+    """Asynchronous counterpart of :class:`RateLimitedEmbeddingAdapter`."""
+
+    def __init__(
+        self,
+        inner: AsyncEmbeddingPort,
+        limiter: QuotaLimiter,
+        provider_batch_size: int = 100,
+        token_estimator: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        if provider_batch_size <= 0:
+            raise ValueError("provider_batch_size must be greater than zero.")
+        self._inner = inner
+        self._limiter = limiter
+        self._provider_batch_size = provider_batch_size
+        self._token_estimator = token_estimator
+
+    async def embed_text(self, text: str) -> list[float]:
+        await self._limiter.acquire_async(tokens=self._token_estimator(text))
+        try:
+            embedding = await self._inner.embed_text(text)
+        except Exception as error:  # noqa: BLE001
+            self._limiter.record_failure(error)
+            raise
+        self._limiter.record_success()
+        return embedding
+
+    async def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        if not texts:
+            return []
+        await self._limiter.acquire_async(
+            tokens=sum(self._token_estimator(text) for text in texts),
+            requests=math.ceil(len(texts) / self._provider_batch_size),
+        )
+        try:
+            results = await self._inner.embed_batch(texts)
+        except Exception as error:  # noqa: BLE001
+            self._limiter.record_failure(error)
+            raise
+        _record_batch_outcome(self._limiter, results)
+        return results
+
+
+def _record_batch_outcome(limiter: QuotaLimiter, results: Sequence[EmbeddingResult]) -> None:
+    if any(result.exception is not None and is_rate_limited(result.exception) for result in results):
+        limiter.record_rate_limited()
+    else:
+        limiter.record_success()
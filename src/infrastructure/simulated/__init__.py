@@ -0,0 +1,9 @@
+"""Deterministic simulated adapters for offline benchmarks and tests."""
+
+from .adapters import SimulatedEmbeddingAdapter, SimulatedGenerationAdapter, SimulatedVectorStore
+
+__all__ = [
+    "SimulatedEmbeddingAdapter",
+    "SimulatedGenerationAdapter",
+    "SimulatedVectorStore",
+]
@@ -0,0 +1,200 @@
+"""Deterministic in-process stand-ins for the provider and vector-store ports."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from typing import Any, Callable, Iterator, Sequence
+
+from src.application import (
+    EmbeddingPort,
+    EmbeddingRecord,
+    EmbeddingResult,
+    GenerationPort,
+    UpsertReport,
+    VectorSearchOptions,
+    VectorSearchQuery,
+    VectorSearchResult,
+    VectorStorePort,
+)
+from src.application.chunking import normalize_text
+
+
+class SimulatedEmbeddingAdapter(EmbeddingPort):
+    """Feature-hashing embeddings with a configurable provider latency.
+
+    Each lower-cased word adds a signed unit to one of ``dimension`` slots
+    picked by its hash, so vectors are identical across runs and texts that
+    share words are close in cosine space. A call sleeps ``latency_seconds``
+    plus ``per_item_latency_seconds`` for every text it embeds.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 64,
+        latency_seconds: float = 0.0,
+        per_item_latency_seconds: float = 0.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if dimension <= 0:
+            raise ValueError("dimension must be greater than zero.")
+        if latency_seconds < 0 or per_item_latency_seconds < 0:
+            raise ValueError("Simulated latency cannot be negative.")
+        self._dimension = dimension
+        self._latency_seconds = latency_seconds
+        self._per_item_latency_seconds = per_item_latency_seconds
+        self._sleep = sleep
+        self.calls = 0
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def embed_text(self, text: str) -> list[float]:
+        self._wait(1)
+        return self._vector(text)
+
+    def embed_batch(self, texts: Sequence[str]) -> list[EmbeddingResult]:
+        if not texts:
+            return []
+        self._wait(len(texts))
+        results: list[EmbeddingResult] = []
+        for text in texts:
+            try:
+                results.append(EmbeddingResult(embedding=self._vector(text)))
+            except ValueError as error:
+                results.append(EmbeddingResult(error=str(error), exception=error))
+        return results
+
+    def _wait(self, items: int) -> None:
+        self.calls += 1
+        delay = self._latency_seconds + self._per_item_latency_seconds * items
+        if delay > 0:
+            self._sleep(delay)
+
+    def _vector(self, text: str) -> list[float]:
+        words = normalize_text(text).lower().split()
+        if not words:
+            raise ValueError("Cannot embed blank text.")
+        vector = [0.0] * self._dimension
+        for word in words:
+            digest = int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+            vector[digest % self._dimension] += 1.0 if digest >> 63 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+
+class SimulatedGenerationAdapter(GenerationPort):
+    """Answers built from the prompt's own words, paced like a streaming LLM.
+
+    The answer is the first ``answer_words`` words of the prompt's context
+    section, so it is deterministic for a given prompt. A call sleeps
+    ``latency_seconds`` before the first word and ``1 / tokens_per_second``
+    between words; ``tokens_per_second=None`` emits all words at once.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        tokens_per_second: float | None = None,
+        answer_words: int = 32,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if latency_seconds < 0:
+            raise ValueError("Simulated latency cannot be negative.")
+        if tokens_per_second is not None and tokens_per_second <= 0:
+            raise ValueError("tokens_per_second must be greater than zero.")
+        if answer_words <= 0:
+            raise ValueError("answer_words must be greater than zero.")
+        self._latency_seconds = latency_seconds
+        self._tokens_per_second = tokens_per_second
+        self._answer_words = answer_words
+        self._sleep = sleep
+        self.calls = 0
+
+    def generate_text(self, prompt: str) -> str:
+        return "".join(self.stream_text(prompt))
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        self.calls += 1
+        words = self._answer(prompt)
+        if self._latency_seconds > 0:
+            self._sleep(self._latency_seconds)
+        for index, word in enumerate(words):
+            if index and self._tokens_per_second is not None:
+                self._sleep(1.0 / self._tokens_per_second)
+            yield word if index == 0 else " " + word
+
+    def _answer(self, prompt: str) -> list[str]:
+        _, _, context = prompt.partition("Context:")
+        words = (context or prompt).split()[: self._answer_words]
+        return words or ["No", "context."]
+
+
+class SimulatedVectorStore(VectorStorePort):
+    """Vector-store decorator that adds fixed latency to every call.
+
+    Without ``inner`` it wraps an in-memory
+    :class:`~src.infrastructure.vector_store.NumpyVectorStore` of
+    ``embedding_size`` dimensions, whose exact search is deterministic.
+    Searches sleep ``search_latency_seconds`` (once per batch) and writes
+    sleep ``write_latency_seconds`` before reaching the wrapped store.
+    """
+
+    def __init__(
+        self,
+        embedding_size: int,
+        search_latency_seconds: float = 0.0,
+        write_latency_seconds: float = 0.0,
+        inner: VectorStorePort | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if search_latency_seconds < 0 or write_latency_seconds < 0:
+            raise ValueError("Simulated latency cannot be negative.")
+        if inner is None:
+            # Imported lazily so the provider stand-ins work without numpy.
+            from src.infrastructure.vector_store import NumpyStoreSettings, NumpyVectorStore
+
+            inner = NumpyVectorStore(NumpyStoreSettings(embedding_size=embedding_size))
+        self._inner = inner
+        self._search_latency_seconds = search_latency_seconds
+        self._write_latency_seconds = write_latency_seconds
+        self._sleep = sleep
+
+    @property
+    def inner(self) -> VectorStorePort:
+        return self._inner
+
+    def ensure_collection(self) -> None:
+        self._inner.ensure_collection()
+
+    def upsert_embedding(self, chunk_id: str, embedding: list[float], payload: dict[str, Any]) -> None:
+        self._pause(self._write_latency_seconds)
+        self._inner.upsert_embedding(chunk_id, embedding, payload)
+
+    def upsert_embeddings(self, records: Sequence[EmbeddingRecord]) -> UpsertReport:
+        self._pause(self._write_latency_seconds)
+        return self._inner.upsert_embeddings(records)
+
+    def delete_embeddings(self, chunk_ids: Sequence[str]) -> None:
+        self._pause(self._write_latency_seconds)
+        self._inner.delete_embeddings(chunk_ids)
+
+    def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+        options: VectorSearchOptions | None = None,
+    ) -> list[VectorSearchResult]:
+        self._pause(self._search_latency_seconds)
+        return self._inner.search_similar(query_embedding, limit, score_threshold, options)
+
+    def search_similar_batch(self, queries: Sequence[VectorSearchQuery]) -> list[list[VectorSearchResult]]:
+        self._pause(self._search_latency_seconds)
+        return self._inner.search_similar_batch(queries)
+
+    def _pause(self, seconds: float) -> None:
+        if seconds > 0:
+            self._sleep(seconds)
@@ -1,5 +1,42 @@
 """Vector-store adapters."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from .qdrant_adapter import QdrantVectorStore, VectorStoreInfrastructureError
+from .qdrant_client_factory import QdrantClientFactory, QdrantClientSettings
+
+if TYPE_CHECKING:
+    from .async_qdrant_adapter import AsyncQdrantVectorStore
+    from .hnsw import HNSWIndex
+    from .numpy_store import NumpyStoreSettings, NumpyVectorStore
+
+# Imported on first access: the local store loads numpy, the async adapter asyncio.
+_LAZY_EXPORTS = {
+    "AsyncQdrantVectorStore": ".async_qdrant_adapter",
+    "NumpyVectorStore": ".numpy_store",
+    "NumpyStoreSettings": ".numpy_store",
+    "HNSWIndex": ".hnsw",
+}
+
+__all__ = [
+    "QdrantVectorStore",
+    "AsyncQdrantVectorStore",
+    "QdrantClientFactory",
+    "QdrantClientSettings",
+    "NumpyVectorStore",
+    "NumpyStoreSettings",
+    "HNSWIndex",
+    "VectorStoreInfrastructureError",
+]
+
 
-__all__ = ["QdrantVectorStore", "VectorStoreInfrastructureError"]
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
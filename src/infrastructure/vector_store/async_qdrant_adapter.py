@@ -0,0 +1,160 @@
+"""Asyncio Qdrant adapter implementing the async vector-store port."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Sequence
+
+from src.application import (
+    AsyncVectorStorePort,
+    EmbeddingRecord,
+    UpsertReport,
+    VectorSearchOptions,
+    VectorSearchResult,
+)
+
+from .qdrant_adapter import (
+    QdrantSettings,
+    VectorStoreInfrastructureError,
+    _QdrantCollectionRules,
+)
+from .qdrant_client_factory import QdrantClientFactory, QdrantClientSettings
+
+
+class AsyncQdrantVectorStore(_QdrantCollectionRules, AsyncVectorStorePort):
+    """Qdrant implementation of the async vector store port over ``AsyncQdrantClient``."""
+
+    def __init__(self, settings: QdrantSettings, client: object) -> None:
+        self._settings = settings
+        self._client = client
+
+    @classmethod
+    def from_url(
+        cls,
+        settings: QdrantSettings,
+        factory: QdrantClientFactory | None = None,
+    ) -> "AsyncQdrantVectorStore":
+        """Build adapter on the async client of ``factory``.
+
+        Without one, a factory with the default transport settings (timeout,
+        pool size, keep-alive) is created for ``settings.url``; pass the
+        process-wide factory to share its connections.
+        """
+        factory = factory or QdrantClientFactory(QdrantClientSettings(url=settings.url))
+        return cls(settings=settings, client=factory.get_async_client())
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def ensure_collection(self) -> None:
+        """Create collection if absent, otherwise validate the existing schema."""
+        try:
+            if await self._client.collection_exists(collection_name=self._settings.collection_name):
+                collection_info = await self._client.get_collection(
+                    collection_name=self._settings.collection_name
+                )
+                self._check_collection_schema(collection_info)
+                return
+
+            await self._client.create_collection(
+                collection_name=self._settings.collection_name,
+                vectors_config=self._vectors_config(),
+                quantization_config=self._quantization_config(),
+            )
+        except VectorStoreInfrastructureError:
+            raise
+        except Exception as error:  # noqa: BLE001
+            raise VectorStoreInfrastructureError(
+                f"Failed to ensure Qdrant collection '{self._settings.collection_name}'."
+            ) from error
+
+    async def upsert_embedding(
+        self,
+        chunk_id: str,
+        embedding: list[float],
+        payload: dict[str, object],
+    ) -> None:
+        """Upsert one embedding record into Qdrant."""
+        self._validate_record(chunk_id, embedding)
+
+        try:
+            await self._client.upsert(
+                collection_name=self._settings.collection_name,
+                points=self._to_points([EmbeddingRecord(chunk_id, embedding, payload)]),
+            )
+        except Exception as error:  # noqa: BLE001
+            raise VectorStoreInfrastructureError(f"Failed to upsert chunk '{chunk_id}' into Qdrant.") from error
+
+    async def upsert_embeddings(self, records: Sequence[EmbeddingRecord]) -> UpsertReport:
+        """Same batching and final ``wait=True`` barrier as the sync adapter."""
+        valid, failures = self._partition_valid(records)
+        batches = self._split_batches(valid)
+        if not batches:
+            return UpsertReport(upserted=0, failures=failures)
+
+        batch_failures: dict[str, str] = {}
+        *leading, barrier = batches
+        semaphore = asyncio.Semaphore(self._settings.upsert_parallelism)
+
+        async def send_bounded(batch: list[EmbeddingRecord]) -> dict[str, str]:
+            async with semaphore:
+                return await self._send_batch(batch, wait=self._settings.upsert_wait)
+
+        for outcome in await asyncio.gather(*(send_bounded(batch) for batch in leading)):
+            batch_failures.update(outcome)
+        batch_failures.update(await self._send_batch(barrier, wait=True))
+
+        failures.update(batch_failures)
+        return UpsertReport(upserted=len(valid) - len(batch_failures), failures=failures)
+
+    async def delete_embeddings(self, chunk_ids: Sequence[str]) -> None:
+        """Delete points by chunk ID and wait until the deletion is applied."""
+        if not chunk_ids:
+            return
+        try:
+            await self._client.delete(
+                collection_name=self._settings.collection_name,
+                points_selector=self._point_ids_selector(chunk_ids),
+                wait=True,
+            )
+        except Exception as error:  # noqa: BLE001
+            raise VectorStoreInfrastructureError(
+                f"Failed to delete {len(chunk_ids)} chunks from Qdrant."
+            ) from error
+
+    async def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+        options: VectorSearchOptions | None = None,
+    ) -> list[VectorSearchResult]:
+        """Return nearest vectors from Qdrant collection."""
+        self._validate_query(query_embedding, limit)
+
+        try:
+            response = await self._client.query_points(
+                collection_name=self._settings.collection_name,
+                query=query_embedding,
+                limit=limit,
+                score_threshold=score_threshold,
+                search_params=self._search_params(options),
+                with_payload=self._payload_selector(),
+                with_vectors=False,
+            )
+        except Exception as error:  # noqa: BLE001
+            raise VectorStoreInfrastructureError("Failed to query Qdrant similarity search.") from error
+
+        return self._to_results(response.points)
+
+    async def _send_batch(self, batch: list[EmbeddingRecord], wait: bool) -> dict[str, str]:
+        try:
+            await self._client.upsert(
+                collection_name=self._settings.collection_name,
+                points=self._to_points(batch),
+                wait=wait,
+            )
+        except Exception as error:  # noqa: BLE001
+            message = f"Failed to upsert batch into Qdrant: {error}"
+            return {record.chunk_id: message for record in batch}
+        return {}
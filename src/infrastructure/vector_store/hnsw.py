@@ -0,0 +1,294 @@
+"""Hierarchical navigable small world (HNSW) graph over unit-length vectors."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import os
+from pathlib import Path
+import random
+from typing import Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - guarded by the owning store
+    np = None
+
+# Results expanded per beam-search round: fewer, larger matrix products.
+_EXPAND_PER_ROUND = 16
+
+
+class HNSWIndex:
+    """Approximate nearest-neighbour graph keyed by matrix row.
+
+    The index stores only graph links; vectors are read from the matrix passed
+    to :meth:`add` and :meth:`search`, whose rows must be unit length so the
+    dot product is the cosine similarity. A row's vector must not change once
+    added. Removed rows are only marked deleted: they keep routing searches
+    but are never returned.
+
+    Layer-0 links, which every row has, live in one ``int32`` array padded
+    with ``-1``; the few rows that reach upper layers keep those links in
+    lists. A single writer may :meth:`add` while other threads
+    :meth:`search`: links are published only after the new row's own links
+    are in place, so a concurrent search sees the graph with or without the
+    row, never a dangling link.
+    """
+
+    def __init__(
+        self,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        seed: int | None = None,
+    ) -> None:
+        if m < 2:
+            raise ValueError("m must be at least 2.")
+        if ef_construction < m:
+            raise ValueError("ef_construction must be at least m.")
+        if ef_search <= 0:
+            raise ValueError("ef_search must be greater than zero.")
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._level_scale = 1.0 / math.log(m)
+        self._random = random.Random(seed)
+        self._levels: list[int] = []
+        self._base_links = np.full((0, 2 * m), -1, dtype=np.int32)
+        self._upper_links: dict[int, list[list[int]]] = {}
+        self._deleted: set[int] = set()
+        self._entry_point: int | None = None
+        self._max_level = -1
+
+    def __len__(self) -> int:
+        return sum(1 for level in self._levels if level >= 0) - len(self._deleted)
+
+    @property
+    def rows(self) -> int:
+        """One past the highest row ever added, deleted rows included."""
+        return len(self._levels)
+
+    def __contains__(self, row: int) -> bool:
+        return row < len(self._levels) and self._levels[row] >= 0
+
+    def add(self, row: int, vectors: Any) -> None:
+        """Link ``vectors[row]`` into the graph."""
+        if row in self:
+            raise ValueError(f"Row {row} is already indexed.")
+        if row >= self._base_links.shape[0]:
+            grown = np.full((max(row + 1, 2 * self._base_links.shape[0], 1024), 2 * self.m), -1, dtype=np.int32)
+            grown[: self._base_links.shape[0]] = self._base_links
+            self._base_links = grown
+        if len(self._levels) <= row:
+            self._levels.extend([-1] * (row + 1 - len(self._levels)))
+
+        level = int(-math.log(1.0 - self._random.random()) * self._level_scale)
+        if level > 0:
+            self._upper_links[row] = [[] for _ in range(level)]
+        self._levels[row] = level
+        if self._entry_point is None:
+            self._entry_point, self._max_level = row, level
+            return
+
+        query = vectors[row]
+        entry_points = [self._entry_point]
+        for layer in range(self._max_level, level, -1):
+            entry_points = [self._search_layer(query, entry_points, 1, layer, vectors)[0][1]]
+
+        for layer in range(min(level, self._max_level), -1, -1):
+            candidates = self._search_layer(query, entry_points, self.ef_construction, layer, vectors)
+            neighbours = self._select_neighbours(
+                np.asarray([node for _, node in candidates], dtype=np.int64),
+                np.asarray([similarity for similarity, _ in candidates], dtype=np.float32),
+                self.m,
+                vectors,
+            )
+            # The row's own links go first: a search reaching it through a
+            # neighbour's new back link must find somewhere to go next.
+            self._set_links(row, layer, neighbours)
+            for neighbour in neighbours:
+                links = self._links(neighbour, layer)
+                if len(links) < self._max_links(layer):
+                    self._set_links(neighbour, layer, links + [row])
+                else:
+                    self._set_links(neighbour, layer, self._prune(neighbour, links + [row], layer, vectors))
+            entry_points = [node for _, node in candidates]
+
+        if level > self._max_level:
+            self._entry_point, self._max_level = row, level
+
+    def mark_deleted(self, row: int) -> None:
+        if row in self:
+            self._deleted.add(row)
+
+    def search(self, query: Any, k: int, vectors: Any, ef: int | None = None) -> list[tuple[int, float]]:
+        """Return up to ``k`` live ``(row, similarity)`` pairs, best first."""
+        entry_point = self._entry_point
+        if entry_point is None or k <= 0:
+            return []
+        # A concurrent add may move the entry point before raising the top
+        # layer; start from the layer the entry point is known to have.
+        entry_points = [entry_point]
+        for layer in range(self._levels[entry_point], 0, -1):
+            entry_points = [self._search_layer(query, entry_points, 1, layer, vectors)[0][1]]
+
+        width = max(ef or self.ef_search, k)
+        # Deleted rows still route the search but take no result slots.
+        candidates = self._search_layer(query, entry_points, width + min(len(self._deleted), width), 0, vectors)
+        return [(node, similarity) for similarity, node in candidates if node not in self._deleted][:k]
+
+    def save(self, path: Path, generation: int) -> None:
+        """Persist the graph to ``path`` atomically, tagged with ``generation``."""
+        rows = len(self._levels)
+        levels = np.asarray(self._levels, dtype=np.int32)
+        arrays: dict[str, Any] = {
+            "header": np.asarray(
+                [
+                    generation,
+                    -1 if self._entry_point is None else self._entry_point,
+                    self._max_level,
+                    self.m,
+                    self.ef_construction,
+                ],
+                dtype=np.int64,
+            ),
+            "levels": levels,
+            "deleted": np.asarray(sorted(self._deleted), dtype=np.int32),
+        }
+        for layer in range(self._max_level + 1):
+            nodes = np.flatnonzero(levels >= layer) if rows else np.empty(0, dtype=np.int64)
+            if layer == 0:
+                links = self._base_links[nodes]
+            else:
+                links = np.full((len(nodes), self._max_links(layer)), -1, dtype=np.int32)
+                for position, node in enumerate(nodes.tolist()):
+                    neighbours = self._upper_links[node][layer - 1]
+                    links[position, : len(neighbours)] = neighbours
+            arrays[f"nodes_{layer}"] = nodes.astype(np.int32)
+            arrays[f"links_{layer}"] = links
+
+        temporary_path = path.with_name(path.name + ".tmp")
+        with temporary_path.open("wb") as handle:
+            np.savez(handle, **arrays)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: Path, ef_search: int, seed: int | None = None) -> tuple["HNSWIndex", int]:
+        """Read a graph written by :meth:`save`; returns it with its generation."""
+        with np.load(path) as arrays:
+            generation, entry_point, max_level, m, ef_construction = (int(value) for value in arrays["header"])
+            index = cls(m=m, ef_construction=ef_construction, ef_search=ef_search, seed=seed)
+            index._levels = arrays["levels"].tolist()
+            index._base_links = np.full((len(index._levels), 2 * m), -1, dtype=np.int32)
+            if max_level >= 0:
+                index._base_links[arrays["nodes_0"]] = arrays["links_0"]
+            index._upper_links = {row: [[] for _ in range(level)] for row, level in enumerate(index._levels) if level > 0}
+            for layer in range(1, max_level + 1):
+                for node, links in zip(arrays[f"nodes_{layer}"].tolist(), arrays[f"links_{layer}"].tolist()):
+                    index._upper_links[node][layer - 1] = [link for link in links if link >= 0]
+            index._deleted = set(arrays["deleted"].tolist())
+        index._entry_point = None if entry_point < 0 else entry_point
+        index._max_level = max_level
+        return index, generation
+
+    def _max_links(self, layer: int) -> int:
+        return 2 * self.m if layer == 0 else self.m
+
+    def _links(self, node: int, layer: int) -> list[int]:
+        if layer == 0:
+            links = self._base_links[node]
+            return links[links >= 0].tolist()
+        return self._upper_links[node][layer - 1]
+
+    def _set_links(self, node: int, layer: int, links: Sequence[int]) -> None:
+        """Replace a node's links in one assignment, so readers see old or new links."""
+        if layer == 0:
+            padded = np.full(2 * self.m, -1, dtype=np.int32)
+            padded[: len(links)] = links
+            self._base_links[node] = padded
+        else:
+            self._upper_links[node][layer - 1] = list(links)
+
+    def _search_layer(
+        self,
+        query: Any,
+        entry_points: Sequence[int],
+        ef: int,
+        layer: int,
+        vectors: Any,
+    ) -> list[tuple[float, int]]:
+        """Beam search of one layer; returns up to ``ef`` ``(similarity, row)`` pairs, best first.
+
+        Each round expands the best few unexpanded results at once, scoring
+        all their unvisited neighbours with one matrix product, and keeps
+        the ``ef`` best; it stops once every kept result has been expanded.
+        """
+        nodes = np.unique(np.asarray(entry_points, dtype=np.int64))
+        # One array read per call: a concurrent add may swap in a grown one.
+        base_links = self._base_links
+        visited = np.zeros(base_links.shape[0], dtype=bool)
+        visited[nodes] = True
+        similarities = vectors[nodes] @ query
+        expanded = np.zeros(len(nodes), dtype=bool)
+        while True:
+            if len(nodes) > ef:
+                kept = np.argpartition(-similarities, ef - 1)[:ef]
+                nodes, similarities, expanded = nodes[kept], similarities[kept], expanded[kept]
+            pending = np.flatnonzero(~expanded)
+            if not pending.size:
+                break
+            if pending.size > _EXPAND_PER_ROUND:
+                pending = pending[np.argpartition(-similarities[pending], _EXPAND_PER_ROUND - 1)[:_EXPAND_PER_ROUND]]
+            expanded[pending] = True
+            if layer == 0:
+                links = base_links[nodes[pending]].ravel()
+            else:
+                links = np.asarray(
+                    [link for node in nodes[pending].tolist() for link in self._upper_links[node][layer - 1]],
+                    dtype=np.int64,
+                )
+            links = links[(links >= 0) & (links < len(visited))]
+            fresh_nodes = np.unique(links[~visited[links]])
+            if not fresh_nodes.size:
+                continue
+            visited[fresh_nodes] = True
+            fresh_similarities = vectors[fresh_nodes] @ query
+            if len(nodes) >= ef:
+                closer = fresh_similarities > similarities.min()
+                fresh_nodes, fresh_similarities = fresh_nodes[closer], fresh_similarities[closer]
+            nodes = np.concatenate([nodes, fresh_nodes])
+            similarities = np.concatenate([similarities, fresh_similarities])
+            expanded = np.concatenate([expanded, np.zeros(len(fresh_nodes), dtype=bool)])
+        order = np.argsort(-similarities, kind="stable")
+        return list(zip(similarities[order].tolist(), nodes[order].tolist()))
+
+    def _select_neighbours(self, nodes: Any, similarities: Any, limit: int, vectors: Any) -> list[int]:
+        """Keep candidates closer to the new node than to any already selected one.
+
+        ``nodes`` are ordered best first. One matrix product finds, for each
+        candidate, the better-ranked candidates that would exclude it; the
+        greedy pass then only tests those sets as bitmasks.
+        """
+        candidate_vectors = vectors[nodes]
+        excluded_by = np.tril(candidate_vectors @ candidate_vectors.T >= similarities[:, None], k=-1)
+        masks = np.packbits(excluded_by, axis=1, bitorder="little").tobytes()
+        width = len(masks) // len(nodes) if len(nodes) else 0
+        selected: list[int] = []
+        selected_mask = 0
+        for position in range(len(nodes)):
+            if not int.from_bytes(masks[position * width : (position + 1) * width], "little") & selected_mask:
+                selected.append(position)
+                selected_mask |= 1 << position
+                if len(selected) == limit:
+                    break
+        if len(selected) < limit:
+            selected.extend(position for position in range(len(nodes)) if not selected_mask >> position & 1)
+        return nodes[selected[:limit]].tolist()
+
+    def _prune(self, node: int, links: list[int], layer: int, vectors: Any) -> list[int]:
+        candidates = np.asarray(links, dtype=np.int64)
+        similarities = vectors[candidates] @ vectors[node]
+        order = np.argsort(-similarities, kind="stable")
+        return self._select_neighbours(candidates[order], similarities[order], self._max_links(layer), vectors)
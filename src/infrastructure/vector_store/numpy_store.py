@@ -0,0 +1,666 @@
+"""In-process vector store backed by a NumPy float32 matrix."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import math
+from pathlib import Path
+import sqlite3
+import tempfile
+import threading
+from typing import IO, Any, Sequence
+
+from src.application import (
+    EmbeddingRecord,
+    UpsertReport,
+    VectorSearchOptions,
+    VectorSearchQuery,
+    VectorSearchResult,
+    VectorStorePort,
+)
+
+from .hnsw import HNSWIndex
+from .qdrant_adapter import QUANTIZATION_MODES, VectorStoreInfrastructureError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - covered by runtime guard
+    np = None
+
+
+@dataclass(frozen=True)
+class NumpyStoreSettings:
+    """Settings for the in-process store.
+
+    With ``path`` set, vectors live in ``<path>/vectors.f32`` as a memory-mapped
+    file and payloads in ``<path>/payloads.sqlite3``; otherwise everything is
+    held in memory. ``index="hnsw"`` answers searches from an approximate
+    HNSW graph (persisted to ``<path>/hnsw.npz`` on flush) instead of an
+    exact scan. ``quantization`` ("int8" or "binary") keeps compressed codes
+    in RAM for the flat scan and rescores the oversampled candidates against
+    the full-precision rows, which are read from disk: from ``vectors.f32``,
+    or without ``path`` from an anonymous temporary file, so that only the
+    codes stay resident.
+
+    A file-backed store syncs the vector file on :meth:`NumpyVectorStore.flush`,
+    on close and after every ``flush_interval_rows`` written rows, not after
+    each batch. Vectors written since the last sync survive a process crash
+    (they sit in the page cache) but not a power loss.
+    """
+
+    embedding_size: int
+    path: str | Path | None = None
+    initial_capacity: int = 1024
+    index: str = "flat"
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 200
+    hnsw_ef_search: int = 64
+    quantization: str = "none"
+    search_oversampling: float = 2.0
+    search_rescore: bool = True
+    flush_interval_rows: int = 65_536
+
+
+_INDEX_TYPES = {"flat", "hnsw"}
+
+# Rows scored per block by the quantized scan, bounding its temporary memory.
+_SCAN_BLOCK_ROWS = 65_536
+_POPCOUNT = None if np is None else np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+_VECTORS_FILE = "vectors.f32"
+_PAYLOADS_FILE = "payloads.sqlite3"
+_GRAPH_FILE = "hnsw.npz"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    chunk_id TEXT PRIMARY KEY,
+    row INTEGER NOT NULL UNIQUE,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class NumpyVectorStore(VectorStorePort):
+    """Exact cosine search over a contiguous matrix of unit-length rows.
+
+    Rows are normalized on write, so a search is one matrix-vector product
+    followed by an ``argpartition`` top-k. Deleted rows are tombstoned and
+    reused by later inserts; the matrix grows geometrically when full.
+
+    With an HNSW index a row's vector must stay fixed once linked into the
+    graph, so rows are never reused: overwrites and deletes tombstone the old
+    row, which keeps routing graph searches. The matrix and graph therefore
+    grow with every re-ingestion; watch :attr:`tombstones` and call
+    :meth:`compact` when they dominate.
+
+    Writers are serialized by their own lock; searches take a second one,
+    which writers hold only while changing the matrix and row maps. Linking
+    rows into the HNSW graph, the slow part of an upsert, runs outside it:
+    searches keep answering and skip the new rows until they are published.
+    """
+
+    def __init__(self, settings: NumpyStoreSettings) -> None:
+        if np is None:
+            raise VectorStoreInfrastructureError(
+                "numpy is not installed. Install project dependencies before using the local vector store."
+            )
+        if settings.embedding_size <= 0:
+            raise VectorStoreInfrastructureError("embedding_size must be greater than zero.")
+        if settings.initial_capacity <= 0:
+            raise VectorStoreInfrastructureError("initial_capacity must be greater than zero.")
+        if settings.index not in _INDEX_TYPES:
+            raise VectorStoreInfrastructureError(
+                f"Invalid index '{settings.index}'. Allowed values: {sorted(_INDEX_TYPES)}"
+            )
+        if settings.quantization not in QUANTIZATION_MODES:
+            raise VectorStoreInfrastructureError(
+                f"Invalid quantization '{settings.quantization}'. Allowed values: {list(QUANTIZATION_MODES)}"
+            )
+        if settings.quantization != "none" and settings.index != "flat":
+            raise VectorStoreInfrastructureError("Quantization is only supported by the flat index.")
+        if settings.search_oversampling < 1.0:
+            raise VectorStoreInfrastructureError("search_oversampling must be at least 1.0.")
+        if settings.flush_interval_rows <= 0:
+            raise VectorStoreInfrastructureError("flush_interval_rows must be greater than zero.")
+        self._settings = settings
+        self._directory = Path(settings.path) if settings.path is not None else None
+        self._lock = threading.RLock()
+        self._write_lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+        self._matrix: Any = None
+        self._spill: IO[bytes] | None = None
+        self._codes: Any = None
+        self._alive: Any = None
+        self._row_ids: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._index: HNSWIndex | None = None
+        # Rows linked into the graph but not yet published; searches ask it for that many more.
+        self._linking = 0
+        if settings.index == "hnsw":
+            try:
+                self._index = HNSWIndex(
+                    m=settings.hnsw_m,
+                    ef_construction=settings.hnsw_ef_construction,
+                    ef_search=settings.hnsw_ef_search,
+                )
+            except ValueError as error:
+                raise VectorStoreInfrastructureError(str(error)) from error
+        self._generation = 0
+        self._saved_generation = 0
+        self._unflushed_rows = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    @property
+    def tombstones(self) -> int:
+        """Rows holding deleted or overwritten vectors that are not reused yet."""
+        with self._lock:
+            return len(self._row_ids) - len(self._rows)
+
+    def ensure_collection(self) -> None:
+        """Open (or create) the store and validate its vector size."""
+        with self._lock:
+            if self._connection is not None:
+                return
+            try:
+                self._open()
+            except VectorStoreInfrastructureError:
+                raise
+            except (OSError, sqlite3.Error, ValueError, KeyError) as error:
+                raise VectorStoreInfrastructureError(
+                    f"Failed to open local vector store '{self._directory}'."
+                ) from error
+
+    def upsert_embedding(
+        self,
+        chunk_id: str,
+        embedding: list[float],
+        payload: dict[str, object],
+    ) -> None:
+        report = self.upsert_embeddings([EmbeddingRecord(chunk_id, embedding, payload)])
+        if not report.ok:
+            raise VectorStoreInfrastructureError(report.failures[chunk_id])
+
+    def upsert_embeddings(self, records: Sequence[EmbeddingRecord]) -> UpsertReport:
+        """Write records in place, overwriting rows of already known chunk IDs."""
+        self.ensure_collection()
+        failures: dict[str, str] = {}
+        latest: dict[str, EmbeddingRecord] = {}
+        for record in records:
+            error = self._record_error(record)
+            if error is not None:
+                failures[record.chunk_id] = error
+            else:
+                latest[record.chunk_id] = record
+        if not latest:
+            return UpsertReport(upserted=0, failures=failures)
+
+        vectors = np.asarray([record.embedding for record in latest.values()], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1)
+        zero_norm = norms == 0.0
+        for chunk_id, is_zero in zip(list(latest), zero_norm):
+            if is_zero:
+                failures[chunk_id] = "Embedding must have a non-zero norm."
+                del latest[chunk_id]
+        vectors = vectors[~zero_norm] / norms[~zero_norm, None]
+        if not latest:
+            return UpsertReport(upserted=0, failures=failures)
+
+        with self._write_lock:
+            with self._lock:
+                if self._index is None:
+                    rows = [self._assign_row(chunk_id) for chunk_id in latest]
+                else:
+                    rows = self._reserve_rows(len(latest))
+                    self._linking = len(rows)
+                self._matrix[rows] = vectors
+                if self._codes is not None:
+                    self._codes[rows] = self._encode(vectors)
+            if self._index is not None:
+                # Searches keep running while the rows are linked and skip them until published.
+                try:
+                    for row in rows:
+                        self._index.add(row, self._matrix)
+                except BaseException:
+                    with self._lock:
+                        self._linking = 0
+                    raise
+            with self._lock:
+                if self._index is not None:
+                    for chunk_id, row in zip(latest, rows):
+                        self._publish_row(chunk_id, row)
+                    self._linking = 0
+                self._alive[rows] = True
+                try:
+                    self._unflushed_rows += len(rows)
+                    if self._unflushed_rows >= self._settings.flush_interval_rows:
+                        self._flush_matrix()
+                    with self._connection:
+                        self._bump_generation()
+                        self._connection.executemany(
+                            "INSERT OR REPLACE INTO chunks (chunk_id, row, payload) VALUES (?, ?, ?)",
+                            [
+                                (chunk_id, row, json.dumps(record.payload, default=str, ensure_ascii=False))
+                                for (chunk_id, record), row in zip(latest.items(), rows)
+                            ],
+                        )
+                except (OSError, sqlite3.Error) as error:
+                    raise VectorStoreInfrastructureError("Failed to persist local vector store.") from error
+        return UpsertReport(upserted=len(latest), failures=failures)
+
+    def delete_embeddings(self, chunk_ids: Sequence[str]) -> None:
+        """Tombstone rows; their slots are reused by later inserts."""
+        self.ensure_collection()
+        with self._write_lock, self._lock:
+            known = [chunk_id for chunk_id in dict.fromkeys(chunk_ids) if chunk_id in self._rows]
+            if not known:
+                return
+            try:
+                with self._connection:
+                    self._bump_generation()
+                    self._connection.executemany(
+                        "DELETE FROM chunks WHERE chunk_id = ?",
+                        [(chunk_id,) for chunk_id in known],
+                    )
+            except sqlite3.Error as error:
+                raise VectorStoreInfrastructureError(
+                    f"Failed to delete {len(known)} chunks from local vector store."
+                ) from error
+            for chunk_id in known:
+                self._release_row(self._rows.pop(chunk_id))
+
+    def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+        options: VectorSearchOptions | None = None,
+    ) -> list[VectorSearchResult]:
+        return self.search_similar_batch([VectorSearchQuery(query_embedding, limit, score_threshold, options)])[0]
+
+    def search_similar_batch(self, queries: Sequence[VectorSearchQuery]) -> list[list[VectorSearchResult]]:
+        """Score all queries against the matrix with one matrix product."""
+        if not queries:
+            return []
+        for query in queries:
+            self._validate_query(query.query_embedding, query.limit)
+        self.ensure_collection()
+
+        matrix = np.asarray([query.query_embedding for query in queries], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        matrix /= norms
+
+        with self._lock:
+            used = len(self._row_ids)
+            if not self._rows:
+                return [[] for _ in queries]
+            if self._index is not None:
+                ranked = [
+                    [
+                        (row, similarity)
+                        for row, similarity in self._index.search(vector, query.limit + self._linking, self._matrix)
+                        if self._alive[row] and (query.score_threshold is None or similarity >= query.score_threshold)
+                    ][: query.limit]
+                    for vector, query in zip(matrix, queries)
+                ]
+            elif self._codes is not None:
+                ranked = [self._quantized_top_rows(vector, query, used) for vector, query in zip(matrix, queries)]
+            else:
+                scores = matrix @ self._matrix[:used].T
+                scores[:, ~self._alive[:used]] = -np.inf
+                ranked = [self._top_rows(row_scores, query) for row_scores, query in zip(scores, queries)]
+            payloads = self._load_payloads({self._row_ids[row] for rows in ranked for row, _ in rows})
+            return [
+                [
+                    VectorSearchResult(
+                        chunk_id=self._row_ids[row],
+                        score=score,
+                        payload=payloads.get(self._row_ids[row], {}),
+                    )
+                    for row, score in rows
+                ]
+                for rows in ranked
+            ]
+
+    def flush(self) -> None:
+        """Write pending vector pages and, when changed, the HNSW graph to disk."""
+        with self._write_lock, self._lock:
+            if self._matrix is not None:
+                self._flush_matrix()
+            if (
+                self._index is not None
+                and self._directory is not None
+                and self._saved_generation != self._generation
+            ):
+                try:
+                    self._index.save(self._directory / _GRAPH_FILE, self._generation)
+                except OSError as error:
+                    raise VectorStoreInfrastructureError("Failed to persist HNSW graph.") from error
+                self._saved_generation = self._generation
+
+    def close(self) -> None:
+        with self._write_lock, self._lock:
+            self.flush()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._matrix = None
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    def compact(self) -> int:
+        """Move live rows to the front and rebuild the HNSW graph; returns rows reclaimed.
+
+        The vector file keeps its size, but the reclaimed rows are reused.
+        Building the graph is the expensive part, so run this when
+        :attr:`tombstones` is a large share of the rows rather than routinely.
+        The new graph is built from a copy of the live vectors while searches
+        keep using the old one, then swapped in.
+        """
+        self.ensure_collection()
+        with self._write_lock:
+            with self._lock:
+                reclaimed = len(self._row_ids) - len(self._rows)
+                if reclaimed == 0:
+                    return 0
+                # Ascending old rows: each new row is at most the old one, so
+                # the UNIQUE(row) constraint holds after every single update.
+                live = sorted(self._rows.items(), key=lambda item: item[1])
+                old_rows = np.asarray([row for _, row in live], dtype=np.int64)
+                compacted = np.asarray(self._matrix[old_rows])
+            index = self._index
+            if index is not None:
+                index = HNSWIndex(m=index.m, ef_construction=index.ef_construction, ef_search=index.ef_search)
+                for row in range(len(compacted)):
+                    index.add(row, compacted)
+
+            with self._lock:
+                count = len(live)
+                used = len(self._row_ids)
+                self._matrix[:count] = compacted
+                self._matrix[count:used] = 0.0
+                if self._codes is not None:
+                    self._codes[:count] = self._codes[old_rows]
+                    self._codes[count:used] = 0
+                self._alive[:] = False
+                self._alive[:count] = True
+                self._rows = {chunk_id: row for row, (chunk_id, _) in enumerate(live)}
+                self._row_ids = [chunk_id for chunk_id, _ in live]
+                self._free_rows = []
+                self._index = index
+                try:
+                    self._flush_matrix()
+                    with self._connection:
+                        self._connection.executemany(
+                            "UPDATE chunks SET row = ? WHERE chunk_id = ?",
+                            [(row, chunk_id) for row, (chunk_id, _) in enumerate(live)],
+                        )
+                        self._bump_generation()
+                except (OSError, sqlite3.Error) as error:
+                    raise VectorStoreInfrastructureError("Failed to persist compacted local vector store.") from error
+                return reclaimed
+
+    def _quantized_top_rows(self, vector: Any, query: VectorSearchQuery, used: int) -> list[tuple[int, float]]:
+        """Shortlist rows by their compressed codes, then optionally rescore in float32."""
+        options = query.options or VectorSearchOptions()
+        oversampling = self._settings.search_oversampling if options.oversampling is None else options.oversampling
+        rescore = self._settings.search_rescore if options.rescore is None else options.rescore
+
+        approximate = np.empty(used, dtype=np.float32)
+        encoded_query = self._encode(vector[None, :])[0]
+        for start in range(0, used, _SCAN_BLOCK_ROWS):
+            stop = min(start + _SCAN_BLOCK_ROWS, used)
+            approximate[start:stop] = self._approximate_scores(encoded_query, vector, self._codes[start:stop])
+        approximate[~self._alive[:used]] = -np.inf
+        if not rescore:
+            return self._top_rows(approximate, query)
+
+        shortlist = self._top_rows(
+            approximate,
+            VectorSearchQuery(vector, max(query.limit, int(math.ceil(query.limit * oversampling)))),
+        )
+        rows = np.asarray([row for row, _ in shortlist], dtype=np.int64)
+        exact = np.full(used, -np.inf, dtype=np.float32)
+        exact[rows] = self._matrix[rows] @ vector
+        return self._top_rows(exact, query)
+
+    def _encode(self, vectors: Any) -> Any:
+        if self._settings.quantization == "binary":
+            return np.packbits(vectors > 0.0, axis=1)
+        return np.clip(np.rint(vectors * 127.0), -127, 127).astype(np.int8)
+
+    def _approximate_scores(self, encoded_query: Any, vector: Any, codes: Any) -> Any:
+        if self._settings.quantization == "binary":
+            # Hamming distance between sign bits approximates the angle.
+            differing = _POPCOUNT[np.bitwise_xor(codes, encoded_query)].sum(axis=1, dtype=np.int32)
+            return 1.0 - 2.0 * differing / self._settings.embedding_size
+        return (codes.astype(np.float32) @ vector) / 127.0
+
+    def _top_rows(self, row_scores: Any, query: VectorSearchQuery) -> list[tuple[int, float]]:
+        limit = min(query.limit, len(self._rows))
+        if limit < len(row_scores):
+            candidates = np.argpartition(row_scores, -limit)[-limit:]
+        else:
+            candidates = np.arange(len(row_scores))
+        candidates = candidates[np.argsort(row_scores[candidates])[::-1]]
+        ranked: list[tuple[int, float]] = []
+        for row in candidates[:limit]:
+            score = float(row_scores[row])
+            if score == -np.inf or (query.score_threshold is not None and score < query.score_threshold):
+                break
+            ranked.append((int(row), score))
+        return ranked
+
+    def _load_payloads(self, chunk_ids: set[str]) -> dict[str, dict[str, object]]:
+        if not chunk_ids:
+            return {}
+        placeholders = ",".join("?" * len(chunk_ids))
+        try:
+            rows = self._connection.execute(
+                f"SELECT chunk_id, payload FROM chunks WHERE chunk_id IN ({placeholders})",
+                list(chunk_ids),
+            ).fetchall()
+        except sqlite3.Error as error:
+            raise VectorStoreInfrastructureError("Failed to read local vector store payloads.") from error
+        return {chunk_id: json.loads(payload) for chunk_id, payload in rows}
+
+    def _assign_row(self, chunk_id: str) -> int:
+        row = self._rows.get(chunk_id)
+        if row is not None:
+            return row
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = self._reserve_rows(1)[0]
+        self._rows[chunk_id] = row
+        self._row_ids[row] = chunk_id
+        return row
+
+    def _reserve_rows(self, count: int) -> list[int]:
+        """Append ``count`` unowned rows, growing the matrix as needed."""
+        start = len(self._row_ids)
+        self._row_ids.extend([None] * count)
+        capacity = self._matrix.shape[0]
+        while capacity < len(self._row_ids):
+            capacity *= 2
+        if capacity > self._matrix.shape[0]:
+            self._grow(capacity)
+        return list(range(start, start + count))
+
+    def _publish_row(self, chunk_id: str, row: int) -> None:
+        """Point ``chunk_id`` at a freshly linked graph row, tombstoning its old row."""
+        previous = self._rows.get(chunk_id)
+        if previous is not None:
+            self._release_row(previous)
+        self._rows[chunk_id] = row
+        self._row_ids[row] = chunk_id
+
+    def _release_row(self, row: int) -> None:
+        self._row_ids[row] = None
+        self._alive[row] = False
+        if self._index is not None:
+            self._index.mark_deleted(row)
+        else:
+            self._free_rows.append(row)
+
+    def _bump_generation(self) -> None:
+        self._generation += 1
+        # The row high-water mark lets a reopened store skip rows the graph still holds.
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("generation", str(self._generation)), ("rows_used", str(len(self._row_ids)))],
+        )
+
+    def _record_error(self, record: EmbeddingRecord) -> str | None:
+        if not record.chunk_id.strip():
+            return "chunk_id cannot be empty."
+        if len(record.embedding) != self._settings.embedding_size:
+            return (
+                "Embedding size mismatch. "
+                f"Expected {self._settings.embedding_size}, got {len(record.embedding)}."
+            )
+        return None
+
+    def _validate_query(self, query_embedding: list[float], limit: int) -> None:
+        if len(query_embedding) != self._settings.embedding_size:
+            raise VectorStoreInfrastructureError(
+                "Query embedding size mismatch. "
+                f"Expected {self._settings.embedding_size}, got {len(query_embedding)}."
+            )
+        if limit <= 0:
+            raise VectorStoreInfrastructureError("limit must be greater than zero.")
+
+    def _open(self) -> None:
+        if self._directory is None:
+            self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self._directory / _PAYLOADS_FILE, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+        stored_size = self._connection.execute("SELECT value FROM meta WHERE key = 'embedding_size'").fetchone()
+        if stored_size is None:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('embedding_size', ?)",
+                    (str(self._settings.embedding_size),),
+                )
+        elif int(stored_size[0]) != self._settings.embedding_size:
+            raise VectorStoreInfrastructureError(
+                "Local vector store schema mismatch for vector size. "
+                f"Expected {self._settings.embedding_size}, got {stored_size[0]}."
+            )
+
+        assignments = self._connection.execute("SELECT chunk_id, row FROM chunks").fetchall()
+        stored_used = self._connection.execute("SELECT value FROM meta WHERE key = 'rows_used'").fetchone()
+        used = max(
+            max((row for _, row in assignments), default=-1) + 1,
+            int(stored_used[0]) if stored_used is not None else 0,
+        )
+        capacity = self._settings.initial_capacity
+        if self._directory is not None:
+            vectors_path = self._directory / _VECTORS_FILE
+            if vectors_path.exists():
+                capacity = max(capacity, vectors_path.stat().st_size // self._row_bytes)
+        while capacity < used:
+            capacity *= 2
+        self._grow(capacity)
+
+        self._row_ids = [None] * used
+        for chunk_id, row in assignments:
+            self._rows[chunk_id] = row
+            self._row_ids[row] = chunk_id
+            self._alive[row] = True
+        if self._codes is not None:
+            for start in range(0, used, _SCAN_BLOCK_ROWS):
+                stop = min(start + _SCAN_BLOCK_ROWS, used)
+                self._codes[start:stop] = self._encode(np.asarray(self._matrix[start:stop]))
+        stored_generation = self._connection.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        self._generation = int(stored_generation[0]) if stored_generation is not None else 0
+        if self._index is not None:
+            self._index = self._open_graph(self._index, used)
+            # Stores written before rows_used was recorded: the graph knows every row it linked.
+            if self._index.rows > used:
+                while self._matrix.shape[0] < self._index.rows:
+                    self._grow(self._matrix.shape[0] * 2)
+                self._row_ids.extend([None] * (self._index.rows - used))
+        else:
+            self._free_rows = [row for row in range(used - 1, -1, -1) if self._row_ids[row] is None]
+
+    def _open_graph(self, graph: HNSWIndex, used: int) -> HNSWIndex:
+        """Load the persisted graph when it matches the store, otherwise rebuild ``graph``."""
+        graph_path = self._directory / _GRAPH_FILE if self._directory is not None else None
+        if graph_path is not None and graph_path.exists():
+            stored, generation = HNSWIndex.load(graph_path, ef_search=graph.ef_search)
+            if (
+                generation == self._generation
+                and stored.m == graph.m
+                and stored.ef_construction == graph.ef_construction
+            ):
+                self._saved_generation = generation
+                return stored
+
+        for row in range(used):
+            if self._alive[row]:
+                graph.add(row, self._matrix)
+        self._saved_generation = -1
+        return graph
+
+    def _grow(self, capacity: int) -> None:
+        previous = self._matrix
+        previous_rows = 0 if previous is None else previous.shape[0]
+        dimension = self._settings.embedding_size
+        if self._directory is None and self._settings.quantization != "none":
+            # The codes answer the scan; full-precision rows are only read to rescore.
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile()
+            self._spill.truncate(capacity * self._row_bytes)
+            matrix = np.memmap(self._spill, dtype=np.float32, mode="r+", shape=(capacity, dimension))
+        elif self._directory is None:
+            matrix = np.zeros((capacity, dimension), dtype=np.float32)
+            if previous is not None:
+                matrix[:previous_rows] = previous
+        else:
+            if previous is not None:
+                previous.flush()
+            vectors_path = self._directory / _VECTORS_FILE
+            with vectors_path.open("ab") as handle:
+                handle.truncate(capacity * self._row_bytes)
+            matrix = np.memmap(vectors_path, dtype=np.float32, mode="r+", shape=(capacity, dimension))
+
+        alive = np.zeros(capacity, dtype=bool)
+        if self._alive is not None:
+            alive[: len(self._alive)] = self._alive
+        if self._settings.quantization == "binary":
+            codes = np.zeros((capacity, (dimension + 7) // 8), dtype=np.uint8)
+        elif self._settings.quantization == "int8":
+            codes = np.zeros((capacity, dimension), dtype=np.int8)
+        else:
+            codes = None
+        if codes is not None and self._codes is not None:
+            codes[: len(self._codes)] = self._codes
+        self._codes = codes
+        self._matrix = matrix
+        self._alive = alive
+
+    def _flush_matrix(self) -> None:
+        # A spilled matrix is scratch space and not worth syncing.
+        if self._directory is not None and isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+        self._unflushed_rows = 0
+
+    @property
+    def _row_bytes(self) -> int:
+        return self._settings.embedding_size * np.dtype(np.float32).itemsize
@@ -2,69 +2,158 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import json
+from typing import TYPE_CHECKING, Any, Sequence
 
-from src.application import VectorSearchResult, VectorStorePort
+from src.application import (
+    EmbeddingRecord,
+    UpsertReport,
+    VectorSearchOptions,
+    VectorSearchQuery,
+    VectorSearchResult,
+    VectorStorePort,
+)
 
-try:
-    from qdrant_client import QdrantClient
-    from qdrant_client.http import models as qdrant_models
-except ImportError:  # pragma: no cover - covered by runtime guard
-    QdrantClient = None
-    qdrant_models = None
+from src.infrastructure.registry import import_optional
+
+if TYPE_CHECKING:
+    from .qdrant_client_factory import QdrantClientFactory
+
+# qdrant-client is heavy to import, so its models are loaded on first use.
+qdrant_models: Any = None
 
 
 class VectorStoreInfrastructureError(Exception):
     """Raised when vector-store operations fail in infrastructure."""
 
 
+_NOT_INSTALLED = "qdrant-client is not installed. Install project dependencies before running Phase 3."
+
+
+def _models() -> Any:
+    global qdrant_models
+    if qdrant_models is None:
+        qdrant_models = import_optional("qdrant_client.http.models")
+    if qdrant_models is None:
+        raise VectorStoreInfrastructureError(_NOT_INSTALLED)
+    return qdrant_models
+
+
+def _client_class(name: str) -> Any:
+    """``QdrantClient`` or ``AsyncQdrantClient``, imported on first use."""
+    module = import_optional("qdrant_client")
+    if module is None:
+        raise VectorStoreInfrastructureError(_NOT_INSTALLED)
+    return getattr(module, name)
+
+
+QUANTIZATION_MODES = ("none", "int8", "binary")
+
+# Payload fields IDs-only searches still return: they locate a chunk in its document.
+_POSITION_PAYLOAD_FIELDS = ("document_id", "sequence_number")
+
+
 @dataclass(frozen=True)
 class QdrantSettings:
-    """Qdrant-specific runtime settings."""
+    """Qdrant-specific runtime settings.
+
+    ``quantization`` is applied when the collection is created and must
+    match the quantization of an existing collection; the ``search_*``
+    values are the defaults for :class:`VectorSearchOptions`.
+    With a separate chunk text store, ``store_text=False`` keeps chunk text
+    out of point payloads and ``search_with_payload=False`` makes searches
+    return IDs and scores plus only the ``document_id`` and
+    ``sequence_number`` fields, which context packing needs to merge
+    adjacent chunks.
+    """
 
     url: str
     collection_name: str
     embedding_size: int
+    upsert_batch_size: int = 256
+    upsert_max_batch_bytes: int = 8 * 1024 * 1024
+    upsert_parallelism: int = 4
+    upsert_wait: bool = False
+    quantization: str = "none"
+    search_oversampling: float = 2.0
+    search_rescore: bool = True
+    store_text: bool = True
+    search_with_payload: bool = True
 
+    def __post_init__(self) -> None:
+        if self.quantization not in QUANTIZATION_MODES:
+            raise VectorStoreInfrastructureError(
+                f"Invalid quantization '{self.quantization}'. Allowed values: {list(QUANTIZATION_MODES)}"
+            )
+        if self.search_oversampling < 1.0:
+            raise VectorStoreInfrastructureError("search_oversampling must be at least 1.0.")
 
-class QdrantVectorStore(VectorStorePort):
-    """Qdrant implementation of vector store operations."""
 
-    def __init__(self, settings: QdrantSettings, client: object) -> None:
-        self._settings = settings
-        self._client = client
+def _quantization_mode(quantization_config: object | None) -> str:
+    """The ``QdrantSettings.quantization`` value a collection's quantization config corresponds to."""
+    if quantization_config is None:
+        return "none"
+    if getattr(quantization_config, "scalar", None) is not None:
+        return "int8"
+    if getattr(quantization_config, "binary", None) is not None:
+        return "binary"
+    return type(quantization_config).__name__
 
-    @classmethod
-    def from_url(cls, settings: QdrantSettings) -> "QdrantVectorStore":
-        """Build adapter from URL using qdrant-client."""
-        if QdrantClient is None:
-            raise VectorStoreInfrastructureError(
-                "qdrant-client is not installed. Install project dependencies before running Phase 3."
-            )
-        client = QdrantClient(url=settings.url)
-        return cls(settings=settings, client=client)
 
-    def ensure_collection(self) -> None:
-        """Create collection if absent, otherwise keep existing collection."""
-        try:
-            if self._client.collection_exists(collection_name=self._settings.collection_name):
-                return
+# Rough serialized size of one float in a REST/JSON request body.
+_BYTES_PER_VECTOR_VALUE = 12
 
-            self._client.create_collection(
-                collection_name=self._settings.collection_name,
-                vectors_config=qdrant_models.VectorParams(
-                    size=self._settings.embedding_size,
-                    distance=qdrant_models.Distance.COSINE,
+
+class _QdrantCollectionRules:
+    """Validation and conversion rules shared by the sync and async adapters."""
+
+    _settings: QdrantSettings
+
+    def _vectors_config(self) -> object:
+        models = _models()
+        return models.VectorParams(
+            size=self._settings.embedding_size,
+            distance=models.Distance.COSINE,
+        )
+
+    def _quantization_config(self) -> object | None:
+        models = _models()
+        if self._settings.quantization == "int8":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
+            )
+        if self._settings.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
+    def _search_params(self, options: VectorSearchOptions | None) -> object | None:
+        if self._settings.quantization == "none":
+            return None
+        options = options or VectorSearchOptions()
+        models = _models()
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=self._settings.search_rescore if options.rescore is None else options.rescore,
+                oversampling=(
+                    self._settings.search_oversampling if options.oversampling is None else options.oversampling
                 ),
             )
-        except Exception as error:  # noqa: BLE001
-            raise VectorStoreInfrastructureError(
-                f"Failed to ensure Qdrant collection '{self._settings.collection_name}'."
-            ) from error
+        )
 
-    def _validate_existing_collection(self) -> None:
-        """Fail fast when existing collection schema differs from expected settings."""
-        collection_info = self._client.get_collection(collection_name=self._settings.collection_name)
+    def _payload_selector(self) -> bool | list[str]:
+        if self._settings.search_with_payload:
+            return True
+        return list(_POSITION_PAYLOAD_FIELDS)
+
+    def _check_collection_schema(self, collection_info: object) -> None:
         configured_vectors = collection_info.config.params.vectors
 
         if isinstance(configured_vectors, dict):
@@ -76,7 +165,7 @@ class QdrantVectorStore(VectorStorePort):
 
         configured_size = getattr(configured_vectors, "size", None)
         configured_distance = getattr(configured_vectors, "distance", None)
-        expected_distance = qdrant_models.Distance.COSINE
+        expected_distance = _models().Distance.COSINE
 
         if configured_size != self._settings.embedding_size:
             raise VectorStoreInfrastructureError(
@@ -90,13 +179,16 @@ class QdrantVectorStore(VectorStorePort):
                 f"Expected {expected_distance}, got {configured_distance}."
             )
 
-    def upsert_embedding(
-        self,
-        chunk_id: str,
-        embedding: list[float],
-        payload: dict[str, object],
-    ) -> None:
-        """Upsert one embedding record into Qdrant."""
+        # Search params assume the configured quantization, so a collection
+        # created with another one would be searched with the wrong settings.
+        configured_quantization = _quantization_mode(getattr(collection_info.config, "quantization_config", None))
+        if configured_quantization != self._settings.quantization:
+            raise VectorStoreInfrastructureError(
+                "Qdrant collection schema mismatch for quantization. "
+                f"Expected {self._settings.quantization}, got {configured_quantization}."
+            )
+
+    def _validate_record(self, chunk_id: str, embedding: list[float]) -> None:
         if not chunk_id.strip():
             raise VectorStoreInfrastructureError("chunk_id cannot be empty.")
 
@@ -106,51 +198,258 @@ class QdrantVectorStore(VectorStorePort):
                 f"Expected {self._settings.embedding_size}, got {len(embedding)}."
             )
 
+    def _split_batches(self, records: list[EmbeddingRecord]) -> list[list[EmbeddingRecord]]:
+        batches: list[list[EmbeddingRecord]] = []
+        current: list[EmbeddingRecord] = []
+        current_bytes = 0
+        for record in records:
+            record_bytes = _estimate_record_bytes(record)
+            if current and (
+                len(current) >= self._settings.upsert_batch_size
+                or current_bytes + record_bytes > self._settings.upsert_max_batch_bytes
+            ):
+                batches.append(current)
+                current, current_bytes = [], 0
+            current.append(record)
+            current_bytes += record_bytes
+        if current:
+            batches.append(current)
+        return batches
+
+    def _validate_query(self, query_embedding: list[float], limit: int) -> None:
+        if len(query_embedding) != self._settings.embedding_size:
+            raise VectorStoreInfrastructureError(
+                "Query embedding size mismatch. "
+                f"Expected {self._settings.embedding_size}, got {len(query_embedding)}."
+            )
+
+        if limit <= 0:
+            raise VectorStoreInfrastructureError("limit must be greater than zero.")
+
+    def _partition_valid(
+        self,
+        records: Sequence[EmbeddingRecord],
+    ) -> tuple[list[EmbeddingRecord], dict[str, str]]:
+        """Split out invalid records; a repeated chunk ID keeps its last valid record.
+
+        Without deduplication, copies of one ID could land in batches sent in
+        parallel, leaving whichever arrived last, and be counted twice.
+        """
+        failures: dict[str, str] = {}
+        latest: dict[str, EmbeddingRecord] = {}
+        for record in records:
+            try:
+                self._validate_record(record.chunk_id, record.embedding)
+            except VectorStoreInfrastructureError as error:
+                failures[record.chunk_id] = str(error)
+            else:
+                latest[record.chunk_id] = record
+        return list(latest.values()), failures
+
+    @staticmethod
+    def _point_ids_selector(chunk_ids: Sequence[str]) -> object:
+        return _models().PointIdsList(points=list(chunk_ids))
+
+    def _to_points(self, records: Sequence[EmbeddingRecord]) -> list[object]:
+        models = _models()
+        return [
+            models.PointStruct(
+                id=record.chunk_id,
+                vector=record.embedding,
+                payload=self._point_payload(record.payload),
+            )
+            for record in records
+        ]
+
+    def _point_payload(self, payload: dict[str, object]) -> dict[str, object]:
+        if self._settings.store_text:
+            return payload
+        return {key: value for key, value in payload.items() if key != "text"}
+
+    @staticmethod
+    def _to_results(points: Sequence[object]) -> list[VectorSearchResult]:
+        return [
+            VectorSearchResult(
+                chunk_id=str(point.id),
+                score=float(point.score),
+                payload=point.payload or {},
+            )
+            for point in points
+        ]
+
+
+class QdrantVectorStore(_QdrantCollectionRules, VectorStorePort):
+    """Qdrant implementation of vector store operations."""
+
+    def __init__(self, settings: QdrantSettings, client: object) -> None:
+        self._settings = settings
+        self._client = client
+
+    @classmethod
+    def from_url(cls, settings: QdrantSettings, factory: QdrantClientFactory | None = None) -> "QdrantVectorStore":
+        """Build adapter on the sync client of ``factory``.
+
+        Without one, a factory with the default transport settings is
+        created for ``settings.url``; pass the process-wide factory to share
+        its connection pool.
+        """
+        # The factory module imports this one, so it is only loaded here.
+        from .qdrant_client_factory import QdrantClientFactory, QdrantClientSettings
+
+        factory = factory or QdrantClientFactory(QdrantClientSettings(url=settings.url))
+        return cls(settings=settings, client=factory.get_client())
+
+    def ensure_collection(self) -> None:
+        """Create collection if absent, otherwise keep existing collection."""
+        try:
+            if self._client.collection_exists(collection_name=self._settings.collection_name):
+                self._validate_existing_collection()
+                return
+
+            self._client.create_collection(
+                collection_name=self._settings.collection_name,
+                vectors_config=self._vectors_config(),
+                quantization_config=self._quantization_config(),
+            )
+        except VectorStoreInfrastructureError:
+            raise
+        except Exception as error:  # noqa: BLE001
+            raise VectorStoreInfrastructureError(
+                f"Failed to ensure Qdrant collection '{self._settings.collection_name}'."
+            ) from error
+
+    def _validate_existing_collection(self) -> None:
+        """Fail fast when existing collection schema differs from expected settings."""
+        collection_info = self._client.get_collection(collection_name=self._settings.collection_name)
+        self._check_collection_schema(collection_info)
+
+    def upsert_embedding(
+        self,
+        chunk_id: str,
+        embedding: list[float],
+        payload: dict[str, object],
+    ) -> None:
+        """Upsert one embedding record into Qdrant."""
+        self._validate_record(chunk_id, embedding)
+
         try:
             self._client.upsert(
                 collection_name=self._settings.collection_name,
-                points=[
-                    qdrant_models.PointStruct(
-                        id=chunk_id,
-                        vector=embedding,
-                        payload=payload,
-                    )
-                ],
+                points=self._to_points([EmbeddingRecord(chunk_id, embedding, payload)]),
             )
         except Exception as error:  # noqa: BLE001
             raise VectorStoreInfrastructureError(f"Failed to upsert chunk '{chunk_id}' into Qdrant.") from error
 
+    def upsert_embeddings(self, records: Sequence[EmbeddingRecord]) -> UpsertReport:
+        """Upsert records in size-bounded batches sent in parallel.
+
+        Batches are bounded by point count and estimated request bytes. All but
+        the last batch honour ``upsert_wait``; the last one is sent with
+        ``wait=True`` once the others were accepted, acting as a consistency
+        barrier for the whole call.
+        """
+        valid, failures = self._partition_valid(records)
+        batches = self._split_batches(valid)
+        if not batches:
+            return UpsertReport(upserted=0, failures=failures)
+
+        batch_failures: dict[str, str] = {}
+        *leading, barrier = batches
+        if leading:
+            workers = min(self._settings.upsert_parallelism, len(leading))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = executor.map(
+                    lambda batch: self._send_batch(batch, wait=self._settings.upsert_wait),
+                    leading,
+                )
+                for outcome in outcomes:
+                    batch_failures.update(outcome)
+        batch_failures.update(self._send_batch(barrier, wait=True))
+
+        failures.update(batch_failures)
+        return UpsertReport(upserted=len(valid) - len(batch_failures), failures=failures)
+
+    def delete_embeddings(self, chunk_ids: Sequence[str]) -> None:
+        """Delete points by chunk ID and wait until the deletion is applied."""
+        if not chunk_ids:
+            return
+        try:
+            self._client.delete(
+                collection_name=self._settings.collection_name,
+                points_selector=self._point_ids_selector(chunk_ids),
+                wait=True,
+            )
+        except Exception as error:  # noqa: BLE001
+            raise VectorStoreInfrastructureError(
+                f"Failed to delete {len(chunk_ids)} chunks from Qdrant."
+            ) from error
+
+    def _send_batch(self, batch: list[EmbeddingRecord], wait: bool) -> dict[str, str]:
+        try:
+            self._client.upsert(
+                collection_name=self._settings.collection_name,
+                points=self._to_points(batch),
+                wait=wait,
+            )
+        except Exception as error:  # noqa: BLE001
+            message = f"Failed to upsert batch into Qdrant: {error}"
+            return {record.chunk_id: message for record in batch}
+        return {}
+
     def search_similar(
         self,
         query_embedding: list[float],
         limit: int,
         score_threshold: float | None = None,
+        options: VectorSearchOptions | None = None,
     ) -> list[VectorSearchResult]:
         """Return nearest vectors from Qdrant collection."""
-        if len(query_embedding) != self._settings.embedding_size:
-            raise VectorStoreInfrastructureError(
-                "Query embedding size mismatch. "
-                f"Expected {self._settings.embedding_size}, got {len(query_embedding)}."
-            )
-
-        if limit <= 0:
-            raise VectorStoreInfrastructureError("limit must be greater than zero.")
+        self._validate_query(query_embedding, limit)
 
         try:
-            results = self._client.search(
+            response = self._client.query_points(
                 collection_name=self._settings.collection_name,
-                query_vector=query_embedding,
+                query=query_embedding,
                 limit=limit,
                 score_threshold=score_threshold,
+                search_params=self._search_params(options),
+                with_payload=self._payload_selector(),
+                with_vectors=False,
             )
         except Exception as error:  # noqa: BLE001
             raise VectorStoreInfrastructureError("Failed to query Qdrant similarity search.") from error
 
-        return [
-            VectorSearchResult(
-                chunk_id=str(point.id),
-                score=float(point.score),
-                payload=point.payload or {},
+        return self._to_results(response.points)
+
+    def search_similar_batch(self, queries: Sequence[VectorSearchQuery]) -> list[list[VectorSearchResult]]:
+        """Answer every lookup in a single ``query_batch_points`` round trip."""
+        if not queries:
+            return []
+        for query in queries:
+            self._validate_query(query.query_embedding, query.limit)
+
+        models = _models()
+        try:
+            responses = self._client.query_batch_points(
+                collection_name=self._settings.collection_name,
+                requests=[
+                    models.QueryRequest(
+                        query=query.query_embedding,
+                        limit=query.limit,
+                        score_threshold=query.score_threshold,
+                        params=self._search_params(query.options),
+                        with_payload=self._payload_selector(),
+                        with_vector=False,
+                    )
+                    for query in queries
+                ],
             )
-            for point in results
-        ]
+        except Exception as error:  # noqa: BLE001
+            raise VectorStoreInfrastructureError("Failed to query Qdrant batch similarity search.") from error
+
+        return [self._to_results(response.points) for response in responses]
+
+
+def _estimate_record_bytes(record: EmbeddingRecord) -> int:
+    payload_bytes = len(json.dumps(record.payload, default=str, ensure_ascii=False).encode("utf-8"))
+    return len(record.chunk_id) + payload_bytes + _BYTES_PER_VECTOR_VALUE * len(record.embedding)
@@ -0,0 +1,154 @@
+"""Shared, long-lived Qdrant clients with tuned transport settings."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
+import threading
+from typing import Callable
+
+from .qdrant_adapter import VectorStoreInfrastructureError, _client_class
+
+
+logger = logging.getLogger("atlas.vector_store")
+
+
+@dataclass(frozen=True)
+class QdrantClientSettings:
+    """Transport settings for Qdrant clients.
+
+    ``timeout_seconds`` bounds every call. ``pool_size`` is the number of
+    pooled REST connections or gRPC channels. ``keepalive_seconds`` sets the
+    gRPC keep-alive ping and the period of the background health probe;
+    ``0`` disables both.
+    """
+
+    url: str
+    prefer_grpc: bool = False
+    grpc_port: int = 6334
+    timeout_seconds: int = 10
+    pool_size: int = 4
+    keepalive_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.timeout_seconds <= 0:
+            raise VectorStoreInfrastructureError("timeout_seconds must be greater than zero.")
+        if self.pool_size <= 0:
+            raise VectorStoreInfrastructureError("pool_size must be greater than zero.")
+        if self.keepalive_seconds < 0:
+            raise VectorStoreInfrastructureError("keepalive_seconds cannot be negative.")
+
+
+class QdrantClientFactory:
+    """Builds one sync and one async client per process and keeps them warm.
+
+    Adapters for ingestion and querying should be given clients from the
+    same factory so they share its connection pool. :meth:`warm_up` opens
+    the connections before the first request, and with keep-alive enabled a
+    daemon thread probes the server periodically so idle connections are
+    neither dropped by intermediaries nor discovered dead on a user request.
+    """
+
+    def __init__(
+        self,
+        settings: QdrantClientSettings,
+        client_cls: Callable[..., object] | None = None,
+        async_client_cls: Callable[..., object] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._client_cls = client_cls
+        self._async_client_cls = async_client_cls
+        self._lock = threading.Lock()
+        self._client: object | None = None
+        self._async_client: object | None = None
+        self._stop = threading.Event()
+        self._probe: threading.Thread | None = None
+        self._healthy: bool | None = None
+
+    @property
+    def healthy(self) -> bool | None:
+        """Outcome of the last warm-up or health probe; ``None`` before either ran."""
+        return self._healthy
+
+    def client_options(self) -> dict[str, object]:
+        """Keyword arguments shared by the sync and async client constructors."""
+        options: dict[str, object] = {
+            "url": self._settings.url,
+            "prefer_grpc": self._settings.prefer_grpc,
+            "grpc_port": self._settings.grpc_port,
+            "timeout": self._settings.timeout_seconds,
+            "pool_size": self._settings.pool_size,
+        }
+        if self._settings.prefer_grpc and self._settings.keepalive_seconds:
+            options["grpc_options"] = {
+                "grpc.keepalive_time_ms": int(self._settings.keepalive_seconds * 1000),
+                "grpc.keepalive_timeout_ms": self._settings.timeout_seconds * 1000,
+                "grpc.keepalive_permit_without_calls": 1,
+            }
+        return options
+
+    def get_client(self) -> object:
+        with self._lock:
+            if self._client is None:
+                self._client = self._build(self._client_cls or _client_class("QdrantClient"))
+            return self._client
+
+    def get_async_client(self) -> object:
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = self._build(self._async_client_cls or _client_class("AsyncQdrantClient"))
+            return self._async_client
+
+    def warm_up(self) -> None:
+        """Open every pooled connection with a cheap call, then start the probe."""
+        client = self.get_client()
+        try:
+            # Concurrent calls, so a REST pool opens that many sockets; gRPC round-robins its channels.
+            with ThreadPoolExecutor(max_workers=self._settings.pool_size) as executor:
+                list(executor.map(lambda _: client.get_collections(), range(self._settings.pool_size)))
+        except Exception as error:  # noqa: BLE001
+            self._healthy = False
+            raise VectorStoreInfrastructureError(
+                f"Failed to warm up Qdrant connections to '{self._settings.url}'."
+            ) from error
+        self._healthy = True
+        self._start_probe()
+
+    def close(self) -> None:
+        """Stop the health probe and close the sync client.
+
+        The async client, if any, must be closed by its owner with
+        ``await client.close()`` on its event loop.
+        """
+        self._stop.set()
+        if self._probe is not None:
+            self._probe.join(timeout=self._settings.timeout_seconds)
+            self._probe = None
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def _build(self, client_cls: Callable[..., object]) -> object:
+        return client_cls(**self.client_options())
+
+    def _start_probe(self) -> None:
+        if not self._settings.keepalive_seconds or self._probe is not None:
+            return
+        self._stop.clear()
+        self._probe = threading.Thread(target=self._probe_loop, name="qdrant-keepalive", daemon=True)
+        self._probe.start()
+
+    def _probe_loop(self) -> None:
+        while not self._stop.wait(self._settings.keepalive_seconds):
+            try:
+                self.get_client().get_collections()
+            except Exception as error:  # noqa: BLE001
+                if self._healthy is not False:
+                    logger.warning("Qdrant health probe failed: %s", error)
+                self._healthy = False
+            else:
+                if self._healthy is False:
+                    logger.info("Qdrant health probe recovered")
+                self._healthy = True
@@ -0,0 +1,408 @@
+"""Open-loop load generator replaying a JSONL query log through the RAG pipeline.
+
+Usage::
+
+    python -m src.interfaces.loadgen queries.jsonl --qps 20 --duration 60
+    python -m src.interfaces.loadgen queries.jsonl --qps 10 --ramp-to 200 --steps 10 \\
+        --duration 300 --concurrency 64 --backend simulated --knowledge-base knowledge_base
+
+Each line of the log is a JSON object with ``RAGRequest`` fields
+(``query_text`` and optionally ``top_k`` and ``score_threshold``).
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+import itertools
+import json
+import logging
+import math
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Sequence
+
+from src.application import RAGPipelineService, RAGRequest
+from src.infrastructure.registry import ADAPTERS
+
+_REQUEST_FIELDS = {item.name for item in fields(RAGRequest)}
+
+
+class LoadGenerationError(Exception):
+    """Raised when a load test cannot be configured or started."""
+
+
+@dataclass(frozen=True)
+class RateStep:
+    """Offered load held for ``duration_seconds``."""
+
+    qps: float
+    duration_seconds: float
+
+    def __post_init__(self) -> None:
+        if self.qps <= 0:
+            raise LoadGenerationError("qps must be greater than zero.")
+        if self.duration_seconds <= 0:
+            raise LoadGenerationError("duration_seconds must be greater than zero.")
+
+    @property
+    def requests(self) -> int:
+        return max(1, round(self.qps * self.duration_seconds))
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Latency percentiles in milliseconds over ``count`` samples."""
+
+    count: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_samples(cls, samples_ms: Sequence[float]) -> LatencySummary:
+        ordered = sorted(samples_ms)
+        if not ordered:
+            return cls(0, 0.0, 0.0, 0.0, 0.0)
+        return cls(
+            count=len(ordered),
+            p50_ms=_percentile(ordered, 50),
+            p90_ms=_percentile(ordered, 90),
+            p99_ms=_percentile(ordered, 99),
+            max_ms=ordered[-1],
+        )
+
+
+@dataclass(frozen=True)
+class StepReport:
+    """Outcome of one rate step; ``achieved_qps`` counts successful answers."""
+
+    offered_qps: float
+    sent: int
+    errors: int
+    achieved_qps: float
+    latency: LatencySummary
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    """Overall and per-stage results of a load test.
+
+    Latencies are measured from each request's scheduled send time, so time
+    spent queued behind busy workers counts against the deployment rather
+    than being hidden by a slow sender. ``max_send_lag_ms`` is how late the
+    worst request actually started.
+    """
+
+    elapsed_seconds: float
+    sent: int
+    errors: int
+    throughput_qps: float
+    latency: LatencySummary
+    stages: dict[str, LatencySummary]
+    steps: list[StepReport]
+    errors_by_type: dict[str, int] = field(default_factory=dict)
+    max_send_lag_ms: float = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.sent if self.sent else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "error_rate": self.error_rate}
+
+
+@dataclass
+class _Outcome:
+    step: int
+    scheduled: float
+    started: float = 0.0
+    finished: float = 0.0
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+def build_schedule(
+    qps: float,
+    duration_seconds: float,
+    ramp_to_qps: float | None = None,
+    steps: int = 1,
+) -> list[RateStep]:
+    """Constant load, or a staircase from ``qps`` to ``ramp_to_qps`` in ``steps`` equal steps."""
+    if ramp_to_qps is None:
+        return [RateStep(qps, duration_seconds)]
+    if steps < 2:
+        raise LoadGenerationError("A ramp needs at least two steps.")
+    increment = (ramp_to_qps - qps) / (steps - 1)
+    return [RateStep(qps + increment * index, duration_seconds / steps) for index in range(steps)]
+
+
+def load_requests(path: str | Path) -> list[RAGRequest]:
+    """Parse a JSONL query log; blank lines are skipped."""
+    requests: list[RAGRequest] = []
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except OSError as error:
+        raise LoadGenerationError(f"Failed to read query log '{path}'.") from error
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise LoadGenerationError(f"Invalid JSON on line {number} of '{path}'.") from error
+        if not isinstance(item, dict) or "query_text" not in item:
+            raise LoadGenerationError(f"Line {number} of '{path}' must be an object with 'query_text'.")
+        unknown = sorted(set(item) - _REQUEST_FIELDS)
+        if unknown:
+            raise LoadGenerationError(f"Unknown fields {unknown} on line {number} of '{path}'.")
+        requests.append(RAGRequest(**item))
+    if not requests:
+        raise LoadGenerationError(f"Query log '{path}' contains no requests.")
+    return requests
+
+
+class LoadGenerator:
+    """Sends requests on a fixed timetable, independent of response times.
+
+    The timetable is open-loop: request ``i`` of a step is due at
+    ``i / qps`` seconds into it whether or not earlier requests finished,
+    and up to ``concurrency`` of them run at once. Requests are taken from
+    the log in order, wrapping around when the schedule needs more.
+    """
+
+    def __init__(
+        self,
+        pipeline: RAGPipelineService,
+        concurrency: int = 16,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if concurrency <= 0:
+            raise LoadGenerationError("concurrency must be greater than zero.")
+        self._pipeline = pipeline
+        self._concurrency = concurrency
+        self._clock = clock
+        self._sleep = sleep
+
+    def run(self, requests: Sequence[RAGRequest], schedule: Sequence[RateStep]) -> LoadReport:
+        if not requests:
+            raise LoadGenerationError("At least one request is required.")
+        if not schedule:
+            raise LoadGenerationError("At least one rate step is required.")
+        replay = itertools.cycle(requests)
+        futures: list[Future[_Outcome]] = []
+        step_starts: list[float] = []
+        with ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="loadgen") as executor:
+            started = self._clock()
+            step_start = started
+            for index, step in enumerate(schedule):
+                step_starts.append(step_start)
+                for sequence in range(step.requests):
+                    scheduled = step_start + sequence / step.qps
+                    delay = scheduled - self._clock()
+                    if delay > 0:
+                        self._sleep(delay)
+                    futures.append(executor.submit(self._issue, next(replay), index, scheduled))
+                step_start += step.duration_seconds
+        outcomes = [future.result() for future in futures]
+        return self._summarize(outcomes, schedule, step_starts, self._clock() - started)
+
+    def _issue(self, request: RAGRequest, step: int, scheduled: float) -> _Outcome:
+        outcome = _Outcome(step=step, scheduled=scheduled, started=self._clock())
+        try:
+            answer = self._pipeline.run(request)
+        except Exception as error:  # noqa: BLE001
+            outcome.error = type(error).__name__
+        else:
+            outcome.timings_ms = dict(answer.metadata.get("timings_ms", {}))
+        outcome.finished = self._clock()
+        return outcome
+
+    def _summarize(
+        self,
+        outcomes: list[_Outcome],
+        schedule: Sequence[RateStep],
+        step_starts: list[float],
+        elapsed_seconds: float,
+    ) -> LoadReport:
+        succeeded = [outcome for outcome in outcomes if outcome.error is None]
+        stage_samples: dict[str, list[float]] = {}
+        for outcome in succeeded:
+            for stage, duration_ms in outcome.timings_ms.items():
+                stage_samples.setdefault(stage, []).append(duration_ms)
+        errors_by_type: dict[str, int] = {}
+        for outcome in outcomes:
+            if outcome.error is not None:
+                errors_by_type[outcome.error] = errors_by_type.get(outcome.error, 0) + 1
+
+        steps: list[StepReport] = []
+        for index, step in enumerate(schedule):
+            issued = [outcome for outcome in outcomes if outcome.step == index]
+            ok = [outcome for outcome in issued if outcome.error is None]
+            # Successes over the time until the step's last answer, which exceeds
+            # the step itself once the deployment falls behind the offered rate.
+            span = max([step.duration_seconds] + [outcome.finished - step_starts[index] for outcome in ok])
+            steps.append(
+                StepReport(
+                    offered_qps=step.qps,
+                    sent=len(issued),
+                    errors=len(issued) - len(ok),
+                    achieved_qps=len(ok) / span,
+                    latency=LatencySummary.from_samples([_latency_ms(outcome) for outcome in ok]),
+                )
+            )
+
+        return LoadReport(
+            elapsed_seconds=elapsed_seconds,
+            sent=len(outcomes),
+            errors=len(outcomes) - len(succeeded),
+            throughput_qps=len(succeeded) / elapsed_seconds if elapsed_seconds > 0 else 0.0,
+            latency=LatencySummary.from_samples([_latency_ms(outcome) for outcome in succeeded]),
+            stages={stage: LatencySummary.from_samples(samples) for stage, samples in stage_samples.items()},
+            steps=steps,
+            errors_by_type=errors_by_type,
+            max_send_lag_ms=max(((outcome.started - outcome.scheduled) * 1000 for outcome in outcomes), default=0.0),
+        )
+
+
+def format_report(report: LoadReport) -> str:
+    lines = [
+        f"requests {report.sent}  errors {report.errors} ({report.error_rate:.2%})  "
+        f"throughput {report.throughput_qps:.1f} qps  elapsed {report.elapsed_seconds:.1f}s  "
+        f"max send lag {report.max_send_lag_ms:.1f} ms",
+        "",
+        f"{'':<22}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        _summary_line("overall", report.latency),
+        *(_summary_line(f"  {stage}", summary) for stage, summary in report.stages.items()),
+        "",
+        f"{'offered qps':<14}{'achieved':>10}{'sent':>8}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}",
+        *(
+            f"{step.offered_qps:<14.1f}{step.achieved_qps:>10.1f}{step.sent:>8}{step.errors:>8}"
+            f"{step.latency.p50_ms:>10.1f}{step.latency.p99_ms:>10.1f}"
+            for step in report.steps
+        ),
+    ]
+    if report.errors_by_type:
+        lines += ["", "errors: " + ", ".join(f"{name}={count}" for name, count in report.errors_by_type.items())]
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    # Failed requests are counted in the report; one log line each would bury it.
+    logging.getLogger("atlas.rag").setLevel(logging.ERROR)
+    try:
+        requests = load_requests(args.query_log)
+        schedule = build_schedule(args.qps, args.duration, args.ramp_to, args.steps)
+        pipeline, close = _build_pipeline(args)
+    except Exception as error:  # noqa: BLE001
+        print(f"Load test setup failed: {error}", file=sys.stderr)
+        return 1
+    try:
+        report = LoadGenerator(pipeline, concurrency=args.concurrency).run(requests, schedule)
+    finally:
+        close()
+    print(format_report(report))
+    if args.output is not None:
+        args.output.write_text(json.dumps(report.as_dict(), indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m src.interfaces.loadgen", description=__doc__.splitlines()[0])
+    parser.add_argument("query_log", type=Path, help="JSONL file of RAGRequest fields")
+    parser.add_argument("--qps", type=float, required=True, help="offered requests per second (first step)")
+    parser.add_argument("--ramp-to", type=float, help="offered rate of the last step")
+    parser.add_argument("--steps", type=int, default=10, help="number of equal steps from --qps to --ramp-to")
+    parser.add_argument("--duration", type=float, default=60.0, help="total seconds of offered load")
+    parser.add_argument("--concurrency", type=int, default=16, help="maximum requests in flight")
+    parser.add_argument("--backend", choices=("live", "simulated"), default="live")
+    parser.add_argument("--output", type=Path, help="write the report as JSON to this file")
+    simulated = parser.add_argument_group("simulated backend")
+    simulated.add_argument("--knowledge-base", type=Path, default=Path("knowledge_base"))
+    simulated.add_argument("--embedding-latency-ms", type=float, default=0.0)
+    simulated.add_argument("--generation-latency-ms", type=float, default=0.0)
+    simulated.add_argument("--search-latency-ms", type=float, default=0.0)
+    return parser.parse_args(argv)
+
+
+def _build_pipeline(args: argparse.Namespace) -> tuple[RAGPipelineService, Callable[[], None]]:
+    if args.backend == "simulated":
+        return _build_simulated_pipeline(args), lambda: None
+    return _build_live_pipeline()
+
+
+def _build_simulated_pipeline(args: argparse.Namespace) -> RAGPipelineService:
+    from src.application import IngestionService
+
+    embedding_adapter = ADAPTERS.resolve("embeddings.simulated")
+    store = ADAPTERS.resolve("vector_store.simulated")(256, search_latency_seconds=args.search_latency_ms / 1000)
+    IngestionService(vector_store=store, embedding_service=embedding_adapter(dimension=256)).run(args.knowledge_base)
+    return RAGPipelineService(
+        vector_store=store,
+        embedding_service=embedding_adapter(dimension=256, latency_seconds=args.embedding_latency_ms / 1000),
+        generation_service=ADAPTERS.resolve("generation.simulated")(
+            latency_seconds=args.generation_latency_ms / 1000,
+        ),
+    )
+
+
+def _build_live_pipeline() -> tuple[RAGPipelineService, Callable[[], None]]:
+    from src.infrastructure.config import load_settings
+    from src.infrastructure.vector_store.qdrant_adapter import QdrantSettings
+    from src.main import build_qdrant_client_factory
+
+    settings = load_settings()
+    client_factory = build_qdrant_client_factory(settings)
+    try:
+        client_factory.warm_up()
+        vector_store = ADAPTERS.resolve("vector_store.qdrant")(
+            settings=QdrantSettings(
+                url=settings.qdrant_url,
+                collection_name=settings.qdrant_collection_name,
+                embedding_size=settings.embedding_size,
+                quantization=settings.qdrant_quantization,
+                search_oversampling=settings.qdrant_search_oversampling,
+                search_rescore=settings.qdrant_search_rescore,
+            ),
+            client=client_factory.get_client(),
+        )
+        pipeline = RAGPipelineService(
+            vector_store=vector_store,
+            embedding_service=ADAPTERS.resolve("embeddings.gemini")(
+                api_key=settings.gemini_api_key,
+                model_name=settings.gemini_embedding_model,
+            ),
+            generation_service=ADAPTERS.resolve("generation.gemini")(
+                api_key=settings.gemini_api_key,
+                model_name=settings.gemini_generation_model,
+            ),
+        )
+    except Exception:
+        client_factory.close()
+        raise
+    return pipeline, client_factory.close
+
+
+def _summary_line(label: str, summary: LatencySummary) -> str:
+    return (
+        f"{label:<22}{summary.count:>8}{summary.p50_ms:>10.1f}{summary.p90_ms:>10.1f}"
+        f"{summary.p99_ms:>10.1f}{summary.max_ms:>10.1f}"
+    )
+
+
+def _latency_ms(outcome: _Outcome) -> float:
+    return (outcome.finished - outcome.scheduled) * 1000
+
+
+def _percentile(ordered: Sequence[float], percentile: float) -> float:
+    """Nearest-rank percentile of an already sorted sample."""
+    return ordered[max(0, math.ceil(len(ordered) * percentile / 100) - 1)]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
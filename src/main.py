@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import argparse
 import logging
 import sys
+from typing import TYPE_CHECKING, Sequence
 
-from src.infrastructure.config import SettingsError, load_settings
+from src.infrastructure.config import AppSettings, SettingsError, load_settings
 from src.infrastructure.logging import configure_logging
-from src.infrastructure.vector_store import QdrantVectorStore, VectorStoreInfrastructureError
-from src.infrastructure.vector_store.qdrant_adapter import QdrantSettings
+from src.infrastructure.registry import ADAPTERS
 
+if TYPE_CHECKING:
+    from src.infrastructure.vector_store import QdrantClientFactory
 
-def main() -> int:
+
+def main(argv: Sequence[str] | None = None) -> int:
     """Bootstrap application and validate vector-store wiring in Phase 3."""
+    args = _parse_args(argv)
+    if args.profile_imports:
+        return profile_startup(args.import_budget_ms, args.top)
+
     try:
         settings = load_settings()
-        configure_logging(level=settings.log_level, log_format=settings.log_format)
+        configure_logging(
+            level=settings.log_level,
+            log_format=settings.log_format,
+            sample_rates=dict(settings.log_debug_sampling),
+        )
     except SettingsError as settings_error:
         logging.basicConfig(level=logging.ERROR)
         logging.getLogger("atlas.bootstrap").error(
@@ -26,13 +38,24 @@ def main() -> int:
 
     logger = logging.getLogger("atlas.bootstrap")
 
+    # Adapter modules, and the SDKs behind them, load only once they are needed.
+    from src.infrastructure.vector_store.qdrant_adapter import QdrantSettings, VectorStoreInfrastructureError
+
+    client_factory: QdrantClientFactory | None = None
     try:
-        vector_store = QdrantVectorStore.from_url(
-            QdrantSettings(
+        client_factory = build_qdrant_client_factory(settings)
+        client_factory.warm_up()
+        # Ingestion and query adapters share this client and its connection pool.
+        vector_store = ADAPTERS.resolve("vector_store.qdrant")(
+            settings=QdrantSettings(
                 url=settings.qdrant_url,
                 collection_name=settings.qdrant_collection_name,
                 embedding_size=settings.embedding_size,
-            )
+                quantization=settings.qdrant_quantization,
+                search_oversampling=settings.qdrant_search_oversampling,
+                search_rescore=settings.qdrant_search_rescore,
+            ),
+            client=client_factory.get_client(),
         )
         vector_store.ensure_collection()
     except VectorStoreInfrastructureError as infrastructure_error:
@@ -41,6 +64,8 @@ def main() -> int:
             infrastructure_error,
             extra={"correlation_id": "phase-3-bootstrap"},
         )
+        if client_factory is not None:
+            client_factory.close()
         return 1
 
     logger.info(
@@ -50,8 +75,56 @@ def main() -> int:
     logger.info(
         "Application terminated without ingestion/rag services (expected in Phase 3)",
     )
+    client_factory.close()
+    return 0
+
+
+def build_qdrant_client_factory(settings: AppSettings) -> QdrantClientFactory:
+    """Process-wide Qdrant client factory configured from application settings."""
+    from src.infrastructure.vector_store.qdrant_client_factory import QdrantClientSettings
+
+    return ADAPTERS.resolve("vector_store.qdrant_client_factory")(
+        QdrantClientSettings(
+            url=settings.qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+            timeout_seconds=settings.qdrant_timeout_seconds,
+            pool_size=settings.qdrant_pool_size,
+            keepalive_seconds=settings.qdrant_keepalive_seconds,
+        )
+    )
+
+
+def profile_startup(budget_ms: float | None, top: int = 15) -> int:
+    """Report where ``import src.main`` spends its time; fail when over budget."""
+    from src.infrastructure.import_profile import ImportProfileError, profile_imports
+
+    try:
+        profile = profile_imports("src.main")
+    except ImportProfileError as error:
+        print(error, file=sys.stderr)
+        return 1
+    print(profile.format(limit=top))
+    if budget_ms is not None and profile.total_ms > budget_ms:
+        print(
+            f"Startup import time {profile.total_ms:.1f} ms exceeds the {budget_ms:.0f} ms budget.",
+            file=sys.stderr,
+        )
+        return 1
     return 0
 
 
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="Atlas RAG Platform bootstrap.")
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="import the entrypoint in a fresh interpreter and report the slowest modules",
+    )
+    parser.add_argument("--import-budget-ms", type=float, help="with --profile-imports, fail above this total")
+    parser.add_argument("--top", type=int, default=15, help="modules listed by --profile-imports")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
     sys.exit(main())
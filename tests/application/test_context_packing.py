@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import io
+import unittest
+
+from src.application import ContextPacker, VectorSearchResult
+from src.application.chunking import ChunkingConfig, iter_text_spans, normalize_text
+
+
+def _result(chunk_id: str, score: float, text: str, sequence_number: int | None = None) -> VectorSearchResult:
+    payload: dict[str, object] = {"text": text, "document_id": "doc-1"}
+    if sequence_number is not None:
+        payload["sequence_number"] = sequence_number
+    return VectorSearchResult(chunk_id=chunk_id, score=score, payload=payload)
+
+
+class ContextPackerTests(unittest.TestCase):
+    def test_drops_exact_and_near_duplicates(self) -> None:
+        base = " ".join(f"Sentence {index} explains how Atlas ingests, chunks and embeds text." for index in range(20))
+        packed = ContextPacker().pack(
+            [
+                _result("a", 0.9, base),
+                _result("b", 0.8, "  " + base.upper()),
+                _result("c", 0.7, base.replace("Sentence 7 explains", "Sentence 7 describes")),
+                _result("d", 0.6, "Completely different content about billing."),
+                _result("e", 0.5, ""),
+            ]
+        )
+
+        self.assertEqual(packed.chunk_ids, ["a", "d"])
+        self.assertEqual(sorted(packed.dropped_chunk_ids), ["b", "c", "e"])
+
+    def test_merges_adjacent_chunks_and_writes_overlap_once(self) -> None:
+        source = " ".join(f"sentence number {index} of the Atlas manual." for index in range(40))
+        spans = list(iter_text_spans(io.BytesIO(source.encode("utf-8")), ChunkingConfig(200, 60)))
+        retrieved = [
+            _result(f"chunk-{span.sequence_number}", 1.0 - span.sequence_number / 100, span.text, span.sequence_number)
+            for span in spans[2:5]
+        ]
+
+        packed = ContextPacker().pack(list(reversed(retrieved)))
+
+        self.assertEqual(len(packed.blocks), 1)
+        self.assertEqual(packed.chunk_ids, ["chunk-2", "chunk-3", "chunk-4"])
+        merged = packed.blocks[0].split("] ", 1)[1]
+        self.assertIn(merged, normalize_text(source))
+
+    def test_fills_budget_in_score_order(self) -> None:
+        packer = ContextPacker(max_tokens=40)
+        packed = packer.pack(
+            [
+                _result("low", 0.2, "short low scoring chunk"),
+                _result("big", 0.9, "x" * 400),
+                _result("mid", 0.5, "medium relevance chunk with a few more words"),
+            ]
+        )
+
+        self.assertEqual(packed.chunk_ids, ["mid", "low"])
+        self.assertEqual(packed.dropped_chunk_ids, ["big"])
+        self.assertLessEqual(packed.estimated_tokens, 40)
+
+    def test_keeps_truncated_best_chunk_when_nothing_fits(self) -> None:
+        packed = ContextPacker(max_tokens=10).pack([_result("big", 0.9, "y" * 400)])
+
+        self.assertEqual(packed.chunk_ids, ["big"])
+        self.assertLess(len(packed.blocks[0]), 100)
+
+    def test_estimates_only_the_block_each_candidate_lands_in(self) -> None:
+        source = " ".join(f"sentence number {index} of the Atlas manual." for index in range(200))
+        spans = list(iter_text_spans(io.BytesIO(source.encode("utf-8")), ChunkingConfig(200, 60)))[:30]
+        estimated: list[str] = []
+
+        def estimator(text: str) -> int:
+            estimated.append(text)
+            return len(text) // 4
+
+        packed = ContextPacker(max_tokens=100_000, token_estimator=estimator).pack(
+            [_result(f"chunk-{span.sequence_number}", 1.0, span.text, span.sequence_number) for span in spans]
+        )
+
+        self.assertEqual(len(packed.blocks), 1)
+        self.assertEqual(len(estimated), len(spans))
+        self.assertIn(packed.blocks[0].split("] ", 1)[1], normalize_text(source))
+
+    def test_overlap_is_only_searched_within_max_overlap_chars(self) -> None:
+        left = "alpha beta gamma delta epsilon zeta eta theta"
+        right = "gamma delta epsilon zeta eta theta iota kappa"
+
+        self.assertEqual(
+            ContextPacker(max_overlap_chars=40).pack([_result("a", 0.9, left, 0), _result("b", 0.8, right, 1)]).blocks,
+            ["[chunk_id=a, b] alpha beta gamma delta epsilon zeta eta theta iota kappa"],
+        )
+        self.assertEqual(
+            ContextPacker(max_overlap_chars=20).pack([_result("a", 0.9, left, 0), _result("b", 0.8, right, 1)]).blocks,
+            [f"[chunk_id=a, b] {left} {right}"],
+        )
+        with self.assertRaises(ValueError):
+            ContextPacker(min_overlap_chars=32, max_overlap_chars=16)
+
+
+if __name__ == "__main__":
+    unittest.main()
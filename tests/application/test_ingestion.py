@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.application import (
+    ChunkTextStorePort,
+    EmbeddingPort,
+    IngestionError,
+    IngestionService,
+    KeywordIndexPort,
+    ManifestEntry,
+    ManifestStorePort,
+    RequestPriority,
+    VectorSearchResult,
+    VectorStorePort,
+    current_priority,
+)
+from src.application.chunking import ChunkingConfig, iter_text_spans
+from src.application.parallel_chunking import ParallelChunker
+
+
+class FakeEmbeddingService(EmbeddingPort):
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self.embedded: list[str] = []
+
+    def embed_text(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        if "poison" in text:
+            raise ValueError("cannot embed poison")
+        return [float(len(text)), 0.0, 1.0]
+
+    def embed_batch(self, texts):  # type: ignore[no-untyped-def]
+        self.batch_sizes.append(len(texts))
+        return super().embed_batch(texts)
+
+
+class RecordingVectorStore(VectorStorePort):
+    def __init__(self) -> None:
+        self.points: dict[str, dict[str, object]] = {}
+
+    def ensure_collection(self) -> None:
+        return None
+
+    def upsert_embedding(self, chunk_id: str, embedding: list[float], payload: dict[str, object]) -> None:
+        self.points[chunk_id] = payload
+
+    def delete_embeddings(self, chunk_ids):  # type: ignore[no-untyped-def]
+        for chunk_id in chunk_ids:
+            self.points.pop(chunk_id, None)
+
+    def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[VectorSearchResult]:
+        return []
+
+
+class InMemoryManifestStore(ManifestStorePort):
+    def __init__(self) -> None:
+        self.entries: dict[str, ManifestEntry] = {}
+
+    def load(self) -> dict[str, ManifestEntry]:
+        return dict(self.entries)
+
+    def save(self, entries: dict[str, ManifestEntry]) -> None:
+        self.entries = dict(entries)
+
+
+class RecordingKeywordIndex(KeywordIndexPort):
+    def __init__(self) -> None:
+        self.texts: dict[str, str] = {}
+
+    def index_texts(self, records):  # type: ignore[no-untyped-def]
+        for record in records:
+            self.texts[record.chunk_id] = record.text
+
+    def delete_texts(self, chunk_ids):  # type: ignore[no-untyped-def]
+        for chunk_id in chunk_ids:
+            self.texts.pop(chunk_id, None)
+
+    def search_text(self, query_text: str, limit: int) -> list[VectorSearchResult]:
+        return []
+
+
+class RecordingChunkTextStore(ChunkTextStorePort):
+    def __init__(self) -> None:
+        self.texts: dict[str, str] = {}
+
+    def put_texts(self, records):  # type: ignore[no-untyped-def]
+        for record in records:
+            self.texts[record.chunk_id] = record.text
+
+    def get_texts(self, chunk_ids):  # type: ignore[no-untyped-def]
+        return {chunk_id: self.texts[chunk_id] for chunk_id in chunk_ids if chunk_id in self.texts}
+
+    def delete_texts(self, chunk_ids):  # type: ignore[no-untyped-def]
+        for chunk_id in chunk_ids:
+            self.texts.pop(chunk_id, None)
+
+
+class ExplodingVectorStore(RecordingVectorStore):
+    def upsert_embeddings(self, records):  # type: ignore[no-untyped-def]
+        raise RuntimeError("store offline")
+
+
+class ChunkingTests(unittest.TestCase):
+    def test_spans_do_not_depend_on_read_block_size(self) -> None:
+        data = ("Atlas indexa documentos em português. " * 50).encode("utf-8")
+        config = ChunkingConfig(chunk_size=64, chunk_overlap=16)
+
+        whole = list(iter_text_spans(io.BytesIO(data), config))
+        tiny_blocks = list(iter_text_spans(io.BytesIO(data), config, block_size=5))
+
+        self.assertEqual(whole, tiny_blocks)
+        self.assertEqual(whole[0].start, 0)
+        self.assertEqual(whole[-1].end, len(data))
+        for span in whole:
+            data[span.start : span.end].decode("utf-8")
+
+    def test_overlap_must_be_smaller_than_chunk_size(self) -> None:
+        with self.assertRaises(ValueError):
+            ChunkingConfig(chunk_size=10, chunk_overlap=10)
+
+
+class IngestionServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "nested").mkdir()
+        (self.root / "a.txt").write_text("alpha " * 40, encoding="utf-8")
+        (self.root / "nested" / "b.txt").write_text("beta " * 40, encoding="utf-8")
+        (self.root / "ignored.md").write_text("not a txt file", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_ingests_txt_files_through_all_stages(self) -> None:
+        store = RecordingVectorStore()
+        embeddings = FakeEmbeddingService()
+        service = IngestionService(
+            vector_store=store,
+            embedding_service=embeddings,
+            chunking=ChunkingConfig(chunk_size=100, chunk_overlap=20),
+            embed_batch_size=3,
+            queue_size=1,
+        )
+
+        report = service.run(self.root)
+
+        self.assertEqual(report.files_processed, 2)
+        self.assertEqual(report.chunks_indexed, len(store.points))
+        self.assertEqual(report.chunks_indexed, 6)
+        self.assertTrue(all(size <= 3 for size in embeddings.batch_sizes))
+        self.assertEqual([stage.name for stage in report.stages], ["discover", "chunk", "embed", "upsert"])
+        self.assertIn(report.bottleneck_stage, {"discover", "chunk", "embed", "upsert"})
+        sources = {payload["source_path"] for payload in store.points.values()}
+        self.assertEqual(sources, {"a.txt", "nested/b.txt"})
+
+    def test_parallel_chunker_indexes_the_same_points(self) -> None:
+        config = ChunkingConfig(chunk_size=100, chunk_overlap=20)
+        streamed = RecordingVectorStore()
+        IngestionService(vector_store=streamed, embedding_service=FakeEmbeddingService(), chunking=config).run(
+            self.root
+        )
+        chunked = RecordingVectorStore()
+        manifest = InMemoryManifestStore()
+        with ParallelChunker(config, workers=1, segment_bytes=100) as chunker:
+            service = IngestionService(
+                vector_store=chunked,
+                embedding_service=FakeEmbeddingService(),
+                chunker=chunker,
+                manifest_store=manifest,
+            )
+            report = service.run(self.root)
+
+        self.assertEqual(report.files_processed, 2)
+        self.assertEqual(chunked.points, streamed.points)
+        self.assertEqual(manifest.entries["a.txt"].chunking, config.fingerprint)
+        with self.assertRaises(IngestionError):
+            IngestionService(
+                vector_store=chunked,
+                embedding_service=FakeEmbeddingService(),
+                chunking=ChunkingConfig(),
+                chunker=chunker,
+            )
+
+    def test_reports_embedding_failures_per_chunk(self) -> None:
+        (self.root / "a.txt").write_text("poison", encoding="utf-8")
+        store = RecordingVectorStore()
+        service = IngestionService(vector_store=store, embedding_service=FakeEmbeddingService())
+
+        report = service.run(self.root)
+
+        self.assertEqual(len(report.failed_chunks), 1)
+        self.assertEqual(report.chunks_indexed, len(store.points))
+
+    def test_stage_failure_aborts_run(self) -> None:
+        service = IngestionService(
+            vector_store=ExplodingVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            embed_batch_size=1,
+            queue_size=1,
+        )
+
+        with self.assertRaises(IngestionError):
+            service.run(self.root)
+
+    def test_reingestion_only_touches_changed_content(self) -> None:
+        store = RecordingVectorStore()
+        embeddings = FakeEmbeddingService()
+        manifest = InMemoryManifestStore()
+        service = IngestionService(
+            vector_store=store,
+            embedding_service=embeddings,
+            chunking=ChunkingConfig(chunk_size=100, chunk_overlap=20),
+            manifest_store=manifest,
+        )
+        service.run(self.root)
+        self.assertEqual(set(manifest.entries), {"a.txt", "nested/b.txt"})
+
+        embeddings.embedded.clear()
+        unchanged = service.run(self.root)
+        self.assertEqual(embeddings.embedded, [])
+        self.assertEqual(unchanged.files_unchanged, 2)
+        self.assertEqual(unchanged.files_processed, 0)
+
+        (self.root / "a.txt").write_text("alpha " * 20 + "omega " * 3, encoding="utf-8")
+        (self.root / "nested" / "b.txt").unlink()
+        changed = service.run(self.root)
+
+        self.assertEqual(changed.files_processed, 1)
+        self.assertEqual(changed.chunks_unchanged, 1)
+        self.assertEqual(len(embeddings.embedded), 1)
+        self.assertEqual(changed.chunks_deleted, 4)
+        self.assertEqual({payload["source_path"] for payload in store.points.values()}, {"a.txt"})
+        self.assertEqual(len(store.points), 2)
+        self.assertEqual(set(manifest.entries), {"a.txt"})
+
+        touched = self.root / "a.txt"
+        touched.write_bytes(touched.read_bytes())
+        os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+        embeddings.embedded.clear()
+        rewritten = service.run(self.root)
+
+        self.assertEqual((rewritten.files_processed, rewritten.files_unchanged), (0, 1))
+        self.assertEqual(embeddings.embedded, [])
+
+    def test_keyword_index_mirrors_vector_store(self) -> None:
+        store = RecordingVectorStore()
+        keyword_index = RecordingKeywordIndex()
+        service = IngestionService(
+            vector_store=store,
+            embedding_service=FakeEmbeddingService(),
+            chunking=ChunkingConfig(chunk_size=100, chunk_overlap=20),
+            manifest_store=InMemoryManifestStore(),
+            keyword_index=keyword_index,
+        )
+        service.run(self.root)
+        self.assertEqual(set(keyword_index.texts), set(store.points))
+
+        (self.root / "nested" / "b.txt").unlink()
+        service.run(self.root)
+
+        self.assertEqual(set(keyword_index.texts), set(store.points))
+        self.assertTrue(all("alpha" in text for text in keyword_index.texts.values()))
+
+    def test_chunk_text_store_mirrors_vector_store(self) -> None:
+        store = RecordingVectorStore()
+        text_store = RecordingChunkTextStore()
+        service = IngestionService(
+            vector_store=store,
+            embedding_service=FakeEmbeddingService(),
+            chunking=ChunkingConfig(chunk_size=100, chunk_overlap=20),
+            manifest_store=InMemoryManifestStore(),
+            chunk_text_store=text_store,
+        )
+        service.run(self.root)
+        self.assertEqual(set(text_store.texts), set(store.points))
+
+        (self.root / "nested" / "b.txt").unlink()
+        service.run(self.root)
+
+        self.assertEqual(text_store.texts, {chunk_id: payload["text"] for chunk_id, payload in store.points.items()})
+
+    def test_embedding_calls_run_with_bulk_priority(self) -> None:
+        priorities: list[RequestPriority] = []
+
+        class PriorityRecordingEmbeddingService(FakeEmbeddingService):
+            def embed_batch(self, texts):  # type: ignore[no-untyped-def]
+                priorities.append(current_priority())
+                return super().embed_batch(texts)
+
+        IngestionService(
+            vector_store=RecordingVectorStore(),
+            embedding_service=PriorityRecordingEmbeddingService(),
+        ).run(self.root)
+
+        self.assertTrue(priorities)
+        self.assertEqual(set(priorities), {RequestPriority.BULK})
+        self.assertEqual(current_priority(), RequestPriority.INTERACTIVE)
+
+    def test_index_change_callback_fires_only_when_points_change(self) -> None:
+        notifications: list[str] = []
+        service = IngestionService(
+            vector_store=RecordingVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            manifest_store=InMemoryManifestStore(),
+            on_index_changed=lambda: notifications.append("changed"),
+        )
+
+        service.run(self.root)
+        service.run(self.root)
+
+        self.assertEqual(notifications, ["changed"])
+
+    def test_failed_chunks_keep_previous_manifest_entry(self) -> None:
+        manifest = InMemoryManifestStore()
+        (self.root / "a.txt").write_text("poison", encoding="utf-8")
+        service = IngestionService(
+            vector_store=RecordingVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            manifest_store=manifest,
+        )
+
+        service.run(self.root)
+
+        self.assertEqual(set(manifest.entries), {"nested/b.txt"})
+
+    def test_missing_directory_is_rejected(self) -> None:
+        service = IngestionService(vector_store=RecordingVectorStore(), embedding_service=FakeEmbeddingService())
+
+        with self.assertRaises(IngestionError):
+            service.run(self.root / "missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
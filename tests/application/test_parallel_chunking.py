@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+import io
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.application.chunking import ChunkingConfig, iter_text_spans, text_hash
+from src.application.parallel_chunking import (
+    ParallelChunker,
+    ParallelChunkingError,
+    _InlineExecutor,
+    chunk_count,
+)
+
+
+class _CountingExecutor(_InlineExecutor):
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.collected = 0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:  # type: ignore[no-untyped-def]
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class ParallelChunkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "corpus.txt"
+        text = "   \n" * 40 + "Atlas indexa documentos em português, 日本語 e emoji 😀. " * 60 + "\n" * 90
+        self.data = text.encode("utf-8")
+        self.path.write_bytes(self.data)
+        self.config = ChunkingConfig(chunk_size=64, chunk_overlap=16)
+        self.expected = list(iter_text_spans(io.BytesIO(self.data), self.config))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_matches_streaming_chunker_for_any_split(self) -> None:
+        for workers, segment_bytes in ((1, 1 << 20), (1, 100), (2, 300)):
+            with self.subTest(workers=workers, segment_bytes=segment_bytes):
+                with ParallelChunker(self.config, workers=workers, segment_bytes=segment_bytes) as chunker:
+                    boundaries = chunker.chunk_file(self.path)
+
+                self.assertEqual(list(boundaries.spans()), self.expected)
+                self.assertEqual(
+                    [boundaries.digest(index) for index in range(len(boundaries))],
+                    [text_hash(span.text) for span in self.expected],
+                )
+
+    def test_byte_ranges_tile_the_file(self) -> None:
+        with ParallelChunker(self.config, workers=1, segment_bytes=200) as chunker:
+            cuts = [0, 500, 1337, len(self.data)]
+            parts = [chunker.chunk_file(self.path, start, end) for start, end in zip(cuts, cuts[1:])]
+
+        self.assertEqual([span for part in parts for span in part.spans()], self.expected)
+        self.assertEqual([chunk_count(size, self.config) for size in (0, 64, 65, 112, 113)], [0, 1, 2, 2, 3])
+
+    def test_files_stream_segment_by_segment_in_order(self) -> None:
+        missing = Path(self._tmp.name) / "missing.txt"
+        empty = Path(self._tmp.name) / "empty.txt"
+        empty.write_bytes(b"")
+        with ParallelChunker(self.config, workers=1, segment_bytes=200) as chunker:
+            seen: list[tuple[Path, list | type[OSError]]] = []
+            for path, parts in chunker.chunk_files([self.path, missing, empty, self.path]):
+                try:
+                    seen.append((path, list(parts)))
+                except OSError:
+                    seen.append((path, OSError))
+
+        self.assertEqual([path for path, _ in seen], [self.path, missing, empty, self.path])
+        self.assertEqual(seen[1][1], OSError)
+        self.assertEqual(seen[2][1], [])
+        self.assertGreater(len(seen[0][1]), 1)
+        self.assertEqual([span for part in seen[3][1] for span in part.spans()], self.expected)
+        with self.assertRaises(ParallelChunkingError):
+            chunker.chunk_file(self.path)
+
+    def test_unconsumed_parts_are_skipped(self) -> None:
+        with ParallelChunker(self.config, workers=1, segment_bytes=100) as chunker:
+            results = chunker.chunk_files([self.path, self.path])
+            _, first = next(results)
+            next(first)
+            path, second = next(results)
+            spans = [span for part in second for span in part.spans()]
+
+        self.assertEqual(path, self.path)
+        self.assertEqual(spans, self.expected)
+
+    def test_segments_are_submitted_within_the_window(self) -> None:
+        executor = _CountingExecutor()
+        chunker = ParallelChunker(self.config, workers=2, segment_bytes=100, executor=executor)
+
+        for _, parts in chunker.chunk_files([self.path]):
+            for _ in parts:
+                self.assertLessEqual(executor.submitted - executor.collected, 4)
+                executor.collected += 1
+
+        self.assertGreater(executor.submitted, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,25 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import unittest
 
 from src.application import (
+    AsyncEmbeddingPort,
+    AsyncGenerationPort,
+    AsyncVectorStorePort,
+    ChunkTextStorePort,
     EmbeddingPort,
     GenerationPort,
+    KeywordIndexPort,
+    MetricsPort,
     RAGPipelineError,
     RAGPipelineService,
     RAGRequest,
+    RAGRetrievalEvent,
+    RAGTextDelta,
+    SemanticAnswerCache,
     VectorSearchResult,
     VectorStorePort,
 )
+from src.application.retrieval import reciprocal_rank_fusion
+from src.domain import Answer
 
 
 class FakeEmbeddingService(EmbeddingPort):
     def embed_text(self, text: str) -> list[float]:
+        if "billing" in text:
+            return [0.9, -0.1, 0.0]
         return [0.1, 0.2, 0.3]
 
 
 class FakeGenerationService(GenerationPort):
+    def __init__(self) -> None:
+        self.calls = 0
+
     def generate_text(self, prompt: str) -> str:
+        self.calls += 1
         return "Atlas is a RAG platform."
 
 
@@ -30,6 +49,9 @@ class FakeVectorStore(VectorStorePort):
     def upsert_embedding(self, chunk_id: str, embedding: list[float], payload: dict[str, object]) -> None:
         return None
 
+    def delete_embeddings(self, chunk_ids):  # type: ignore[no-untyped-def]
+        return None
+
     def search_similar(
         self,
         query_embedding: list[float],
@@ -80,5 +102,553 @@ class RAGPipelineServiceTests(unittest.TestCase):
             service.run(RAGRequest(query_text="What is Atlas?"))
 
 
+class RecordingMetrics(MetricsPort):
+    def __init__(self) -> None:
+        self.observations: list[tuple[str, float]] = []
+
+    def observe_latency(self, stage: str, seconds: float) -> None:
+        self.observations.append((stage, seconds))
+
+
+class RAGPipelineTracingTests(unittest.TestCase):
+    def test_stage_timings_reach_metadata_metrics_and_logs(self) -> None:
+        metrics = RecordingMetrics()
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+            metrics=metrics,
+        )
+
+        with self.assertLogs("atlas.rag", level="INFO") as logs:
+            answer = service.run(RAGRequest(query_text="What is Atlas?", correlation_id="req-42"))
+
+        stages = ["query", "embedding", "vector_search", "context", "generation"]
+        self.assertEqual(list(answer.metadata["timings_ms"]), stages)
+        spans = {span["stage"]: span for span in answer.metadata["spans"]}
+        self.assertEqual(spans["embedding"]["vector_dimension"], 3)
+        self.assertEqual(spans["vector_search"]["hits"], 1)
+        self.assertGreater(spans["context"]["prompt_tokens"], 0)
+        self.assertEqual(spans["generation"]["output_chars"], len("Atlas is a RAG platform."))
+        self.assertEqual(answer.metadata["correlation_id"], "req-42")
+        self.assertEqual([stage for stage, _ in metrics.observations], [*stages, "total"])
+        self.assertEqual(logs.records[0].correlation_id, "req-42")
+        self.assertEqual(len(logs.records[0].fields["spans"]), len(stages))
+
+    def test_failures_are_logged_with_the_failing_stage(self) -> None:
+        service = RAGPipelineService(
+            vector_store=EmptyVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+        )
+
+        with self.assertLogs("atlas.rag", level="WARNING") as logs, self.assertRaises(RAGPipelineError):
+            service.run(RAGRequest(query_text="What is Atlas?"))
+
+        self.assertEqual(logs.records[0].fields["failed_stage"], "context")
+        self.assertTrue(logs.records[0].correlation_id)
+
+
+class FakeKeywordIndex(KeywordIndexPort):
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, int]] = []
+
+    def index_texts(self, records):  # type: ignore[no-untyped-def]
+        return None
+
+    def delete_texts(self, chunk_ids):  # type: ignore[no-untyped-def]
+        return None
+
+    def search_text(self, query_text: str, limit: int) -> list[VectorSearchResult]:
+        self.queries.append((query_text, limit))
+        return [
+            VectorSearchResult(chunk_id="chunk-err", score=12.0, payload={"text": "ERR-4012 means expired token."}),
+            VectorSearchResult(chunk_id="chunk-1", score=3.0, payload={"text": "Atlas overview."}),
+        ]
+
+
+class HybridRetrievalTests(unittest.TestCase):
+    def test_reciprocal_rank_fusion_rewards_agreement(self) -> None:
+        dense = [
+            VectorSearchResult("a", 0.9, {"text": "a"}),
+            VectorSearchResult("b", 0.8, {"text": "b"}),
+        ]
+        lexical = [
+            VectorSearchResult("c", 9.0, {"text": "c"}),
+            VectorSearchResult("b", 7.0, {"text": "b"}),
+        ]
+
+        fused = reciprocal_rank_fusion([dense, lexical], limit=2, k=60)
+
+        self.assertEqual([item.chunk_id for item in fused], ["b", "a"])
+        self.assertAlmostEqual(fused[0].score, 2 / 62)
+
+    def test_pipeline_fuses_keyword_matches_into_context(self) -> None:
+        keyword_index = FakeKeywordIndex()
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+            keyword_index=keyword_index,
+            hybrid_candidates=10,
+        )
+
+        answer = service.run(RAGRequest(query_text="What is ERR-4012?", top_k=2))
+
+        self.assertEqual(answer.source_chunk_ids, ["chunk-1", "chunk-err"])
+        self.assertEqual(keyword_index.queries, [("What is ERR-4012?", 10)])
+        self.assertEqual(answer.metadata["retrieval"], "hybrid")
+
+    def test_run_many_fuses_each_request(self) -> None:
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+            keyword_index=FakeKeywordIndex(),
+        )
+
+        results = service.run_many([RAGRequest(query_text="ERR-4012?", top_k=1)])
+
+        self.assertEqual(results[0].answer.source_chunk_ids, ["chunk-1"])
+
+
+class IdsOnlyVectorStore(FakeVectorStore):
+    def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[VectorSearchResult]:
+        return [VectorSearchResult("chunk-1", 0.94, {}), VectorSearchResult("chunk-2", 0.9, {})]
+
+
+class PositionOnlyVectorStore(FakeVectorStore):
+    """Results shaped like an IDs-only Qdrant search: position fields, no text."""
+
+    def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[VectorSearchResult]:
+        return [
+            VectorSearchResult("chunk-2", 0.94, {"document_id": "doc-1", "sequence_number": 1}),
+            VectorSearchResult("chunk-1", 0.9, {"document_id": "doc-1", "sequence_number": 0}),
+        ]
+
+
+class PromptRecordingGenerationService(FakeGenerationService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.prompts: list[str] = []
+
+    def generate_text(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return super().generate_text(prompt)
+
+
+class FakeChunkTextStore(ChunkTextStorePort):
+    def __init__(self) -> None:
+        self.texts = {"chunk-1": "Atlas is a Retrieval-Augmented Generation platform."}
+        self.lookups: list[list[str]] = []
+
+    def put_texts(self, records):  # type: ignore[no-untyped-def]
+        return None
+
+    def get_texts(self, chunk_ids):  # type: ignore[no-untyped-def]
+        self.lookups.append(list(chunk_ids))
+        return {chunk_id: self.texts[chunk_id] for chunk_id in chunk_ids if chunk_id in self.texts}
+
+    def delete_texts(self, chunk_ids):  # type: ignore[no-untyped-def]
+        return None
+
+
+class ChunkTextStoreTests(unittest.TestCase):
+    def test_text_is_hydrated_with_one_batched_lookup(self) -> None:
+        text_store = FakeChunkTextStore()
+        generation = FakeGenerationService()
+        service = RAGPipelineService(
+            vector_store=IdsOnlyVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=generation,
+            chunk_text_store=text_store,
+        )
+
+        answer = service.run(RAGRequest(query_text="What is Atlas?", top_k=2))
+
+        self.assertEqual(text_store.lookups, [["chunk-1", "chunk-2"]])
+        self.assertEqual(answer.source_chunk_ids, ["chunk-1"])
+
+    def test_adjacent_ids_only_results_are_merged_after_hydration(self) -> None:
+        text_store = FakeChunkTextStore()
+        text_store.texts = {
+            "chunk-1": "Atlas is a Retrieval-Augmented Generation platform built on Qdrant.",
+            "chunk-2": "platform built on Qdrant. It packs prompt context within a token budget.",
+        }
+        generation = PromptRecordingGenerationService()
+        service = RAGPipelineService(
+            vector_store=PositionOnlyVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=generation,
+            chunk_text_store=text_store,
+        )
+
+        answer = service.run(RAGRequest(query_text="What is Atlas?", top_k=2))
+
+        self.assertIn(
+            "Generation platform built on Qdrant. It packs prompt context",
+            generation.prompts[0],
+        )
+        self.assertEqual(generation.prompts[0].count("platform built on Qdrant."), 1)
+        self.assertEqual(sorted(answer.source_chunk_ids), ["chunk-1", "chunk-2"])
+
+    def test_ids_only_results_without_text_store_fail(self) -> None:
+        service = RAGPipelineService(
+            vector_store=IdsOnlyVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+        )
+
+        with self.assertRaises(RAGPipelineError):
+            service.run(RAGRequest(query_text="What is Atlas?"))
+
+
+class StreamingGenerationService(FakeGenerationService):
+    def stream_text(self, prompt: str):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        yield from ["Atlas is ", "a RAG ", "platform."]
+
+
+class RAGPipelineStreamTests(unittest.TestCase):
+    def test_run_stream_yields_retrieval_then_deltas_then_answer(self) -> None:
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=StreamingGenerationService(),
+        )
+
+        events = list(service.run_stream(RAGRequest(query_text="What is Atlas?")))
+
+        self.assertIsInstance(events[0], RAGRetrievalEvent)
+        self.assertEqual(events[0].source_chunk_ids, ["chunk-1"])
+        self.assertEqual(events[0].scores, {"chunk-1": 0.94})
+        self.assertEqual([event.text for event in events[1:-1]], ["Atlas is ", "a RAG ", "platform."])
+        self.assertEqual(events[-1].text, "Atlas is a RAG platform.")
+        self.assertEqual(events[-1].source_chunk_ids, ["chunk-1"])
+
+    def test_run_stream_falls_back_to_single_delta(self) -> None:
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+        )
+
+        events = list(service.run_stream(RAGRequest(query_text="What is Atlas?")))
+
+        self.assertEqual(len(events), 3)
+        self.assertIsInstance(events[1], RAGTextDelta)
+
+    def test_run_stream_serves_cache_hits_without_generation(self) -> None:
+        generation = StreamingGenerationService()
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=generation,
+            answer_cache=SemanticAnswerCache(),
+        )
+
+        list(service.run_stream(RAGRequest(query_text="What is Atlas?")))
+        events = list(service.run_stream(RAGRequest(query_text="What is Atlas?")))
+
+        self.assertEqual(generation.calls, 1)
+        self.assertTrue(events[0].cache_hit)
+        self.assertTrue(events[-1].metadata["cache_hit"])
+
+
+class AsyncFakeEmbeddingService(AsyncEmbeddingPort):
+    async def embed_text(self, text: str) -> list[float]:
+        await asyncio.sleep(0.01)
+        return [0.1, 0.2, 0.3]
+
+
+class SelectiveAsyncEmbeddingService(AsyncEmbeddingPort):
+    async def embed_text(self, text: str) -> list[float]:
+        if text == "bad":
+            raise ValueError("bad input")
+        if text == "cancelled":
+            raise asyncio.CancelledError()
+        return [float(len(text))]
+
+
+class AsyncEmbeddingPortTests(unittest.IsolatedAsyncioTestCase):
+    async def test_default_batch_reports_item_failures(self) -> None:
+        results = await SelectiveAsyncEmbeddingService().embed_batch(["ok", "bad"])
+
+        self.assertEqual(results[0].embedding, [2.0])
+        self.assertEqual(results[1].error, "bad input")
+        self.assertIsInstance(results[1].exception, ValueError)
+
+    async def test_default_batch_propagates_cancellation(self) -> None:
+        with self.assertRaises(asyncio.CancelledError):
+            await SelectiveAsyncEmbeddingService().embed_batch(["ok", "cancelled"])
+
+
+class AsyncFakeGenerationService(AsyncGenerationPort):
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_text(self, prompt: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        return "Atlas is a RAG platform."
+
+
+class AsyncFakeVectorStore(AsyncVectorStorePort):
+    async def ensure_collection(self) -> None:
+        return None
+
+    async def upsert_embedding(self, chunk_id: str, embedding: list[float], payload: dict[str, object]) -> None:
+        return None
+
+    async def delete_embeddings(self, chunk_ids):  # type: ignore[no-untyped-def]
+        return None
+
+    async def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[VectorSearchResult]:
+        return FakeVectorStore().search_similar(query_embedding, limit, score_threshold)
+
+
+class BatchCountingEmbeddingService(FakeEmbeddingService):
+    def __init__(self) -> None:
+        self.batch_calls = 0
+
+    def embed_batch(self, texts):  # type: ignore[no-untyped-def]
+        self.batch_calls += 1
+        return super().embed_batch(texts)
+
+
+class BatchSearchVectorStore(FakeVectorStore):
+    def __init__(self) -> None:
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def search_similar(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[VectorSearchResult]:
+        self.single_calls += 1
+        if query_embedding[0] > 0.5:
+            return []
+        return super().search_similar(query_embedding, limit, score_threshold)
+
+    def search_similar_batch(self, queries):  # type: ignore[no-untyped-def]
+        self.batch_calls += 1
+        return super().search_similar_batch(queries)
+
+
+class RAGPipelineBatchTests(unittest.TestCase):
+    def test_run_many_batches_round_trips_and_keeps_order(self) -> None:
+        embeddings = BatchCountingEmbeddingService()
+        store = BatchSearchVectorStore()
+        generation = FakeGenerationService()
+        service = RAGPipelineService(
+            vector_store=store,
+            embedding_service=embeddings,
+            generation_service=generation,
+        )
+
+        results = service.run_many(
+            [
+                RAGRequest(query_text="What is Atlas?"),
+                RAGRequest(query_text="   "),
+                RAGRequest(query_text="How does billing work?"),
+                RAGRequest(query_text="Who maintains Atlas?", top_k=5),
+            ],
+            max_generation_concurrency=2,
+        )
+
+        self.assertEqual([result.ok for result in results], [True, False, False, True])
+        self.assertIn("No relevant context", results[2].error or "")
+        self.assertEqual(results[3].answer.metadata["top_k"], 5)
+        self.assertEqual(embeddings.batch_calls, 1)
+        self.assertEqual(store.batch_calls, 1)
+        self.assertEqual(generation.calls, 2)
+
+    def test_run_many_reports_generation_failures_per_item(self) -> None:
+        class FlakyGenerationService(GenerationPort):
+            def generate_text(self, prompt: str) -> str:
+                if "Who" in prompt:
+                    raise RuntimeError("provider unavailable")
+                return "ok"
+
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FlakyGenerationService(),
+        )
+
+        results = service.run_many(
+            [RAGRequest(query_text="What is Atlas?"), RAGRequest(query_text="Who maintains Atlas?")]
+        )
+
+        self.assertTrue(results[0].ok)
+        self.assertEqual(results[1].error, "provider unavailable")
+
+
+class RAGPipelineAsyncTests(unittest.IsolatedAsyncioTestCase):
+    async def test_arun_falls_back_to_sync_ports(self) -> None:
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+        )
+
+        answer = await service.arun(RAGRequest(query_text="What is Atlas?", top_k=3))
+
+        self.assertEqual(answer.source_chunk_ids, ["chunk-1"])
+        self.assertEqual(answer.metadata["top_k"], 3)
+
+    async def test_arun_overlaps_concurrent_requests_on_async_ports(self) -> None:
+        generation = AsyncFakeGenerationService()
+        service = RAGPipelineService(
+            vector_store=EmptyVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+            async_vector_store=AsyncFakeVectorStore(),
+            async_embedding_service=AsyncFakeEmbeddingService(),
+            async_generation_service=generation,
+        )
+
+        answers = await asyncio.gather(
+            *(service.arun(RAGRequest(query_text=f"Question {index}?")) for index in range(20))
+        )
+
+        self.assertEqual(len(answers), 20)
+        self.assertGreater(generation.max_in_flight, 1)
+
+    async def test_arun_builds_context_off_the_event_loop(self) -> None:
+        loop_thread = threading.get_ident()
+        text_store = FakeChunkTextStore()
+        lookup_threads: list[int] = []
+        get_texts = text_store.get_texts
+
+        def recording_get_texts(chunk_ids):  # type: ignore[no-untyped-def]
+            lookup_threads.append(threading.get_ident())
+            return get_texts(chunk_ids)
+
+        text_store.get_texts = recording_get_texts  # type: ignore[method-assign]
+        service = RAGPipelineService(
+            vector_store=IdsOnlyVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+            chunk_text_store=text_store,
+        )
+
+        answer = await service.arun(RAGRequest(query_text="What is Atlas?", top_k=2))
+
+        self.assertEqual(answer.source_chunk_ids, ["chunk-1"])
+        self.assertEqual(len(lookup_threads), 1)
+        self.assertNotEqual(lookup_threads[0], loop_thread)
+        self.assertIn("context", answer.metadata["timings_ms"])
+
+    async def test_arun_raises_without_context(self) -> None:
+        service = RAGPipelineService(
+            vector_store=EmptyVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=FakeGenerationService(),
+        )
+
+        with self.assertRaises(RAGPipelineError):
+            await service.arun(RAGRequest(query_text="What is Atlas?"))
+
+
+class SemanticAnswerCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.cache = SemanticAnswerCache(similarity_threshold=0.98, ttl_seconds=60, clock=lambda: self.now)
+        self.generation = FakeGenerationService()
+        self.service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=self.generation,
+            answer_cache=self.cache,
+        )
+
+    def test_similar_query_reuses_cached_answer(self) -> None:
+        first = self.service.run(RAGRequest(query_text="What is Atlas?"))
+        second = self.service.run(RAGRequest(query_text="what's atlas"))
+
+        self.assertEqual(self.generation.calls, 1)
+        self.assertFalse(first.metadata["cache_hit"])
+        self.assertTrue(second.metadata["cache_hit"])
+        self.assertEqual(second.metadata["query_text"], "what's atlas")
+        self.assertEqual(second.source_chunk_ids, ["chunk-1"])
+
+    def test_cache_respects_retrieval_parameters_and_distance(self) -> None:
+        self.service.run(RAGRequest(query_text="What is Atlas?", top_k=3))
+        self.service.run(RAGRequest(query_text="What is Atlas?", top_k=5))
+        self.service.run(RAGRequest(query_text="How does billing work?", top_k=3))
+
+        self.assertEqual(self.generation.calls, 3)
+
+    def test_entries_expire_and_can_be_invalidated(self) -> None:
+        self.service.run(RAGRequest(query_text="What is Atlas?"))
+        self.now = 61.0
+        self.service.run(RAGRequest(query_text="What is Atlas?"))
+        self.cache.invalidate()
+        self.service.run(RAGRequest(query_text="What is Atlas?"))
+
+        self.assertEqual(self.generation.calls, 3)
+
+    def test_answers_generated_across_an_invalidation_are_not_stored(self) -> None:
+        cache = self.cache
+
+        class InvalidatingGenerationService(FakeGenerationService):
+            def generate_text(self, prompt: str) -> str:
+                cache.invalidate()
+                return super().generate_text(prompt)
+
+        generation = InvalidatingGenerationService()
+        service = RAGPipelineService(
+            vector_store=FakeVectorStore(),
+            embedding_service=FakeEmbeddingService(),
+            generation_service=generation,
+            answer_cache=cache,
+        )
+
+        service.run(RAGRequest(query_text="What is Atlas?"))
+
+        self.assertEqual(len(cache), 0)
+        epoch = cache.epoch
+        cache.invalidate()
+        cache.store([1.0, 0.0, 0.0], 3, None, Answer.create(text="stale", source_chunk_ids=["chunk-1"]), epoch)
+        self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], 3, None))
+
+    def test_least_recently_used_entry_is_evicted_first(self) -> None:
+        cache = SemanticAnswerCache(similarity_threshold=0.99, max_entries=2, clock=lambda: self.now)
+        answers = [Answer.create(text=f"answer {index}", source_chunk_ids=["chunk-1"]) for index in range(3)]
+        cache.store([1.0, 0.0, 0.0], 3, None, answers[0])
+        cache.store([0.0, 1.0, 0.0], 3, None, answers[1])
+        self.assertIs(cache.lookup([2.0, 0.0, 0.0], 3, None)[0], answers[0])
+
+        cache.store([0.0, 0.0, 1.0], 3, None, answers[2])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.lookup([0.0, 1.0, 0.0], 3, None))
+        self.assertIs(cache.lookup([1.0, 0.0, 0.0], 3, None)[0], answers[0])
+        self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], 3, 0.5))
+        cache.store([1.0, 0.0], 3, None, answers[1])
+        self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], 3, None))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from array import array
+import pickle
+import unittest
+
+from src.domain import Chunk, ChunkBatch, ChunkBatchBuilder
+
+
+def _batch() -> ChunkBatch:
+    builder = ChunkBatchBuilder()
+    first = builder.add_document("doc-1", {"source_path": "a.txt"})
+    builder.append("chunk-1", first, "alpha beta", 0, 0, 10)
+    second = builder.add_document("doc-2", {"source_path": "b.txt"})
+    builder.append("chunk-2", second, "gamma", 0, 0, 6)
+    builder.append("chunk-3", builder.add_document("doc-1"), "délta", 2, 16, 22)
+    return builder.build()
+
+
+class ChunkBatchTests(unittest.TestCase):
+    def test_materializes_equal_chunks(self) -> None:
+        batch = _batch()
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.document_ids, ("doc-1", "doc-2"))
+        self.assertEqual(batch.contents(), ["alpha beta", "gamma", "délta"])
+        self.assertEqual(batch.chunk_ids(), ["chunk-1", "chunk-2", "chunk-3"])
+        self.assertEqual(
+            list(batch)[2],
+            Chunk(
+                id="chunk-3",
+                document_id="doc-1",
+                content="délta",
+                sequence_number=2,
+                metadata={"source_path": "a.txt", "start_offset": 16, "end_offset": 22},
+            ),
+        )
+        with self.assertRaises(IndexError):
+            batch.chunk(3)
+
+    def test_builder_starts_over_after_build(self) -> None:
+        builder = ChunkBatchBuilder()
+        builder.append("chunk-1", builder.add_document("doc-1"), "text", 0, 0, 4)
+        builder.build()
+
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(len(builder.build()), 0)
+
+    def test_rejects_invalid_columns(self) -> None:
+        batch = _batch()
+        cases = {
+            "blank content": dict(text="alpha beta gamm ", text_offsets=array("q", [0, 10, 15, 16])),
+            "empty id": dict(ids="chunk-1chunk-2", id_offsets=array("q", [0, 7, 14, 14])),
+            "negative sequence": dict(sequence_numbers=array("q", [0, -1, 2])),
+            "unknown document": dict(document_indices=array("l", [0, 2, 0])),
+            "inverted range": dict(source_starts=array("q", [11, 0, 16])),
+            "short column": dict(source_ends=array("q", [10, 6])),
+        }
+        for name, changes in cases.items():
+            fields = {field: getattr(batch, field) for field in ChunkBatch.__dataclass_fields__}
+            fields.update(changes)
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                ChunkBatch(**fields)
+
+    def test_entities_are_slotted_and_picklable(self) -> None:
+        chunk = _batch().chunk(0)
+
+        self.assertFalse(hasattr(chunk, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(chunk)), chunk)
+
+
+if __name__ == "__main__":
+    unittest.main()
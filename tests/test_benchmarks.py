@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from benchmarks.results import BenchmarkResult, compare_results, dump_results, load_results
+
+
+class CompareResultsTests(unittest.TestCase):
+    def test_flags_slowdowns_in_either_direction(self) -> None:
+        baseline = [
+            BenchmarkResult("search.p50", 1.0, "ms", params={"size": 1000}),
+            BenchmarkResult("ingestion.chunks_per_second", 1000.0, "chunks/s", higher_is_better=True),
+            BenchmarkResult("prompt_build.p50", 2.0, "ms"),
+            BenchmarkResult("retired", 1.0, "ms"),
+        ]
+        current = [
+            BenchmarkResult("search.p50", 1.3, "ms", params={"size": 1000}),
+            BenchmarkResult("ingestion.chunks_per_second", 700.0, "chunks/s", higher_is_better=True),
+            BenchmarkResult("prompt_build.p50", 1.0, "ms"),
+            BenchmarkResult("new_metric", 1.0, "ms"),
+        ]
+
+        statuses = {comparison.key: comparison.status for comparison in compare_results(current, baseline, 0.25)}
+
+        self.assertEqual(
+            statuses,
+            {
+                "search.p50[size=1000]": "regression",
+                "ingestion.chunks_per_second": "regression",
+                "prompt_build.p50": "improvement",
+                "new_metric": "new",
+                "retired": "missing",
+            },
+        )
+
+    def test_noise_floor_ignores_tiny_latency_changes(self) -> None:
+        baseline = [BenchmarkResult("search.p50", 0.1, "ms")]
+        current = [BenchmarkResult("search.p50", 0.18, "ms")]
+
+        [comparison] = compare_results(current, baseline, 0.25, noise_floor_ms=0.1)
+
+        self.assertEqual(comparison.status, "ok")
+        self.assertAlmostEqual(comparison.change, 0.8)
+
+    def test_results_round_trip_through_json(self) -> None:
+        results = [BenchmarkResult("search.p95", 0.5, "ms", params={"size": 10, "dimension": 8})]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "results.json"
+            dump_results(results, path, {"python": "3.11"})
+
+            self.assertEqual(load_results(path), results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.application import TextRecord
+from src.infrastructure.chunk_store import MmapChunkTextStore
+
+
+class MmapChunkTextStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = Path(self._directory.name)
+        self.store = MmapChunkTextStore(self.path)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self._directory.cleanup()
+
+    def test_batched_lookup_returns_known_texts_only(self) -> None:
+        self.store.put_texts([TextRecord("a", "primeiro trecho", {}), TextRecord("b", "ação ✓", {})])
+
+        self.assertEqual(self.store.get_texts(["b", "missing", "a"]), {"a": "primeiro trecho", "b": "ação ✓"})
+        self.assertEqual(self.store.get_texts([]), {})
+
+    def test_lookup_sees_texts_appended_after_mapping(self) -> None:
+        self.store.put_texts([TextRecord("a", "um", {})])
+        self.store.get_texts(["a"])
+        self.store.put_texts([TextRecord("b", "dois", {})])
+
+        self.assertEqual(self.store.get_texts(["a", "b"]), {"a": "um", "b": "dois"})
+
+    def test_empty_texts_are_served_without_mapping_an_empty_blob(self) -> None:
+        self.store.put_texts([TextRecord("a", "", {})])
+
+        self.assertEqual(self.store.get_texts(["a"]), {"a": ""})
+        self.store.compact()
+        self.assertEqual(self.store.get_texts(["a"]), {"a": ""})
+
+    def test_replace_delete_and_reopen(self) -> None:
+        self.store.put_texts([TextRecord("a", "antigo", {}), TextRecord("b", "fica", {})])
+        self.store.put_texts([TextRecord("a", "novo", {})])
+        self.store.delete_texts(["b", "unknown"])
+        self.store.close()
+
+        self.store = MmapChunkTextStore(self.path)
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store.get_texts(["a", "b"]), {"a": "novo"})
+        self.assertEqual(self.store.dead_bytes, len("antigo") + len("fica"))
+
+    def test_compact_drops_dead_bytes(self) -> None:
+        self.store.put_texts([TextRecord("a", "x" * 100, {}), TextRecord("b", "mantido", {})])
+        self.store.delete_texts(["a"])
+        self.store.compact()
+
+        self.assertEqual(self.store.dead_bytes, 0)
+        self.assertEqual((self.path / "texts.blob").stat().st_size, len("mantido"))
+        self.store.put_texts([TextRecord("c", "depois", {})])
+        self.store.close()
+
+        self.store = MmapChunkTextStore(self.path)
+        self.assertEqual(self.store.get_texts(["a", "b", "c"]), {"b": "mantido", "c": "depois"})
+
+    def test_torn_index_tail_is_discarded(self) -> None:
+        self.store.put_texts([TextRecord("a", "completo", {})])
+        self.store.close()
+        with (self.path / "texts.idx").open("ab") as handle:
+            handle.write(b"\x05\x00partial")
+
+        self.store = MmapChunkTextStore(self.path)
+        self.assertEqual(self.store.get_texts(["a"]), {"a": "completo"})
+        self.store.put_texts([TextRecord("b", "seguinte", {})])
+        self.store.close()
+
+        self.store = MmapChunkTextStore(self.path)
+        self.assertEqual(self.store.get_texts(["a", "b"]), {"a": "completo", "b": "seguinte"})
+
+
+if __name__ == "__main__":
+    unittest.main()
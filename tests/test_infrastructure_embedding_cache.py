@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.application import EmbeddingPort
+from src.infrastructure.embeddings import CachingEmbeddingAdapter
+
+
+class CountingEmbeddingService(EmbeddingPort):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def embed_text(self, text: str) -> list[float]:
+        self.calls.append(text)
+        if text == "fail":
+            raise ValueError("provider error")
+        return [float(len(text)), 0.5, -0.25]
+
+
+class CachingEmbeddingAdapterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "embeddings.sqlite3"
+        self.inner = CountingEmbeddingService()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_normalized_repeats_hit_memory_cache(self) -> None:
+        cache = CachingEmbeddingAdapter(self.inner, model_name="test-model")
+
+        first = cache.embed_text("What is  Atlas?")
+        second = cache.embed_text(" What is Atlas? ")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.inner.calls), 1)
+        self.assertEqual(cache.stats.memory_hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_batch_only_forwards_unique_misses(self) -> None:
+        cache = CachingEmbeddingAdapter(self.inner, model_name="test-model")
+        cache.embed_text("alpha")
+
+        results = cache.embed_batch(["alpha", "beta", "beta", "fail"])
+
+        self.assertEqual(self.inner.calls, ["alpha", "beta", "fail"])
+        self.assertEqual([result.ok for result in results], [True, True, True, False])
+        self.assertEqual(results[1].embedding, results[2].embedding)
+
+    def test_disk_store_survives_restart_and_is_scoped_by_model(self) -> None:
+        cache = CachingEmbeddingAdapter(self.inner, model_name="model-a", path=self.path)
+        cache.embed_text("alpha")
+        cache.close()
+
+        reopened = CachingEmbeddingAdapter(self.inner, model_name="model-a", path=self.path)
+        self.assertEqual(reopened.embed_text("alpha"), [5.0, 0.5, -0.25])
+        self.assertEqual(reopened.stats.disk_hits, 1)
+        reopened.close()
+
+        other_model = CachingEmbeddingAdapter(self.inner, model_name="model-b", path=self.path)
+        other_model.embed_text("alpha")
+        self.assertEqual(other_model.stats.misses, 1)
+        self.assertEqual(len(self.inner.calls), 2)
+        other_model.close()
+
+    def test_disk_store_is_size_bounded(self) -> None:
+        cache = CachingEmbeddingAdapter(
+            self.inner,
+            model_name="test-model",
+            path=self.path,
+            memory_entries=0,
+            max_disk_entries=10,
+        )
+
+        cache.embed_batch([f"text-{index}" for index in range(25)])
+
+        self.assertEqual(cache.stats.evictions, 16)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+import src.infrastructure.embeddings.gemini_embeddings as gemini_embeddings
+from src.infrastructure.embeddings import GeminiEmbeddingAdapter, GeminiEmbeddingError
+
+
+class FakeGenai:
+    def __init__(self) -> None:
+        self.calls: list[object] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_on: str | None = None
+        self._lock = threading.Lock()
+
+    def configure(self, api_key: str) -> None:
+        return None
+
+    def embed_content(self, model: str, content: object) -> dict[str, object]:
+        with self._lock:
+            self.calls.append(content)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.01)
+            if isinstance(content, list):
+                if self.fail_on is not None and self.fail_on in content:
+                    raise RuntimeError("503 unavailable")
+                return {"embedding": [[float(len(text))] for text in content]}
+            return {"embedding": [float(len(content))]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class GeminiEmbeddingAdapterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_genai = gemini_embeddings.genai
+        self.fake = FakeGenai()
+        gemini_embeddings.genai = self.fake
+
+    def tearDown(self) -> None:
+        gemini_embeddings.genai = self._original_genai
+
+    def test_embed_batch_preserves_input_order_across_batches(self) -> None:
+        adapter = GeminiEmbeddingAdapter(api_key="key", batch_size=2, max_concurrent_batches=3)
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        results = adapter.embed_batch(texts)
+
+        self.assertEqual([result.embedding for result in results], [[1.0], [2.0], [3.0], [4.0], [5.0]])
+        self.assertEqual(len(self.fake.calls), 3)
+        self.assertLessEqual(self.fake.max_in_flight, 3)
+
+    def test_embed_batch_reports_errors_per_item(self) -> None:
+        adapter = GeminiEmbeddingAdapter(api_key="key", batch_size=2, max_concurrent_batches=2)
+        self.fake.fail_on = "ccc"
+
+        results = adapter.embed_batch(["a", "  ", "ccc", "dddd", "e"])
+
+        self.assertEqual([result.ok for result in results], [False, False, False, True, True])
+        self.assertEqual(results[3].embedding, [4.0])
+        self.assertIn("cannot be empty", results[1].error)
+
+    def test_rejects_batch_size_above_provider_limit(self) -> None:
+        with self.assertRaises(GeminiEmbeddingError):
+            GeminiEmbeddingAdapter(api_key="key", batch_size=101)
+
+
+if __name__ == "__main__":
+    unittest.main()
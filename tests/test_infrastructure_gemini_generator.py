@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+import unittest
+
+import src.infrastructure.llm.gemini_generator as gemini_generator
+from src.infrastructure.llm import GeminiGenerationAdapter, GeminiGenerationError
+
+
+class FakeModel:
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+        self.stream_flags: list[bool] = []
+
+    def generate_content(self, prompt: str, stream: bool = False):  # type: ignore[no-untyped-def]
+        self.stream_flags.append(stream)
+        if stream:
+            return (SimpleNamespace(text=text) for text in self.chunks)
+        return SimpleNamespace(text="".join(self.chunks))
+
+
+class FakeGenai:
+    def __init__(self, model: FakeModel) -> None:
+        self.model = model
+
+    def configure(self, api_key: str) -> None:
+        return None
+
+    def GenerativeModel(self, model_name: str) -> FakeModel:  # noqa: N802
+        return self.model
+
+
+class GeminiGenerationAdapterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_genai = gemini_generator.genai
+
+    def tearDown(self) -> None:
+        gemini_generator.genai = self._original_genai
+
+    def _adapter(self, chunks: list[str]) -> tuple[GeminiGenerationAdapter, FakeModel]:
+        model = FakeModel(chunks)
+        gemini_generator.genai = FakeGenai(model)
+        return GeminiGenerationAdapter(api_key="key", model_name="gemini-test"), model
+
+    def test_stream_text_yields_provider_chunks(self) -> None:
+        adapter, model = self._adapter(["Atlas ", "", "streams."])
+
+        self.assertEqual(list(adapter.stream_text("prompt")), ["Atlas ", "streams."])
+        self.assertEqual(model.stream_flags, [True])
+
+    def test_stream_text_rejects_empty_stream(self) -> None:
+        adapter, _ = self._adapter([])
+
+        with self.assertRaises(GeminiGenerationError):
+            list(adapter.stream_text("prompt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
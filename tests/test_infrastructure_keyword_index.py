@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.application import TextRecord
+from src.infrastructure.keyword_index import KeywordIndexError, SqliteKeywordIndex
+
+
+def _records() -> list[TextRecord]:
+    return [
+        TextRecord("chunk-1", "Atlas retorna ERR-4012 quando o token expira.", {"text": "ignored", "source_path": "a.txt"}),
+        TextRecord("chunk-2", "O erro 4012 é raro; ERR aparece em todos os logs.", {"source_path": "b.txt"}),
+        TextRecord("chunk-3", "Configuração de ingestão e embeddings.", {"source_path": "c.txt"}),
+    ]
+
+
+class SqliteKeywordIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SqliteKeywordIndex()
+        self.index.index_texts(_records())
+
+    def tearDown(self) -> None:
+        self.index.close()
+
+    def test_identifier_terms_match_as_phrases(self) -> None:
+        results = self.index.search_text("o que significa ERR-4012?", limit=5)
+
+        self.assertEqual(results[0].chunk_id, "chunk-1")
+        self.assertGreater(results[0].score, 0.0)
+        self.assertEqual(results[0].payload["text"], "Atlas retorna ERR-4012 quando o token expira.")
+        self.assertEqual(results[0].payload["source_path"], "a.txt")
+
+    def test_diacritics_are_folded(self) -> None:
+        results = self.index.search_text("configuracao ingestao", limit=5)
+
+        self.assertEqual([item.chunk_id for item in results], ["chunk-3"])
+
+    def test_reindex_and_delete_replace_previous_text(self) -> None:
+        self.index.index_texts([TextRecord("chunk-3", "Texto novo sobre quantização.", {})])
+        self.index.delete_texts(["chunk-1", "unknown"])
+
+        self.assertEqual(self.index.search_text("ingestão", limit=5), [])
+        self.assertEqual([item.chunk_id for item in self.index.search_text("quantização", 5)], ["chunk-3"])
+        self.assertNotIn("chunk-1", [item.chunk_id for item in self.index.search_text("ERR-4012", 5)])
+
+    def test_punctuation_only_query_returns_nothing(self) -> None:
+        self.assertEqual(self.index.search_text("?!", limit=5), [])
+
+    def test_index_persists_on_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "keywords.sqlite3"
+            index = SqliteKeywordIndex(path)
+            index.index_texts(_records())
+            index.close()
+
+            reopened = SqliteKeywordIndex(path)
+            results = reopened.search_text("embeddings", limit=1)
+            reopened.close()
+
+            self.assertEqual(results[0].chunk_id, "chunk-3")
+
+    def test_limit_must_be_positive(self) -> None:
+        with self.assertRaises(KeywordIndexError):
+            self.index.search_text("atlas", limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import io
+import json
+import logging
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+from src.infrastructure.logging import JsonFormatter, SamplingFilter, configure_logging, shutdown_logging
+from src.infrastructure.logging.setup import default_json_encoder, stdlib_json_encoder
+
+
+def _record(name: str = "atlas.test", level: int = logging.INFO, msg: str = "hello %s", args: tuple = ("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class JsonFormatterTests(unittest.TestCase):
+    def test_payload_fields_and_timestamp_come_from_the_record(self) -> None:
+        record = _record()
+        record.created = 0.0
+        record.correlation_id = "abc"
+        record.fields = {"stage": "search", "level": "ignored"}
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(
+            payload,
+            {
+                "timestamp": "1970-01-01T00:00:00+00:00",
+                "level": "INFO",
+                "logger": "atlas.test",
+                "message": "hello world",
+                "correlation_id": "abc",
+                "stage": "search",
+            },
+        )
+
+    def test_uses_the_given_encoder(self) -> None:
+        formatter = JsonFormatter(encoder=lambda payload: "|".join(payload))
+
+        self.assertEqual(formatter.format(_record()), "timestamp|level|logger|message")
+
+    def test_orjson_leaves_non_native_values_to_the_stdlib_encoder(self) -> None:
+        def dumps(payload, default, option):
+            # Stand-in for orjson: compact output, ``default`` called for unsupported types.
+            return json.dumps(payload, default=default, separators=(",", ":")).encode("utf-8")
+
+        fake_orjson = SimpleNamespace(dumps=dumps, OPT_PASSTHROUGH_DATETIME=1, OPT_PASSTHROUGH_DATACLASS=2)
+        with mock.patch("src.infrastructure.logging.setup.import_optional", return_value=fake_orjson):
+            encode = default_json_encoder()
+
+        self.assertEqual(encode({"a": 1}), '{"a":1}')
+        payload = {"at": datetime(2024, 1, 2, tzinfo=timezone.utc)}
+        self.assertEqual(encode(payload), stdlib_json_encoder(payload))
+        self.assertIn("2024-01-02 00:00:00+00:00", encode(payload))
+
+
+class SamplingFilterTests(unittest.TestCase):
+    def test_keeps_one_debug_record_in_n_per_logger(self) -> None:
+        sampling = SamplingFilter({"atlas.rag": 0.25, "atlas.rag.noisy": 0.0})
+
+        kept = [sampling.filter(_record("atlas.rag.search", logging.DEBUG)) for _ in range(8)]
+
+        self.assertEqual(kept, [True, False, False, False, True, False, False, False])
+        self.assertFalse(sampling.filter(_record("atlas.rag.noisy", logging.DEBUG)))
+        self.assertTrue(sampling.filter(_record("atlas.rag.noisy", logging.INFO)))
+        self.assertTrue(sampling.filter(_record("atlas.other", logging.DEBUG)))
+
+    def test_rejects_rates_outside_unit_interval(self) -> None:
+        with self.assertRaises(ValueError):
+            SamplingFilter({"atlas": 1.5})
+
+
+class ConfigureLoggingTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        shutdown_logging()
+        logging.getLogger().handlers.clear()
+
+    def test_queued_records_are_written_on_shutdown(self) -> None:
+        stream = io.StringIO()
+        configure_logging("DEBUG", stream=stream, sample_rates={"atlas.sampled": 0.5})
+        logger = logging.getLogger("atlas.sampled")
+        payload = {"mutable": 1}
+
+        for index in range(4):
+            logger.debug("event %d %s", index, payload)
+        payload["mutable"] = 2
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(
+            [line["message"] for line in lines],
+            ["event 0 {'mutable': 1}", "event 2 {'mutable': 1}", "failed"],
+        )
+
+    def test_text_format_keeps_tracebacks(self) -> None:
+        stream = io.StringIO()
+        configure_logging("INFO", log_format="text", stream=stream)
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logging.getLogger("atlas.text").exception("failed")
+        shutdown_logging()
+        logging.getLogger("atlas.text").info("after shutdown")
+
+        output = stream.getvalue()
+        self.assertIn("RuntimeError: boom", output)
+        self.assertIn("after shutdown", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
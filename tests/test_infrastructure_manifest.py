@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.application import ManifestEntry
+from src.infrastructure.manifest import JsonManifestStore, ManifestStoreError
+
+
+class JsonManifestStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "state" / "manifest.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_missing_file_loads_empty_manifest(self) -> None:
+        self.assertEqual(JsonManifestStore(self.path).load(), {})
+
+    def test_round_trip_preserves_entries(self) -> None:
+        entry = ManifestEntry(
+            source_path="docs/a.txt",
+            size=120,
+            mtime_ns=1_700_000_000_000_000_000,
+            content_hash="abc",
+            chunking="bytes:100:20",
+            chunk_hashes={0: "h0", 2: "h2"},
+        )
+        store = JsonManifestStore(self.path)
+
+        store.save({entry.source_path: entry})
+
+        self.assertEqual(store.load(), {"docs/a.txt": entry})
+        self.assertFalse(self.path.with_name("manifest.json.tmp").exists())
+
+    def test_rejects_corrupt_manifest(self) -> None:
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text("{not json", encoding="utf-8")
+
+        with self.assertRaises(ManifestStoreError):
+            JsonManifestStore(self.path).load()
+
+
+if __name__ == "__main__":
+    unittest.main()
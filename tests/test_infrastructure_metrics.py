@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import logging
+import unittest
+
+from src.infrastructure.logging.setup import JsonFormatter
+from src.infrastructure.metrics import InMemoryLatencyHistogram
+
+
+class InMemoryLatencyHistogramTests(unittest.TestCase):
+    def test_quantiles_interpolate_within_buckets(self) -> None:
+        histogram = InMemoryLatencyHistogram(buckets=(0.1, 0.2, 0.4))
+        for seconds in [0.05] * 50 + [0.15] * 45 + [0.3] * 5:
+            histogram.observe_latency("embedding", seconds)
+
+        self.assertAlmostEqual(histogram.quantile("embedding", 0.5), 0.1)
+        self.assertAlmostEqual(histogram.quantile("embedding", 0.95), 0.2)
+        self.assertAlmostEqual(histogram.quantile("embedding", 0.99), 0.36)
+        self.assertIsNone(histogram.quantile("generation", 0.5))
+        self.assertEqual(histogram.snapshot()["embedding"]["count"], 100)
+
+    def test_values_beyond_last_bucket_report_that_bound(self) -> None:
+        histogram = InMemoryLatencyHistogram(buckets=(0.1, 1.0))
+        histogram.observe_latency("generation", 12.0)
+
+        self.assertEqual(histogram.quantile("generation", 0.99), 1.0)
+
+    def test_prometheus_export(self) -> None:
+        histogram = InMemoryLatencyHistogram(buckets=(0.1, 1.0))
+        histogram.observe_latency("vector_search", 0.05)
+        histogram.observe_latency("vector_search", 0.5)
+
+        lines = histogram.to_prometheus().splitlines()
+
+        self.assertIn("# TYPE atlas_rag_stage_latency_seconds histogram", lines)
+        self.assertIn('atlas_rag_stage_latency_seconds_bucket{stage="vector_search",le="0.1"} 1', lines)
+        self.assertIn('atlas_rag_stage_latency_seconds_bucket{stage="vector_search",le="+Inf"} 2', lines)
+        self.assertIn('atlas_rag_stage_latency_seconds_count{stage="vector_search"} 2', lines)
+        self.assertIn('atlas_rag_stage_latency_seconds_quantile{stage="vector_search",quantile="0.5"} 0.1', lines)
+
+
+class JsonFormatterTests(unittest.TestCase):
+    def test_structured_fields_are_merged_without_overriding_core_keys(self) -> None:
+        record = logging.LogRecord("atlas.rag", logging.INFO, __file__, 1, "done", None, None)
+        record.correlation_id = "req-1"
+        record.fields = {"total_ms": 12.5, "message": "ignored"}
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(payload["correlation_id"], "req-1")
+        self.assertEqual(payload["total_ms"], 12.5)
+        self.assertEqual(payload["message"], "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
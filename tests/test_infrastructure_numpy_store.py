@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.application import EmbeddingRecord, VectorSearchOptions, VectorSearchQuery
+from src.infrastructure.vector_store import (
+    NumpyStoreSettings,
+    NumpyVectorStore,
+    VectorStoreInfrastructureError,
+)
+
+
+def _records() -> list[EmbeddingRecord]:
+    return [
+        EmbeddingRecord("chunk-x", [1.0, 0.0, 0.0], {"text": "x axis"}),
+        EmbeddingRecord("chunk-y", [0.0, 2.0, 0.0], {"text": "y axis"}),
+        EmbeddingRecord("chunk-xy", [1.0, 1.0, 0.0], {"text": "diagonal"}),
+    ]
+
+
+class NumpyVectorStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = NumpyVectorStore(NumpyStoreSettings(embedding_size=3, initial_capacity=2))
+        self.store.ensure_collection()
+
+    def test_search_ranks_by_cosine_similarity(self) -> None:
+        report = self.store.upsert_embeddings(_records())
+
+        results = self.store.search_similar([3.0, 0.0, 0.0], limit=2)
+
+        self.assertEqual(report.upserted, 3)
+        self.assertEqual([item.chunk_id for item in results], ["chunk-x", "chunk-xy"])
+        self.assertAlmostEqual(results[1].score, 0.7071, places=3)
+        self.assertEqual(results[0].payload, {"text": "x axis"})
+
+    def test_score_threshold_and_batch_search(self) -> None:
+        self.store.upsert_embeddings(_records())
+
+        results = self.store.search_similar_batch(
+            [
+                VectorSearchQuery([0.0, 1.0, 0.0], limit=3, score_threshold=0.5),
+                VectorSearchQuery([1.0, 0.0, 0.0], limit=1),
+            ]
+        )
+
+        self.assertEqual([item.chunk_id for item in results[0]], ["chunk-y", "chunk-xy"])
+        self.assertEqual([item.chunk_id for item in results[1]], ["chunk-x"])
+
+    def test_delete_tombstones_rows_and_reuses_them(self) -> None:
+        self.store.upsert_embeddings(_records())
+        self.store.delete_embeddings(["chunk-x", "unknown"])
+
+        self.assertNotIn("chunk-x", [item.chunk_id for item in self.store.search_similar([1.0, 0.0, 0.0], 3)])
+
+        self.store.upsert_embedding("chunk-z", [0.0, 0.0, 1.0], {"text": "z axis"})
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.search_similar([0.0, 0.0, 1.0], 1)[0].chunk_id, "chunk-z")
+
+    def test_invalid_records_are_reported_per_chunk(self) -> None:
+        report = self.store.upsert_embeddings(
+            [
+                EmbeddingRecord("short", [1.0], {}),
+                EmbeddingRecord("zero", [0.0, 0.0, 0.0], {}),
+                EmbeddingRecord("ok", [0.0, 1.0, 0.0], {}),
+            ]
+        )
+
+        self.assertEqual(report.upserted, 1)
+        self.assertEqual(set(report.failures), {"short", "zero"})
+
+    def test_query_size_is_validated(self) -> None:
+        with self.assertRaises(VectorStoreInfrastructureError):
+            self.store.search_similar([1.0, 0.0], limit=1)
+
+
+class NumpyVectorStorePersistenceTests(unittest.TestCase):
+    def test_reopened_store_serves_persisted_vectors(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            settings = NumpyStoreSettings(embedding_size=3, path=Path(directory), initial_capacity=1)
+            store = NumpyVectorStore(settings)
+            store.upsert_embeddings(_records())
+            store.delete_embeddings(["chunk-y"])
+            store.close()
+
+            reopened = NumpyVectorStore(settings)
+            reopened.ensure_collection()
+            results = reopened.search_similar([1.0, 1.0, 0.0], limit=3)
+            reopened.close()
+
+            self.assertEqual([item.chunk_id for item in results], ["chunk-xy", "chunk-x"])
+            self.assertEqual(results[0].payload, {"text": "diagonal"})
+
+    def test_reopening_with_different_size_fails(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            store = NumpyVectorStore(NumpyStoreSettings(embedding_size=3, path=directory))
+            store.ensure_collection()
+            store.close()
+
+            with self.assertRaises(VectorStoreInfrastructureError):
+                NumpyVectorStore(NumpyStoreSettings(embedding_size=4, path=directory)).ensure_collection()
+
+    def test_vector_file_is_synced_at_checkpoints_not_per_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            settings = NumpyStoreSettings(embedding_size=3, path=directory, flush_interval_rows=4)
+            store = NumpyVectorStore(settings)
+            store.ensure_collection()
+            with mock.patch.object(np.memmap, "flush", autospec=True) as flush:
+                for record in _records() * 2:
+                    store.upsert_embeddings([record])
+                self.assertEqual(flush.call_count, 1)
+                store.close()
+                self.assertEqual(flush.call_count, 2)
+
+
+def _random_records(count: int, size: int, seed: int = 7) -> list[EmbeddingRecord]:
+    generator = random.Random(seed)
+    return [
+        EmbeddingRecord(f"chunk-{index}", [generator.gauss(0.0, 1.0) for _ in range(size)], {"index": index})
+        for index in range(count)
+    ]
+
+
+class HNSWIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.records = _random_records(300, 8)
+        self.exact = NumpyVectorStore(NumpyStoreSettings(embedding_size=8))
+        self.exact.upsert_embeddings(self.records)
+
+    def _hnsw_settings(self, path: str | None = None) -> NumpyStoreSettings:
+        return NumpyStoreSettings(
+            embedding_size=8,
+            path=path,
+            initial_capacity=16,
+            index="hnsw",
+            hnsw_m=8,
+            hnsw_ef_construction=64,
+            hnsw_ef_search=64,
+        )
+
+    def test_graph_search_matches_exact_scan(self) -> None:
+        store = NumpyVectorStore(self._hnsw_settings())
+        for start in range(0, len(self.records), 50):
+            store.upsert_embeddings(self.records[start : start + 50])
+
+        queries = [record.embedding for record in _random_records(20, 8, seed=11)]
+        found = 0
+        for query in queries:
+            expected = {item.chunk_id for item in self.exact.search_similar(query, limit=5)}
+            found += len(expected & {item.chunk_id for item in store.search_similar(query, limit=5)})
+
+        self.assertGreaterEqual(found / (5 * len(queries)), 0.9)
+
+    def test_deleted_and_overwritten_chunks_are_not_returned_stale(self) -> None:
+        store = NumpyVectorStore(self._hnsw_settings())
+        store.upsert_embeddings(self.records)
+        target = self.records[0]
+
+        store.delete_embeddings([target.chunk_id])
+        self.assertNotIn(target.chunk_id, [item.chunk_id for item in store.search_similar(target.embedding, 3)])
+
+        moved = self.records[1]
+        store.upsert_embedding(moved.chunk_id, target.embedding, {"moved": True})
+        best = store.search_similar(target.embedding, 1)[0]
+        self.assertEqual(best.chunk_id, moved.chunk_id)
+        self.assertAlmostEqual(best.score, 1.0, places=5)
+        self.assertEqual(len(store), len(self.records) - 1)
+
+    def test_searches_run_while_rows_are_linked(self) -> None:
+        store = NumpyVectorStore(self._hnsw_settings())
+        store.upsert_embeddings(self.records[:100])
+        target = self.records[0]
+        graph = store._index
+        link = graph.add
+        seen: list[list[str]] = []
+
+        def add_while_searching(row: int, vectors: object) -> None:
+            link(row, vectors)
+            if not seen:
+                search = threading.Thread(
+                    target=lambda: seen.append([item.chunk_id for item in store.search_similar(target.embedding, 3)])
+                )
+                search.start()
+                search.join(timeout=5)
+                self.assertFalse(search.is_alive())
+
+        with mock.patch.object(graph, "add", side_effect=add_while_searching):
+            store.upsert_embeddings([EmbeddingRecord("chunk-new", target.embedding, {})])
+
+        # Mid-link the search answered from the published rows only.
+        self.assertEqual(seen[0][0], target.chunk_id)
+        self.assertNotIn("chunk-new", seen[0])
+        self.assertEqual(len(seen[0]), 3)
+        self.assertIn("chunk-new", [item.chunk_id for item in store.search_similar(target.embedding, 2)])
+
+    def test_graph_is_persisted_and_reloaded(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            store = NumpyVectorStore(self._hnsw_settings(directory))
+            store.upsert_embeddings(self.records)
+            query = self.records[42].embedding
+            before = [item.chunk_id for item in store.search_similar(query, 5)]
+            store.close()
+
+            self.assertTrue((Path(directory) / "hnsw.npz").exists())
+            reopened = NumpyVectorStore(self._hnsw_settings(directory))
+            after = [item.chunk_id for item in reopened.search_similar(query, 5)]
+            reopened.close()
+
+            self.assertEqual(before, after)
+            self.assertEqual(after[0], "chunk-42")
+
+    def test_reopened_store_does_not_reuse_tombstoned_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            store = NumpyVectorStore(self._hnsw_settings(directory))
+            store.upsert_embeddings(self.records[:10])
+            store.delete_embeddings([record.chunk_id for record in self.records[5:10]])
+            store.close()
+
+            reopened = NumpyVectorStore(self._hnsw_settings(directory))
+            reopened.ensure_collection()
+            self.assertEqual(reopened.tombstones, 5)
+            reopened.upsert_embeddings(self.records[10:12])
+            best = reopened.search_similar(self.records[11].embedding, 1)[0]
+            reopened.close()
+
+            self.assertEqual(best.chunk_id, "chunk-11")
+
+    def test_compact_reclaims_tombstoned_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            store = NumpyVectorStore(self._hnsw_settings(directory))
+            store.upsert_embeddings(self.records)
+            store.delete_embeddings([record.chunk_id for record in self.records[::2]])
+            store.upsert_embeddings(self.records[1:20:2])
+
+            self.assertEqual(store.tombstones, len(self.records) // 2 + 10)
+            self.assertEqual(store.compact(), len(self.records) // 2 + 10)
+            self.assertEqual(store.tombstones, 0)
+            self.assertEqual(store.compact(), 0)
+            store.close()
+
+            reopened = NumpyVectorStore(self._hnsw_settings(directory))
+            reopened.upsert_embeddings(self.records[:1])
+            self.assertEqual(len(reopened), len(self.records) // 2 + 1)
+            for record in (self.records[0], self.records[99], self.records[201]):
+                self.assertEqual(reopened.search_similar(record.embedding, 1)[0].chunk_id, record.chunk_id)
+            reopened.close()
+
+    def test_invalid_graph_parameters_are_rejected(self) -> None:
+        with self.assertRaises(VectorStoreInfrastructureError):
+            NumpyVectorStore(NumpyStoreSettings(embedding_size=8, index="hnsw", hnsw_m=1))
+
+
+class QuantizedNumpyVectorStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.records = _random_records(400, 32)
+        self.exact = NumpyVectorStore(NumpyStoreSettings(embedding_size=32))
+        self.exact.upsert_embeddings(self.records)
+        self.queries = [record.embedding for record in _random_records(10, 32, seed=3)]
+
+    def _recall(self, store: NumpyVectorStore, options: VectorSearchOptions | None = None) -> float:
+        found = 0
+        for query in self.queries:
+            expected = {item.chunk_id for item in self.exact.search_similar(query, limit=5)}
+            found += len(expected & {item.chunk_id for item in store.search_similar(query, 5, options=options)})
+        return found / (5 * len(self.queries))
+
+    def test_int8_rescored_search_matches_exact_scores(self) -> None:
+        store = NumpyVectorStore(NumpyStoreSettings(embedding_size=32, quantization="int8"))
+        store.upsert_embeddings(self.records)
+
+        self.assertGreaterEqual(self._recall(store), 0.9)
+        query = self.queries[0]
+        self.assertAlmostEqual(
+            store.search_similar(query, 1)[0].score,
+            self.exact.search_similar(query, 1)[0].score,
+            places=5,
+        )
+
+    def test_binary_search_rescores_oversampled_candidates(self) -> None:
+        store = NumpyVectorStore(
+            NumpyStoreSettings(embedding_size=32, quantization="binary", search_oversampling=16.0)
+        )
+        store.upsert_embeddings(self.records)
+
+        self.assertGreaterEqual(self._recall(store), 0.9)
+        self.assertLess(
+            self._recall(store, VectorSearchOptions(oversampling=1.0, rescore=False)),
+            self._recall(store),
+        )
+
+    def test_codes_are_rebuilt_when_reopened(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            settings = NumpyStoreSettings(embedding_size=32, path=directory, quantization="int8")
+            store = NumpyVectorStore(settings)
+            store.upsert_embeddings(self.records)
+            store.close()
+
+            reopened = NumpyVectorStore(settings)
+            best = reopened.search_similar(self.records[7].embedding, 1)[0]
+            reopened.close()
+
+            self.assertEqual(best.chunk_id, "chunk-7")
+
+    def test_in_memory_store_spills_full_precision_rows_to_disk(self) -> None:
+        store = NumpyVectorStore(NumpyStoreSettings(embedding_size=32, initial_capacity=16, quantization="int8"))
+        store.upsert_embeddings(self.records)
+
+        self.assertIsInstance(store._matrix, np.memmap)
+        self.assertGreaterEqual(self._recall(store), 0.9)
+        self.assertEqual(store.search_similar(self.records[7].embedding, 1)[0].chunk_id, "chunk-7")
+        store.close()
+
+    def test_quantization_requires_flat_index(self) -> None:
+        with self.assertRaises(VectorStoreInfrastructureError):
+            NumpyVectorStore(NumpyStoreSettings(embedding_size=8, index="hnsw", quantization="int8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
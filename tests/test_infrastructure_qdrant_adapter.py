@@ -1,60 +1,151 @@
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
 import unittest
+from unittest import mock
+
+from src.application import EmbeddingRecord, VectorSearchOptions, VectorSearchQuery
 
 import src.infrastructure.vector_store.qdrant_adapter as adapter
+from src.infrastructure.vector_store.async_qdrant_adapter import AsyncQdrantVectorStore
+from src.infrastructure.registry import import_optional
+from src.infrastructure.vector_store.qdrant_client_factory import QdrantClientFactory, QdrantClientSettings
 from src.infrastructure.vector_store.qdrant_adapter import (
     QdrantSettings,
     QdrantVectorStore,
     VectorStoreInfrastructureError,
 )
 
+qdrant_client = import_optional("qdrant_client")
+
+
+def _with_client_spec(fake: object, class_name: str) -> object:
+    """Restrict ``fake`` to the real client's methods and signatures when qdrant-client is installed.
+
+    Calls to methods the client no longer has, or with arguments it does not
+    accept, then fail instead of silently reaching the fake.
+    """
+    if qdrant_client is None:
+        return fake
+    client = mock.create_autospec(getattr(qdrant_client, class_name), instance=True)
+    for name in dir(fake):
+        if not name.startswith("_") and callable(getattr(fake, name)):
+            getattr(client, name).side_effect = getattr(fake, name)
+    return client
+
 
 class FakeQdrantClient:
     def __init__(self) -> None:
         self.exists = False
         self.created = False
         self.upsert_called = False
+        self.upsert_calls: list[dict[str, object]] = []
+        self.fail_point_ids: set[str] = set()
+        self.delete_calls: list[dict[str, object]] = []
+        self.query_batch_calls: list[dict[str, object]] = []
+        self.create_calls: list[dict[str, object]] = []
+        self.query_calls: list[dict[str, object]] = []
+        self._lock = threading.Lock()
         self.vector_size = 3
         self.distance = "cosine"
+        self.quantization_config: object | None = None
 
-    def collection_exists(self, collection_name: str) -> bool:
+    def collection_exists(self, collection_name: str, **kwargs: object) -> bool:
         return self.exists
 
     def create_collection(self, **kwargs: object) -> None:
         self.created = True
+        self.create_calls.append(kwargs)
 
     def get_collection(self, **kwargs: object) -> SimpleNamespace:
         return SimpleNamespace(
             config=SimpleNamespace(
                 params=SimpleNamespace(
                     vectors=SimpleNamespace(size=self.vector_size, distance=self.distance)
-                )
+                ),
+                quantization_config=self.quantization_config,
             )
         )
 
     def upsert(self, **kwargs: object) -> None:
-        self.upsert_called = True
+        with self._lock:
+            self.upsert_called = True
+            self.upsert_calls.append(kwargs)
+        point_ids = {point["id"] for point in kwargs["points"]}
+        if point_ids & self.fail_point_ids:
+            raise RuntimeError("batch rejected")
+
+    def delete(self, **kwargs: object) -> None:
+        self.delete_calls.append(kwargs)
+
+    def query_points(self, **kwargs: object) -> SimpleNamespace:
+        self.query_calls.append(kwargs)
+        return SimpleNamespace(points=[SimpleNamespace(id="chunk-1", score=0.99, payload={"document_id": "doc-1"})])
+
+    def query_batch_points(self, **kwargs: object) -> list[SimpleNamespace]:
+        self.query_batch_calls.append(kwargs)
+        return [
+            SimpleNamespace(points=[SimpleNamespace(id=f"chunk-{index}", score=0.9, payload=None)])
+            for index, _ in enumerate(kwargs["requests"])
+        ]
+
+
+class FakeAsyncQdrantClient:
+    """Async facade over the sync fake, mirroring AsyncQdrantClient's API."""
+
+    def __init__(self) -> None:
+        self.sync = FakeQdrantClient()
 
-    def search(self, **kwargs: object) -> list[SimpleNamespace]:
-        return [SimpleNamespace(id="chunk-1", score=0.99, payload={"document_id": "doc-1"})]
+    async def collection_exists(self, collection_name: str, **kwargs: object) -> bool:
+        return self.sync.collection_exists(collection_name)
+
+    async def create_collection(self, **kwargs: object) -> None:
+        self.sync.create_collection(**kwargs)
+
+    async def get_collection(self, **kwargs: object) -> SimpleNamespace:
+        return self.sync.get_collection(**kwargs)
+
+    async def upsert(self, **kwargs: object) -> None:
+        self.sync.upsert(**kwargs)
+
+    async def delete(self, **kwargs: object) -> None:
+        self.sync.delete(**kwargs)
+
+    async def query_points(self, **kwargs: object) -> SimpleNamespace:
+        return self.sync.query_points(**kwargs)
+
+
+def _install_fake_models() -> None:
+    adapter.qdrant_models = adapter.qdrant_models or SimpleNamespace(
+        VectorParams=lambda **kwargs: kwargs,
+        Distance=SimpleNamespace(COSINE="cosine"),
+        PointStruct=lambda **kwargs: kwargs,
+        PointIdsList=lambda **kwargs: kwargs,
+        QueryRequest=lambda **kwargs: kwargs,
+        ScalarQuantization=lambda **kwargs: kwargs,
+        ScalarQuantizationConfig=lambda **kwargs: kwargs,
+        ScalarType=SimpleNamespace(INT8="int8"),
+        BinaryQuantization=lambda **kwargs: kwargs,
+        BinaryQuantizationConfig=lambda **kwargs: kwargs,
+        SearchParams=lambda **kwargs: kwargs,
+        QuantizationSearchParams=lambda **kwargs: kwargs,
+    )
 
 
 class QdrantAdapterTests(unittest.TestCase):
     def setUp(self) -> None:
-        adapter.qdrant_models = adapter.qdrant_models or SimpleNamespace(
-            VectorParams=lambda **kwargs: kwargs,
-            Distance=SimpleNamespace(COSINE="cosine"),
-            PointStruct=lambda **kwargs: kwargs,
-        )
+        _install_fake_models()
         self.settings = QdrantSettings(
             url="http://localhost:6333",
             collection_name="atlas_chunks",
             embedding_size=3,
         )
         self.client = FakeQdrantClient()
-        self.store = QdrantVectorStore(settings=self.settings, client=self.client)
+        self.store = QdrantVectorStore(
+            settings=self.settings,
+            client=_with_client_spec(self.client, "QdrantClient"),
+        )
 
     def test_ensure_collection_creates_when_absent(self) -> None:
         self.store.ensure_collection()
@@ -87,6 +178,199 @@ class QdrantAdapterTests(unittest.TestCase):
                 payload={},
             )
 
+    def test_upsert_embeddings_splits_batches_and_waits_on_last(self) -> None:
+        store = QdrantVectorStore(
+            settings=QdrantSettings(
+                url="http://localhost:6333",
+                collection_name="atlas_chunks",
+                embedding_size=3,
+                upsert_batch_size=2,
+            ),
+            client=_with_client_spec(self.client, "QdrantClient"),
+        )
+        records = [
+            EmbeddingRecord(chunk_id=f"chunk-{index}", embedding=[0.1, 0.2, 0.3], payload={})
+            for index in range(5)
+        ]
+
+        report = store.upsert_embeddings(records)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(report.upserted, 5)
+        self.assertEqual([len(call["points"]) for call in self.client.upsert_calls][-1], 1)
+        self.assertEqual([call["wait"] for call in self.client.upsert_calls].count(True), 1)
+        self.assertTrue(self.client.upsert_calls[-1]["wait"])
+
+    def test_upsert_embeddings_bounds_batches_by_bytes(self) -> None:
+        store = QdrantVectorStore(
+            settings=QdrantSettings(
+                url="http://localhost:6333",
+                collection_name="atlas_chunks",
+                embedding_size=3,
+                upsert_max_batch_bytes=200,
+            ),
+            client=_with_client_spec(self.client, "QdrantClient"),
+        )
+        records = [
+            EmbeddingRecord(chunk_id=f"chunk-{index}", embedding=[0.1, 0.2, 0.3], payload={"text": "x" * 120})
+            for index in range(3)
+        ]
+
+        store.upsert_embeddings(records)
+
+        self.assertEqual(len(self.client.upsert_calls), 3)
+
+    def test_upsert_embeddings_reports_failures_per_chunk(self) -> None:
+        self.client.fail_point_ids = {"chunk-1"}
+        records = [
+            EmbeddingRecord(chunk_id="chunk-1", embedding=[0.1, 0.2, 0.3], payload={}),
+            EmbeddingRecord(chunk_id="chunk-2", embedding=[0.1], payload={}),
+        ]
+
+        report = self.store.upsert_embeddings(records)
+
+        self.assertEqual(report.upserted, 0)
+        self.assertEqual(set(report.failures), {"chunk-1", "chunk-2"})
+        self.assertIn("size mismatch", report.failures["chunk-2"])
+
+    def test_repeated_chunk_ids_keep_the_last_record_and_count_once(self) -> None:
+        records = [
+            EmbeddingRecord("a", [0.1, 0.2, 0.3], {"version": 1}),
+            EmbeddingRecord("b", [0.1, 0.2, 0.3], {}),
+            EmbeddingRecord("a", [0.3, 0.2, 0.1], {"version": 2}),
+            EmbeddingRecord("c", [0.1, 0.2, 0.3], {}),
+        ]
+        self.client.fail_point_ids = {"c"}
+        store = QdrantVectorStore(
+            settings=QdrantSettings(
+                url="http://localhost:6333",
+                collection_name="atlas_chunks",
+                embedding_size=3,
+                upsert_batch_size=2,
+            ),
+            client=_with_client_spec(self.client, "QdrantClient"),
+        )
+
+        report = store.upsert_embeddings(records)
+
+        points = sorted(
+            (point for call in self.client.upsert_calls for point in call["points"]), key=lambda point: point["id"]
+        )
+        self.assertEqual([(point["id"], point["payload"]) for point in points], [("a", {"version": 2}), ("b", {}), ("c", {})])
+        self.assertEqual(report.upserted, 2)
+        self.assertEqual(set(report.failures), {"c"})
+
+    def test_delete_embeddings_waits_for_completion(self) -> None:
+        self.store.delete_embeddings(["chunk-1", "chunk-2"])
+
+        self.assertEqual(len(self.client.delete_calls), 1)
+        self.assertTrue(self.client.delete_calls[0]["wait"])
+        selector = self.client.delete_calls[0]["points_selector"]
+        points = selector["points"] if isinstance(selector, dict) else selector.points
+        self.assertEqual(points, ["chunk-1", "chunk-2"])
+
+    def test_search_similar_batch_uses_one_round_trip(self) -> None:
+        queries = [
+            VectorSearchQuery(query_embedding=[0.1, 0.2, 0.3], limit=2),
+            VectorSearchQuery(query_embedding=[0.3, 0.2, 0.1], limit=4, score_threshold=0.5),
+        ]
+
+        results = self.store.search_similar_batch(queries)
+
+        self.assertEqual(len(self.client.query_batch_calls), 1)
+        self.assertEqual([[item.chunk_id for item in items] for items in results], [["chunk-0"], ["chunk-1"]])
+        self.assertEqual(results[0][0].payload, {})
+
+    def test_search_similar_batch_validates_every_query(self) -> None:
+        with self.assertRaises(VectorStoreInfrastructureError):
+            self.store.search_similar_batch([VectorSearchQuery(query_embedding=[0.1], limit=1)])
+
+    def test_quantization_is_applied_on_create_and_search(self) -> None:
+        client = FakeQdrantClient()
+        store = QdrantVectorStore(
+            settings=QdrantSettings(
+                url="http://localhost:6333",
+                collection_name="atlas_chunks",
+                embedding_size=3,
+                quantization="int8",
+                search_oversampling=3.0,
+            ),
+            client=_with_client_spec(client, "QdrantClient"),
+        )
+
+        store.ensure_collection()
+        store.search_similar([0.1, 0.2, 0.3], limit=2)
+        store.search_similar([0.1, 0.2, 0.3], limit=2, options=VectorSearchOptions(rescore=False))
+
+        self.assertEqual(client.create_calls[0]["quantization_config"]["scalar"]["type"], "int8")
+        self.assertEqual(
+            [call["search_params"]["quantization"] for call in client.query_calls],
+            [{"rescore": True, "oversampling": 3.0}, {"rescore": False, "oversampling": 3.0}],
+        )
+
+    def test_existing_collection_must_match_configured_quantization(self) -> None:
+        client = FakeQdrantClient()
+        client.exists = True
+        store = QdrantVectorStore(
+            settings=QdrantSettings(
+                url="http://localhost:6333",
+                collection_name="atlas_chunks",
+                embedding_size=3,
+                quantization="int8",
+            ),
+            client=_with_client_spec(client, "QdrantClient"),
+        )
+
+        with self.assertRaisesRegex(VectorStoreInfrastructureError, "Expected int8, got none"):
+            store.ensure_collection()
+
+        client.quantization_config = SimpleNamespace(binary=SimpleNamespace(always_ram=True))
+        with self.assertRaisesRegex(VectorStoreInfrastructureError, "Expected int8, got binary"):
+            store.ensure_collection()
+
+        client.quantization_config = SimpleNamespace(scalar=SimpleNamespace(type="int8"))
+        store.ensure_collection()
+        self.assertFalse(client.created)
+
+        self.client.exists = True
+        self.client.quantization_config = client.quantization_config
+        with self.assertRaisesRegex(VectorStoreInfrastructureError, "Expected none, got int8"):
+            self.store.ensure_collection()
+
+    def test_unquantized_collection_sends_no_search_params(self) -> None:
+        self.store.ensure_collection()
+        self.store.search_similar([0.1, 0.2, 0.3], limit=1, options=VectorSearchOptions(oversampling=4.0))
+
+        self.assertIsNone(self.client.create_calls[0]["quantization_config"])
+        self.assertIsNone(self.client.query_calls[0]["search_params"])
+
+    def test_ids_only_mode_keeps_text_out_of_points_and_results(self) -> None:
+        client = FakeQdrantClient()
+        store = QdrantVectorStore(
+            settings=QdrantSettings(
+                url="http://localhost:6333",
+                collection_name="atlas_chunks",
+                embedding_size=3,
+                store_text=False,
+                search_with_payload=False,
+            ),
+            client=_with_client_spec(client, "QdrantClient"),
+        )
+
+        store.upsert_embedding("chunk-1", [0.1, 0.2, 0.3], {"text": "hello", "document_id": "doc-1"})
+        store.search_similar([0.1, 0.2, 0.3], limit=1)
+        store.search_similar_batch([VectorSearchQuery(query_embedding=[0.1, 0.2, 0.3], limit=1)])
+
+        self.assertEqual(client.upsert_calls[0]["points"][0]["payload"], {"document_id": "doc-1"})
+        position_fields = ["document_id", "sequence_number"]
+        self.assertEqual(client.query_calls[0]["with_payload"], position_fields)
+        self.assertFalse(client.query_calls[0]["with_vectors"])
+        self.assertEqual(client.query_batch_calls[0]["requests"][0]["with_payload"], position_fields)
+
+    def test_invalid_quantization_is_rejected(self) -> None:
+        with self.assertRaises(VectorStoreInfrastructureError):
+            QdrantSettings(url="http://localhost:6333", collection_name="c", embedding_size=3, quantization="pq")
+
     def test_search_returns_port_result_type(self) -> None:
         results = self.store.search_similar(query_embedding=[0.1, 0.2, 0.3], limit=1)
         self.assertEqual(len(results), 1)
@@ -94,5 +378,91 @@ class QdrantAdapterTests(unittest.TestCase):
         self.assertEqual(results[0].payload["document_id"], "doc-1")
 
 
+class AsyncQdrantAdapterTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        _install_fake_models()
+        self.client = FakeAsyncQdrantClient()
+        self.store = AsyncQdrantVectorStore(
+            settings=QdrantSettings(
+                url="http://localhost:6333",
+                collection_name="atlas_chunks",
+                embedding_size=3,
+                upsert_batch_size=2,
+            ),
+            client=_with_client_spec(self.client, "AsyncQdrantClient"),
+        )
+
+    async def test_ensure_collection_validates_existing_schema(self) -> None:
+        self.client.sync.exists = True
+        self.client.sync.vector_size = 99
+
+        with self.assertRaises(VectorStoreInfrastructureError):
+            await self.store.ensure_collection()
+
+    async def test_upsert_embeddings_uses_final_barrier(self) -> None:
+        records = [
+            EmbeddingRecord(chunk_id=f"chunk-{index}", embedding=[0.1, 0.2, 0.3], payload={})
+            for index in range(5)
+        ]
+
+        report = await self.store.upsert_embeddings(records)
+
+        self.assertEqual(report.upserted, 5)
+        self.assertEqual(len(self.client.sync.upsert_calls), 3)
+        self.assertTrue(self.client.sync.upsert_calls[-1]["wait"])
+
+    async def test_repeated_chunk_ids_are_counted_once(self) -> None:
+        records = [
+            EmbeddingRecord("a", [0.1, 0.2, 0.3], {"version": 1}),
+            EmbeddingRecord("a", [0.3, 0.2, 0.1], {"version": 2}),
+            EmbeddingRecord("b", [0.1, 0.2, 0.3], {}),
+            EmbeddingRecord("c", [0.1, 0.2, 0.3], {}),
+        ]
+        self.client.sync.fail_point_ids = {"c"}
+
+        report = await self.store.upsert_embeddings(records)
+
+        points = sorted(
+            (point for call in self.client.sync.upsert_calls for point in call["points"]), key=lambda point: point["id"]
+        )
+        self.assertEqual([(point["id"], point["payload"]) for point in points], [("a", {"version": 2}), ("b", {}), ("c", {})])
+        self.assertEqual(report.upserted, 2)
+        self.assertEqual(set(report.failures), {"c"})
+
+    async def test_search_returns_port_result_type(self) -> None:
+        results = await self.store.search_similar(query_embedding=[0.1, 0.2, 0.3], limit=1)
+
+        self.assertEqual(results[0].chunk_id, "chunk-1")
+
+
+class FromUrlTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.settings = QdrantSettings(url="http://qdrant:6333", collection_name="c", embedding_size=3)
+
+    def test_adapters_use_the_factory_clients(self) -> None:
+        factory = QdrantClientFactory(
+            QdrantClientSettings(url="http://qdrant:6333"),
+            client_cls=lambda **options: SimpleNamespace(**options),
+            async_client_cls=lambda **options: SimpleNamespace(**options),
+        )
+
+        self.assertIs(QdrantVectorStore.from_url(self.settings, factory)._client, factory.get_client())
+        self.assertIs(AsyncQdrantVectorStore.from_url(self.settings, factory)._client, factory.get_async_client())
+
+    def test_default_factory_applies_transport_settings(self) -> None:
+        built: dict[str, dict[str, object]] = {}
+
+        def client_class(name: str) -> object:
+            return lambda **options: built.setdefault(name, options)
+
+        with mock.patch("src.infrastructure.vector_store.qdrant_client_factory._client_class", client_class):
+            AsyncQdrantVectorStore.from_url(self.settings)
+
+        options = built["AsyncQdrantClient"]
+        self.assertEqual(options["url"], "http://qdrant:6333")
+        self.assertEqual(options["timeout"], QdrantClientSettings(url="x").timeout_seconds)
+        self.assertEqual(options["pool_size"], QdrantClientSettings(url="x").pool_size)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from src.infrastructure.vector_store import (
+    QdrantClientFactory,
+    QdrantClientSettings,
+    VectorStoreInfrastructureError,
+)
+
+
+class FakeClient:
+    instances: list["FakeClient"] = []
+
+    def __init__(self, **kwargs: object) -> None:
+        self.kwargs = kwargs
+        self.calls = 0
+        self.fail = False
+        self.closed = False
+        self._lock = threading.Lock()
+        FakeClient.instances.append(self)
+
+    def get_collections(self) -> list[object]:
+        with self._lock:
+            self.calls += 1
+        if self.fail:
+            raise RuntimeError("unreachable")
+        return []
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class QdrantClientFactoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        FakeClient.instances = []
+
+    def test_client_is_built_once_with_transport_options(self) -> None:
+        factory = QdrantClientFactory(
+            QdrantClientSettings(url="http://qdrant:6333", prefer_grpc=True, timeout_seconds=5, pool_size=3),
+            client_cls=FakeClient,
+        )
+
+        self.assertIs(factory.get_client(), factory.get_client())
+        self.assertEqual(len(FakeClient.instances), 1)
+        options = FakeClient.instances[0].kwargs
+        self.assertEqual(options["timeout"], 5)
+        self.assertEqual(options["pool_size"], 3)
+        self.assertTrue(options["prefer_grpc"])
+        self.assertEqual(options["grpc_options"]["grpc.keepalive_time_ms"], 30000)
+
+    def test_rest_client_gets_no_grpc_options(self) -> None:
+        factory = QdrantClientFactory(QdrantClientSettings(url="http://qdrant:6333"), client_cls=FakeClient)
+
+        self.assertNotIn("grpc_options", factory.client_options())
+
+    def test_warm_up_touches_every_pooled_connection(self) -> None:
+        factory = QdrantClientFactory(
+            QdrantClientSettings(url="http://qdrant:6333", pool_size=4, keepalive_seconds=0),
+            client_cls=FakeClient,
+        )
+
+        factory.warm_up()
+        factory.close()
+
+        self.assertEqual(FakeClient.instances[0].calls, 4)
+        self.assertTrue(factory.healthy)
+        self.assertTrue(FakeClient.instances[0].closed)
+
+    def test_warm_up_failure_is_reported(self) -> None:
+        factory = QdrantClientFactory(QdrantClientSettings(url="http://qdrant:6333"), client_cls=FakeClient)
+        factory.get_client().fail = True
+
+        with self.assertRaises(VectorStoreInfrastructureError):
+            factory.warm_up()
+        self.assertFalse(factory.healthy)
+
+    def test_keepalive_probe_tracks_health(self) -> None:
+        factory = QdrantClientFactory(
+            QdrantClientSettings(url="http://qdrant:6333", pool_size=1, keepalive_seconds=0.01),
+            client_cls=FakeClient,
+        )
+        factory.warm_up()
+        client = factory.get_client()
+        client.fail = True
+        deadline = time.monotonic() + 2.0
+        while factory.healthy and time.monotonic() < deadline:
+            time.sleep(0.01)
+        factory.close()
+
+        self.assertFalse(factory.healthy)
+        self.assertGreater(client.calls, 1)
+
+    def test_invalid_settings_are_rejected(self) -> None:
+        with self.assertRaises(VectorStoreInfrastructureError):
+            QdrantClientSettings(url="http://qdrant:6333", pool_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.application import (
+    EmbeddingPort,
+    EmbeddingResult,
+    GenerationPort,
+    RequestPriority,
+    priority_scope,
+)
+from src.infrastructure.resilience import (
+    QuotaLimiter,
+    RateLimitedEmbeddingAdapter,
+    RateLimitedGenerationAdapter,
+)
+
+
+class TooManyRequests(Exception):
+    code = 429
+
+
+class RecordingLimiter(QuotaLimiter):
+    def __init__(self) -> None:
+        super().__init__(requests_per_minute=10_000, tokens_per_minute=10_000_000)
+        self.acquired: list[tuple[int, int, RequestPriority | None]] = []
+
+    def acquire(self, tokens: int = 0, requests: int = 1, priority: RequestPriority | None = None) -> None:
+        self.acquired.append((tokens, requests, priority))
+        super().acquire(tokens, requests, priority)
+
+
+class QuotaLimiterTests(unittest.TestCase):
+    def test_interactive_waiters_go_ahead_of_bulk(self) -> None:
+        limiter = QuotaLimiter(requests_per_minute=600)
+        limiter.acquire(requests=600)
+        order: list[str] = []
+
+        def take(name: str, priority: RequestPriority) -> None:
+            with priority_scope(priority):
+                limiter.acquire()
+            order.append(name)
+
+        bulk = threading.Thread(target=take, args=("bulk", RequestPriority.BULK))
+        bulk.start()
+        while limiter.queued < 1:
+            time.sleep(0.001)
+        interactive = threading.Thread(target=take, args=("interactive", RequestPriority.INTERACTIVE))
+        interactive.start()
+        bulk.join(2.0)
+        interactive.join(2.0)
+
+        self.assertEqual(order, ["interactive", "bulk"])
+
+    def test_token_bucket_throttles_large_calls(self) -> None:
+        limiter = QuotaLimiter(requests_per_minute=100_000, tokens_per_minute=60_000)
+        limiter.acquire(tokens=60_000)
+
+        started = time.perf_counter()
+        limiter.acquire(tokens=100)
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+    def test_async_waiters_share_the_queue_without_threads(self) -> None:
+        limiter = QuotaLimiter(requests_per_minute=600)
+        limiter.acquire(requests=600)
+        order: list[str] = []
+
+        async def take(name: str, priority: RequestPriority) -> None:
+            await limiter.acquire_async(priority=priority)
+            order.append(name)
+
+        async def scenario() -> None:
+            bulk = asyncio.create_task(take("bulk", RequestPriority.BULK))
+            while limiter.queued < 1:
+                await asyncio.sleep(0.001)
+            await asyncio.gather(take("interactive", RequestPriority.INTERACTIVE), bulk)
+
+        with mock.patch("asyncio.to_thread", side_effect=AssertionError("acquire_async used a thread")):
+            asyncio.run(scenario())
+
+        self.assertEqual(order, ["interactive", "bulk"])
+        self.assertEqual(limiter.queued, 0)
+
+    def test_rate_adapts_to_429_and_recovers(self) -> None:
+        limiter = QuotaLimiter(requests_per_minute=100, min_rate_fraction=0.2, recovery_step=0.1)
+
+        for _ in range(5):
+            limiter.record_rate_limited()
+        self.assertAlmostEqual(limiter.rate_fraction, 0.2)
+        limiter.record_success()
+        self.assertAlmostEqual(limiter.rate_fraction, 0.3)
+
+
+class FailingGenerationService(GenerationPort):
+    def generate_text(self, prompt: str) -> str:
+        raise RuntimeError("Gemini generation request failed.") from TooManyRequests("quota")
+
+
+class BatchEmbeddingService(EmbeddingPort):
+    def embed_text(self, text: str) -> list[float]:
+        return [1.0]
+
+    def embed_batch(self, texts):  # type: ignore[no-untyped-def]
+        throttled = EmbeddingResult(error="Gemini embedding request failed: quota", exception=TooManyRequests("quota"))
+        return [throttled] + [EmbeddingResult(embedding=[1.0]) for _ in texts[1:]]
+
+
+class InvalidInputEmbeddingService(BatchEmbeddingService):
+    def embed_batch(self, texts):  # type: ignore[no-untyped-def]
+        # Mentions "429" without being a rate limit.
+        return [EmbeddingResult(error="Text 429 is too long.", exception=ValueError("Text 429 is too long."))]
+
+
+class RateLimitedAdapterTests(unittest.TestCase):
+    def test_generation_429_slows_the_shared_limiter(self) -> None:
+        limiter = RecordingLimiter()
+        adapter = RateLimitedGenerationAdapter(FailingGenerationService(), limiter, expected_output_tokens=100)
+
+        with self.assertRaises(RuntimeError):
+            adapter.generate_text("x" * 40)
+
+        self.assertEqual(limiter.acquired, [(110, 1, None)])
+        self.assertAlmostEqual(limiter.rate_fraction, 0.5)
+
+    def test_embedding_batch_costs_one_request_per_provider_batch(self) -> None:
+        limiter = RecordingLimiter()
+        adapter = RateLimitedEmbeddingAdapter(BatchEmbeddingService(), limiter, provider_batch_size=100)
+
+        results = adapter.embed_batch(["abcd"] * 250)
+
+        self.assertEqual(limiter.acquired, [(250, 3, None)])
+        self.assertFalse(results[0].ok)
+        self.assertAlmostEqual(limiter.rate_fraction, 0.5)
+
+    def test_item_errors_are_classified_by_exception_not_message(self) -> None:
+        limiter = RecordingLimiter()
+        adapter = RateLimitedEmbeddingAdapter(InvalidInputEmbeddingService(), limiter)
+
+        adapter.embed_batch(["abcd"])
+
+        self.assertAlmostEqual(limiter.rate_fraction, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
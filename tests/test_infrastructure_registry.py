@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import subprocess
+import sys
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+from src.infrastructure.import_profile import parse_import_times
+from src.infrastructure.registry import ADAPTERS, AdapterRegistry, AdapterRegistryError
+
+
+class AdapterRegistryTests(unittest.TestCase):
+    def test_resolves_targets_on_first_use_and_caches_them(self) -> None:
+        registry = AdapterRegistry({"store": "src.infrastructure.simulated.adapters:SimulatedVectorStore"})
+
+        self.assertEqual(registry.loaded(), [])
+        first = registry.resolve("store")
+
+        self.assertEqual(first.__name__, "SimulatedVectorStore")
+        self.assertIs(registry.resolve("store"), first)
+        self.assertEqual(registry.loaded(), ["store"])
+
+    def test_unknown_names_and_bad_targets_raise(self) -> None:
+        registry = AdapterRegistry({"missing": "src.infrastructure.simulated.adapters:Nope"})
+
+        with self.assertRaisesRegex(AdapterRegistryError, "Unknown adapter"):
+            registry.resolve("other")
+        with self.assertRaisesRegex(AdapterRegistryError, "Failed to load"):
+            registry.resolve("missing")
+        with self.assertRaises(AdapterRegistryError):
+            registry.register("bad", "no_attribute_separator")
+
+    def test_default_adapters_resolve_without_provider_sdks(self) -> None:
+        for name in ADAPTERS.names():
+            with self.subTest(name=name):
+                self.assertTrue(callable(ADAPTERS.resolve(name)))
+
+
+class StartupImportTests(unittest.TestCase):
+    def test_entrypoint_import_skips_heavy_modules(self) -> None:
+        heavy = [
+            "numpy",
+            "asyncio",
+            "qdrant_client",
+            "google.generativeai",
+            "src.application.use_cases.rag_pipeline",
+        ]
+        script = f"import sys, src.main; print([name for name in {heavy!r} if name in sys.modules])"
+
+        completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+        self.assertEqual(completed.stdout.strip(), "[]")
+
+    def test_parses_importtime_output(self) -> None:
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       120 |        120 |     re._parser",
+                "import time:       300 |        420 |   re",
+                "import time:       210 |        630 | src.main",
+            ]
+        )
+
+        timings = parse_import_times(output)
+
+        self.assertEqual([timing.module for timing in timings], ["re._parser", "re", "src.main"])
+        self.assertEqual([timing.depth for timing in timings], [2, 1, 0])
+        self.assertEqual(timings[-1].cumulative_us, 630)
+
+    def test_budget_overrun_is_reported_on_stderr(self) -> None:
+        from src.main import profile_startup
+
+        profile = SimpleNamespace(total_ms=500.0, format=lambda limit: "import report")
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with (
+            mock.patch("src.infrastructure.import_profile.profile_imports", return_value=profile),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            status = profile_startup(budget_ms=100.0)
+
+        self.assertEqual(status, 1)
+        self.assertEqual(stdout.getvalue(), "import report\n")
+        self.assertIn("exceeds the 100 ms budget", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+
+from src.application import EmbeddingPort, EmbeddingResult, GenerationPort
+from src.infrastructure.resilience import (
+    AsyncResilientGenerationAdapter,
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgingPolicy,
+    ResilientCaller,
+    ResilientEmbeddingAdapter,
+    ResilientGenerationAdapter,
+    RetryPolicy,
+    is_retryable,
+)
+
+
+class ServiceUnavailable(Exception):
+    code = 503
+
+
+class FlakyGenerationService(GenerationPort):
+    def __init__(self, failures: int, error: Exception | None = None) -> None:
+        self.failures = failures
+        self.error = error or ServiceUnavailable("try later")
+        self.calls = 0
+
+    def generate_text(self, prompt: str) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("Gemini generation request failed.") from self.error
+        return "ok"
+
+    def stream_text(self, prompt: str):  # type: ignore[no-untyped-def]
+        yield self.generate_text(prompt)
+        yield " more"
+
+
+class SlowFirstCallService(GenerationPort):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def generate_text(self, prompt: str) -> str:
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            self.release.wait(2.0)
+            return "slow"
+        return "fast"
+
+
+def _caller(**kwargs: object) -> tuple[ResilientCaller, list[float]]:
+    delays: list[float] = []
+    kwargs.setdefault("retry", RetryPolicy(max_attempts=3, base_delay_seconds=0.1, max_delay_seconds=0.15))
+    return ResilientCaller(sleep=delays.append, **kwargs), delays
+
+
+class RetryTests(unittest.TestCase):
+    def test_transient_errors_are_retried_with_capped_jittered_backoff(self) -> None:
+        caller, delays = _caller()
+        service = FlakyGenerationService(failures=2)
+
+        self.assertEqual(ResilientGenerationAdapter(service, caller).generate_text("q"), "ok")
+
+        self.assertEqual(service.calls, 3)
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0.0 <= delays[0] <= 0.1)
+        self.assertTrue(0.0 <= delays[1] <= 0.15)
+
+    def test_non_retryable_errors_fail_immediately(self) -> None:
+        caller, delays = _caller()
+        service = FlakyGenerationService(failures=1, error=ValueError("bad prompt"))
+
+        with self.assertRaises(RuntimeError):
+            ResilientGenerationAdapter(service, caller).generate_text("q")
+        self.assertEqual((service.calls, delays), (1, []))
+
+    def test_stream_is_retried_until_first_chunk(self) -> None:
+        caller, _ = _caller()
+        adapter = ResilientGenerationAdapter(FlakyGenerationService(failures=1), caller)
+
+        self.assertEqual(list(adapter.stream_text("q")), ["ok", " more"])
+        # Time to first chunk would skew the hedge delay of full generations.
+        self.assertEqual(len(caller.latencies), 0)
+
+    def test_retryable_classification_follows_cause_chain(self) -> None:
+        class ResourceExhausted(Exception):
+            pass
+
+        try:
+            try:
+                raise ResourceExhausted("429")
+            except ResourceExhausted as inner:
+                raise RuntimeError("wrapped") from inner
+        except RuntimeError as error:
+            self.assertTrue(is_retryable(error))
+        self.assertTrue(is_retryable(TimeoutError()))
+        self.assertFalse(is_retryable(ValueError("nope")))
+
+
+class HedgingTests(unittest.TestCase):
+    def test_slow_call_is_hedged_and_fast_response_wins(self) -> None:
+        caller = ResilientCaller(
+            hedging=HedgingPolicy(min_delay_seconds=0.01, max_delay_seconds=0.05, initial_delay_seconds=0.02),
+        )
+        service = SlowFirstCallService()
+        try:
+            started = time.perf_counter()
+            result = ResilientGenerationAdapter(service, caller).generate_text("q")
+            elapsed = time.perf_counter() - started
+        finally:
+            service.release.set()
+            caller.close()
+
+        self.assertEqual(result, "fast")
+        self.assertEqual(service.calls, 2)
+        self.assertLess(elapsed, 1.0)
+
+    def test_hedge_delay_follows_observed_percentile(self) -> None:
+        caller = ResilientCaller(hedging=HedgingPolicy(percentile=50.0, min_samples=3, max_delay_seconds=1.0))
+        self.assertEqual(caller.hedge_delay(), 1.0)
+        for seconds in (0.1, 0.2, 0.3, 0.4):
+            caller.latencies.record(seconds)
+
+        self.assertAlmostEqual(caller.hedge_delay(), 0.2)
+
+    def test_async_hedge_cancels_the_loser(self) -> None:
+        cancelled = asyncio.Event()
+        calls = 0
+
+        class AsyncService:
+            async def generate_text(self, prompt: str) -> str:
+                nonlocal calls
+                calls += 1
+                if calls == 1:
+                    try:
+                        await asyncio.sleep(5)
+                    except asyncio.CancelledError:
+                        cancelled.set()
+                        raise
+                return "fast"
+
+        async def scenario() -> str:
+            caller = ResilientCaller(
+                hedging=HedgingPolicy(min_delay_seconds=0.01, max_delay_seconds=0.05, initial_delay_seconds=0.02),
+            )
+            result = await AsyncResilientGenerationAdapter(AsyncService(), caller).generate_text("q")
+            await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+            return result
+
+        self.assertEqual(asyncio.run(scenario()), "fast")
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_breaker_opens_fails_fast_and_recovers_after_trial(self) -> None:
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10.0, clock=lambda: now[0])
+        caller, _ = _caller(retry=RetryPolicy(max_attempts=1), breaker=breaker)
+        service = FlakyGenerationService(failures=3)
+        adapter = ResilientGenerationAdapter(service, caller)
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                adapter.generate_text("q")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            adapter.generate_text("q")
+        self.assertEqual(service.calls, 2)
+
+        now[0] = 10.0
+        with self.assertRaises(RuntimeError):
+            adapter.generate_text("q")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        now[0] = 20.0
+        self.assertEqual(adapter.generate_text("q"), "ok")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class FlakyEmbeddingService(EmbeddingPort):
+    """Fails "b" transiently for ``flaky_rounds`` batches and "bad" permanently."""
+
+    def __init__(self, flaky_rounds: int = 1) -> None:
+        self.batches: list[list[str]] = []
+        self.flaky_rounds = flaky_rounds
+
+    def embed_text(self, text: str) -> list[float]:
+        return [1.0]
+
+    def embed_batch(self, texts):  # type: ignore[no-untyped-def]
+        self.batches.append(list(texts))
+        flaky = len(self.batches) <= self.flaky_rounds
+        return [
+            EmbeddingResult(error="empty") if not text.strip()
+            else EmbeddingResult(error="bad input", exception=ValueError("bad input")) if text == "bad"
+            else EmbeddingResult(error="503", exception=ServiceUnavailable("503")) if flaky and text == "b"
+            else EmbeddingResult(embedding=[float(len(text))])
+            for text in texts
+        ]
+
+
+class ResilientEmbeddingTests(unittest.TestCase):
+    def test_only_failed_non_blank_items_are_retried(self) -> None:
+        caller, delays = _caller()
+        service = FlakyEmbeddingService()
+
+        results = ResilientEmbeddingAdapter(service, caller).embed_batch(["a", "b", " "])
+
+        self.assertEqual(service.batches, [["a", "b", " "], ["b"]])
+        self.assertEqual([result.ok for result in results], [True, True, False])
+        self.assertEqual(len(delays), 1)
+
+    def test_non_retryable_item_errors_are_not_resent(self) -> None:
+        caller, delays = _caller()
+        service = FlakyEmbeddingService()
+
+        results = ResilientEmbeddingAdapter(service, caller).embed_batch(["bad", "b"])
+
+        self.assertEqual(service.batches, [["bad", "b"], ["b"]])
+        self.assertEqual([result.ok for result in results], [False, True])
+
+    def test_each_round_trip_counts_once_on_the_breaker(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=2)
+        caller, _ = _caller(retry=RetryPolicy(max_attempts=4), breaker=breaker)
+        service = FlakyEmbeddingService()
+
+        results = ResilientEmbeddingAdapter(service, caller).embed_batch(["b"] * 64)
+
+        self.assertEqual(len(service.batches), 2)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failing_round_trips_open_the_breaker_and_stop_resending(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=2)
+        caller, _ = _caller(retry=RetryPolicy(max_attempts=4), breaker=breaker)
+        service = FlakyEmbeddingService(flaky_rounds=4)
+
+        results = ResilientEmbeddingAdapter(service, caller).embed_batch(["a", "b"])
+
+        self.assertEqual(service.batches, [["a", "b"], ["b"]])
+        self.assertEqual([result.ok for result in results], [True, False])
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+if __name__ == "__main__":
+    unittest.main()
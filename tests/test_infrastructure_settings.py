@@ -34,6 +34,56 @@ class SettingsTests(unittest.TestCase):
         self.assertEqual(settings.qdrant_url, "http://localhost:6333")
         self.assertEqual(settings.embedding_size, 384)
         self.assertEqual(settings.gemini_api_key, "dummy-key")
+        self.assertEqual(settings.qdrant_quantization, "none")
+
+    def test_load_settings_reads_quantization(self) -> None:
+        os.environ["QDRANT_URL"] = "http://localhost:6333"
+        os.environ["GEMINI_API_KEY"] = "dummy-key"
+        os.environ["QDRANT_QUANTIZATION"] = "Binary"
+        os.environ["QDRANT_SEARCH_OVERSAMPLING"] = "3"
+        os.environ["QDRANT_SEARCH_RESCORE"] = "false"
+        settings = load_settings()
+        self.assertEqual(settings.qdrant_quantization, "binary")
+        self.assertEqual(settings.qdrant_search_oversampling, 3.0)
+        self.assertFalse(settings.qdrant_search_rescore)
+
+    def test_load_settings_rejects_unknown_quantization(self) -> None:
+        os.environ["QDRANT_URL"] = "http://localhost:6333"
+        os.environ["GEMINI_API_KEY"] = "dummy-key"
+        os.environ["QDRANT_QUANTIZATION"] = "pq"
+        with self.assertRaises(SettingsError):
+            load_settings()
+
+
+    def test_load_settings_reads_client_transport(self) -> None:
+        os.environ["QDRANT_URL"] = "http://localhost:6333"
+        os.environ["GEMINI_API_KEY"] = "dummy-key"
+        os.environ["QDRANT_PREFER_GRPC"] = "true"
+        os.environ["QDRANT_POOL_SIZE"] = "8"
+        os.environ["QDRANT_KEEPALIVE_SECONDS"] = "0"
+        settings = load_settings()
+        self.assertTrue(settings.qdrant_prefer_grpc)
+        self.assertEqual(settings.qdrant_pool_size, 8)
+        self.assertEqual(settings.qdrant_timeout_seconds, 10)
+        self.assertEqual(settings.qdrant_keepalive_seconds, 0.0)
+
+    def test_load_settings_rejects_invalid_pool_size(self) -> None:
+        os.environ["QDRANT_URL"] = "http://localhost:6333"
+        os.environ["GEMINI_API_KEY"] = "dummy-key"
+        os.environ["QDRANT_POOL_SIZE"] = "zero"
+        with self.assertRaises(SettingsError):
+            load_settings()
+
+    def test_load_settings_reads_debug_sampling(self) -> None:
+        os.environ["QDRANT_URL"] = "http://localhost:6333"
+        os.environ["GEMINI_API_KEY"] = "dummy-key"
+        os.environ["LOG_DEBUG_SAMPLING"] = "atlas.rag=0.1, atlas.ingestion=0"
+        settings = load_settings()
+        self.assertEqual(settings.log_debug_sampling, (("atlas.rag", 0.1), ("atlas.ingestion", 0.0)))
+
+        os.environ["LOG_DEBUG_SAMPLING"] = "atlas.rag=2"
+        with self.assertRaises(SettingsError):
+            load_settings()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import unittest
+
+from src.application import EmbeddingRecord, RAGPipelineService, RAGRequest
+from src.infrastructure.simulated import (
+    SimulatedEmbeddingAdapter,
+    SimulatedGenerationAdapter,
+    SimulatedVectorStore,
+)
+
+
+class RecordingSleep:
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+
+    def __call__(self, seconds: float) -> None:
+        self.delays.append(seconds)
+
+
+class SimulatedEmbeddingAdapterTests(unittest.TestCase):
+    def test_vectors_are_deterministic_unit_length_and_word_based(self) -> None:
+        adapter = SimulatedEmbeddingAdapter(dimension=32)
+
+        first = adapter.embed_text("Atlas indexes  TXT files")
+        second = SimulatedEmbeddingAdapter(dimension=32).embed_text("atlas indexes txt files")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 32)
+        self.assertAlmostEqual(sum(value * value for value in first), 1.0)
+
+    def test_batch_latency_and_blank_items(self) -> None:
+        sleep = RecordingSleep()
+        adapter = SimulatedEmbeddingAdapter(
+            dimension=8,
+            latency_seconds=0.1,
+            per_item_latency_seconds=0.01,
+            sleep=sleep,
+        )
+
+        results = adapter.embed_batch(["alpha", "  ", "beta"])
+
+        self.assertEqual(sleep.delays, [0.1 + 0.01 * 3])
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertEqual(adapter.calls, 1)
+
+
+class SimulatedGenerationAdapterTests(unittest.TestCase):
+    def test_stream_is_paced_and_matches_generate(self) -> None:
+        sleep = RecordingSleep()
+        adapter = SimulatedGenerationAdapter(
+            latency_seconds=0.5,
+            tokens_per_second=10,
+            answer_words=3,
+            sleep=sleep,
+        )
+        prompt = "Rules.\n\nContext:\nAtlas is a RAG platform.\n\nQuestion: What?"
+
+        deltas = list(adapter.stream_text(prompt))
+
+        self.assertEqual(deltas, ["Atlas", " is", " a"])
+        self.assertEqual(sleep.delays, [0.5, 0.1, 0.1])
+        self.assertEqual(SimulatedGenerationAdapter(answer_words=3).generate_text(prompt), "Atlas is a")
+
+
+class SimulatedVectorStoreTests(unittest.TestCase):
+    def test_adds_latency_around_in_memory_store(self) -> None:
+        sleep = RecordingSleep()
+        embeddings = SimulatedEmbeddingAdapter(dimension=16)
+        store = SimulatedVectorStore(16, search_latency_seconds=0.02, write_latency_seconds=0.03, sleep=sleep)
+        store.upsert_embeddings(
+            [
+                EmbeddingRecord("c1", embeddings.embed_text("billing invoices"), {"text": "billing invoices"}),
+                EmbeddingRecord("c2", embeddings.embed_text("vector search"), {"text": "vector search"}),
+            ]
+        )
+
+        results = store.search_similar(embeddings.embed_text("billing invoices"), limit=1)
+
+        self.assertEqual([result.chunk_id for result in results], ["c1"])
+        self.assertEqual(sleep.delays, [0.03, 0.02])
+
+    def test_pipeline_runs_end_to_end_offline(self) -> None:
+        embeddings = SimulatedEmbeddingAdapter(dimension=16)
+        store = SimulatedVectorStore(16)
+        store.upsert_embedding(
+            "c1",
+            embeddings.embed_text("Atlas answers questions"),
+            {"text": "Atlas answers questions"},
+        )
+        pipeline = RAGPipelineService(store, embeddings, SimulatedGenerationAdapter())
+
+        answer = pipeline.run(RAGRequest(query_text="What does Atlas answer?", top_k=1))
+
+        self.assertEqual(answer.source_chunk_ids, ["c1"])
+        self.assertIn("Atlas", answer.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.application import RAGPipelineService, RAGRequest
+from src.infrastructure.simulated import (
+    SimulatedEmbeddingAdapter,
+    SimulatedGenerationAdapter,
+    SimulatedVectorStore,
+)
+from src.interfaces.loadgen import (
+    LoadGenerationError,
+    LoadGenerator,
+    RateStep,
+    build_schedule,
+    format_report,
+    load_requests,
+)
+
+
+class QueryLogTests(unittest.TestCase):
+    def test_parses_request_fields_and_skips_blank_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "queries.jsonl"
+            path.write_text(
+                '{"query_text": "What is Atlas?"}\n\n{"query_text": "Billing?", "top_k": 5, "score_threshold": 0.2}\n',
+                encoding="utf-8",
+            )
+
+            requests = load_requests(path)
+
+        self.assertEqual(
+            requests,
+            [RAGRequest("What is Atlas?"), RAGRequest("Billing?", top_k=5, score_threshold=0.2)],
+        )
+
+    def test_rejects_unknown_fields(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "queries.jsonl"
+            path.write_text('{"query_text": "What is Atlas?", "topk": 5}\n', encoding="utf-8")
+
+            with self.assertRaisesRegex(LoadGenerationError, "line 1"):
+                load_requests(path)
+
+
+class ScheduleTests(unittest.TestCase):
+    def test_ramp_is_a_staircase_of_equal_steps(self) -> None:
+        schedule = build_schedule(10, 30, ramp_to_qps=30, steps=3)
+
+        self.assertEqual(schedule, [RateStep(10, 10), RateStep(20, 10), RateStep(30, 10)])
+        self.assertEqual(build_schedule(5, 2), [RateStep(5, 2)])
+        with self.assertRaises(LoadGenerationError):
+            build_schedule(10, 30, ramp_to_qps=30, steps=1)
+
+
+class LoadGeneratorTests(unittest.TestCase):
+    def test_reports_throughput_errors_and_stage_latencies(self) -> None:
+        embeddings = SimulatedEmbeddingAdapter(dimension=16)
+        store = SimulatedVectorStore(16)
+        store.upsert_embedding("c1", embeddings.embed_text("Atlas platform"), {"text": "Atlas platform"})
+        pipeline = RAGPipelineService(store, embeddings, SimulatedGenerationAdapter())
+        requests = [RAGRequest("What is Atlas?", top_k=1), RAGRequest("   ")]
+
+        report = LoadGenerator(pipeline, concurrency=4).run(requests, [RateStep(200, 0.1), RateStep(400, 0.05)])
+
+        self.assertEqual(report.sent, 40)
+        self.assertEqual(report.errors, 20)
+        self.assertAlmostEqual(report.error_rate, 0.5)
+        self.assertEqual(report.latency.count, 20)
+        self.assertEqual([step.sent for step in report.steps], [20, 20])
+        self.assertIn("generation", report.stages)
+        self.assertEqual(report.stages["embedding"].count, 20)
+        self.assertIn("overall", format_report(report))
+
+
+if __name__ == "__main__":
+    unittest.main()